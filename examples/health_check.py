@@ -1,8 +1,9 @@
 """Queue manager health check.
 
 Connects to one or more queue managers and checks QMGR status,
-command server availability, and listener state. Produces a
-pass/fail summary for each queue manager.
+command server availability, and listener state. Queue managers are
+checked concurrently. Produces a pass/fail summary for each queue
+manager.
 
 Usage::
 
@@ -16,7 +17,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from os import getenv
 
-from pymqrest import MQRESTError, MQRESTSession
+from pymqrest import Fleet, MQRESTError, MQRESTSession
 from pymqrest.auth import LTPAAuth
 
 
@@ -98,11 +99,9 @@ def main(sessions: list[MQRESTSession]) -> list[QMHealthResult]:
         List of QMHealthResult, one per session.
 
     """
-    results = []
-    for session in sessions:
-        result = check_health(session)
-        results.append(result)
-
+    run = Fleet(sessions).run(check_health)
+    results = [fleet_result.value or QMHealthResult(qmgr_name=fleet_result.qmgr_name) for fleet_result in run.results]
+    for result in results:
         verdict = "PASS" if result.passed else "FAIL"
         print(f"\n=== {result.qmgr_name}: {verdict} ===")
         print(f"  Reachable:      {result.reachable}")
@@ -3,16 +3,24 @@
 from importlib.metadata import version
 
 from ._mapping_merge import MappingOverrideMode
-from .auth import BasicAuth, CertificateAuth, Credentials, LTPAAuth
-from .ensure import EnsureAction, EnsureResult
+from .auth import BasicAuth, CertificateAuth, Credentials, LTPAAuth, LTPAToken, LTPATokenCache
+from .cache import ResultCache, ResultCacheConfig, ResultCacheStats
+from .ensure import EnsureAction, EnsureResult, EnsureSpec
 from .exceptions import (
     MQRESTAuthError,
     MQRESTCommandError,
+    MQRESTEnsureError,
     MQRESTError,
     MQRESTResponseError,
     MQRESTTimeoutError,
     MQRESTTransportError,
 )
+from .failover import EndpointHealth, EndpointSelection, FailoverConfig, RESTEndpoint
+from .fingerprint import FingerprintEntry, FingerprintStore
+from .fleet import Fleet, FleetBootstrap, FleetResult, FleetRun, RolloutConfig, RolloutRun
+from .hedging import HedgeConfig, LatencyStats
+from .index import NameIndex
+from .inventory import Inventory, InventoryConfig, InventoryEntry
 from .mapping import (
     MappingError,
     MappingIssue,
@@ -20,31 +28,92 @@ from .mapping import (
     map_response_attributes,
     map_response_list,
 )
+from .plan import ApplyResult, ChangeAction, ChangeOutcome, DesiredObject, Plan, PlannedChange, Planner
+from .pool import MQRESTSessionPool, SessionPoolStats
 from .session import MQRESTSession
-from .sync import SyncConfig, SyncOperation, SyncResult
+from .singleflight import SingleFlight
+from .snapshot import ObjectVersion, SnapshotInfo, SnapshotStore, SnapshotWriter
+from .sync import SyncBatchResult, SyncConfig, SyncOperation, SyncResult
+from .throttle import (
+    AdaptiveConcurrencyConfig,
+    EndpointThrottle,
+    ThrottleConfig,
+    ThrottledTransport,
+    ThrottleRegistry,
+    ThrottleStats,
+)
+from .wait import PendingWait, WaitResult
 
 __version__ = version("pymqrest")
 
 __all__ = [
+    "AdaptiveConcurrencyConfig",
+    "ApplyResult",
     "BasicAuth",
     "CertificateAuth",
+    "ChangeAction",
+    "ChangeOutcome",
     "Credentials",
+    "DesiredObject",
+    "EndpointHealth",
+    "EndpointSelection",
+    "EndpointThrottle",
     "EnsureAction",
     "EnsureResult",
+    "EnsureSpec",
+    "FailoverConfig",
+    "FingerprintEntry",
+    "FingerprintStore",
+    "Fleet",
+    "FleetBootstrap",
+    "FleetResult",
+    "FleetRun",
+    "HedgeConfig",
+    "Inventory",
+    "InventoryConfig",
+    "InventoryEntry",
     "LTPAAuth",
+    "LTPAToken",
+    "LTPATokenCache",
+    "LatencyStats",
     "MQRESTAuthError",
     "MQRESTCommandError",
+    "MQRESTEnsureError",
     "MQRESTError",
     "MQRESTResponseError",
     "MQRESTSession",
+    "MQRESTSessionPool",
     "MQRESTTimeoutError",
     "MQRESTTransportError",
     "MappingError",
     "MappingIssue",
     "MappingOverrideMode",
+    "NameIndex",
+    "ObjectVersion",
+    "PendingWait",
+    "Plan",
+    "PlannedChange",
+    "Planner",
+    "RESTEndpoint",
+    "ResultCache",
+    "ResultCacheConfig",
+    "ResultCacheStats",
+    "RolloutConfig",
+    "RolloutRun",
+    "SessionPoolStats",
+    "SingleFlight",
+    "SnapshotInfo",
+    "SnapshotStore",
+    "SnapshotWriter",
+    "SyncBatchResult",
     "SyncConfig",
     "SyncOperation",
     "SyncResult",
+    "ThrottleConfig",
+    "ThrottleRegistry",
+    "ThrottleStats",
+    "ThrottledTransport",
+    "WaitResult",
     "__version__",
     "map_request_attributes",
     "map_response_attributes",
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import hmac
 import http.cookies
+import json
+import os
+import secrets
+import threading
+import time
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .exceptions import MQRESTAuthError
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
 
     from .session import MQRESTTransport
 
@@ -17,6 +27,11 @@ LTPA_COOKIE_NAME = "LtpaToken2"
 LTPA_LOGIN_PATH = "/login"
 ERROR_LTPA_LOGIN_FAILED = "LTPA login failed."
 ERROR_LTPA_TOKEN_MISSING = "LTPA login succeeded but no LtpaToken2 cookie was returned."  # noqa: S105
+DEFAULT_LTPA_TOKEN_LIFETIME_SECONDS = 7200.0
+DEFAULT_LTPA_REFRESH_MARGIN_SECONDS = 300.0
+_TOKEN_CACHE_FILE_MODE = 0o600
+_VERIFIER_SALT_BYTES = 16
+_VERIFIER_ITERATIONS = 100_000
 
 
 @dataclass(frozen=True)
@@ -38,16 +53,204 @@ class LTPAAuth:
     """LTPA token-based authentication credentials.
 
     The session performs an LTPA login at construction time and uses
-    the returned ``LtpaToken2`` cookie for subsequent requests.
+    the returned ``LtpaToken2`` cookie for subsequent requests. The
+    token is refreshed by logging in again shortly before it expires,
+    and once more if the server rejects it with HTTP 401.
 
     Attributes:
         username: Username for the LTPA login request.
         password: Password for the LTPA login request.
+        token_lifetime_seconds: Assumed token lifetime when the login
+            response does not state one. Match the mqweb
+            ``ltpaExpiration`` setting (120 minutes by default).
+        refresh_margin_seconds: Seconds before expiry at which the
+            token is refreshed.
 
     """
 
     username: str
     password: str
+    token_lifetime_seconds: float = DEFAULT_LTPA_TOKEN_LIFETIME_SECONDS
+    refresh_margin_seconds: float = DEFAULT_LTPA_REFRESH_MARGIN_SECONDS
+
+
+@dataclass(frozen=True)
+class LTPAToken:
+    """An ``LtpaToken2`` value with its expiry time.
+
+    Attributes:
+        value: The ``LtpaToken2`` cookie value.
+        expires_at: Expiry as a Unix timestamp.
+
+    """
+
+    value: str
+    expires_at: float
+
+    def needs_refresh(self, margin_seconds: float, now: float | None = None) -> bool:
+        """Return whether the token expires within *margin_seconds*."""
+        current = time.time() if now is None else now
+        return self.expires_at - margin_seconds <= current
+
+
+@dataclass(frozen=True)
+class _CachedToken:
+    """A cached token with a salted verifier of the password that obtained it."""
+
+    token: LTPAToken
+    salt: bytes
+    verifier: bytes
+
+
+class LTPATokenCache:
+    """Thread-safe LTPA token store keyed by endpoint and username.
+
+    Pass one cache to several sessions to share tokens between them:
+    sessions for the same user and endpoint then log in once, and a
+    token refreshed by one session is picked up by the others. Logins
+    for the same key are serialized, so concurrent sessions never log
+    in twice for one token.
+
+    A cached token is only handed to credentials whose password matches
+    the one that obtained it. Each entry keeps a salted PBKDF2 verifier
+    of that password, checked once per process and credential; a
+    session with a different password logs in itself, and fails if the
+    server rejects it.
+
+    When *path* is given, tokens are also persisted to that file (created
+    with owner-only permissions) and loaded from it on construction, so
+    tokens survive process restarts. The file holds live credentials and
+    should be protected accordingly.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Optional file used to persist tokens. A missing or
+                unreadable file starts the cache empty.
+
+        """
+        self._path = Path(path).expanduser() if path is not None else None
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._entries: dict[tuple[str, str], _CachedToken] = {}
+        self._secret = secrets.token_bytes(32)
+        self._verified: dict[tuple[str, str], bytes] = {}
+        if self._path is not None:
+            self._entries = _load_token_file(self._path)
+
+    def get(self, rest_base_url: str, credentials: LTPAAuth) -> LTPAToken | None:
+        """Return the unexpired token for *credentials* at *rest_base_url*, if any."""
+        token = self._lookup((rest_base_url, credentials.username), credentials.password)
+        if token is None or token.needs_refresh(0.0):
+            return None
+        return token
+
+    def put(self, rest_base_url: str, credentials: LTPAAuth, token: LTPAToken) -> None:
+        """Store *token*, obtained with *credentials*, for *rest_base_url*."""
+        key = (rest_base_url, credentials.username)
+        salt = secrets.token_bytes(_VERIFIER_SALT_BYTES)
+        entry = _CachedToken(token, salt, _derive_verifier(credentials.password, salt))
+        with self._lock:
+            self._entries[key] = entry
+            self._verified[key] = self._fast_digest(credentials.password)
+            self._save()
+
+    def invalidate(self, rest_base_url: str, username: str) -> None:
+        """Forget the token for *username* at *rest_base_url*."""
+        key = (rest_base_url, username)
+        with self._lock:
+            self._verified.pop(key, None)
+            if self._entries.pop(key, None) is not None:
+                self._save()
+
+    def clear(self) -> None:
+        """Forget every token."""
+        with self._lock:
+            self._entries.clear()
+            self._verified.clear()
+            self._save()
+
+    def acquire(
+        self,
+        rest_base_url: str,
+        credentials: LTPAAuth,
+        login: Callable[[], LTPAToken],
+        *,
+        margin_seconds: float,
+        stale: LTPAToken | None = None,
+    ) -> LTPAToken:
+        """Return a usable token, calling *login* only when needed.
+
+        Args:
+            rest_base_url: Base URL of the endpoint.
+            credentials: The LTPA credentials. A cached token is only
+                returned if it was obtained with the same password.
+            login: Callable performing a fresh login with *credentials*.
+            margin_seconds: Tokens expiring within this many seconds
+                are refreshed.
+            stale: A token the server has rejected. It is never
+                returned, even if not yet expired.
+
+        Returns:
+            The cached token, or the token returned by *login*.
+
+        """
+        key = (rest_base_url, credentials.username)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            token = self._lookup(key, credentials.password)
+            if token is not None and token != stale and not token.needs_refresh(margin_seconds):
+                return token
+            token = login()
+            self.put(rest_base_url, credentials, token)
+            return token
+
+    def _lookup(self, key: tuple[str, str], password: str) -> LTPAToken | None:
+        """Return the cached token for *key* if *password* obtained it.
+
+        The slow verifier is derived outside the cache lock, so it never
+        holds up lookups for other keys.
+        """
+        fast = self._fast_digest(password)
+        with self._lock:
+            entry = self._entries.get(key)
+            verified = self._verified.get(key)
+        if entry is None:
+            return None
+        if verified is not None and hmac.compare_digest(verified, fast):
+            return entry.token
+        if not hmac.compare_digest(_derive_verifier(password, entry.salt), entry.verifier):
+            return None
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._verified[key] = fast
+        return entry.token
+
+    def _fast_digest(self, password: str) -> bytes:
+        return hmac.new(self._secret, password.encode(), hashlib.sha256).digest()
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        entries = [
+            {
+                "url": url,
+                "username": username,
+                "token": entry.token.value,
+                "expires_at": entry.token.expires_at,
+                "salt": entry.salt.hex(),
+                "verifier": entry.verifier.hex(),
+            }
+            for (url, username), entry in self._entries.items()
+        ]
+        temporary = self._path.with_name(f"{self._path.name}.tmp")
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, _TOKEN_CACHE_FILE_MODE)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+            json.dump({"tokens": entries}, handle)
+        temporary.replace(self._path)
 
 
 @dataclass(frozen=True)
@@ -72,7 +275,7 @@ Credentials = BasicAuth | LTPAAuth | CertificateAuth
 """Type alias for the supported credential types."""
 
 
-def _perform_ltpa_login(
+def _request_ltpa_token(
     transport: MQRESTTransport,
     rest_base_url: str,
     credentials: LTPAAuth,
@@ -80,19 +283,12 @@ def _perform_ltpa_login(
     csrf_token: str | None,
     timeout_seconds: float | None,
     verify_tls: bool,
-) -> str:
-    """Perform an LTPA login and return the ``LtpaToken2`` token value.
-
-    Args:
-        transport: The transport to use for the login POST request.
-        rest_base_url: Base URL of the MQ REST API.
-        credentials: LTPA credentials containing username and password.
-        csrf_token: CSRF token value for the request header.
-        timeout_seconds: Request timeout in seconds.
-        verify_tls: Whether to verify the server's TLS certificate.
+) -> LTPAToken:
+    """Perform an LTPA login and return the token with its expiry.
 
-    Returns:
-        The ``LtpaToken2`` cookie value string.
+    The expiry comes from the cookie's ``Max-Age`` or ``Expires``
+    attribute when present, and from
+    :attr:`LTPAAuth.token_lifetime_seconds` otherwise.
 
     Raises:
         MQRESTAuthError: If the login request fails or the response
@@ -120,34 +316,55 @@ def _perform_ltpa_login(
             url=login_url,
             status_code=response.status_code,
         )
-    token = _extract_ltpa_token(response.headers)
-    if token is None:
+    now = time.time()
+    morsel = _extract_ltpa_morsel(response.headers)
+    if morsel is None:
         raise MQRESTAuthError(
             ERROR_LTPA_TOKEN_MISSING,
             url=login_url,
             status_code=response.status_code,
         )
-    return token
-
-
-def _extract_ltpa_token(headers: Mapping[str, str]) -> str | None:
-    """Extract the ``LtpaToken2`` value from response ``Set-Cookie`` headers.
+    expires_at = _morsel_expiry(morsel, now)
+    if expires_at is None:
+        expires_at = now + credentials.token_lifetime_seconds
+    return LTPAToken(value=morsel.value, expires_at=expires_at)
 
-    Uses :class:`http.cookies.SimpleCookie` for robust cookie parsing.
 
-    Args:
-        headers: Response headers mapping.
-
-    Returns:
-        The token string, or ``None`` if not found.
-
-    """
+def _extract_ltpa_morsel(headers: Mapping[str, str]) -> http.cookies.Morsel[str] | None:
     set_cookie = headers.get("Set-Cookie") or headers.get("set-cookie")
     if not set_cookie:
         return None
     cookie = http.cookies.SimpleCookie()
     cookie.load(set_cookie)
-    morsel = cookie.get(LTPA_COOKIE_NAME)
-    if morsel is not None:
-        return morsel.value
+    return cookie.get(LTPA_COOKIE_NAME)
+
+
+def _morsel_expiry(morsel: http.cookies.Morsel[str], now: float) -> float | None:
+    max_age = morsel["max-age"]
+    if max_age:
+        with contextlib.suppress(ValueError):
+            return now + float(max_age)
+    expires = morsel["expires"]
+    if expires:
+        with contextlib.suppress(TypeError, ValueError):
+            return parsedate_to_datetime(expires).timestamp()
     return None
+
+
+def _derive_verifier(password: str, salt: bytes) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, _VERIFIER_ITERATIONS)
+
+
+def _load_token_file(path: Path) -> dict[tuple[str, str], _CachedToken]:
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+        return {
+            (entry["url"], entry["username"]): _CachedToken(
+                token=LTPAToken(value=entry["token"], expires_at=float(entry["expires_at"])),
+                salt=bytes.fromhex(entry["salt"]),
+                verifier=bytes.fromhex(entry["verifier"]),
+            )
+            for entry in document["tokens"]
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
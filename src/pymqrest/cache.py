@@ -0,0 +1,287 @@
+"""Read-through TTL cache for read-only MQSC command responses."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+    from .session import TransportResponse
+
+DEFAULT_CACHE_ENTRIES = 1024
+DEFAULT_CACHE_TTL_SECONDS = 60.0
+
+DEFAULT_QUALIFIER_TTL_SECONDS: Mapping[str, float] = {
+    "APSTATUS": 0.0,
+    "CFSTATUS": 0.0,
+    "CHINIT": 0.0,
+    "CHSTATUS": 0.0,
+    "CMDSERV": 0.0,
+    "CONN": 0.0,
+    "LSSTATUS": 0.0,
+    "PUBSUB": 0.0,
+    "QMSTATUS": 0.0,
+    "QSTATS": 0.0,
+    "QSTATUS": 0.0,
+    "SBSTATUS": 0.0,
+    "SVSTATUS": 0.0,
+    "THREAD": 0.0,
+    "TPSTATUS": 0.0,
+    "USAGE": 0.0,
+}
+"""Default per-qualifier TTLs: status qualifiers are not cached."""
+
+_ALL_FAMILIES = "*"
+_QUALIFIER_FAMILIES: Mapping[str, str] = {
+    "QALIAS": "QUEUE",
+    "QCLUSTER": "QUEUE",
+    "QLOCAL": "QUEUE",
+    "QMODEL": "QUEUE",
+    "QREMOTE": "QUEUE",
+    "QSTATS": "QUEUE",
+    "QSTATUS": "QUEUE",
+    "CHSTATUS": "CHANNEL",
+    "CLUSQMGR": "CHANNEL",
+    "LSSTATUS": "LISTENER",
+    "SVSTATUS": "SERVICE",
+    "SBSTATUS": "SUB",
+    "TCLUSTER": "TOPIC",
+    "TOPICSTR": "TOPIC",
+    "TPSTATUS": "TOPIC",
+    "QMSTATUS": "QMGR",
+}
+
+
+def qualifier_family(qualifier: str) -> str:
+    """Return the object family a qualifier reads or changes.
+
+    ``QLOCAL``, ``QREMOTE``, ``QALIAS``, ``QMODEL`` and ``QSTATUS`` all
+    belong to the ``QUEUE`` family, ``CHSTATUS`` to ``CHANNEL``, and so
+    on; other qualifiers form a family of their own.
+
+    Args:
+        qualifier: An MQSC qualifier, e.g. ``"QLOCAL"``.
+
+    Returns:
+        The family name.
+
+    """
+    upper = qualifier.upper()
+    return _QUALIFIER_FAMILIES.get(upper, upper)
+
+
+@dataclass(frozen=True)
+class ResultCacheConfig:
+    """Size and freshness limits for a :class:`ResultCache`.
+
+    Attributes:
+        max_entries: Maximum number of cached responses; the least
+            recently used entry is dropped beyond it.
+        default_ttl_seconds: Seconds a response stays fresh when its
+            qualifier has no entry in *qualifier_ttl_seconds*.
+        qualifier_ttl_seconds: Per-qualifier TTLs keyed by MQSC
+            qualifier. A TTL of ``0`` disables caching for that
+            qualifier. Defaults to :data:`DEFAULT_QUALIFIER_TTL_SECONDS`,
+            which excludes status qualifiers such as ``QSTATUS`` and
+            ``CHSTATUS``.
+
+    """
+
+    max_entries: int = DEFAULT_CACHE_ENTRIES
+    default_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS
+    qualifier_ttl_seconds: Mapping[str, float] = field(default_factory=lambda: dict(DEFAULT_QUALIFIER_TTL_SECONDS))
+
+    def ttl_for(self, qualifier: str) -> float:
+        """Return the TTL in seconds for *qualifier*."""
+        return self.qualifier_ttl_seconds.get(qualifier.upper(), self.default_ttl_seconds)
+
+
+@dataclass(frozen=True)
+class ResultCacheStats:
+    """Point-in-time counters for a :class:`ResultCache`.
+
+    Attributes:
+        size: Responses currently held.
+        hits: Lookups answered from the cache.
+        misses: Lookups that found no fresh entry.
+        evictions: Entries dropped as least recently used.
+        invalidations: Entries dropped by state-changing commands or
+            :meth:`ResultCache.invalidate`.
+
+    """
+
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    response: TransportResponse
+    expires_at: float
+    qmgr_name: str
+    family: str
+
+
+class ResultCache:
+    """Thread-safe, size-bounded LRU cache of ``DISPLAY`` responses.
+
+    Sessions given a cache answer repeated ``DISPLAY`` commands from it
+    until the entry's TTL expires. When a session runs a
+    state-changing command (``DEFINE``, ``ALTER``, ``DELETE``,
+    ``CLEAR`` and so on), entries for the same queue manager and
+    qualifier family are dropped, so a session reads its own writes.
+    Changes made by other clients are only seen once the TTL expires.
+
+    Share one cache across sessions to share cached responses; keys
+    include the endpoint, queue manager, credentials and full command
+    payload.
+    """
+
+    def __init__(self, config: ResultCacheConfig | None = None) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            config: Size and TTL limits. Defaults to
+                :class:`ResultCacheConfig` defaults.
+
+        Raises:
+            ValueError: If *max_entries* is less than 1.
+
+        """
+        self._config = config or ResultCacheConfig()
+        if self._config.max_entries < 1:
+            message = "max_entries must be at least 1."
+            raise ValueError(message)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._generations: dict[tuple[str, str], int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def config(self) -> ResultCacheConfig:
+        """The cache configuration."""
+        return self._config
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        with self._lock:
+            return len(self._entries)
+
+    def lookup(self, key: Hashable) -> TransportResponse | None:
+        """Return the fresh response cached under *key*, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.response
+
+    def generation(self, qmgr_name: str, qualifier: str) -> int:
+        """Return the invalidation generation of a queue manager's qualifier family.
+
+        Read it before sending a command and pass it to :meth:`store`,
+        so a response that raced with a state-changing command is not
+        cached.
+        """
+        with self._lock:
+            return self._generation(qmgr_name, qualifier_family(qualifier))
+
+    def store(
+        self,
+        key: Hashable,
+        response: TransportResponse,
+        *,
+        qmgr_name: str,
+        qualifier: str,
+        generation: int,
+    ) -> None:
+        """Cache *response* under *key* if its qualifier is cacheable.
+
+        Args:
+            key: Identity of the request.
+            response: The response to cache.
+            qmgr_name: Queue manager the request targeted.
+            qualifier: MQSC qualifier of the request.
+            generation: Value of :meth:`generation` read before the
+                request was sent. The response is discarded when the
+                family was invalidated since.
+
+        """
+        ttl = self._config.ttl_for(qualifier)
+        if ttl <= 0:
+            return
+        family = qualifier_family(qualifier)
+        with self._lock:
+            if self._generation(qmgr_name, family) != generation:
+                return
+            self._entries[key] = _CacheEntry(
+                response=response,
+                expires_at=time.monotonic() + ttl,
+                qmgr_name=qmgr_name,
+                family=family,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._config.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, qmgr_name: str, qualifier: str | None = None) -> int:
+        """Drop cached responses for a queue manager.
+
+        Args:
+            qmgr_name: Queue manager whose entries are dropped.
+            qualifier: Drop only entries in this qualifier's family, or
+                every entry for the queue manager when ``None``.
+
+        Returns:
+            The number of entries dropped.
+
+        """
+        family = None if qualifier is None else qualifier_family(qualifier)
+        scope = (qmgr_name, _ALL_FAMILIES if family is None else family)
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.qmgr_name == qmgr_name and family in (None, entry.family)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def _generation(self, qmgr_name: str, family: str) -> int:
+        return self._generations.get((qmgr_name, family), 0) + self._generations.get((qmgr_name, _ALL_FAMILIES), 0)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> ResultCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return ResultCacheStats(
+                size=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
@@ -3,13 +3,42 @@
 from __future__ import annotations
 
 import enum
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
-from .exceptions import MQRESTCommandError
+from .cache import qualifier_family
+from .exceptions import MQRESTCommandError, MQRESTEnsureError, MQRESTError
+from .fingerprint import desired_fingerprint
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from .fingerprint import FingerprintStore
+
+DEFAULT_ENSURE_WORKERS = 8
+
+# MQRC_UNKNOWN_OBJECT_NAME: the DISPLAY matched no objects.
+_NO_MATCH_REASON_CODES = frozenset({2085})
+
+# object_type -> (DISPLAY, DEFINE, ALTER) qualifiers of each ensure_* method.
+_ENSURE_QUALIFIERS: dict[str, tuple[str, str, str]] = {
+    "qlocal": ("QUEUE", "QLOCAL", "QLOCAL"),
+    "qremote": ("QUEUE", "QREMOTE", "QREMOTE"),
+    "qalias": ("QUEUE", "QALIAS", "QALIAS"),
+    "qmodel": ("QUEUE", "QMODEL", "QMODEL"),
+    "channel": ("CHANNEL", "CHANNEL", "CHANNEL"),
+    "authinfo": ("AUTHINFO", "AUTHINFO", "AUTHINFO"),
+    "listener": ("LISTENER", "LISTENER", "LISTENER"),
+    "namelist": ("NAMELIST", "NAMELIST", "NAMELIST"),
+    "process": ("PROCESS", "PROCESS", "PROCESS"),
+    "service": ("SERVICE", "SERVICE", "SERVICE"),
+    "topic": ("TOPIC", "TOPIC", "TOPIC"),
+    "sub": ("SUB", "SUB", "SUB"),
+    "stgclass": ("STGCLASS", "STGCLASS", "STGCLASS"),
+    "comminfo": ("COMMINFO", "COMMINFO", "COMMINFO"),
+    "cfstruct": ("CFSTRUCT", "CFSTRUCT", "CFSTRUCT"),
+}
 
 
 class EnsureAction(enum.Enum):
@@ -43,6 +72,25 @@ class EnsureResult:
     changed: tuple[str, ...] = ()
 
 
+@dataclass(frozen=True)
+class EnsureSpec:
+    """Desired state of one object for :meth:`MQRESTEnsureMixin.ensure_many`.
+
+    Attributes:
+        object_type: The ensure method's object type: ``"qlocal"`` for
+            :meth:`~MQRESTEnsureMixin.ensure_qlocal`, ``"channel"`` for
+            :meth:`~MQRESTEnsureMixin.ensure_channel`, and so on.
+            ``"qmgr"`` is not supported.
+        name: MQ object name.
+        request_parameters: Desired attributes to assert/set.
+
+    """
+
+    object_type: str
+    name: str
+    request_parameters: Mapping[str, object] | None = None
+
+
 class MQRESTEnsureMixin:
     """Mixin providing idempotent ensure methods for MQ objects.
 
@@ -52,6 +100,9 @@ class MQRESTEnsureMixin:
     ``ALTDATE``/``ALTTIME`` for unchanged objects.
     """
 
+    _qmgr_name: str
+    _fingerprint_store: FingerprintStore | None = None
+
     def _mqsc_command(
         self,
         *,
@@ -64,41 +115,236 @@ class MQRESTEnsureMixin:
     ) -> list[dict[str, object]]:
         raise NotImplementedError  # pragma: no cover
 
-    def _ensure_object(
+    def response_key(self, qualifier: str, attribute: str) -> str:
+        """Return the key under which ``DISPLAY`` results report an MQSC attribute."""
+        raise NotImplementedError  # pragma: no cover
+
+    def display_projection(self, qualifier: str, attributes: Iterable[str]) -> list[str]:
+        """Return the ``DISPLAY`` response parameters needed to compare *attributes*."""
+        raise NotImplementedError  # pragma: no cover
+
+    def ensure_many(
         self,
+        specs: Iterable[EnsureSpec],
         *,
+        max_workers: int = DEFAULT_ENSURE_WORKERS,
+    ) -> list[EnsureResult]:
+        """Ensure many objects with one ``DISPLAY`` per qualifier.
+
+        Instead of one ``DISPLAY`` per object, the current state of every
+        object sharing a ``DISPLAY`` qualifier is fetched with a single
+        generic ``DISPLAY``, using the longest name prefix the specs have
+        in common (``APP.*`` for ``APP.IN`` and ``APP.OUT``). Diffs are
+        computed locally with the same rules as the ``ensure_*``
+        methods, and the resulting ``DEFINE`` and ``ALTER`` commands run
+        on up to *max_workers* threads.
+
+        Args:
+            specs: Desired state of each object.
+            max_workers: Maximum number of ``DEFINE`` and ``ALTER``
+                commands in flight at once.
+
+        Returns:
+            One :class:`EnsureResult` per spec, in the order given.
+
+        Raises:
+            ValueError: If a spec has an unknown object type, two specs
+                name the same object, or *max_workers* is less than 1.
+            MQRESTEnsureError: If a ``DEFINE`` or ``ALTER`` fails, or a
+                generic ``DISPLAY`` fails for any reason other than no
+                matching objects, which fails every spec it was issued
+                for. It is raised after every other command has
+                completed, and carries the result of each spec that
+                succeeded and the error of each that failed.
+
+        """
+        if max_workers < 1:
+            message = "max_workers must be at least 1."
+            raise ValueError(message)
+        spec_list = list(specs)
+        qualifiers = _spec_qualifiers(spec_list)
+        fingerprints = [
+            desired_fingerprint(define_qualifier, spec.request_parameters)
+            for spec, (_, define_qualifier, _) in zip(spec_list, qualifiers, strict=True)
+        ]
+        fresh = [
+            self._fingerprint_matches(display_qualifier, spec.name, fingerprint)
+            for spec, (display_qualifier, _, _), fingerprint in zip(spec_list, qualifiers, fingerprints, strict=True)
+        ]
+        names_by_display: dict[str, list[str]] = {}
+        attributes_by_display: dict[str, list[str]] = {}
+        for spec, (display_qualifier, _, _), skip in zip(spec_list, qualifiers, fresh, strict=True):
+            if skip:
+                continue
+            names_by_display.setdefault(display_qualifier, []).append(spec.name)
+            attributes_by_display.setdefault(display_qualifier, []).extend(spec.request_parameters or ())
+        current_by_display, display_errors = self._display_groups(names_by_display, attributes_by_display)
+
+        results: list[EnsureResult | None] = []
+        errors: dict[int, MQRESTError] = {}
+        commands: list[tuple[str, str, str, dict[str, object] | None]] = []
+        applied: list[tuple[int, str, str, str]] = []
+        for index, (spec, (display_qualifier, define_qualifier, alter_qualifier), fingerprint, skip) in enumerate(
+            zip(spec_list, qualifiers, fingerprints, fresh, strict=True)
+        ):
+            if skip:
+                results.append(EnsureResult(EnsureAction.UNCHANGED))
+                continue
+            if display_qualifier in display_errors:
+                results.append(None)
+                errors[index] = display_errors[display_qualifier]
+                continue
+            params = dict(spec.request_parameters) if spec.request_parameters else {}
+            current = current_by_display[display_qualifier].get(spec.name)
+            if current is None:
+                results.append(EnsureResult(EnsureAction.CREATED))
+                commands.append(("DEFINE", define_qualifier, spec.name, params or None))
+                applied.append((index, display_qualifier, spec.name, fingerprint))
+                continue
+            changed = _changed_attributes(params, current)
+            if not changed:
+                results.append(EnsureResult(EnsureAction.UNCHANGED))
+                self._record_fingerprint(display_qualifier, spec.name, fingerprint)
+                continue
+            results.append(EnsureResult(EnsureAction.UPDATED, changed=tuple(changed.keys())))
+            commands.append(("ALTER", alter_qualifier, spec.name, changed))
+            applied.append((index, display_qualifier, spec.name, fingerprint))
+
+        self._apply_commands(commands, applied, results, errors, max_workers)
+        return cast("list[EnsureResult]", results)
+
+    def _apply_commands(
+        self,
+        commands: Sequence[tuple[str, str, str, dict[str, object] | None]],
+        applied: Sequence[tuple[int, str, str, str]],
+        results: list[EnsureResult | None],
+        errors: dict[int, MQRESTError],
+        max_workers: int,
+    ) -> None:
+        """Run the commands, record the fingerprints of those that succeeded, then raise the failures.
+
+        *errors* holds the specs that already failed, keyed by index.
+        """
+        for (index, display_qualifier, name, fingerprint), error in zip(
+            applied, self._run_concurrently(commands, max_workers), strict=True
+        ):
+            if error is None:
+                self._record_fingerprint(display_qualifier, name, fingerprint)
+            else:
+                errors[index] = error
+                results[index] = None
+        if errors:
+            message = f"{len(errors)} of {len(results)} ensure specs failed; first: {errors[min(errors)]}"
+            raise MQRESTEnsureError(message, results=results, errors=errors)
+
+    def _run_concurrently(
+        self,
+        commands: Sequence[tuple[str, str, str, dict[str, object] | None]],
+        max_workers: int,
+    ) -> list[MQRESTError | None]:
+        """Run commands on a thread pool and return each command's error, if any."""
+        if not commands:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(commands)),
+            thread_name_prefix="pymqrest-ensure",
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._mqsc_command,
+                    command=command,
+                    mqsc_qualifier=qualifier,
+                    name=name,
+                    request_parameters=params,
+                    response_parameters=None,
+                )
+                for command, qualifier, name, params in commands
+            ]
+        errors: list[MQRESTError | None] = []
+        for future in futures:
+            error = future.exception()
+            if error is not None and not isinstance(error, MQRESTError):
+                raise error
+            errors.append(error)
+        return errors
+
+    def _display_groups(
+        self,
+        names_by_display: Mapping[str, Sequence[str]],
+        attributes_by_display: Mapping[str, Sequence[str]],
+    ) -> tuple[dict[str, dict[str, dict[str, object]]], dict[str, MQRESTError]]:
+        """Return the current objects of each ``DISPLAY`` qualifier, and the error of each that failed."""
+        current_by_display: dict[str, dict[str, dict[str, object]]] = {}
+        errors: dict[str, MQRESTError] = {}
+        for display_qualifier, names in names_by_display.items():
+            try:
+                current_by_display[display_qualifier] = self._display_generic(
+                    display_qualifier, names, attributes_by_display[display_qualifier]
+                )
+            except MQRESTError as error:
+                errors[display_qualifier] = error
+        return current_by_display, errors
+
+    def _display_generic(
+        self,
+        display_qualifier: str,
+        names: Sequence[str],
+        attributes: Iterable[str],
+    ) -> dict[str, dict[str, object]]:
+        """Return the current objects among *names* with *attributes*, keyed by name."""
+        generic_name = _common_prefix(names) + "*"
+        try:
+            rows = self._mqsc_command(
+                command="DISPLAY",
+                mqsc_qualifier=display_qualifier,
+                name=generic_name,
+                request_parameters=None,
+                response_parameters=self.display_projection(display_qualifier, attributes),
+            )
+        except MQRESTCommandError as error:
+            if not _is_no_match_error(error):
+                raise
+            rows = []
+        name_key = self.response_key(display_qualifier, qualifier_family(display_qualifier))
+        wanted = set(names)
+        return {str(row[name_key]): row for row in rows if row.get(name_key) in wanted}
+
+    def _ensure_object(
+        self,
+        object_type: str,
         name: str,
         request_parameters: Mapping[str, object] | None,
-        display_qualifier: str,
-        define_qualifier: str,
-        alter_qualifier: str,
     ) -> EnsureResult:
         """Core ensure logic shared by all ``ensure_*`` methods.
 
         Args:
+            object_type: Key of the object's qualifiers in
+                ``_ENSURE_QUALIFIERS``.
             name: MQ object name.
             request_parameters: Desired attributes to assert/set.
-            display_qualifier: MQSC qualifier for the DISPLAY command.
-            define_qualifier: MQSC qualifier for the DEFINE command.
-            alter_qualifier: MQSC qualifier for the ALTER command.
 
         Returns:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
+        display_qualifier, define_qualifier, alter_qualifier = _ENSURE_QUALIFIERS[object_type]
+        params = dict(request_parameters) if request_parameters else {}
+        fingerprint = desired_fingerprint(define_qualifier, params)
+        if self._fingerprint_matches(display_qualifier, name, fingerprint):
+            return EnsureResult(EnsureAction.UNCHANGED)
         try:
             current_objects = self._mqsc_command(
                 command="DISPLAY",
                 mqsc_qualifier=display_qualifier,
                 name=name,
                 request_parameters=None,
-                response_parameters=["all"],
+                response_parameters=self.display_projection(display_qualifier, params),
             )
-        except MQRESTCommandError:
+        except MQRESTCommandError as error:
+            if not _is_no_match_error(error):
+                raise
             current_objects = []
 
-        params = dict(request_parameters) if request_parameters else {}
-
         if not current_objects:
             self._mqsc_command(
                 command="DEFINE",
@@ -107,19 +353,14 @@ class MQRESTEnsureMixin:
                 request_parameters=params or None,
                 response_parameters=None,
             )
+            self._record_fingerprint(display_qualifier, name, fingerprint)
             return EnsureResult(EnsureAction.CREATED)
 
-        if not params:
-            return EnsureResult(EnsureAction.UNCHANGED)
-
         current = current_objects[0]
-        changed: dict[str, object] = {}
-        for key, desired_value in params.items():
-            current_value = current.get(key)
-            if not _values_match(desired_value, current_value):
-                changed[key] = desired_value
+        changed = _changed_attributes(params, current)
 
         if not changed:
+            self._record_fingerprint(display_qualifier, name, fingerprint)
             return EnsureResult(EnsureAction.UNCHANGED)
 
         self._mqsc_command(
@@ -129,8 +370,20 @@ class MQRESTEnsureMixin:
             request_parameters=changed,
             response_parameters=None,
         )
+        self._record_fingerprint(display_qualifier, name, fingerprint)
         return EnsureResult(EnsureAction.UPDATED, changed=tuple(changed.keys()))
 
+    def _fingerprint_matches(self, qualifier: str, name: str, fingerprint: str) -> bool:
+        """Return whether the fingerprint store holds *fingerprint* for the object, fresh."""
+        store = self._fingerprint_store
+        return store is not None and store.matches(self._qmgr_name, qualifier, name, fingerprint)
+
+    def _record_fingerprint(self, qualifier: str, name: str, fingerprint: str) -> None:
+        """Record *fingerprint* as the object's applied or verified desired state."""
+        store = self._fingerprint_store
+        if store is not None:
+            store.record(self._qmgr_name, qualifier, name, fingerprint)
+
     def ensure_qmgr(
         self,
         request_parameters: Mapping[str, object] | None = None,
@@ -153,23 +406,23 @@ class MQRESTEnsureMixin:
         params = dict(request_parameters) if request_parameters else {}
         if not params:
             return EnsureResult(EnsureAction.UNCHANGED)
+        fingerprint = desired_fingerprint("QMGR", params)
+        if self._fingerprint_matches("QMGR", self._qmgr_name, fingerprint):
+            return EnsureResult(EnsureAction.UNCHANGED)
 
         current_objects = self._mqsc_command(
             command="DISPLAY",
             mqsc_qualifier="QMGR",
             name=None,
             request_parameters=None,
-            response_parameters=["all"],
+            response_parameters=self.display_projection("QMGR", params),
         )
 
         current = current_objects[0] if current_objects else {}
-        changed: dict[str, object] = {}
-        for key, desired_value in params.items():
-            current_value = current.get(key)
-            if not _values_match(desired_value, current_value):
-                changed[key] = desired_value
+        changed = _changed_attributes(params, current)
 
         if not changed:
+            self._record_fingerprint("QMGR", self._qmgr_name, fingerprint)
             return EnsureResult(EnsureAction.UNCHANGED)
 
         self._mqsc_command(
@@ -179,6 +432,7 @@ class MQRESTEnsureMixin:
             request_parameters=changed,
             response_parameters=None,
         )
+        self._record_fingerprint("QMGR", self._qmgr_name, fingerprint)
         return EnsureResult(EnsureAction.UPDATED, changed=tuple(changed.keys()))
 
     def ensure_qlocal(
@@ -196,13 +450,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="QUEUE",
-            define_qualifier="QLOCAL",
-            alter_qualifier="QLOCAL",
-        )
+        return self._ensure_object("qlocal", name, request_parameters)
 
     def ensure_qremote(
         self,
@@ -219,13 +467,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="QUEUE",
-            define_qualifier="QREMOTE",
-            alter_qualifier="QREMOTE",
-        )
+        return self._ensure_object("qremote", name, request_parameters)
 
     def ensure_qalias(
         self,
@@ -242,13 +484,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="QUEUE",
-            define_qualifier="QALIAS",
-            alter_qualifier="QALIAS",
-        )
+        return self._ensure_object("qalias", name, request_parameters)
 
     def ensure_qmodel(
         self,
@@ -265,13 +501,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="QUEUE",
-            define_qualifier="QMODEL",
-            alter_qualifier="QMODEL",
-        )
+        return self._ensure_object("qmodel", name, request_parameters)
 
     def ensure_channel(
         self,
@@ -288,13 +518,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="CHANNEL",
-            define_qualifier="CHANNEL",
-            alter_qualifier="CHANNEL",
-        )
+        return self._ensure_object("channel", name, request_parameters)
 
     def ensure_authinfo(
         self,
@@ -311,13 +535,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="AUTHINFO",
-            define_qualifier="AUTHINFO",
-            alter_qualifier="AUTHINFO",
-        )
+        return self._ensure_object("authinfo", name, request_parameters)
 
     def ensure_listener(
         self,
@@ -334,13 +552,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="LISTENER",
-            define_qualifier="LISTENER",
-            alter_qualifier="LISTENER",
-        )
+        return self._ensure_object("listener", name, request_parameters)
 
     def ensure_namelist(
         self,
@@ -357,13 +569,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="NAMELIST",
-            define_qualifier="NAMELIST",
-            alter_qualifier="NAMELIST",
-        )
+        return self._ensure_object("namelist", name, request_parameters)
 
     def ensure_process(
         self,
@@ -380,13 +586,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="PROCESS",
-            define_qualifier="PROCESS",
-            alter_qualifier="PROCESS",
-        )
+        return self._ensure_object("process", name, request_parameters)
 
     def ensure_service(
         self,
@@ -403,13 +603,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="SERVICE",
-            define_qualifier="SERVICE",
-            alter_qualifier="SERVICE",
-        )
+        return self._ensure_object("service", name, request_parameters)
 
     def ensure_topic(
         self,
@@ -426,13 +620,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="TOPIC",
-            define_qualifier="TOPIC",
-            alter_qualifier="TOPIC",
-        )
+        return self._ensure_object("topic", name, request_parameters)
 
     def ensure_sub(
         self,
@@ -449,13 +637,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="SUB",
-            define_qualifier="SUB",
-            alter_qualifier="SUB",
-        )
+        return self._ensure_object("sub", name, request_parameters)
 
     def ensure_stgclass(
         self,
@@ -472,13 +654,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="STGCLASS",
-            define_qualifier="STGCLASS",
-            alter_qualifier="STGCLASS",
-        )
+        return self._ensure_object("stgclass", name, request_parameters)
 
     def ensure_comminfo(
         self,
@@ -495,13 +671,7 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="COMMINFO",
-            define_qualifier="COMMINFO",
-            alter_qualifier="COMMINFO",
-        )
+        return self._ensure_object("comminfo", name, request_parameters)
 
     def ensure_cfstruct(
         self,
@@ -518,13 +688,61 @@ class MQRESTEnsureMixin:
             The :class:`EnsureResult` indicating what action was taken.
 
         """
-        return self._ensure_object(
-            name=name,
-            request_parameters=request_parameters,
-            display_qualifier="CFSTRUCT",
-            define_qualifier="CFSTRUCT",
-            alter_qualifier="CFSTRUCT",
-        )
+        return self._ensure_object("cfstruct", name, request_parameters)
+
+
+def _spec_qualifiers(specs: Sequence[EnsureSpec]) -> list[tuple[str, str, str]]:
+    """Return each spec's (DISPLAY, DEFINE, ALTER) qualifiers, rejecting bad specs."""
+    qualifiers: list[tuple[str, str, str]] = []
+    seen: set[tuple[str, str]] = set()
+    for spec in specs:
+        triple = _ENSURE_QUALIFIERS.get(spec.object_type.strip().lower())
+        if triple is None:
+            message = f"Unsupported ensure object type {spec.object_type!r}."
+            raise ValueError(message)
+        if (triple[0], spec.name) in seen:
+            message = f"Duplicate ensure spec for {triple[0]} {spec.name!r}."
+            raise ValueError(message)
+        seen.add((triple[0], spec.name))
+        qualifiers.append(triple)
+    return qualifiers
+
+
+def _common_prefix(names: Sequence[str]) -> str:
+    """Return the longest prefix shared by all *names*."""
+    shortest, longest = min(names), max(names)
+    length = 0
+    while length < len(shortest) and shortest[length] == longest[length]:
+        length += 1
+    return shortest[:length]
+
+
+def _is_no_match_error(
+    error: MQRESTCommandError,
+    reason_codes: frozenset[int] = _NO_MATCH_REASON_CODES,
+) -> bool:
+    """Check whether a failed ``DISPLAY`` only reports that nothing matched.
+
+    The per-command reason codes are checked when the response carries
+    any, since mqweb reports a generic overall reason code alongside
+    them; otherwise the overall reason code is.
+    """
+    payload = error.payload
+    command_response = payload.get("commandResponse")
+    items = command_response if isinstance(command_response, list) else []
+    codes = [
+        item.get("reasonCode")
+        for item in items
+        if isinstance(item, dict) and (item.get("completionCode") or item.get("reasonCode"))
+    ]
+    if not codes:
+        codes = [payload.get("overallReasonCode")]
+    return all(code in reason_codes for code in codes)
+
+
+def _changed_attributes(params: Mapping[str, object], current: Mapping[str, object]) -> dict[str, object]:
+    """Return the desired attributes whose current values differ."""
+    return {key: value for key, value in params.items() if not _values_match(value, current.get(key))}
 
 
 def _values_match(desired: object, current: object) -> bool:
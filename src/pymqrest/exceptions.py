@@ -5,7 +5,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
+
+    from .ensure import EnsureResult
 
 
 class MQRESTError(Exception):
@@ -123,6 +125,45 @@ class MQRESTCommandError(MQRESTError):
         self.status_code = status_code
 
 
+class MQRESTEnsureError(MQRESTCommandError):
+    """Raised when some commands of an ``ensure_many`` call fail.
+
+    Every other command still runs, so the error carries the outcome of
+    each spec. The payload and status code are those of the first
+    failure in spec order.
+
+    Attributes:
+        results: One entry per spec, in spec order: its
+            :class:`~pymqrest.ensure.EnsureResult`, or ``None`` when its
+            ``DEFINE`` or ``ALTER`` failed.
+        errors: The error of each failed spec, keyed by its index.
+
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        results: Sequence[EnsureResult | None],
+        errors: Mapping[int, MQRESTError],
+    ) -> None:
+        """Initialize with the per-spec results and errors.
+
+        Args:
+            message: Human-readable error description.
+            results: The result of each spec, ``None`` where it failed.
+            errors: The error of each failed spec, keyed by its index.
+
+        """
+        first = errors[min(errors)]
+        if isinstance(first, MQRESTCommandError):
+            super().__init__(message, payload=first.payload, status_code=first.status_code)
+        else:
+            super().__init__(message, payload={})
+        self.results = list(results)
+        self.errors = dict(errors)
+
+
 class MQRESTTimeoutError(MQRESTError):
     """Raised when a synchronous operation exceeds its timeout.
 
@@ -0,0 +1,204 @@
+"""Multi-endpoint routing and failover for highly available mqweb deployments."""
+
+from __future__ import annotations
+
+import enum
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_LATENCY_SMOOTHING = 0.2
+
+
+class EndpointSelection(enum.Enum):
+    """How a session picks among healthy endpoints.
+
+    Attributes:
+        ORDERED: Use the first healthy endpoint in the configured order
+            (active/passive, e.g. a multi-instance queue manager).
+        WEIGHTED: Use the healthy endpoint with the lowest smoothed
+            latency divided by its weight (active/active, e.g. RDQM
+            nodes behind separate mqweb servers).
+
+    """
+
+    ORDERED = "ordered"
+    WEIGHTED = "weighted"
+
+
+@dataclass(frozen=True)
+class RESTEndpoint:
+    """A single mqweb base URL with a routing weight.
+
+    Attributes:
+        url: Base URL of the MQ REST API on this endpoint.
+        weight: Relative preference under
+            :attr:`EndpointSelection.WEIGHTED`. Higher is preferred.
+
+    """
+
+    url: str
+    weight: float = 1.0
+
+
+@dataclass(frozen=True)
+class FailoverConfig:
+    """Failover behaviour for sessions with several endpoints.
+
+    Attributes:
+        selection: The :class:`EndpointSelection` policy.
+        cooldown_seconds: Seconds a failed endpoint is skipped before it
+            is tried again.
+        failover_status_codes: HTTP status codes that cause the command
+            to be retried on the next endpoint.
+
+    """
+
+    selection: EndpointSelection = EndpointSelection.ORDERED
+    cooldown_seconds: float = 30.0
+    failover_status_codes: frozenset[int] = frozenset({502, 503, 504})
+
+
+@dataclass(frozen=True)
+class EndpointHealth:
+    """Point-in-time health of one endpoint.
+
+    Attributes:
+        url: Base URL of the endpoint.
+        weight: The configured routing weight.
+        healthy: Whether the endpoint is currently eligible for routing.
+        consecutive_failures: Failures since the last success.
+        requests: Total requests sent to the endpoint.
+        failures: Total failed requests.
+        latency_seconds: Smoothed request latency, or ``None`` before
+            the first success.
+
+    """
+
+    url: str
+    weight: float
+    healthy: bool
+    consecutive_failures: int
+    requests: int
+    failures: int
+    latency_seconds: float | None
+
+
+class EndpointState:
+    """Mutable routing state for one endpoint.
+
+    Owned by an :class:`EndpointSet`; not intended for direct use.
+    """
+
+    def __init__(self, endpoint: RESTEndpoint, index: int) -> None:
+        """Initialize state for *endpoint* at position *index*."""
+        self.url = endpoint.url.rstrip("/")
+        self.weight = endpoint.weight
+        self.index = index
+        self.down_until = 0.0
+        self.consecutive_failures = 0
+        self.requests = 0
+        self.failures = 0
+        self.latency_seconds: float | None = None
+
+
+class EndpointSet:
+    """Thread-safe set of endpoints with passive health tracking.
+
+    Endpoints that fail are skipped for ``cooldown_seconds`` and then
+    become eligible again. When every endpoint is cooling down, they
+    are still offered as a last resort so that commands keep flowing.
+    """
+
+    def __init__(self, endpoints: Sequence[str | RESTEndpoint], config: FailoverConfig) -> None:
+        """Initialize the set.
+
+        Args:
+            endpoints: Base URLs or :class:`RESTEndpoint` entries, in
+                order of preference.
+            config: The failover configuration.
+
+        Raises:
+            ValueError: If *endpoints* is empty or a weight is not
+                positive.
+
+        """
+        if not endpoints:
+            message = "At least one REST endpoint is required."
+            raise ValueError(message)
+        resolved = [RESTEndpoint(entry) if isinstance(entry, str) else entry for entry in endpoints]
+        if any(endpoint.weight <= 0 for endpoint in resolved):
+            message = "Endpoint weights must be positive."
+            raise ValueError(message)
+        self._config = config
+        self._lock = threading.Lock()
+        self._states = [EndpointState(endpoint, index) for index, endpoint in enumerate(resolved)]
+
+    @property
+    def config(self) -> FailoverConfig:
+        """The failover configuration."""
+        return self._config
+
+    @property
+    def states(self) -> tuple[EndpointState, ...]:
+        """Every endpoint state, in configured order."""
+        return tuple(self._states)
+
+    def candidates(self) -> list[EndpointState]:
+        """Return endpoints in the order they should be tried.
+
+        Returns:
+            Healthy endpoints ranked by the selection policy, followed
+            by cooling-down endpoints in order of recovery.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            available = [state for state in self._states if state.down_until <= now]
+            cooling = sorted(
+                (state for state in self._states if state.down_until > now),
+                key=lambda state: state.down_until,
+            )
+            if self._config.selection is EndpointSelection.WEIGHTED:
+                available.sort(key=lambda state: ((state.latency_seconds or 0.0) / state.weight, state.index))
+        return available + cooling
+
+    def record_success(self, state: EndpointState, latency_seconds: float) -> None:
+        """Mark *state* healthy and fold *latency_seconds* into its average."""
+        with self._lock:
+            state.requests += 1
+            state.consecutive_failures = 0
+            state.down_until = 0.0
+            if state.latency_seconds is None:
+                state.latency_seconds = latency_seconds
+            else:
+                state.latency_seconds += (latency_seconds - state.latency_seconds) * _LATENCY_SMOOTHING
+
+    def record_failure(self, state: EndpointState) -> None:
+        """Mark *state* unhealthy for the configured cooldown."""
+        with self._lock:
+            state.requests += 1
+            state.failures += 1
+            state.consecutive_failures += 1
+            state.down_until = time.monotonic() + self._config.cooldown_seconds
+
+    def health(self) -> list[EndpointHealth]:
+        """Return an :class:`EndpointHealth` snapshot per endpoint."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                EndpointHealth(
+                    url=state.url,
+                    weight=state.weight,
+                    healthy=state.down_until <= now,
+                    consecutive_failures=state.consecutive_failures,
+                    requests=state.requests,
+                    failures=state.failures,
+                    latency_seconds=state.latency_seconds,
+                )
+                for state in self._states
+            ]
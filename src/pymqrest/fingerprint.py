@@ -0,0 +1,214 @@
+"""Fingerprints of applied desired state, letting repeat ensures skip ``DISPLAY``."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Mapping
+    from types import TracebackType
+
+DEFAULT_VERIFY_INTERVAL_SECONDS = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    qmgr_name TEXT NOT NULL,
+    qualifier TEXT NOT NULL,
+    name TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    verified_at REAL NOT NULL,
+    PRIMARY KEY (qmgr_name, qualifier, name)
+) WITHOUT ROWID;
+"""
+
+
+def desired_fingerprint(qualifier: str, request_parameters: Mapping[str, object] | None) -> str:
+    """Return the fingerprint of one object's desired attributes.
+
+    Values are normalized the way ensure compares them (stripped and
+    upper-cased strings), so ``{"max_depth": 5000}`` and
+    ``{"max_depth": "5000"}`` share a fingerprint. Attribute order does
+    not matter.
+
+    Args:
+        qualifier: The ``DEFINE`` qualifier, e.g. ``"QLOCAL"``, so that
+            the same attributes asserted for different object types
+            differ.
+        request_parameters: Desired attributes.
+
+    Returns:
+        A SHA-256 hex digest.
+
+    """
+    attributes = sorted((str(key), str(value).strip().upper()) for key, value in (request_parameters or {}).items())
+    encoded = json.dumps([qualifier.strip().upper(), attributes], separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class FingerprintEntry:
+    """The recorded desired state of one object.
+
+    Attributes:
+        fingerprint: :func:`desired_fingerprint` of the attributes last
+            applied or verified.
+        verified_at: :func:`time.time` at which the fingerprint was
+            recorded.
+
+    """
+
+    fingerprint: str
+    verified_at: float
+
+
+class FingerprintStore:
+    """Records which desired state each object was last brought to.
+
+    Pass a store to :class:`~pymqrest.session.MQRESTSession` as
+    *fingerprint_store*. Each successful ``ensure_*`` call records a
+    fingerprint of its desired attributes; a later call with the same
+    attributes for the same object returns
+    :attr:`~pymqrest.ensure.EnsureAction.UNCHANGED` without a
+    ``DISPLAY``, until *verify_interval_seconds* have passed and the
+    object is checked against the queue manager again.
+
+    Any ``DEFINE``, ``ALTER``, ``DELETE`` or other state-changing
+    command run through a session using the store drops the fingerprint
+    of the object it names. Changes made outside those sessions are
+    found at the next forced verification, or straight away after
+    :meth:`invalidate`.
+
+    Example::
+
+        store = FingerprintStore("fingerprints.db", verify_interval_seconds=900)
+        session = MQRESTSession(url, "QM1", credentials=creds, fingerprint_store=store)
+        session.ensure_qlocal("APP.IN", {"max_queue_depth": 50000})
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = ":memory:",
+        *,
+        verify_interval_seconds: float = DEFAULT_VERIFY_INTERVAL_SECONDS,
+    ) -> None:
+        """Open or create a fingerprint database.
+
+        Args:
+            path: Database file, or ``":memory:"`` for a private
+                in-memory database. ``~`` is expanded.
+            verify_interval_seconds: Age after which a fingerprint no
+                longer spares a ``DISPLAY`` and the object is verified
+                against the queue manager again.
+
+        Raises:
+            ValueError: If *verify_interval_seconds* is not positive.
+
+        """
+        if verify_interval_seconds <= 0:
+            message = "verify_interval_seconds must be positive."
+            raise ValueError(message)
+        database = str(path) if str(path) == ":memory:" else str(Path(path).expanduser())
+        self._verify_interval_seconds = verify_interval_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        """Return the store."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the database."""
+        self.close()
+
+    @property
+    def verify_interval_seconds(self) -> float:
+        """Age after which an object is verified against the queue manager again."""
+        return self._verify_interval_seconds
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def get(self, qmgr_name: str, qualifier: str, name: str) -> FingerprintEntry | None:
+        """Return the recorded entry for one object, or ``None``."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT fingerprint, verified_at FROM fingerprints WHERE qmgr_name = ? AND qualifier = ? AND name = ?",
+                (qmgr_name, qualifier.upper(), name),
+            ).fetchone()
+        if row is None:
+            return None
+        return FingerprintEntry(fingerprint=row[0], verified_at=row[1])
+
+    def matches(self, qmgr_name: str, qualifier: str, name: str, fingerprint: str) -> bool:
+        """Return whether *fingerprint* is recorded for the object and not due for verification."""
+        entry = self.get(qmgr_name, qualifier, name)
+        return (
+            entry is not None
+            and entry.fingerprint == fingerprint
+            and time.time() - entry.verified_at < self._verify_interval_seconds
+        )
+
+    def record(self, qmgr_name: str, qualifier: str, name: str, fingerprint: str) -> None:
+        """Record that the object now holds the desired state *fingerprint*.
+
+        Args:
+            qmgr_name: Queue manager owning the object.
+            qualifier: The object's ``DISPLAY`` qualifier, e.g. ``"QUEUE"``.
+            name: Object name.
+            fingerprint: :func:`desired_fingerprint` of the attributes.
+
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO fingerprints (qmgr_name, qualifier, name, fingerprint, verified_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (qmgr_name, qualifier.upper(), name, fingerprint, time.time()),
+            )
+
+    def invalidate(
+        self,
+        qmgr_name: str | None = None,
+        qualifier: str | None = None,
+        name: str | None = None,
+    ) -> int:
+        """Drop recorded fingerprints so the next ensure verifies the objects.
+
+        Each argument left as ``None`` matches every value, so
+        ``invalidate()`` empties the store and
+        ``invalidate("QM1", "QUEUE")`` drops every queue of ``QM1``.
+
+        Returns:
+            The number of fingerprints dropped.
+
+        """
+        clauses: list[str] = []
+        values: list[str] = []
+        for column, value in (
+            ("qmgr_name", qmgr_name),
+            ("qualifier", None if qualifier is None else qualifier.upper()),
+            ("name", name),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                values.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock, self._connection:
+            cursor = self._connection.execute(f"DELETE FROM fingerprints{where}", values)  # noqa: S608
+        return cursor.rowcount
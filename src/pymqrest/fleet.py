@@ -0,0 +1,497 @@
+"""Concurrent execution of one operation across many queue managers."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .exceptions import MQRESTAuthError, MQRESTTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+    from .ensure import EnsureResult, EnsureSpec
+    from .session import MQRESTSession
+
+DEFAULT_FLEET_WORKERS = 16
+FLEET_QMGR_KEY = "qmgr_name"
+"""Key added to every row returned by :meth:`FleetRun.rows`."""
+
+ERROR_FLEET_DEADLINE = "Queue manager did not answer within the fleet deadline."
+_FLEET_OPERATION = "fleet"
+
+
+@dataclass(frozen=True)
+class FleetResult[T]:
+    """Outcome of a fleet operation on one queue manager.
+
+    Attributes:
+        qmgr_name: The queue manager the operation targeted.
+        value: The operation's return value, or ``None`` if it failed.
+        error: The exception the operation raised, or ``None``.
+        elapsed_seconds: Seconds from the operation's start to its
+            completion or deadline.
+
+    """
+
+    qmgr_name: str
+    value: T | None
+    error: BaseException | None
+    elapsed_seconds: float
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation completed without raising."""
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class FleetRun[T]:
+    """Results of one fleet operation, in session order.
+
+    Attributes:
+        results: One :class:`FleetResult` per session.
+
+    """
+
+    results: tuple[FleetResult[T], ...]
+
+    @property
+    def succeeded(self) -> list[FleetResult[T]]:
+        """Results for queue managers where the operation succeeded."""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> list[FleetResult[T]]:
+        """Results for queue managers where the operation raised or timed out."""
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def errors(self) -> dict[str, BaseException]:
+        """Map of queue manager name to the exception raised for it."""
+        return {result.qmgr_name: result.error for result in self.results if result.error is not None}
+
+    def rows(self) -> list[dict[str, object]]:
+        """Flatten successful results into rows tagged with their queue manager.
+
+        A result that is a list of dicts contributes each dict; a result
+        that is a single dict contributes itself; ``None`` and other
+        values contribute nothing. Each row is copied and gets a
+        ``"qmgr_name"`` key.
+
+        Returns:
+            The tagged rows, in session order.
+
+        """
+        rows: list[dict[str, object]] = []
+        for result in self.succeeded:
+            value: object = result.value
+            items = value if isinstance(value, list) else [value]
+            rows.extend({**item, FLEET_QMGR_KEY: result.qmgr_name} for item in items if isinstance(item, dict))
+        return rows
+
+
+@dataclass(frozen=True)
+class RolloutConfig:
+    """How :meth:`Fleet.rollout` splits a fleet into waves and when it stops.
+
+    Attributes:
+        canary_count: Queue managers in the first wave, taken from the
+            front of the fleet. Any failure among them stops the
+            rollout. ``0`` skips the canary wave.
+        growth_factor: Each later wave is this many times larger than
+            the one before it, rounded up. The first wave after the
+            canaries is *growth_factor* times the canary count (or one
+            queue manager without canaries).
+        max_wave_size: Upper bound on a wave's size, or ``None`` for no
+            bound.
+        max_error_rate: Fraction of the queue managers attempted so far
+            that may fail before the rollout stops. ``0.0`` stops at the
+            first failure.
+        pause_seconds: Time to wait between waves, giving monitoring a
+            chance to notice problems before the next wave starts.
+
+    """
+
+    canary_count: int = 1
+    growth_factor: float = 2.0
+    max_wave_size: int | None = None
+    max_error_rate: float = 0.0
+    pause_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class RolloutRun:
+    """Results of :meth:`Fleet.rollout`.
+
+    Attributes:
+        waves: One :class:`FleetRun` per wave that ran, in wave order.
+            Each result's value is the list of
+            :class:`~pymqrest.ensure.EnsureResult` returned by
+            :meth:`~pymqrest.ensure.MQRESTEnsureMixin.ensure_many`.
+            When some of a queue manager's commands failed, its error is
+            an :class:`~pymqrest.exceptions.MQRESTEnsureError` holding
+            the outcome of every spec.
+        skipped: Names of the queue managers left untouched because the
+            rollout stopped.
+
+    """
+
+    waves: tuple[FleetRun[list[EnsureResult]], ...]
+    skipped: tuple[str, ...]
+
+    @property
+    def halted(self) -> bool:
+        """Whether the rollout stopped before reaching every queue manager."""
+        return bool(self.skipped)
+
+    @property
+    def results(self) -> tuple[FleetResult[list[EnsureResult]], ...]:
+        """Every attempted queue manager's result, in rollout order."""
+        return tuple(result for wave in self.waves for result in wave.results)
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of the attempted queue managers that failed."""
+        results = self.results
+        if not results:
+            return 0.0
+        return sum(1 for result in results if not result.ok) / len(results)
+
+
+@dataclass(frozen=True)
+class FleetBootstrap:
+    """Outcome of :meth:`Fleet.bootstrap`.
+
+    Attributes:
+        fleet: A :class:`Fleet` of every session that was built.
+        failures: Map of target name to the exception raised while
+            building its session.
+
+    """
+
+    fleet: Fleet
+    failures: dict[str, BaseException]
+
+    @property
+    def auth_failures(self) -> dict[str, MQRESTAuthError]:
+        """The failures caused by rejected credentials."""
+        return {name: error for name, error in self.failures.items() if isinstance(error, MQRESTAuthError)}
+
+
+class Fleet:
+    """Runs the same operation concurrently against many sessions.
+
+    Operations run on a bounded thread pool, so a sweep takes roughly
+    as long as the slowest queue manager rather than the sum of all of
+    them. A failing or slow queue manager never fails the whole run:
+    its :class:`FleetResult` carries the error instead.
+
+    Example::
+
+        fleet = Fleet(sessions, timeout_seconds=10)
+        run = fleet.run(lambda session: session.display_queue("APP.*"))
+        for row in run.rows():
+            print(row["qmgr_name"], row["queue_name"])
+        for qmgr_name, error in run.errors.items():
+            print(qmgr_name, error)
+    """
+
+    def __init__(
+        self,
+        sessions: Iterable[MQRESTSession],
+        *,
+        max_workers: int = DEFAULT_FLEET_WORKERS,
+        timeout_seconds: float | None = None,
+    ) -> None:
+        """Initialize the fleet.
+
+        Args:
+            sessions: The sessions to run operations against.
+            max_workers: Maximum number of operations running at once,
+                not counting those abandoned past their deadline.
+            timeout_seconds: Default per-queue-manager deadline, measured
+                from when that queue manager's operation starts, or
+                ``None`` for no deadline.
+
+        Raises:
+            ValueError: If *max_workers* is less than 1.
+
+        """
+        if max_workers < 1:
+            message = "max_workers must be at least 1."
+            raise ValueError(message)
+        self._sessions = tuple(sessions)
+        self._max_workers = max_workers
+        self._timeout_seconds = timeout_seconds
+
+    @classmethod
+    def bootstrap(
+        cls,
+        factories: Mapping[str, Callable[[], MQRESTSession]],
+        *,
+        max_workers: int = DEFAULT_FLEET_WORKERS,
+        login_interval_seconds: float = 0.0,
+        timeout_seconds: float | None = None,
+    ) -> FleetBootstrap:
+        """Build sessions concurrently and return them as a fleet.
+
+        Building an :class:`~pymqrest.auth.LTPAAuth` session performs a
+        blocking login, so building hundreds one after another makes
+        startup slow. ``bootstrap`` runs the factories on a bounded
+        thread pool and starts them at most once per
+        *login_interval_seconds*, spreading logins over time instead of
+        sending them to mqweb in one burst. Factories that share an
+        :class:`~pymqrest.auth.LTPATokenCache` log in once per endpoint.
+
+        Args:
+            factories: Map of target name to a callable building its
+                session, e.g. a :func:`functools.partial` of
+                :class:`~pymqrest.session.MQRESTSession`.
+            max_workers: Maximum number of sessions built at once, and
+                the resulting fleet's worker limit.
+            login_interval_seconds: Minimum spacing between factory
+                starts. ``0`` starts them as fast as workers allow.
+            timeout_seconds: Default per-queue-manager deadline of the
+                resulting fleet.
+
+        Returns:
+            A :class:`FleetBootstrap` with the fleet of built sessions,
+            in factory order, and the failures keyed by target name.
+
+        Raises:
+            ValueError: If *max_workers* is less than 1.
+
+        """
+        if max_workers < 1:
+            message = "max_workers must be at least 1."
+            raise ValueError(message)
+        pacer = _StartPacer(login_interval_seconds)
+
+        def build(factory: Callable[[], MQRESTSession]) -> MQRESTSession:
+            pacer.wait()
+            return factory()
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, max(len(factories), 1)),
+            thread_name_prefix="pymqrest-bootstrap",
+        ) as executor:
+            futures = {name: executor.submit(build, factory) for name, factory in factories.items()}
+            wait(futures.values())
+        sessions = [future.result() for future in futures.values() if future.exception() is None]
+        failures = {name: error for name, future in futures.items() if (error := future.exception()) is not None}
+        fleet = cls(sessions, max_workers=max_workers, timeout_seconds=timeout_seconds)
+        return FleetBootstrap(fleet=fleet, failures=failures)
+
+    @property
+    def sessions(self) -> tuple[MQRESTSession, ...]:
+        """The sessions in this fleet."""
+        return self._sessions
+
+    def run[T](
+        self,
+        operation: Callable[[MQRESTSession], T],
+        *,
+        timeout_seconds: float | None = None,
+    ) -> FleetRun[T]:
+        """Run *operation* against every session concurrently.
+
+        An operation that outlives its deadline is reported as a
+        :class:`~pymqrest.exceptions.MQRESTTimeoutError`; its thread is
+        left to finish in the background and its result is discarded.
+        Its worker slot passes to the next queue manager straight away,
+        so with a deadline the run takes at most one deadline per
+        *max_workers* queue managers, although abandoned threads then
+        add to the threads running at once.
+
+        Args:
+            operation: Callable receiving one session.
+            timeout_seconds: Per-queue-manager deadline overriding the
+                fleet default.
+
+        Returns:
+            A :class:`FleetRun` with one result per session.
+
+        """
+        deadline = timeout_seconds if timeout_seconds is not None else self._timeout_seconds
+        started: dict[int, float] = {}
+        results: dict[int, FleetResult[T]] = {}
+
+        def execute(index: int, session: MQRESTSession) -> T:
+            started[index] = time.monotonic()
+            return operation(session)
+
+        queued = deque(enumerate(self._sessions))
+        futures: dict[Future[T], int] = {}
+        pending: set[Future[T]] = set()
+        executor = ThreadPoolExecutor(max_workers=max(len(self._sessions), 1), thread_name_prefix="pymqrest-fleet")
+        try:
+            while queued or pending:
+                while queued and len(pending) < self._max_workers:
+                    index, session = queued.popleft()
+                    future = executor.submit(execute, index, session)
+                    futures[future] = index
+                    pending.add(future)
+                done, pending = wait(
+                    pending, timeout=_next_wait(started, pending, futures, deadline), return_when=FIRST_COMPLETED
+                )
+                now = time.monotonic()
+                for future in done:
+                    index = futures[future]
+                    results[index] = self._complete(index, future, now - started[index])
+                if deadline is None:
+                    continue
+                for future in list(pending):
+                    index = futures[future]
+                    if index in started and now - started[index] >= deadline:
+                        pending.discard(future)
+                        results[index] = self._timed_out(index, now - started[index])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return FleetRun(results=tuple(results[index] for index in range(len(self._sessions))))
+
+    def rollout(
+        self,
+        specs: Sequence[EnsureSpec],
+        *,
+        config: RolloutConfig | None = None,
+        timeout_seconds: float | None = None,
+    ) -> RolloutRun:
+        """Apply one desired state to the fleet in waves, canaries first.
+
+        Every queue manager runs
+        :meth:`~pymqrest.ensure.MQRESTEnsureMixin.ensure_many` with
+        *specs*. Sessions are taken in fleet order: the first
+        *canary_count* form the canary wave, and later waves grow by
+        *growth_factor*. Each wave runs like :meth:`run`, with at most
+        *max_workers* queue managers in flight, and must finish before
+        the next one starts. After a wave, the rollout stops if a
+        canary failed or the error rate over every queue manager
+        attempted so far exceeds *max_error_rate*.
+
+        Args:
+            specs: Desired state of each object, applied to every queue
+                manager.
+            config: Wave sizes and stop conditions. Defaults to
+                :class:`RolloutConfig`.
+            timeout_seconds: Per-queue-manager deadline overriding the
+                fleet default.
+
+        Returns:
+            A :class:`RolloutRun` with each wave's results and the
+            queue managers skipped after a stop.
+
+        Raises:
+            ValueError: If *config* has an invalid value.
+
+        """
+        rollout_config = config if config is not None else RolloutConfig()
+        _validate_rollout_config(rollout_config)
+        spec_list = list(specs)
+
+        def apply(session: MQRESTSession) -> list[EnsureResult]:
+            return session.ensure_many(spec_list)
+
+        waves: list[FleetRun[list[EnsureResult]]] = []
+        start = 0
+        failures = 0
+        for size in _wave_sizes(len(self._sessions), rollout_config):
+            if waves and rollout_config.pause_seconds > 0:
+                time.sleep(rollout_config.pause_seconds)
+            wave = Fleet(
+                self._sessions[start : start + size],
+                max_workers=self._max_workers,
+                timeout_seconds=self._timeout_seconds,
+            ).run(apply, timeout_seconds=timeout_seconds)
+            waves.append(wave)
+            start += size
+            failures += len(wave.failed)
+            canary_failed = len(waves) == 1 and rollout_config.canary_count > 0 and failures > 0
+            if canary_failed or failures / start > rollout_config.max_error_rate:
+                break
+        skipped = tuple(session.qmgr_name for session in self._sessions[start:])
+        return RolloutRun(waves=tuple(waves), skipped=skipped)
+
+    def _complete[T](self, index: int, future: Future[T], elapsed: float) -> FleetResult[T]:
+        qmgr_name = self._sessions[index].qmgr_name
+        error = future.exception()
+        if error is not None:
+            return FleetResult(qmgr_name=qmgr_name, value=None, error=error, elapsed_seconds=elapsed)
+        return FleetResult(qmgr_name=qmgr_name, value=future.result(), error=None, elapsed_seconds=elapsed)
+
+    def _timed_out[T](self, index: int, elapsed: float) -> FleetResult[T]:
+        qmgr_name = self._sessions[index].qmgr_name
+        error = MQRESTTimeoutError(ERROR_FLEET_DEADLINE, name=qmgr_name, operation=_FLEET_OPERATION, elapsed=elapsed)
+        return FleetResult(qmgr_name=qmgr_name, value=None, error=error, elapsed_seconds=elapsed)
+
+
+def _wave_sizes(total: int, config: RolloutConfig) -> list[int]:
+    sizes: list[int] = []
+    canaries = min(config.canary_count, total)
+    if canaries:
+        sizes.append(canaries)
+    size = max(canaries, 1)
+    placed = canaries
+    while placed < total:
+        if sizes:
+            size = math.ceil(size * config.growth_factor)
+        if config.max_wave_size is not None:
+            size = min(size, config.max_wave_size)
+        sizes.append(min(size, total - placed))
+        placed += sizes[-1]
+    return sizes
+
+
+def _validate_rollout_config(config: RolloutConfig) -> None:
+    if config.canary_count < 0:
+        message = "canary_count must not be negative."
+        raise ValueError(message)
+    if config.growth_factor < 1:
+        message = "growth_factor must be at least 1."
+        raise ValueError(message)
+    if config.max_wave_size is not None and config.max_wave_size < 1:
+        message = "max_wave_size must be at least 1."
+        raise ValueError(message)
+    if not 0 <= config.max_error_rate <= 1:
+        message = "max_error_rate must be between 0 and 1."
+        raise ValueError(message)
+    if config.pause_seconds < 0:
+        message = "pause_seconds must not be negative."
+        raise ValueError(message)
+
+
+class _StartPacer:
+    def __init__(self, interval_seconds: float) -> None:
+        self._interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._next_start: float | None = None
+
+    def wait(self) -> None:
+        if self._interval_seconds <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = now if self._next_start is None else max(now, self._next_start)
+            self._next_start = start + self._interval_seconds
+        if start > now:
+            time.sleep(start - now)
+
+
+def _next_wait[T](
+    started: dict[int, float],
+    pending: set[Future[T]],
+    futures: dict[Future[T], int],
+    deadline: float | None,
+) -> float | None:
+    if deadline is None:
+        return None
+    now = time.monotonic()
+    remaining = [started[futures[future]] + deadline - now for future in pending if futures[future] in started]
+    if not remaining:
+        return deadline
+    return max(min(remaining), 0.0)
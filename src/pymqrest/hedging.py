@@ -0,0 +1,219 @@
+"""Per-command latency tracking and hedged requests for read-only commands."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+READ_ONLY_COMMANDS: frozenset[str] = frozenset({"DISPLAY"})
+"""MQSC verbs eligible for hedging. Commands that change state never are."""
+
+DEFAULT_LATENCY_WINDOW = 256
+
+
+@dataclass(frozen=True)
+class HedgeConfig:
+    """Configuration for hedged read-only requests.
+
+    When a read-only command has not answered within the hedge delay, a
+    duplicate request is sent and the first successful response wins.
+    The delay is the configured percentile of the latencies the session
+    has recorded for the same command, so it adapts to each command's
+    normal behaviour.
+
+    Attributes:
+        percentile: Latency percentile, between ``0`` and ``1``, after
+            which a duplicate request is sent.
+        min_samples: Samples required before the percentile is trusted.
+            Until then *initial_delay_seconds* is used.
+        initial_delay_seconds: Hedge delay used while fewer than
+            *min_samples* latencies have been recorded.
+        min_delay_seconds: Lower bound for the hedge delay.
+        max_delay_seconds: Upper bound for the hedge delay, or ``None``
+            for no upper bound.
+        max_workers: Maximum number of hedges in flight at once per
+            session. Primary requests are not counted against it.
+
+    """
+
+    percentile: float = 0.95
+    min_samples: int = 20
+    initial_delay_seconds: float = 1.0
+    min_delay_seconds: float = 0.05
+    max_delay_seconds: float | None = None
+    max_workers: int = 8
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Latency summary for a single MQSC command.
+
+    Attributes:
+        command: The command key (e.g. ``"DISPLAY QUEUE"``).
+        count: Requests recorded since the session was created.
+        hedged: Requests for which a hedge was sent.
+        p50_seconds: Median latency over the recent window.
+        p95_seconds: 95th percentile latency over the recent window.
+        p99_seconds: 99th percentile latency over the recent window.
+        max_seconds: Highest latency over the recent window.
+
+    """
+
+    command: str
+    count: int
+    hedged: int
+    p50_seconds: float
+    p95_seconds: float
+    p99_seconds: float
+    max_seconds: float
+
+
+class LatencyTracker:
+    """Thread-safe sliding-window latency recorder keyed by command."""
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW) -> None:
+        """Initialize the tracker.
+
+        Args:
+            window: Number of recent samples kept per command.
+
+        """
+        self._window = window
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._hedged: dict[str, int] = {}
+
+    def record(self, command: str, seconds: float) -> None:
+        """Record one request latency for *command*."""
+        with self._lock:
+            samples = self._samples.get(command)
+            if samples is None:
+                samples = deque(maxlen=self._window)
+                self._samples[command] = samples
+            samples.append(seconds)
+            self._counts[command] = self._counts.get(command, 0) + 1
+
+    def record_hedge(self, command: str) -> None:
+        """Count one hedge sent for *command*."""
+        with self._lock:
+            self._hedged[command] = self._hedged.get(command, 0) + 1
+
+    def sample_count(self, command: str) -> int:
+        """Return the number of samples currently held for *command*."""
+        with self._lock:
+            return len(self._samples.get(command, ()))
+
+    def percentile(self, command: str, fraction: float) -> float | None:
+        """Return the *fraction* percentile latency, or ``None`` without samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(command, ()))
+        if not samples:
+            return None
+        return _nearest_rank(samples, fraction)
+
+    def stats(self) -> dict[str, LatencyStats]:
+        """Return a :class:`LatencyStats` summary per command."""
+        with self._lock:
+            snapshot = {command: sorted(samples) for command, samples in self._samples.items()}
+            counts = dict(self._counts)
+            hedged = dict(self._hedged)
+        return {
+            command: LatencyStats(
+                command=command,
+                count=counts[command],
+                hedged=hedged.get(command, 0),
+                p50_seconds=_nearest_rank(samples, 0.50),
+                p95_seconds=_nearest_rank(samples, 0.95),
+                p99_seconds=_nearest_rank(samples, 0.99),
+                max_seconds=samples[-1],
+            )
+            for command, samples in snapshot.items()
+        }
+
+
+def hedge_delay_seconds(config: HedgeConfig, tracker: LatencyTracker, command: str) -> float:
+    """Return how long to wait for *command* before sending a hedge.
+
+    Args:
+        config: The hedging configuration.
+        tracker: The session's latency tracker.
+        command: The command key.
+
+    Returns:
+        The hedge delay in seconds, clamped to the configured bounds.
+
+    """
+    observed = None
+    if tracker.sample_count(command) >= config.min_samples:
+        observed = tracker.percentile(command, config.percentile)
+    delay = config.initial_delay_seconds if observed is None else observed
+    delay = max(delay, config.min_delay_seconds)
+    if config.max_delay_seconds is not None:
+        delay = min(delay, config.max_delay_seconds)
+    return delay
+
+
+class _HedgeExecutor:
+    """Threads sending the primary and hedge requests of one session.
+
+    Each primary request runs on a thread of its own, so concurrent
+    commands are never queued behind each other and a hedge delay is
+    counted from the moment the primary is actually sent. Only hedges
+    run on the bounded pool, which is created on first use and released
+    by :meth:`shutdown`.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def send_primary[T](self, call: Callable[[], T]) -> Future[T]:
+        future: Future[T] = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(call())
+            except BaseException as error:  # noqa: BLE001
+                future.set_exception(error)
+
+        threading.Thread(target=run, name="pymqrest-primary", daemon=True).start()
+        return future
+
+    def send_hedge[T](self, call: Callable[[], T]) -> Future[T]:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="pymqrest-hedge")
+            return self._pool.submit(call)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def validate_hedge_config(config: HedgeConfig) -> None:
+    """Raise ``ValueError`` if *config* is not usable."""
+    if not 0 < config.percentile < 1:
+        message = "percentile must be between 0 and 1."
+        raise ValueError(message)
+    if config.min_samples < 1:
+        message = "min_samples must be at least 1."
+        raise ValueError(message)
+    if config.max_workers < 1:
+        message = "max_workers must be at least 1."
+        raise ValueError(message)
+
+
+def _nearest_rank(sorted_samples: list[float], fraction: float) -> float:
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
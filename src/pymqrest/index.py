@@ -0,0 +1,188 @@
+"""Local name index answering existence and pattern queries without mqweb."""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from .inventory import _display, _require_list_display, object_name_attribute
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from .session import MQRESTSession
+
+DEFAULT_INDEX_QUALIFIERS: tuple[str, ...] = ("QUEUE",)
+_GENERIC_SUFFIX = "*"
+
+
+class NameIndex:
+    """Holds the object names of selected qualifiers for one queue manager.
+
+    Names are loaded with one ``DISPLAY <qualifier>(*)`` per qualifier,
+    requesting no attributes beyond the defaults mqweb always returns,
+    and kept as a sorted list and a set. :meth:`exists`,
+    :meth:`missing` and :meth:`names` then answer locally, so checking
+    thousands of names costs one round trip per qualifier instead of
+    one per name.
+
+    A qualifier is loaded on first use and reloaded by :meth:`refresh`,
+    after :meth:`invalidate`, or once *ttl_seconds* have passed. Keep
+    the index in step with your own changes by calling :meth:`add` and
+    :meth:`discard` after ``DEFINE`` and ``DELETE``.
+
+    Example::
+
+        index = NameIndex(session, ["QUEUE", "CHANNEL"])
+        to_define = index.missing("QUEUE", wanted_queue_names)
+        app_queues = index.names("QUEUE", "APP.*")
+    """
+
+    def __init__(
+        self,
+        session: MQRESTSession,
+        qualifiers: Iterable[str] = DEFAULT_INDEX_QUALIFIERS,
+        *,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            session: Session of the queue manager to index.
+            qualifiers: MQSC qualifiers to index, each with a
+                ``display_*`` method listing objects by name.
+            ttl_seconds: Reload a qualifier's names once they are this
+                old, or ``None`` to keep them until refreshed or
+                invalidated.
+
+        Raises:
+            ValueError: If a qualifier cannot be listed by name, or
+                *ttl_seconds* is not positive.
+
+        """
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            message = "ttl_seconds must be positive."
+            raise ValueError(message)
+        self._session = session
+        self._qualifiers = tuple(qualifier.strip().upper() for qualifier in qualifiers)
+        for qualifier in self._qualifiers:
+            _require_list_display(qualifier)
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._sorted: dict[str, list[str]] = {}
+        self._members: dict[str, set[str]] = {}
+        self._loaded_at: dict[str, float] = {}
+
+    @property
+    def qualifiers(self) -> tuple[str, ...]:
+        """The indexed qualifiers."""
+        return self._qualifiers
+
+    def refresh(self, qualifier: str | None = None) -> None:
+        """Reload names now, for one qualifier or all of them."""
+        for item in self._select(qualifier):
+            self._load(item)
+
+    def invalidate(self, qualifier: str | None = None) -> None:
+        """Drop names so the next query reloads them."""
+        with self._lock:
+            for item in self._select(qualifier):
+                self._sorted.pop(item, None)
+                self._members.pop(item, None)
+                self._loaded_at.pop(item, None)
+
+    def exists(self, qualifier: str, name: str) -> bool:
+        """Return whether an object named *name* exists."""
+        return name in self._names_of(qualifier)[1]
+
+    def missing(self, qualifier: str, names: Iterable[str]) -> list[str]:
+        """Return the names in *names* that do not exist, in input order."""
+        members = self._names_of(qualifier)[1]
+        return [name for name in names if name not in members]
+
+    def names(self, qualifier: str, pattern: str | None = None) -> list[str]:
+        """Return the sorted names matching *pattern*.
+
+        Args:
+            qualifier: The indexed qualifier.
+            pattern: ``None`` for every name, an MQSC generic name with
+                a single trailing ``*`` (answered by binary search), or
+                any :mod:`fnmatch` pattern.
+
+        Returns:
+            The matching names in sorted order.
+
+        """
+        ordered = self._names_of(qualifier)[0]
+        if pattern is None:
+            return list(ordered)
+        prefix = pattern.removesuffix(_GENERIC_SUFFIX)
+        if not any(character in prefix for character in "*?["):
+            if not pattern.endswith(_GENERIC_SUFFIX):
+                return [pattern] if _contains(ordered, pattern) else []
+            start = bisect.bisect_left(ordered, prefix)
+            end = start
+            while end < len(ordered) and ordered[end].startswith(prefix):
+                end += 1
+            return ordered[start:end]
+        return [name for name in ordered if fnmatch.fnmatchcase(name, pattern)]
+
+    def add(self, qualifier: str, name: str) -> None:
+        """Record that *name* was defined, if the qualifier is loaded."""
+        qualifier_upper = self._require(qualifier)
+        with self._lock:
+            members = self._members.get(qualifier_upper)
+            if members is None or name in members:
+                return
+            members.add(name)
+            bisect.insort(self._sorted[qualifier_upper], name)
+
+    def discard(self, qualifier: str, name: str) -> None:
+        """Record that *name* was deleted, if the qualifier is loaded."""
+        qualifier_upper = self._require(qualifier)
+        with self._lock:
+            members = self._members.get(qualifier_upper)
+            if members is None or name not in members:
+                return
+            members.discard(name)
+            self._sorted[qualifier_upper].remove(name)
+
+    def _names_of(self, qualifier: str) -> tuple[list[str], set[str]]:
+        qualifier_upper = self._require(qualifier)
+        with self._lock:
+            loaded_at = self._loaded_at.get(qualifier_upper)
+            fresh = loaded_at is not None and (
+                self._ttl_seconds is None or time.monotonic() - loaded_at < self._ttl_seconds
+            )
+            if fresh:
+                return self._sorted[qualifier_upper], self._members[qualifier_upper]
+        return self._load(qualifier_upper)
+
+    def _load(self, qualifier: str) -> tuple[list[str], set[str]]:
+        name_key = self._session.response_key(qualifier, object_name_attribute(qualifier))
+        rows = _display(self._session, qualifier)("*", response_parameters=[])
+        ordered = sorted({str(row[name_key]) for row in rows if name_key in row})
+        members = set(ordered)
+        with self._lock:
+            self._sorted[qualifier] = ordered
+            self._members[qualifier] = members
+            self._loaded_at[qualifier] = time.monotonic()
+        return ordered, members
+
+    def _select(self, qualifier: str | None) -> Sequence[str]:
+        return self._qualifiers if qualifier is None else (self._require(qualifier),)
+
+    def _require(self, qualifier: str) -> str:
+        qualifier_upper = qualifier.strip().upper()
+        if qualifier_upper not in self._qualifiers:
+            message = f"Qualifier {qualifier_upper!r} is not indexed."
+            raise KeyError(message)
+        return qualifier_upper
+
+
+def _contains(ordered: list[str], name: str) -> bool:
+    position = bisect.bisect_left(ordered, name)
+    return position < len(ordered) and ordered[position] == name
@@ -0,0 +1,412 @@
+"""In-memory object inventory refreshed ahead of staleness in the background."""
+
+from __future__ import annotations
+
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self, cast
+
+from .cache import qualifier_family
+from .exceptions import MQRESTCommandError
+from .session import MQRESTSession
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+    from types import TracebackType
+
+DEFAULT_INVENTORY_QUALIFIERS: tuple[str, ...] = ("QUEUE", "CHANNEL")
+DEFAULT_INVENTORY_TTL_SECONDS = 300.0
+DEFAULT_INVENTORY_WORKERS = 4
+
+_ALTERATION_DATE = "ALTDATE"
+_ALTERATION_TIME = "ALTTIME"
+_ALL_ATTRIBUTES = "all"
+
+type AlterationStamp = tuple[object, object]
+
+type InventoryKey = tuple[str, str]
+"""``(qmgr_name, qualifier)`` identifying one inventory entry."""
+
+
+@dataclass(frozen=True)
+class InventoryConfig:
+    """What an :class:`Inventory` holds and how often it is refreshed.
+
+    Attributes:
+        qualifiers: MQSC qualifiers loaded for every queue manager, each
+            with ``DISPLAY <qualifier>(*)``.
+        ttl_seconds: Age after which an entry counts as stale.
+        refresh_ahead: Fraction of *ttl_seconds* after which an entry
+            is refreshed, so it is replaced before it goes stale.
+        retry_seconds: Delay before a failed refresh is retried. The
+            entry keeps serving its last loaded objects meanwhile.
+        max_workers: Maximum number of refreshes running at once.
+        response_parameters: Attributes requested for every object, or
+            ``None`` for all of them.
+        incremental: Refresh by listing object names with ``ALTDATE``
+            and ``ALTTIME`` only, then fetching full attributes just for
+            new and altered objects and dropping deleted ones. The
+            first load of an entry is always a full load.
+        max_incremental_fetches: Most objects an incremental refresh
+            fetches one by one; when more have changed, the entry is
+            reloaded in full instead.
+
+    """
+
+    qualifiers: Sequence[str] = DEFAULT_INVENTORY_QUALIFIERS
+    ttl_seconds: float = DEFAULT_INVENTORY_TTL_SECONDS
+    refresh_ahead: float = 0.8
+    retry_seconds: float = 10.0
+    max_workers: int = DEFAULT_INVENTORY_WORKERS
+    response_parameters: Sequence[str] | None = None
+    incremental: bool = False
+    max_incremental_fetches: int = 100
+
+
+@dataclass(frozen=True)
+class InventoryEntry:
+    """The objects of one qualifier on one queue manager.
+
+    Attributes:
+        qmgr_name: The queue manager the objects were read from.
+        qualifier: The MQSC qualifier, e.g. ``"QUEUE"``.
+        objects: Map of object name to its attributes. Treat as
+            read-only.
+        refreshed_at: :func:`time.monotonic` time of the last successful
+            load, or ``None`` before the first one.
+        error: The exception raised by the last refresh, or ``None`` if
+            it succeeded.
+
+    """
+
+    qmgr_name: str
+    qualifier: str
+    objects: Mapping[str, Mapping[str, object]]
+    refreshed_at: float | None
+    error: BaseException | None
+
+    @property
+    def age_seconds(self) -> float | None:
+        """Seconds since the last successful load, or ``None`` before it."""
+        if self.refreshed_at is None:
+            return None
+        return time.monotonic() - self.refreshed_at
+
+
+class Inventory:
+    """Keeps the definitions of selected qualifiers in memory for many queue managers.
+
+    Reads never touch mqweb: :meth:`get` and :meth:`objects` answer from
+    the last loaded snapshot, and :attr:`InventoryEntry.age_seconds`
+    says how old it is. A background thread reloads each entry once it
+    is ``refresh_ahead * ttl_seconds`` old, so a healthy entry is always
+    younger than ``ttl_seconds``. A failed reload keeps the previous
+    objects, records the error and is retried after ``retry_seconds``.
+
+    Example::
+
+        with Inventory(sessions, InventoryConfig(qualifiers=["QUEUE"])) as inventory:
+            queue = inventory.get("QM1", "QUEUE", "APP.IN")
+            age = inventory.entry("QM1", "QUEUE").age_seconds
+    """
+
+    def __init__(self, sessions: Iterable[MQRESTSession], config: InventoryConfig | None = None) -> None:
+        """Initialize an empty inventory.
+
+        Args:
+            sessions: Sessions of the queue managers to hold, keyed by
+                their :attr:`~pymqrest.session.MQRESTSession.qmgr_name`.
+            config: What to load and when. Defaults to
+                :class:`InventoryConfig` defaults.
+
+        Raises:
+            ValueError: If a qualifier has no ``display_*`` method
+                listing objects by name, or *ttl_seconds*,
+                *refresh_ahead*, *retry_seconds* or *max_workers* is
+                out of range.
+
+        """
+        self._config = config or InventoryConfig()
+        _validate_inventory_config(self._config)
+        self._sessions = {session.qmgr_name: session for session in sessions}
+        self._qualifiers = tuple(qualifier.strip().upper() for qualifier in self._config.qualifiers)
+        for qualifier in self._qualifiers:
+            _require_list_display(qualifier)
+        self._lock = threading.Lock()
+        self._entries: dict[InventoryKey, InventoryEntry] = {
+            (qmgr_name, qualifier): InventoryEntry(qmgr_name, qualifier, {}, None, None)
+            for qmgr_name in self._sessions
+            for qualifier in self._qualifiers
+        }
+        self._due_at: dict[InventoryKey, float] = dict.fromkeys(self._entries, 0.0)
+        self._stamps: dict[InventoryKey, dict[str, AlterationStamp]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def config(self) -> InventoryConfig:
+        """The inventory configuration."""
+        return self._config
+
+    def __enter__(self) -> Self:
+        """Load every entry and start background refresh."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop background refresh."""
+        self.stop()
+
+    def start(self, *, load: bool = True) -> None:
+        """Start the background refresh thread.
+
+        Args:
+            load: Load every entry before returning, so the first reads
+                are served from memory. When ``False``, entries are
+                loaded by the background thread.
+
+        """
+        if load:
+            self.refresh()
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="pymqrest-inventory", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout_seconds: float | None = None) -> None:
+        """Stop the background refresh thread and wait for it to exit."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join(timeout_seconds)
+
+    def entry(self, qmgr_name: str, qualifier: str) -> InventoryEntry:
+        """Return the entry for one queue manager and qualifier.
+
+        Raises:
+            KeyError: If the inventory does not hold that pair.
+
+        """
+        with self._lock:
+            return self._entries[(qmgr_name, qualifier.upper())]
+
+    def entries(self) -> list[InventoryEntry]:
+        """Return every entry, ordered by queue manager and qualifier."""
+        with self._lock:
+            return [self._entries[key] for key in sorted(self._entries)]
+
+    def get(self, qmgr_name: str, qualifier: str, name: str) -> dict[str, object] | None:
+        """Return a copy of one object's attributes, or ``None`` if it is not held.
+
+        Raises:
+            KeyError: If the inventory does not hold the queue manager
+                and qualifier.
+
+        """
+        found = self.entry(qmgr_name, qualifier).objects.get(name)
+        return None if found is None else dict(found)
+
+    def objects(self, qmgr_name: str, qualifier: str) -> list[dict[str, object]]:
+        """Return copies of every object held for one queue manager and qualifier.
+
+        Raises:
+            KeyError: If the inventory does not hold the queue manager
+                and qualifier.
+
+        """
+        return [dict(item) for item in self.entry(qmgr_name, qualifier).objects.values()]
+
+    def refresh(self, qmgr_name: str | None = None, qualifier: str | None = None) -> list[InventoryEntry]:
+        """Reload entries now, blocking until they are loaded.
+
+        Args:
+            qmgr_name: Reload only this queue manager's entries.
+            qualifier: Reload only this qualifier's entries.
+
+        Returns:
+            The reloaded entries.
+
+        """
+        qualifier_upper = None if qualifier is None else qualifier.upper()
+        keys = [key for key in self._entries if qmgr_name in (None, key[0]) and qualifier_upper in (None, key[1])]
+        return self._refresh_keys(keys)
+
+    def refresh_due(self) -> list[InventoryEntry]:
+        """Reload the entries whose refresh time has come.
+
+        This is what the background thread runs; call it directly to
+        drive refreshes from your own scheduler instead.
+
+        Returns:
+            The reloaded entries.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            keys = [key for key, due_at in self._due_at.items() if due_at <= now]
+        return self._refresh_keys(keys)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.refresh_due()
+            self._stop.wait(self._seconds_until_due())
+
+    def _seconds_until_due(self) -> float:
+        with self._lock:
+            next_due = min(self._due_at.values(), default=None)
+        if next_due is None:
+            return self._config.retry_seconds
+        return max(next_due - time.monotonic(), 0.0)
+
+    def _refresh_keys(self, keys: Sequence[InventoryKey]) -> list[InventoryEntry]:
+        if not keys:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(self._config.max_workers, len(keys)),
+            thread_name_prefix="pymqrest-inventory-refresh",
+        ) as executor:
+            return list(executor.map(self._refresh_key, keys))
+
+    def _refresh_key(self, key: InventoryKey) -> InventoryEntry:
+        qmgr_name, qualifier = key
+        try:
+            objects = self._load_incremental(key) if self._config.incremental else self._load_full(key)
+        except Exception as error:  # noqa: BLE001 - any failure keeps serving the previous snapshot
+            with self._lock:
+                previous = self._entries[key]
+                entry = InventoryEntry(qmgr_name, qualifier, previous.objects, previous.refreshed_at, error)
+                self._entries[key] = entry
+                self._due_at[key] = time.monotonic() + self._config.retry_seconds
+            return entry
+        now = time.monotonic()
+        entry = InventoryEntry(qmgr_name, qualifier, objects, now, None)
+        with self._lock:
+            self._entries[key] = entry
+            self._due_at[key] = now + self._config.ttl_seconds * self._config.refresh_ahead
+        return entry
+
+    def _load_full(self, key: InventoryKey) -> dict[str, Mapping[str, object]]:
+        qmgr_name, qualifier = key
+        session = self._sessions[qmgr_name]
+        name_key = session.response_key(qualifier, object_name_attribute(qualifier))
+        response_parameters = self._config.response_parameters
+        if self._config.incremental:
+            response_parameters = _with_alteration_stamp(session, qualifier, response_parameters)
+        rows = _display(session, qualifier)("*", response_parameters=response_parameters)
+        objects: dict[str, Mapping[str, object]] = {str(row.get(name_key, "")): row for row in rows}
+        if self._config.incremental:
+            stamps = {name: _alteration_stamp(session, qualifier, row) for name, row in objects.items()}
+            with self._lock:
+                self._stamps[key] = stamps
+        return objects
+
+    def _load_incremental(self, key: InventoryKey) -> dict[str, Mapping[str, object]]:
+        with self._lock:
+            previous_stamps = self._stamps.get(key)
+            previous_objects = self._entries[key].objects
+        if previous_stamps is None:
+            return self._load_full(key)
+        qmgr_name, qualifier = key
+        session = self._sessions[qmgr_name]
+        name_key = session.response_key(qualifier, object_name_attribute(qualifier))
+        display = _display(session, qualifier)
+        listing = display("*", response_parameters=_with_alteration_stamp(session, qualifier, []))
+        stamps = {str(row.get(name_key, "")): _alteration_stamp(session, qualifier, row) for row in listing}
+        changed = [
+            name
+            for name, stamp in stamps.items()
+            if stamp == (None, None) or previous_stamps.get(name) != stamp or name not in previous_objects
+        ]
+        if len(changed) > self._config.max_incremental_fetches:
+            return self._load_full(key)
+        objects = {name: previous_objects[name] for name in stamps if name not in changed}
+        for name in changed:
+            try:
+                rows = display(name, response_parameters=self._config.response_parameters)
+            except MQRESTCommandError:
+                rows = []
+            if rows:
+                objects[name] = rows[0]
+            else:
+                del stamps[name]
+        with self._lock:
+            self._stamps[key] = stamps
+        return objects
+
+
+def object_name_attribute(qualifier: str) -> str:
+    """Return the MQSC attribute holding an object's name in ``DISPLAY`` results.
+
+    This is the name keyword of the qualifier's family: ``QUEUE`` for
+    ``QLOCAL`` and ``QSTATUS``, ``CHANNEL`` for ``CHSTATUS``.
+
+    Args:
+        qualifier: An MQSC qualifier.
+
+    Returns:
+        The MQSC attribute name.
+
+    """
+    return qualifier_family(qualifier)
+
+
+def _display_method(qualifier: str) -> str:
+    return f"display_{qualifier.lower()}"
+
+
+def _display(session: MQRESTSession, qualifier: str) -> Callable[..., list[dict[str, object]]]:
+    return cast("Callable[..., list[dict[str, object]]]", getattr(session, _display_method(qualifier)))
+
+
+def _alteration_stamp(session: MQRESTSession, qualifier: str, row: Mapping[str, object]) -> AlterationStamp:
+    return (
+        row.get(session.response_key(qualifier, _ALTERATION_DATE)),
+        row.get(session.response_key(qualifier, _ALTERATION_TIME)),
+    )
+
+
+def _with_alteration_stamp(
+    session: MQRESTSession,
+    qualifier: str,
+    response_parameters: Sequence[str] | None,
+) -> list[str] | None:
+    if response_parameters is None or any(item.lower() == _ALL_ATTRIBUTES for item in response_parameters):
+        return None if response_parameters is None else list(response_parameters)
+    stamp_keys = [session.response_key(qualifier, _ALTERATION_DATE), session.response_key(qualifier, _ALTERATION_TIME)]
+    return [*response_parameters, *(item for item in stamp_keys if item not in response_parameters)]
+
+
+def _require_list_display(qualifier: str) -> None:
+    method = getattr(MQRESTSession, _display_method(qualifier), None)
+    if method is None or "name" not in inspect.signature(method).parameters:
+        message = f"No DISPLAY method listing objects by name for qualifier {qualifier!r}."
+        raise ValueError(message)
+
+
+def _validate_inventory_config(config: InventoryConfig) -> None:
+    if config.ttl_seconds <= 0:
+        message = "ttl_seconds must be positive."
+        raise ValueError(message)
+    if not 0 < config.refresh_ahead <= 1:
+        message = "refresh_ahead must be between 0 and 1."
+        raise ValueError(message)
+    if config.retry_seconds <= 0:
+        message = "retry_seconds must be positive."
+        raise ValueError(message)
+    if config.max_workers < 1:
+        message = "max_workers must be at least 1."
+        raise ValueError(message)
+    if config.max_incremental_fetches < 0:
+        message = "max_incremental_fetches must not be negative."
+        raise ValueError(message)
@@ -0,0 +1,522 @@
+"""Desired-state plans across queue managers, applied in dependency order."""
+
+from __future__ import annotations
+
+import enum
+import heapq
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, cast
+
+from .ensure import _ENSURE_QUALIFIERS, _changed_attributes, _common_prefix, _is_no_match_error
+from .exceptions import MQRESTCommandError
+from .inventory import _display, object_name_attribute
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+    from .session import MQRESTSession
+
+DEFAULT_PLAN_WORKERS = 8
+
+type ObjectKey = tuple[str, str, str]
+"""``(qmgr_name, display_qualifier, name)`` identifying one object."""
+
+# Attributes naming another object on the same queue manager, by MQSC and
+# snake_case name, and the DISPLAY qualifiers the referenced object may have.
+_REFERENCE_ATTRIBUTES: dict[str, tuple[str, ...]] = {
+    "xmitq": ("QUEUE",),
+    "transmission_queue_name": ("QUEUE",),
+    "initq": ("QUEUE",),
+    "initiation_queue_name": ("QUEUE",),
+    "boqname": ("QUEUE",),
+    "backout_requeue_name": ("QUEUE",),
+    "dest": ("QUEUE",),
+    "destination": ("QUEUE",),
+    "target": ("QUEUE", "TOPIC"),
+    "target_queue_name": ("QUEUE", "TOPIC"),
+    "process": ("PROCESS",),
+    "process_name": ("PROCESS",),
+    "topicobj": ("TOPIC",),
+    "topic_object": ("TOPIC",),
+    "clusnl": ("NAMELIST",),
+    "cluster_namelist": ("NAMELIST",),
+}
+
+
+class ChangeAction(enum.Enum):
+    """Command a planned change sends.
+
+    Attributes:
+        CREATE: ``DEFINE`` an object that does not exist.
+        ALTER: ``ALTER`` the attributes that differ.
+        DELETE: ``DELETE`` an object that should not exist.
+
+    """
+
+    CREATE = "create"
+    ALTER = "alter"
+    DELETE = "delete"
+
+
+_COMMAND_VERBS = {ChangeAction.CREATE: "define", ChangeAction.ALTER: "alter", ChangeAction.DELETE: "delete"}
+
+
+@dataclass(frozen=True)
+class DesiredObject:
+    """Desired state of one object on one queue manager.
+
+    Attributes:
+        qmgr_name: Queue manager holding the object.
+        object_type: The ensure method's object type, such as
+            ``"qlocal"`` or ``"channel"``; see
+            :class:`~pymqrest.ensure.EnsureSpec`.
+        name: MQ object name.
+        request_parameters: Desired attributes to assert/set.
+        present: ``False`` to delete the object if it exists.
+
+    """
+
+    qmgr_name: str
+    object_type: str
+    name: str
+    request_parameters: Mapping[str, object] | None = None
+    present: bool = True
+
+
+@dataclass(frozen=True)
+class PlannedChange:
+    """One command of a :class:`Plan`.
+
+    Attributes:
+        action: The :class:`ChangeAction` to take.
+        qmgr_name: Queue manager holding the object.
+        object_type: The object type from the :class:`DesiredObject`.
+        name: MQ object name.
+        request_parameters: Attributes sent with the command: all desired
+            attributes for ``CREATE``, only the differing ones for
+            ``ALTER``, ``None`` for ``DELETE``.
+        changed: Attribute names that differ, for ``ALTER``.
+        depends_on: Positions in :attr:`Plan.changes` of the changes
+            that must succeed before this one runs.
+
+    """
+
+    action: ChangeAction
+    qmgr_name: str
+    object_type: str
+    name: str
+    request_parameters: Mapping[str, object] | None = None
+    changed: tuple[str, ...] = ()
+    depends_on: tuple[int, ...] = ()
+
+    @property
+    def qualifier(self) -> str:
+        """The MQSC qualifier of the ``DEFINE``, ``ALTER`` or ``DELETE`` command."""
+        _, define_qualifier, alter_qualifier = _ENSURE_QUALIFIERS[self.object_type.strip().lower()]
+        return alter_qualifier if self.action is ChangeAction.ALTER else define_qualifier
+
+
+@dataclass(frozen=True)
+class Plan:
+    """Changes needed to reach a desired state, in dependency order.
+
+    Attributes:
+        changes: The changes to apply. Every change comes after the
+            changes it depends on.
+        unchanged: Desired objects that already match.
+
+    """
+
+    changes: tuple[PlannedChange, ...]
+    unchanged: tuple[DesiredObject, ...] = ()
+
+    def diff(self) -> str:
+        """Return a dry-run listing of the changes, one line per change.
+
+        Lines start with ``+`` for ``CREATE``, ``~`` for ``ALTER`` (followed
+        by the differing attributes) and ``-`` for ``DELETE``.
+        """
+        symbols = {ChangeAction.CREATE: "+", ChangeAction.ALTER: "~", ChangeAction.DELETE: "-"}
+        lines = []
+        for change in self.changes:
+            line = f"{symbols[change.action]} {change.qmgr_name} {change.qualifier}({change.name})"
+            if change.changed:
+                line += f" [{', '.join(change.changed)}]"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+@dataclass(frozen=True)
+class ChangeOutcome:
+    """Outcome of one planned change.
+
+    Attributes:
+        change: The :class:`PlannedChange`.
+        error: The exception the command raised, or ``None``.
+        skipped: ``True`` if the change did not run because a change it
+            depends on failed.
+
+    """
+
+    change: PlannedChange
+    error: BaseException | None = None
+    skipped: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        """``True`` if the command ran without error."""
+        return self.error is None and not self.skipped
+
+
+@dataclass(frozen=True)
+class ApplyResult:
+    """Outcomes of :meth:`Planner.apply`, in plan order.
+
+    Attributes:
+        outcomes: One :class:`ChangeOutcome` per planned change.
+
+    """
+
+    outcomes: tuple[ChangeOutcome, ...]
+
+    @property
+    def succeeded(self) -> bool:
+        """``True`` if every change succeeded."""
+        return all(outcome.succeeded for outcome in self.outcomes)
+
+    @property
+    def failures(self) -> list[ChangeOutcome]:
+        """The changes that failed or were skipped."""
+        return [outcome for outcome in self.outcomes if not outcome.succeeded]
+
+
+class Planner:
+    """Plans and applies desired state across queue managers.
+
+    :meth:`plan` reads the current state with one generic ``DISPLAY`` per
+    queue manager and ``DISPLAY`` qualifier, compares it with the
+    desired objects using the ensure comparison rules, and orders the
+    resulting changes by the references between objects: a
+    transmission queue before the sender channel using it, a process
+    before the queue naming it, and the reverse when deleting.
+    :meth:`apply` then runs independent changes in parallel.
+
+    Example::
+
+        planner = Planner([qm1, qm2])
+        plan = planner.plan(desired_objects)
+        print(plan.diff())
+        result = planner.apply(plan)
+    """
+
+    def __init__(self, sessions: Iterable[MQRESTSession], *, max_workers: int = DEFAULT_PLAN_WORKERS) -> None:
+        """Initialize a planner.
+
+        Args:
+            sessions: Sessions of the queue managers to manage, keyed by
+                their :attr:`~pymqrest.session.MQRESTSession.qmgr_name`.
+            max_workers: Maximum number of commands in flight at once.
+
+        Raises:
+            ValueError: If *max_workers* is less than 1.
+
+        """
+        if max_workers < 1:
+            message = "max_workers must be at least 1."
+            raise ValueError(message)
+        self._sessions = {session.qmgr_name: session for session in sessions}
+        self._max_workers = max_workers
+
+    def plan(self, desired: Iterable[DesiredObject]) -> Plan:
+        """Compare desired objects with the queue managers and plan the changes.
+
+        Nothing is changed; :meth:`Plan.diff` shows what :meth:`apply`
+        would do.
+
+        Args:
+            desired: Desired state of each managed object.
+
+        Returns:
+            The :class:`Plan`.
+
+        Raises:
+            ValueError: If an object has an unknown queue manager or
+                object type, two objects have the same name and
+                ``DISPLAY`` qualifier on one queue manager, or the
+                references between objects form a cycle.
+            MQRESTError: If a ``DISPLAY`` fails for any reason other than
+                no matching objects; nothing is planned from a failed
+                read.
+
+        """
+        objects = list(desired)
+        keys = [self._object_key(item) for item in objects]
+        if len(set(keys)) != len(keys):
+            duplicate = next(key for index, key in enumerate(keys) if key in keys[:index])
+            message = f"Duplicate desired object {duplicate[1]} {duplicate[2]!r} on {duplicate[0]}."
+            raise ValueError(message)
+        current = self._fetch_current(objects, keys)
+
+        changes: list[PlannedChange] = []
+        change_keys: list[ObjectKey] = []
+        references: list[set[tuple[str, str]]] = []
+        unchanged: list[DesiredObject] = []
+        for item, key in zip(objects, keys, strict=True):
+            existing = current.get(key)
+            change = _change_for(item, existing)
+            if change is None:
+                unchanged.append(item)
+                continue
+            changes.append(change)
+            change_keys.append(key)
+            attributes = existing if change.action is ChangeAction.DELETE else item.request_parameters
+            references.append(_references(attributes or {}))
+        return Plan(changes=_ordered(changes, change_keys, references), unchanged=tuple(unchanged))
+
+    def apply(self, plan: Plan) -> ApplyResult:
+        """Run a plan's changes, in parallel where dependencies allow.
+
+        A change starts once every change it depends on has succeeded.
+        When a change fails, the changes depending on it are skipped and
+        independent changes carry on.
+
+        Args:
+            plan: The :class:`Plan` from :meth:`plan`.
+
+        Returns:
+            The :class:`ApplyResult`.
+
+        """
+        run = _PlanRun(plan.changes, self._execute)
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, max(len(plan.changes), 1)),
+            thread_name_prefix="pymqrest-plan",
+        ) as executor:
+            run.execute(executor)
+        return ApplyResult(outcomes=run.outcomes())
+
+    def _object_key(self, item: DesiredObject) -> ObjectKey:
+        if item.qmgr_name not in self._sessions:
+            message = f"No session for queue manager {item.qmgr_name!r}."
+            raise ValueError(message)
+        qualifiers = _ENSURE_QUALIFIERS.get(item.object_type.strip().lower())
+        if qualifiers is None:
+            message = f"Unsupported object type {item.object_type!r}."
+            raise ValueError(message)
+        return (item.qmgr_name, qualifiers[0], item.name)
+
+    def _fetch_current(
+        self,
+        objects: Sequence[DesiredObject],
+        keys: Sequence[ObjectKey],
+    ) -> dict[ObjectKey, dict[str, object]]:
+        """Return the existing objects among *keys*, one DISPLAY per group."""
+        names_by_group: dict[tuple[str, str], list[str]] = {}
+        attributes_by_group: dict[tuple[str, str], list[str] | None] = {}
+        for item, (qmgr_name, display_qualifier, name) in zip(objects, keys, strict=True):
+            group = (qmgr_name, display_qualifier)
+            names_by_group.setdefault(group, []).append(name)
+            attributes = attributes_by_group.setdefault(group, [])
+            if not item.present:
+                # Deletes are ordered by the references in the current attributes.
+                attributes_by_group[group] = None
+            elif attributes is not None:
+                attributes.extend(item.request_parameters or ())
+        current: dict[ObjectKey, dict[str, object]] = {}
+        if not names_by_group:
+            return current
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(names_by_group)),
+            thread_name_prefix="pymqrest-plan",
+        ) as executor:
+            futures = {
+                group: executor.submit(self._display_group, group[0], group[1], names, attributes_by_group[group])
+                for group, names in names_by_group.items()
+            }
+        for (qmgr_name, display_qualifier), future in futures.items():
+            for name, row in future.result().items():
+                current[(qmgr_name, display_qualifier, name)] = row
+        return current
+
+    def _display_group(
+        self,
+        qmgr_name: str,
+        display_qualifier: str,
+        names: Sequence[str],
+        attributes: Sequence[str] | None,
+    ) -> dict[str, dict[str, object]]:
+        session = self._sessions[qmgr_name]
+        response_parameters = (
+            ["all"] if attributes is None else session.display_projection(display_qualifier, attributes)
+        )
+        try:
+            rows = _display(session, display_qualifier)(
+                _common_prefix(names) + "*",
+                response_parameters=response_parameters,
+            )
+        except MQRESTCommandError as error:
+            if not _is_no_match_error(error):
+                raise
+            rows = []
+        name_key = session.response_key(display_qualifier, object_name_attribute(display_qualifier))
+        wanted = set(names)
+        return {str(row[name_key]): row for row in rows if row.get(name_key) in wanted}
+
+    def _execute(self, change: PlannedChange) -> object:
+        session = self._sessions[change.qmgr_name]
+        method = cast(
+            "Callable[..., object]",
+            getattr(session, f"{_COMMAND_VERBS[change.action]}_{change.qualifier.lower()}"),
+        )
+        if change.action is ChangeAction.DELETE:
+            return method(change.name)
+        return method(change.name, request_parameters=change.request_parameters)
+
+
+def _change_for(item: DesiredObject, existing: Mapping[str, object] | None) -> PlannedChange | None:
+    """Return the change bringing *existing* to *item*, or ``None`` if none is needed."""
+    if not item.present:
+        if existing is None:
+            return None
+        return PlannedChange(ChangeAction.DELETE, item.qmgr_name, item.object_type, item.name)
+    params = dict(item.request_parameters) if item.request_parameters else {}
+    if existing is None:
+        return PlannedChange(ChangeAction.CREATE, item.qmgr_name, item.object_type, item.name, params or None)
+    changed = _changed_attributes(params, existing)
+    if not changed:
+        return None
+    return PlannedChange(
+        ChangeAction.ALTER,
+        item.qmgr_name,
+        item.object_type,
+        item.name,
+        changed,
+        changed=tuple(changed.keys()),
+    )
+
+
+def _references(attributes: Mapping[str, object]) -> set[tuple[str, str]]:
+    """Return ``(display_qualifier, name)`` for each object *attributes* names."""
+    referenced: set[tuple[str, str]] = set()
+    for key, value in attributes.items():
+        targets = _REFERENCE_ATTRIBUTES.get(key.lower())
+        name = str(value).strip() if value is not None else ""
+        if targets is None or not name:
+            continue
+        referenced.update((target, name) for target in targets)
+    return referenced
+
+
+def _ordered(
+    changes: Sequence[PlannedChange],
+    keys: Sequence[ObjectKey],
+    references: Sequence[set[tuple[str, str]]],
+) -> tuple[PlannedChange, ...]:
+    """Sort changes so each follows its dependencies, keeping input order otherwise."""
+    dependencies = _dependencies(changes, keys, references)
+    order = _topological_order(dependencies)
+    if len(order) != len(changes):
+        cycle = sorted(repr(keys[index][2]) for index in set(range(len(changes))) - set(order))
+        message = f"Desired objects reference each other in a cycle: {', '.join(cycle)}."
+        raise ValueError(message)
+    new_position = {old: new for new, old in enumerate(order)}
+    return tuple(
+        replace(changes[old], depends_on=tuple(sorted(new_position[dependency] for dependency in dependencies[old])))
+        for old in order
+    )
+
+
+def _dependencies(
+    changes: Sequence[PlannedChange],
+    keys: Sequence[ObjectKey],
+    references: Sequence[set[tuple[str, str]]],
+) -> list[set[int]]:
+    """Return, for each change, the changes that must run before it.
+
+    A referencing object is created after, and deleted before, the object
+    it references. Creates and alters are not ordered against deletes.
+    """
+    position = {key: index for index, key in enumerate(keys)}
+    dependencies: list[set[int]] = [set() for _ in changes]
+    for index, change in enumerate(changes):
+        deleting = change.action is ChangeAction.DELETE
+        for display_qualifier, name in references[index]:
+            other = position.get((keys[index][0], display_qualifier, name))
+            if other is None or other == index or deleting != (changes[other].action is ChangeAction.DELETE):
+                continue
+            if deleting:
+                dependencies[other].add(index)
+            else:
+                dependencies[index].add(other)
+    return dependencies
+
+
+def _topological_order(dependencies: Sequence[set[int]]) -> list[int]:
+    """Return indices with dependencies first, lowest index first among ready ones.
+
+    Indices on a cycle are left out.
+    """
+    remaining = [len(items) for items in dependencies]
+    dependents: list[list[int]] = [[] for _ in dependencies]
+    for index, items in enumerate(dependencies):
+        for dependency in items:
+            dependents[dependency].append(index)
+    ready = [index for index, count in enumerate(remaining) if count == 0]
+    heapq.heapify(ready)
+    order: list[int] = []
+    while ready:
+        index = heapq.heappop(ready)
+        order.append(index)
+        for dependent in dependents[index]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                heapq.heappush(ready, dependent)
+    return order
+
+
+class _PlanRun:
+    """Runs planned changes as their dependencies complete."""
+
+    def __init__(self, changes: Sequence[PlannedChange], execute: Callable[[PlannedChange], object]) -> None:
+        self._changes = changes
+        self._execute = execute
+        self._waiting = {index: set(change.depends_on) for index, change in enumerate(changes)}
+        self._dependents: list[list[int]] = [[] for _ in changes]
+        for index, change in enumerate(changes):
+            for dependency in change.depends_on:
+                self._dependents[dependency].append(index)
+        self._outcomes: dict[int, ChangeOutcome] = {}
+        self._running: dict[Future[object], int] = {}
+
+    def execute(self, executor: ThreadPoolExecutor) -> None:
+        self._submit_ready(executor)
+        while self._running:
+            done, _ = wait(self._running, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._complete(self._running.pop(future), future.exception())
+            self._submit_ready(executor)
+
+    def outcomes(self) -> tuple[ChangeOutcome, ...]:
+        return tuple(self._outcomes[index] for index in range(len(self._changes)))
+
+    def _submit_ready(self, executor: ThreadPoolExecutor) -> None:
+        for index in [index for index, pending in self._waiting.items() if not pending]:
+            del self._waiting[index]
+            self._running[executor.submit(self._execute, self._changes[index])] = index
+
+    def _complete(self, index: int, error: BaseException | None) -> None:
+        self._outcomes[index] = ChangeOutcome(self._changes[index], error=error)
+        if error is not None:
+            self._skip_dependents(index)
+            return
+        for dependent in self._dependents[index]:
+            if dependent in self._waiting:
+                self._waiting[dependent].discard(index)
+
+    def _skip_dependents(self, index: int) -> None:
+        for dependent in self._dependents[index]:
+            if dependent in self._waiting:
+                del self._waiting[dependent]
+                self._outcomes[dependent] = ChangeOutcome(self._changes[dependent], skipped=True)
+                self._skip_dependents(dependent)
@@ -0,0 +1,263 @@
+"""Thread-safe pool of reusable sessions for long-running services."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypedDict, Unpack
+
+from .auth import CertificateAuth, Credentials, LTPATokenCache
+from .session import MQRESTSession, MQRESTTransport, RequestsTransport
+
+if TYPE_CHECKING:
+    from ._mapping_merge import MappingOverrideMode
+    from .cache import ResultCache
+    from .failover import FailoverConfig, RESTEndpoint
+    from .fingerprint import FingerprintStore
+    from .hedging import HedgeConfig
+    from .singleflight import SingleFlight
+    from .throttle import ThrottleRegistry
+
+DEFAULT_MAX_SESSIONS = 128
+DEFAULT_IDLE_TTL_SECONDS = 600.0
+
+
+class SessionOptions(TypedDict, total=False):
+    """Optional :class:`~pymqrest.session.MQRESTSession` arguments accepted by the pool.
+
+    ``transport`` and ``token_cache`` are supplied by the pool itself.
+    """
+
+    gateway_qmgr: str | None
+    verify_tls: bool
+    timeout_seconds: float | None
+    map_attributes: bool
+    mapping_strict: bool
+    mapping_overrides: Mapping[str, object] | None
+    mapping_overrides_mode: MappingOverrideMode
+    csrf_token: str | None
+    throttle: ThrottleRegistry | None
+    hedging: HedgeConfig | None
+    failover: FailoverConfig | None
+    single_flight: SingleFlight | None
+    result_cache: ResultCache | None
+    fingerprint_store: FingerprintStore | None
+
+
+@dataclass(frozen=True)
+class SessionPoolStats:
+    """Point-in-time counters for a :class:`MQRESTSessionPool`.
+
+    Attributes:
+        size: Sessions currently held.
+        hits: Requests served by an existing session.
+        misses: Requests that built a new session.
+        evictions: Sessions dropped for being idle or least recently used.
+
+    """
+
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+@dataclass
+class _PoolEntry:
+    session: MQRESTSession
+    last_used: float
+
+
+class MQRESTSessionPool:
+    """Hands out sessions keyed by endpoint, queue manager, credentials and options.
+
+    Requests with the same key receive the same session, so per-request
+    session setup (mapping data, LTPA login) happens once per key.
+    Every session the pool builds shares one transport (one per client
+    certificate for :class:`~pymqrest.auth.CertificateAuth`) and one
+    :class:`~pymqrest.auth.LTPATokenCache`, so connection pools and
+    LTPA tokens are shared across queue managers on the same endpoint.
+    A shared token is only reused by credentials with the password that
+    obtained it, so a request with a wrong password still fails to log
+    in on a warm pool.
+
+    Sessions idle for longer than *idle_ttl_seconds* are dropped, and
+    the least recently used session is dropped when *max_sessions* is
+    exceeded. Dropped sessions are closed, releasing their hedging
+    threads; a caller still holding one can keep using it. The pool is
+    thread-safe; a session's ``last_*`` diagnostic attributes reflect
+    whichever thread used it last.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_ttl_seconds: float | None = DEFAULT_IDLE_TTL_SECONDS,
+        transport: MQRESTTransport | None = None,
+        token_cache: LTPATokenCache | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_sessions: Maximum number of sessions held.
+            idle_ttl_seconds: Seconds a session may go unused before it
+                is dropped, or ``None`` to keep idle sessions.
+            transport: Transport shared by every session. Defaults to a
+                pool-owned :class:`~pymqrest.session.RequestsTransport`.
+            token_cache: LTPA token cache shared by every session.
+                Defaults to a pool-owned cache.
+
+        Raises:
+            ValueError: If *max_sessions* or *idle_ttl_seconds* is not
+                positive.
+
+        """
+        if max_sessions < 1:
+            message = "max_sessions must be at least 1."
+            raise ValueError(message)
+        if idle_ttl_seconds is not None and idle_ttl_seconds <= 0:
+            message = "idle_ttl_seconds must be positive."
+            raise ValueError(message)
+        self._max_sessions = max_sessions
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._transport = transport
+        self._token_cache = token_cache if token_cache is not None else LTPATokenCache()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, _PoolEntry] = OrderedDict()
+        self._transports: dict[Hashable, MQRESTTransport] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of sessions currently held."""
+        with self._lock:
+            return len(self._entries)
+
+    def get(
+        self,
+        rest_base_url: str | Sequence[str | RESTEndpoint],
+        qmgr_name: str,
+        *,
+        credentials: Credentials,
+        **options: Unpack[SessionOptions],
+    ) -> MQRESTSession:
+        """Return the pooled session for the given arguments, building it if needed.
+
+        Args:
+            rest_base_url: Base URL, or URLs, as accepted by
+                :class:`~pymqrest.session.MQRESTSession`.
+            qmgr_name: Target queue manager name.
+            credentials: Authentication credentials.
+            **options: Further :class:`~pymqrest.session.MQRESTSession`
+                arguments. They are part of the pool key.
+
+        Returns:
+            A session shared with every caller using the same arguments.
+
+        Raises:
+            MQRESTAuthError: If building a new LTPA session fails to log in.
+
+        """
+        key = _freeze((rest_base_url, qmgr_name, credentials, options))
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.last_used = now
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.session
+            transport = self._transport_for(credentials)
+        session = MQRESTSession(
+            rest_base_url,
+            qmgr_name,
+            credentials=credentials,
+            transport=transport,
+            token_cache=self._token_cache,
+            **options,
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._hits += 1
+                session.close()
+                return entry.session
+            self._misses += 1
+            self._entries[key] = _PoolEntry(session=session, last_used=time.monotonic())
+            while len(self._entries) > self._max_sessions:
+                _, evicted = self._entries.popitem(last=False)
+                evicted.session.close()
+                self._evictions += 1
+        return session
+
+    def evict_idle(self) -> int:
+        """Drop every session idle for longer than the TTL.
+
+        Returns:
+            The number of sessions dropped.
+
+        """
+        with self._lock:
+            return self._evict_expired(time.monotonic())
+
+    def clear(self) -> None:
+        """Drop and close every pooled session."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry.session.close()
+            self._entries.clear()
+
+    def stats(self) -> SessionPoolStats:
+        """Return a :class:`SessionPoolStats` snapshot."""
+        with self._lock:
+            return SessionPoolStats(
+                size=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+    def _evict_expired(self, now: float) -> int:
+        if self._idle_ttl_seconds is None:
+            return 0
+        cutoff = now - self._idle_ttl_seconds
+        entries = self._entries
+        expired = [key for key, entry in entries.items() if entry.last_used < cutoff]
+        for key in expired:
+            entries.pop(key).session.close()
+        self._evictions += len(expired)
+        return len(expired)
+
+    def _transport_for(self, credentials: Credentials) -> MQRESTTransport:
+        if self._transport is not None:
+            return self._transport
+        cert_key: Hashable = None
+        client_cert: tuple[str, str] | str | None = None
+        if isinstance(credentials, CertificateAuth):
+            cert_key = (credentials.cert_path, credentials.key_path)
+            client_cert = (
+                (credentials.cert_path, credentials.key_path)
+                if credentials.key_path is not None
+                else credentials.cert_path
+            )
+        transport = self._transports.get(cert_key)
+        if transport is None:
+            transport = RequestsTransport(client_cert=client_cert)
+            self._transports[cert_key] = transport
+        return transport
+
+
+def _freeze(value: object) -> Hashable:
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(_freeze(item) for item in value)
+    return value
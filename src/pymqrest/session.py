@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import base64
+import copy
+import functools
 import json
+import time
 from collections.abc import Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from dataclasses import dataclass
-from typing import Protocol, cast
+from typing import TYPE_CHECKING, Protocol, cast
 
 import requests
 from requests import RequestException
@@ -18,21 +22,59 @@ from ._mapping_merge import (
     validate_mapping_overrides,
     validate_mapping_overrides_complete,
 )
-from .auth import LTPA_COOKIE_NAME, BasicAuth, CertificateAuth, Credentials, LTPAAuth, _perform_ltpa_login
+from .auth import (
+    LTPA_COOKIE_NAME,
+    BasicAuth,
+    CertificateAuth,
+    Credentials,
+    LTPAAuth,
+    LTPAToken,
+    LTPATokenCache,
+    _request_ltpa_token,
+)
+from .cache import qualifier_family
 from .commands import MQRESTCommandMixin
 from .ensure import MQRESTEnsureMixin
 from .exceptions import (
+    MQRESTAuthError,
     MQRESTCommandError,
+    MQRESTError,
     MQRESTResponseError,
     MQRESTTransportError,
 )
-from .mapping import MappingError, MappingIssue, map_request_attributes, map_response_list
+from .failover import EndpointHealth, EndpointSet, EndpointState, FailoverConfig, RESTEndpoint
+from .hedging import (
+    READ_ONLY_COMMANDS,
+    HedgeConfig,
+    LatencyStats,
+    LatencyTracker,
+    _HedgeExecutor,
+    hedge_delay_seconds,
+    validate_hedge_config,
+)
+from .mapping import (
+    MappingError,
+    MappingIssue,
+    map_request_attributes,
+    map_response_attributes,
+    map_response_list,
+)
 from .mapping_data import MAPPING_DATA
 from .sync import MQRESTSyncMixin
+from .throttle import ThrottledTransport, ThrottleRegistry
+from .wait import MQRESTWaitMixin, _PollScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .cache import ResultCache
+    from .fingerprint import FingerprintStore
+    from .singleflight import SingleFlight
 
 DEFAULT_RESPONSE_PARAMETERS: list[str] = ["all"]
 DEFAULT_CSRF_TOKEN = "local"  # noqa: S105
 GATEWAY_HEADER = "ibm-mq-rest-gateway-qmgr"
+HTTP_UNAUTHORIZED = 401
 ERROR_TRANSPORT_FAILURE = "Failed to reach MQ REST endpoint."
 ERROR_INVALID_JSON = "Response body was not valid JSON."
 ERROR_NON_OBJECT_RESPONSE = "Response payload was not a JSON object."
@@ -166,7 +208,7 @@ class RequestsTransport:
         )
 
 
-class MQRESTSession(MQRESTSyncMixin, MQRESTEnsureMixin, MQRESTCommandMixin):
+class MQRESTSession(MQRESTSyncMixin, MQRESTWaitMixin, MQRESTEnsureMixin, MQRESTCommandMixin):
     """Session wrapper for MQ REST admin calls.
 
     Provides MQSC command execution via the IBM MQ ``runCommandJSON``
@@ -191,7 +233,7 @@ class MQRESTSession(MQRESTSyncMixin, MQRESTEnsureMixin, MQRESTCommandMixin):
 
     def __init__(  # noqa: PLR0913
         self,
-        rest_base_url: str,
+        rest_base_url: str | Sequence[str | RESTEndpoint],
         qmgr_name: str,
         *,
         credentials: Credentials,
@@ -204,12 +246,22 @@ class MQRESTSession(MQRESTSyncMixin, MQRESTEnsureMixin, MQRESTCommandMixin):
         mapping_overrides_mode: MappingOverrideMode = MappingOverrideMode.MERGE,
         csrf_token: str | None = DEFAULT_CSRF_TOKEN,
         transport: MQRESTTransport | None = None,
+        throttle: ThrottleRegistry | None = None,
+        hedging: HedgeConfig | None = None,
+        failover: FailoverConfig | None = None,
+        token_cache: LTPATokenCache | None = None,
+        single_flight: SingleFlight | None = None,
+        result_cache: ResultCache | None = None,
+        fingerprint_store: FingerprintStore | None = None,
     ) -> None:
         """Initialize an MQ REST session.
 
         Args:
             rest_base_url: Base URL of the MQ REST API
-                (e.g. ``"https://localhost:9443/ibmmq/rest/v2"``).
+                (e.g. ``"https://localhost:9443/ibmmq/rest/v2"``), or a
+                sequence of base URLs and
+                :class:`~pymqrest.failover.RESTEndpoint` entries for
+                mqweb instances serving the same queue manager.
             qmgr_name: Name of the target queue manager.
             credentials: A credential object (:class:`~pymqrest.auth.BasicAuth`,
                 :class:`~pymqrest.auth.LTPAAuth`, or
@@ -246,13 +298,45 @@ class MQRESTSession(MQRESTSyncMixin, MQRESTEnsureMixin, MQRESTCommandMixin):
                 ``"local"``. Set to ``None`` to omit the header.
             transport: Custom :class:`MQRESTTransport` implementation.
                 Defaults to :class:`RequestsTransport`.
+            throttle: Optional :class:`~pymqrest.throttle.ThrottleRegistry`
+                enforcing per-endpoint rate and concurrency limits. The
+                transport is wrapped in a
+                :class:`~pymqrest.throttle.ThrottledTransport`; share one
+                registry across sessions to share the endpoint budget.
+            hedging: Optional :class:`~pymqrest.hedging.HedgeConfig`
+                enabling hedged requests for read-only (``DISPLAY``)
+                commands. When ``None`` (default), no hedges are sent.
+            failover: Optional :class:`~pymqrest.failover.FailoverConfig`
+                controlling endpoint selection and failover when several
+                endpoints are given. Defaults to ordered selection.
+            token_cache: Optional :class:`~pymqrest.auth.LTPATokenCache`
+                holding LTPA tokens. Share one cache across sessions so
+                sessions for the same user and endpoint reuse one login.
+                Defaults to a cache private to this session.
+            single_flight: Optional :class:`~pymqrest.singleflight.SingleFlight`
+                group. Identical ``DISPLAY`` commands issued concurrently
+                share one in-flight request and its response. Share one
+                group across sessions to coalesce between them.
+            result_cache: Optional :class:`~pymqrest.cache.ResultCache`.
+                ``DISPLAY`` responses are served from it until their TTL
+                expires, and state-changing commands run through this
+                session drop the cached responses they affect.
+            fingerprint_store: Optional
+                :class:`~pymqrest.fingerprint.FingerprintStore`. Repeat
+                ``ensure_*`` calls asserting the attributes already
+                applied or verified skip their ``DISPLAY`` until the
+                store's verification interval passes, and
+                state-changing commands run through this session drop
+                the fingerprint of the object they name.
 
         Raises:
             MQRESTAuthError: If LTPA login fails at construction time.
-            ValueError: If *mapping_overrides* has an invalid structure.
+            ValueError: If *mapping_overrides* or *hedging* has an
+                invalid structure, or no endpoint is given.
 
         """
-        self._rest_base_url = rest_base_url.rstrip("/")
+        endpoints = [rest_base_url] if isinstance(rest_base_url, str) else list(rest_base_url)
+        self._endpoints = EndpointSet(endpoints, failover or FailoverConfig())
         self._qmgr_name = qmgr_name
         self._gateway_qmgr = gateway_qmgr
         self._verify_tls = verify_tls
@@ -261,6 +345,16 @@ class MQRESTSession(MQRESTSyncMixin, MQRESTEnsureMixin, MQRESTCommandMixin):
         self._mapping_strict = mapping_strict
         self._csrf_token = csrf_token
         self._credentials = credentials
+        self._token_cache = token_cache if token_cache is not None else LTPATokenCache()
+        if hedging is not None:
+            validate_hedge_config(hedging)
+        self._hedging = hedging
+        self._hedge_executor = _HedgeExecutor(hedging.max_workers) if hedging is not None else None
+        self._latency = LatencyTracker()
+        self._single_flight = single_flight
+        self._result_cache = result_cache
+        self._fingerprint_store = fingerprint_store
+        self._poll_scheduler = _PollScheduler()
 
         if mapping_overrides is not None:
             validate_mapping_overrides(mapping_overrides)
@@ -281,17 +375,11 @@ class MQRESTSession(MQRESTSyncMixin, MQRESTEnsureMixin, MQRESTCommandMixin):
             self._transport: MQRESTTransport = RequestsTransport(client_cert=cert)
         else:
             self._transport = transport or RequestsTransport()
+        if throttle is not None:
+            self._transport = ThrottledTransport(self._transport, throttle)
 
-        self._ltpa_token: str | None = None
         if isinstance(credentials, LTPAAuth):
-            self._ltpa_token = _perform_ltpa_login(
-                self._transport,
-                self._rest_base_url,
-                credentials,
-                csrf_token=self._csrf_token,
-                timeout_seconds=self._timeout_seconds,
-                verify_tls=self._verify_tls,
-            )
+            self._login_any_endpoint(credentials)
 
         self.last_response_payload: dict[str, object] | None = None
         self.last_response_text: str | None = None
@@ -308,6 +396,164 @@ class MQRESTSession(MQRESTSyncMixin, MQRESTEnsureMixin, MQRESTCommandMixin):
         """The gateway queue manager name, or ``None`` for direct access."""
         return self._gateway_qmgr
 
+    @property
+    def rest_base_url(self) -> str:
+        """The base URL of the endpoint currently preferred for commands."""
+        return self._endpoints.candidates()[0].url
+
+    def for_qmgr(self, qmgr_name: str, *, via_gateway: bool = True) -> MQRESTSession:
+        """Return a session targeting another queue manager over this session's connection.
+
+        The derived session shares this session's transport, endpoints,
+        LTPA tokens, mapping data and latency statistics, so creating
+        one costs no login and no mapping work. Only the target queue
+        manager and the diagnostic ``last_*`` attributes are its own.
+
+        Args:
+            qmgr_name: Queue manager the derived session targets.
+            via_gateway: Route commands through a gateway queue
+                manager: this session's gateway, or this session's own
+                queue manager when it has none. Set to ``False`` for a
+                queue manager served directly by the same mqweb server.
+
+        Returns:
+            A new :class:`MQRESTSession` for *qmgr_name*.
+
+        """
+        derived = copy.copy(self)
+        derived._qmgr_name = qmgr_name  # noqa: SLF001
+        gateway_qmgr = (self._gateway_qmgr or self._qmgr_name) if via_gateway else None
+        derived._gateway_qmgr = None if gateway_qmgr == qmgr_name else gateway_qmgr  # noqa: SLF001
+        derived.last_response_payload = None
+        derived.last_response_text = None
+        derived.last_http_status = None
+        derived.last_command_payload = None
+        return derived
+
+    def close(self) -> None:
+        """Release the threads this session holds for hedged requests.
+
+        Sessions derived with :meth:`for_qmgr` share the threads, so
+        closing any of them releases them for all. A closed session
+        stays usable: a later hedged request starts new threads.
+        """
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown()
+
+    def endpoint_health(self) -> list[EndpointHealth]:
+        """Return the health of every configured endpoint.
+
+        Returns:
+            One :class:`~pymqrest.failover.EndpointHealth` per endpoint,
+            in configured order.
+
+        """
+        return self._endpoints.health()
+
+    def check_endpoints(self) -> list[EndpointHealth]:
+        """Probe every endpoint with ``DISPLAY QMGR`` and update its health.
+
+        Unreachable endpoints, and endpoints answering with a failover
+        status code, are marked unhealthy for the configured cooldown.
+        Authentication errors are recorded as failures rather than
+        raised.
+
+        Returns:
+            The refreshed :class:`~pymqrest.failover.EndpointHealth`
+            list, in configured order.
+
+        """
+        probe = _build_command_payload(
+            command="DISPLAY",
+            qualifier="QMGR",
+            name=None,
+            request_parameters={},
+            response_parameters=["QMNAME"],
+        )
+        for endpoint in self._endpoints.states:
+            start_time = time.monotonic()
+            try:
+                response = self._post_to_endpoint(endpoint, probe)
+            except (MQRESTTransportError, MQRESTAuthError):
+                self._endpoints.record_failure(endpoint)
+                continue
+            if response.status_code in self._endpoints.config.failover_status_codes:
+                self._endpoints.record_failure(endpoint)
+            else:
+                self._endpoints.record_success(endpoint, time.monotonic() - start_time)
+        return self._endpoints.health()
+
+    def response_key(self, qualifier: str, attribute: str) -> str:
+        """Return the key under which ``DISPLAY`` results report an MQSC attribute.
+
+        With attribute mapping enabled this is the ``snake_case`` name
+        (``response_key("QUEUE", "ALTDATE")`` is ``"alteration_date"``);
+        otherwise it is the MQSC name itself.
+
+        Args:
+            qualifier: The MQSC qualifier of the ``DISPLAY`` command.
+            attribute: The MQSC attribute name.
+
+        Returns:
+            The response key.
+
+        """
+        attribute_upper = attribute.strip().upper()
+        if not self._map_attributes:
+            return attribute_upper
+        mapping_qualifier = self._resolve_mapping_qualifier("DISPLAY", qualifier.strip().upper())
+        mapped = map_response_attributes(
+            mapping_qualifier,
+            {attribute_upper: None},
+            strict=False,
+            mapping_data=self._mapping_data,
+        )
+        return next(iter(mapped))
+
+    def display_projection(self, qualifier: str, attributes: Iterable[str]) -> list[str]:
+        """Return the ``DISPLAY`` response parameters needed to compare *attributes*.
+
+        When every attribute name (in the caller's namespace) is reported
+        by ``DISPLAY`` for *qualifier*, the names themselves are returned,
+        so mqweb sends back only those attributes. An empty list requests
+        mqweb's default attributes only, which always include the object
+        name. If any name is not a ``DISPLAY`` attribute, such as a
+        ``DEFINE``-only keyword like ``replace``, all attributes are
+        requested instead.
+
+        Args:
+            qualifier: The MQSC qualifier of the ``DISPLAY`` command.
+            attributes: Attribute names to compare.
+
+        Returns:
+            Response parameters for ``DISPLAY``.
+
+        """
+        names = list(dict.fromkeys(attributes))
+        if not names:
+            return []
+        mapping_qualifier = self._resolve_mapping_qualifier("DISPLAY", qualifier.strip().upper())
+        qualifier_entry = _get_qualifier_entry(mapping_qualifier, mapping_data=self._mapping_data)
+        response_key_map = qualifier_entry.get("response_key_map") if qualifier_entry is not None else None
+        if not isinstance(response_key_map, Mapping):
+            return list(DEFAULT_RESPONSE_PARAMETERS)
+        if self._map_attributes:
+            to_mqsc = _build_snake_to_mqsc_map(cast("Mapping[str, object]", qualifier_entry))
+            projectable = all(response_key_map.get(to_mqsc.get(name, "")) == name for name in names)
+        else:
+            projectable = all(name in response_key_map for name in names)
+        return names if projectable else list(DEFAULT_RESPONSE_PARAMETERS)
+
+    def latency_stats(self) -> dict[str, LatencyStats]:
+        """Return per-command latency statistics recorded by this session.
+
+        Returns:
+            A dict mapping command keys (e.g. ``"DISPLAY QUEUE"``) to
+            :class:`~pymqrest.hedging.LatencyStats`.
+
+        """
+        return self._latency.stats()
+
     def _mqsc_command(
         self,
         *,
@@ -361,18 +607,23 @@ class MQRESTSession(MQRESTSyncMixin, MQRESTEnsureMixin, MQRESTCommandMixin):
             response_parameters=normalized_response_parameters,
         )
         self.last_command_payload = dict(payload)
-        transport_response = self._transport.post_json(
-            self._build_mqsc_url(),
-            payload,
-            headers=self._build_headers(),
-            timeout_seconds=self._timeout_seconds,
-            verify_tls=self._verify_tls,
-        )
+        command_key = f"{command_upper} {qualifier_upper}"
+        pending_store: Callable[[], None] | None = None
+        if command_upper not in READ_ONLY_COMMANDS:
+            transport_response = self._send_state_changing(payload, command_upper, qualifier_upper, command_key)
+        elif self._result_cache is not None and self._result_cache.config.ttl_for(qualifier_upper) > 0:
+            transport_response, pending_store = self._send_cached(
+                self._result_cache, payload, command_upper, qualifier_upper, command_key
+            )
+        else:
+            transport_response = self._send_read_only(payload, command_upper, command_key)
         self.last_http_status = transport_response.status_code
         self.last_response_text = transport_response.text
         response_payload = _parse_response_payload(transport_response.text)
         self.last_response_payload = response_payload
         _raise_for_command_errors(response_payload, transport_response.status_code)
+        if pending_store is not None:
+            pending_store()
 
         command_response = _extract_command_response(response_payload)
         parameter_objects: list[dict[str, object]] = []
@@ -396,18 +647,196 @@ class MQRESTSession(MQRESTSyncMixin, MQRESTEnsureMixin, MQRESTCommandMixin):
             )
         return parameter_objects
 
-    def _build_mqsc_url(self) -> str:
-        return f"{self._rest_base_url}/admin/action/qmgr/{self._qmgr_name}/mqsc"
+    def _send_state_changing(
+        self,
+        payload: Mapping[str, object],
+        command: str,
+        qualifier: str,
+        command_key: str,
+    ) -> TransportResponse:
+        try:
+            return self._send_command(payload, command, command_key)
+        finally:
+            if self._result_cache is not None:
+                self._result_cache.invalidate(self._qmgr_name, qualifier)
+            if self._fingerprint_store is not None:
+                name = payload.get("name")
+                self._fingerprint_store.invalidate(
+                    self._qmgr_name, qualifier_family(qualifier), name if isinstance(name, str) else None
+                )
+
+    def _send_cached(
+        self,
+        cache: ResultCache,
+        payload: Mapping[str, object],
+        command: str,
+        qualifier: str,
+        command_key: str,
+    ) -> tuple[TransportResponse, Callable[[], None] | None]:
+        request_key = self._request_key(payload)
+        generation = cache.generation(self._qmgr_name, qualifier)
+        cached = cache.lookup(request_key)
+        if cached is not None:
+            return cached, None
+        response = self._send_read_only(payload, command, command_key)
+        store = functools.partial(
+            cache.store,
+            request_key,
+            response,
+            qmgr_name=self._qmgr_name,
+            qualifier=qualifier,
+            generation=generation,
+        )
+        return response, store
+
+    def _send_read_only(self, payload: Mapping[str, object], command: str, command_key: str) -> TransportResponse:
+        if self._single_flight is None:
+            return self._send_command(payload, command, command_key)
+        return self._single_flight.do(
+            self._request_key(payload),
+            lambda: self._send_command(payload, command, command_key),
+        )
 
-    def _build_headers(self) -> dict[str, str]:
+    def _send_command(self, payload: Mapping[str, object], command: str, command_key: str) -> TransportResponse:
+        if self._hedging is not None and self._hedge_executor is not None and command in READ_ONLY_COMMANDS:
+            return self._post_hedged(payload, command_key, self._hedging, self._hedge_executor)
+        return self._post_command(payload, command_key)
+
+    def _request_key(self, payload: Mapping[str, object]) -> tuple[object, ...]:
+        return (
+            tuple(endpoint.url for endpoint in self._endpoints.states),
+            self._qmgr_name,
+            self._gateway_qmgr,
+            self._credentials,
+            json.dumps(payload, sort_keys=True),
+        )
+
+    def _post_command(self, payload: Mapping[str, object], command_key: str) -> TransportResponse:
+        candidates = self._endpoints.candidates()
+        failover_status_codes = self._endpoints.config.failover_status_codes
+        last_error: MQRESTTransportError | MQRESTAuthError | None = None
+        for index, endpoint in enumerate(candidates):
+            start_time = time.monotonic()
+            try:
+                response = self._post_to_endpoint(endpoint, payload)
+            except (MQRESTTransportError, MQRESTAuthError) as error:
+                if not self._is_endpoint_failure(error):
+                    raise
+                self._endpoints.record_failure(endpoint)
+                last_error = error
+                continue
+            elapsed = time.monotonic() - start_time
+            self._latency.record(command_key, elapsed)
+            if response.status_code not in failover_status_codes:
+                self._endpoints.record_success(endpoint, elapsed)
+                return response
+            self._endpoints.record_failure(endpoint)
+            if index == len(candidates) - 1:
+                return response
+        raise cast("MQRESTError", last_error)
+
+    def _post_to_endpoint(self, endpoint: EndpointState, payload: Mapping[str, object]) -> TransportResponse:
+        if not isinstance(self._credentials, LTPAAuth):
+            return self._post_mqsc(endpoint.url, payload)
+        token = self._acquire_ltpa_token(endpoint.url, self._credentials)
+        response = self._post_mqsc(endpoint.url, payload, token.value)
+        if response.status_code != HTTP_UNAUTHORIZED:
+            return response
+        token = self._acquire_ltpa_token(endpoint.url, self._credentials, stale=token)
+        return self._post_mqsc(endpoint.url, payload, token.value)
+
+    def _post_mqsc(
+        self,
+        rest_base_url: str,
+        payload: Mapping[str, object],
+        ltpa_token: str | None = None,
+    ) -> TransportResponse:
+        return self._transport.post_json(
+            self._build_mqsc_url(rest_base_url),
+            payload,
+            headers=self._build_headers(ltpa_token),
+            timeout_seconds=self._timeout_seconds,
+            verify_tls=self._verify_tls,
+        )
+
+    def _acquire_ltpa_token(
+        self,
+        rest_base_url: str,
+        credentials: LTPAAuth,
+        *,
+        stale: LTPAToken | None = None,
+    ) -> LTPAToken:
+        return self._token_cache.acquire(
+            rest_base_url,
+            credentials,
+            lambda: _request_ltpa_token(
+                self._transport,
+                rest_base_url,
+                credentials,
+                csrf_token=self._csrf_token,
+                timeout_seconds=self._timeout_seconds,
+                verify_tls=self._verify_tls,
+            ),
+            margin_seconds=credentials.refresh_margin_seconds,
+            stale=stale,
+        )
+
+    def _login_any_endpoint(self, credentials: LTPAAuth) -> None:
+        last_error: MQRESTTransportError | MQRESTAuthError | None = None
+        for endpoint in self._endpoints.candidates():
+            try:
+                self._acquire_ltpa_token(endpoint.url, credentials)
+            except (MQRESTTransportError, MQRESTAuthError) as error:
+                if not self._is_endpoint_failure(error):
+                    raise
+                self._endpoints.record_failure(endpoint)
+                last_error = error
+                continue
+            return
+        raise cast("MQRESTError", last_error)
+
+    def _is_endpoint_failure(self, error: MQRESTTransportError | MQRESTAuthError) -> bool:
+        if isinstance(error, MQRESTTransportError):
+            return True
+        return error.status_code in self._endpoints.config.failover_status_codes
+
+    def _post_hedged(
+        self,
+        payload: Mapping[str, object],
+        command_key: str,
+        hedging: HedgeConfig,
+        executor: _HedgeExecutor,
+    ) -> TransportResponse:
+        delay = hedge_delay_seconds(hedging, self._latency, command_key)
+        primary = executor.send_primary(lambda: self._post_command(payload, command_key))
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        self._latency.record_hedge(command_key)
+        hedge = executor.send_hedge(lambda: self._post_command(payload, command_key))
+        pending: set[Future[TransportResponse]] = {primary, hedge}
+        first_error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    return future.result()
+                first_error = first_error or error
+        raise cast("BaseException", first_error)
+
+    def _build_mqsc_url(self, rest_base_url: str) -> str:
+        return f"{rest_base_url}/admin/action/qmgr/{self._qmgr_name}/mqsc"
+
+    def _build_headers(self, ltpa_token: str | None = None) -> dict[str, str]:
         headers: dict[str, str] = {"Accept": "application/json"}
         if isinstance(self._credentials, BasicAuth):
             headers["Authorization"] = _build_basic_auth_header(
                 self._credentials.username,
                 self._credentials.password,
             )
-        elif isinstance(self._credentials, LTPAAuth) and self._ltpa_token is not None:
-            headers["Cookie"] = f"{LTPA_COOKIE_NAME}={self._ltpa_token}"
+        elif isinstance(self._credentials, LTPAAuth) and ltpa_token is not None:
+            headers["Cookie"] = f"{LTPA_COOKIE_NAME}={ltpa_token}"
         if self._csrf_token is not None:
             headers["ibm-mq-rest-csrf-token"] = self._csrf_token
         if self._gateway_qmgr is not None:
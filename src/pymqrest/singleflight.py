@@ -0,0 +1,82 @@
+"""Single-flight coalescing of identical concurrent read-only requests."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers with the same key.
+
+    The first caller for a key runs the call; callers arriving while it
+    is in flight wait for it and receive the same result or exception.
+    Once the call completes the key is forgotten, so later callers run
+    a fresh call. Nothing is cached.
+
+    Pass one instance to several sessions to coalesce across them; the
+    session key includes the endpoint, queue manager and credentials,
+    so only truly identical requests are shared.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[object]] = {}
+        self._calls_started = 0
+        self._calls_coalesced = 0
+
+    @property
+    def calls_started(self) -> int:
+        """Calls that were actually run."""
+        with self._lock:
+            return self._calls_started
+
+    @property
+    def calls_coalesced(self) -> int:
+        """Calls that joined a call already in flight."""
+        with self._lock:
+            return self._calls_coalesced
+
+    def do[T](self, key: Hashable, call: Callable[[], T]) -> T:
+        """Run *call*, or join the in-flight call with the same *key*.
+
+        Args:
+            key: Identity of the call.
+            call: The call to run when none is in flight for *key*.
+
+        Returns:
+            The result of the call that ran.
+
+        Raises:
+            BaseException: Whatever the call that ran raised.
+
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._calls[key] = future
+                self._calls_started += 1
+            else:
+                self._calls_coalesced += 1
+        if not leader:
+            return cast("T", future.result())
+        try:
+            result = call()
+        except BaseException as error:
+            self._forget(key)
+            future.set_exception(error)
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
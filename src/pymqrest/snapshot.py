@@ -0,0 +1,486 @@
+"""Persistent point-in-time snapshots of DISPLAY results in SQLite."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Self, cast
+
+from .inventory import object_name_attribute
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Mapping, Sequence
+    from types import TracebackType
+
+    from .session import MQRESTSession
+
+DEFAULT_SNAPSHOT_BATCH_SIZE = 500
+_NO_SNAPSHOT_KEPT = 2**63 - 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    taken_at REAL NOT NULL,
+    label TEXT,
+    complete INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS scopes (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    qmgr_name TEXT NOT NULL,
+    qualifier TEXT NOT NULL,
+    PRIMARY KEY (qmgr_name, qualifier, snapshot_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS objects (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    qmgr_name TEXT NOT NULL,
+    qualifier TEXT NOT NULL,
+    name TEXT NOT NULL,
+    digest TEXT NOT NULL REFERENCES blobs (digest),
+    PRIMARY KEY (snapshot_id, qmgr_name, qualifier, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS objects_by_name ON objects (qmgr_name, qualifier, name, snapshot_id);
+"""
+
+_LATEST_SCOPE_SQL = """
+SELECT scopes.snapshot_id FROM scopes JOIN snapshots ON snapshots.id = scopes.snapshot_id
+WHERE scopes.qmgr_name = ? AND scopes.qualifier = ? AND snapshots.complete = 1 AND snapshots.taken_at <= ?
+ORDER BY snapshots.taken_at DESC, snapshots.id DESC LIMIT 1
+"""
+
+
+@dataclass(frozen=True)
+class SnapshotInfo:
+    """One completed snapshot.
+
+    Attributes:
+        snapshot_id: Identifier of the snapshot, increasing with time.
+        taken_at: :func:`time.time` at which the snapshot was started.
+        label: Optional caller-supplied label.
+        object_count: Number of objects recorded in the snapshot.
+
+    """
+
+    snapshot_id: int
+    taken_at: float
+    label: str | None
+    object_count: int
+
+
+@dataclass(frozen=True)
+class ObjectVersion:
+    """One distinct version of an object across snapshots.
+
+    Attributes:
+        snapshot_id: The first snapshot holding this version.
+        taken_at: When that snapshot was taken.
+        attributes: The object's attributes in that version.
+
+    """
+
+    snapshot_id: int
+    taken_at: float
+    attributes: dict[str, object]
+
+
+class SnapshotStore:
+    """Stores mapped ``DISPLAY`` results per queue manager, qualifier and object in SQLite.
+
+    Every write belongs to a snapshot, which becomes visible to readers
+    only once committed. Lookups answer from the latest snapshot that
+    captured the queue manager and qualifier, or from the latest one
+    taken at or before a given time, so audit jobs can query the store
+    instead of mqweb and compare configurations over time.
+
+    Attribute sets are stored as compressed JSON blobs keyed by their
+    content hash, so an object that did not change between snapshots
+    costs one index row, not another copy of its attributes.
+
+    Example::
+
+        with SnapshotStore("mq-config.db") as store:
+            with store.begin(label="nightly") as writer:
+                for session in sessions:
+                    writer.capture(session, "QUEUE")
+                    writer.capture(session, "CHANNEL")
+            queue = store.get("QM1", "QUEUE", "APP.IN")
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str] = ":memory:", *, batch_size: int = DEFAULT_SNAPSHOT_BATCH_SIZE
+    ) -> None:
+        """Open or create a snapshot database.
+
+        Args:
+            path: Database file, or ``":memory:"`` for a private
+                in-memory database. ``~`` is expanded.
+            batch_size: Objects buffered by a writer before they are
+                inserted in one batch.
+
+        Raises:
+            ValueError: If *batch_size* is less than 1.
+
+        """
+        if batch_size < 1:
+            message = "batch_size must be at least 1."
+            raise ValueError(message)
+        database = str(path) if str(path) == ":memory:" else str(Path(path).expanduser())
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        """Return the store."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the database."""
+        self.close()
+
+    @property
+    def batch_size(self) -> int:
+        """Objects a writer buffers before inserting them in one batch."""
+        return self._batch_size
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def begin(self, *, label: str | None = None, taken_at: float | None = None) -> SnapshotWriter:
+        """Start a new snapshot.
+
+        Args:
+            label: Optional label stored with the snapshot.
+            taken_at: Snapshot time as :func:`time.time` seconds.
+                Defaults to now.
+
+        Returns:
+            A :class:`SnapshotWriter` for the new snapshot.
+
+        """
+        taken = time.time() if taken_at is None else taken_at
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO snapshots (taken_at, label) VALUES (?, ?)",
+                (taken, label),
+            )
+        return SnapshotWriter(self, cast("int", cursor.lastrowid), taken, label)
+
+    def snapshots(self) -> list[SnapshotInfo]:
+        """Return every committed snapshot, oldest first."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT snapshots.id, taken_at, label, COUNT(objects.name) FROM snapshots "
+                "LEFT JOIN objects ON objects.snapshot_id = snapshots.id "
+                "WHERE complete = 1 GROUP BY snapshots.id ORDER BY snapshots.id",
+            ).fetchall()
+        return [SnapshotInfo(snapshot_id=row[0], taken_at=row[1], label=row[2], object_count=row[3]) for row in rows]
+
+    def get(self, qmgr_name: str, qualifier: str, name: str, *, at: float | None = None) -> dict[str, object] | None:
+        """Return one object's attributes from the latest matching snapshot.
+
+        Args:
+            qmgr_name: Queue manager name.
+            qualifier: MQSC qualifier the object was captured under.
+            name: Object name.
+            at: Use the latest snapshot taken at or before this
+                :func:`time.time` value. Defaults to the latest one.
+
+        Returns:
+            The attributes, or ``None`` if no such snapshot exists or
+            it does not hold the object.
+
+        """
+        with self._lock:
+            snapshot_id = self._scope_snapshot(qmgr_name, qualifier, at)
+            row = self._connection.execute(
+                "SELECT blobs.data FROM objects JOIN blobs ON blobs.digest = objects.digest "
+                "WHERE qmgr_name = ? AND qualifier = ? AND name = ? AND snapshot_id = ?",
+                (qmgr_name, qualifier.upper(), name, snapshot_id),
+            ).fetchone()
+        return None if row is None else _decode(row[0])
+
+    def objects(self, qmgr_name: str, qualifier: str, *, at: float | None = None) -> list[dict[str, object]]:
+        """Return every object of a queue manager and qualifier from the latest matching snapshot.
+
+        Args:
+            qmgr_name: Queue manager name.
+            qualifier: MQSC qualifier the objects were captured under.
+            at: Use the latest snapshot taken at or before this
+                :func:`time.time` value. Defaults to the latest one.
+
+        Returns:
+            The objects' attributes ordered by name, or an empty list if
+            no such snapshot exists.
+
+        """
+        with self._lock:
+            snapshot_id = self._scope_snapshot(qmgr_name, qualifier, at)
+            rows = self._connection.execute(
+                "SELECT blobs.data FROM objects JOIN blobs ON blobs.digest = objects.digest "
+                "WHERE qmgr_name = ? AND qualifier = ? AND snapshot_id = ? ORDER BY name",
+                (qmgr_name, qualifier.upper(), snapshot_id),
+            ).fetchall()
+        return [_decode(row[0]) for row in rows]
+
+    def history(self, qmgr_name: str, qualifier: str, name: str) -> list[ObjectVersion]:
+        """Return the distinct versions of one object, oldest first.
+
+        Consecutive snapshots holding identical attributes collapse into
+        one version; snapshots that do not hold the object are skipped.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT objects.snapshot_id, snapshots.taken_at, objects.digest, blobs.data FROM objects "
+                "JOIN snapshots ON snapshots.id = objects.snapshot_id "
+                "JOIN blobs ON blobs.digest = objects.digest "
+                "WHERE qmgr_name = ? AND qualifier = ? AND name = ? AND snapshots.complete = 1 "
+                "ORDER BY snapshots.taken_at, objects.snapshot_id",
+                (qmgr_name, qualifier.upper(), name),
+            ).fetchall()
+        versions: list[ObjectVersion] = []
+        previous_digest: str | None = None
+        for snapshot_id, taken_at, digest, data in rows:
+            if digest != previous_digest:
+                versions.append(ObjectVersion(snapshot_id=snapshot_id, taken_at=taken_at, attributes=_decode(data)))
+            previous_digest = digest
+        return versions
+
+    def prune(self, keep: int) -> int:
+        """Delete all but the newest *keep* committed snapshots.
+
+        Attribute blobs no longer referenced are deleted too. Snapshots
+        not yet committed are never deleted, so pruning is safe while
+        writers are still capturing.
+
+        Returns:
+            The number of snapshots deleted.
+
+        Raises:
+            ValueError: If *keep* is negative.
+
+        """
+        if keep < 0:
+            message = "keep must not be negative."
+            raise ValueError(message)
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT MIN(id) FROM (SELECT id FROM snapshots WHERE complete = 1 ORDER BY id DESC LIMIT ?)",
+                (keep,),
+            ).fetchone()
+            oldest_kept = row[0] if row[0] is not None else _NO_SNAPSHOT_KEPT
+            deleted = self._connection.execute(
+                "SELECT COUNT(*) FROM snapshots WHERE complete = 1 AND id < ?", (oldest_kept,)
+            ).fetchone()
+            self._delete_snapshots("complete = 1 AND id < ?", (oldest_kept,))
+            self._connection.execute("DELETE FROM blobs WHERE digest NOT IN (SELECT digest FROM objects)")
+        return cast("int", deleted[0])
+
+    def _scope_snapshot(self, qmgr_name: str, qualifier: str, at: float | None) -> int | None:
+        row = self._connection.execute(
+            _LATEST_SCOPE_SQL,
+            (qmgr_name, qualifier.upper(), float("inf") if at is None else at),
+        ).fetchone()
+        return None if row is None else cast("int", row[0])
+
+    def _delete_snapshots(self, condition: str, parameters: Sequence[object]) -> None:
+        selected = f"SELECT id FROM snapshots WHERE {condition}"  # noqa: S608 - fixed internal conditions only
+        self._connection.execute(f"DELETE FROM objects WHERE snapshot_id IN ({selected})", parameters)  # noqa: S608
+        self._connection.execute(f"DELETE FROM scopes WHERE snapshot_id IN ({selected})", parameters)  # noqa: S608
+        self._connection.execute(f"DELETE FROM snapshots WHERE {condition}", parameters)  # noqa: S608
+
+    def _write_batch(
+        self,
+        snapshot_id: int,
+        scopes: Iterable[tuple[str, str]],
+        batch: Sequence[tuple[str, str, str, Mapping[str, object]]],
+    ) -> None:
+        blobs: dict[str, bytes] = {}
+        rows: list[tuple[int, str, str, str, str]] = []
+        for qmgr_name, qualifier, name, attributes in batch:
+            encoded = json.dumps(attributes, sort_keys=True, separators=(",", ":"), default=str).encode()
+            digest = hashlib.sha256(encoded).hexdigest()
+            blobs.setdefault(digest, encoded)
+            rows.append((snapshot_id, qmgr_name, qualifier, name, digest))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO scopes (snapshot_id, qmgr_name, qualifier) VALUES (?, ?, ?)",
+                [(snapshot_id, qmgr_name, qualifier) for qmgr_name, qualifier in scopes],
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO blobs (digest, data) VALUES (?, ?)",
+                [(digest, zlib.compress(encoded)) for digest, encoded in blobs.items()],
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO objects (snapshot_id, qmgr_name, qualifier, name, digest) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _complete(self, snapshot_id: int) -> None:
+        with self._lock, self._connection:
+            cursor = self._connection.execute("UPDATE snapshots SET complete = 1 WHERE id = ?", (snapshot_id,))
+            if not cursor.rowcount:
+                self._connection.execute("DELETE FROM objects WHERE snapshot_id = ?", (snapshot_id,))
+                self._connection.execute("DELETE FROM scopes WHERE snapshot_id = ?", (snapshot_id,))
+        if not cursor.rowcount:
+            message = f"Snapshot {snapshot_id} no longer exists; it was discarded or deleted."
+            raise LookupError(message)
+
+    def _discard(self, snapshot_id: int) -> None:
+        with self._lock, self._connection:
+            self._delete_snapshots("id = ?", (snapshot_id,))
+
+
+class SnapshotWriter:
+    """Streams objects into one snapshot of a :class:`SnapshotStore`.
+
+    Objects are buffered and inserted in batches of the store's
+    *batch_size*, so capturing a large queue manager does not hold all
+    of it in memory twice. The snapshot becomes visible to readers
+    when :meth:`commit` is called; used as a context manager, it is
+    committed on success and discarded on error.
+    """
+
+    def __init__(self, store: SnapshotStore, snapshot_id: int, taken_at: float, label: str | None) -> None:
+        """Initialize a writer for an already created snapshot row."""
+        self._store = store
+        self._snapshot_id = snapshot_id
+        self._taken_at = taken_at
+        self._label = label
+        self._scopes: set[tuple[str, str]] = set()
+        self._batch: list[tuple[str, str, str, Mapping[str, object]]] = []
+        self._count = 0
+
+    @property
+    def snapshot_id(self) -> int:
+        """Identifier of the snapshot being written."""
+        return self._snapshot_id
+
+    def __enter__(self) -> Self:
+        """Return the writer."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Commit the snapshot, or discard it if the block raised."""
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    def add(self, qmgr_name: str, qualifier: str, name: str, attributes: Mapping[str, object]) -> None:
+        """Record one object."""
+        qualifier_upper = qualifier.upper()
+        self._scopes.add((qmgr_name, qualifier_upper))
+        self._batch.append((qmgr_name, qualifier_upper, name, attributes))
+        self._count += 1
+        if len(self._batch) >= self._store.batch_size:
+            self._flush()
+
+    def add_rows(self, qmgr_name: str, qualifier: str, rows: Iterable[Mapping[str, object]], *, name_key: str) -> int:
+        """Record every row of a ``DISPLAY`` result.
+
+        The queue manager and qualifier are recorded as captured even
+        when *rows* is empty, so lookups see that no objects existed.
+
+        Args:
+            qmgr_name: Queue manager the rows were read from.
+            qualifier: MQSC qualifier of the ``DISPLAY`` command.
+            rows: The ``DISPLAY`` result rows.
+            name_key: Row key holding the object name.
+
+        Returns:
+            The number of rows recorded.
+
+        """
+        self._scopes.add((qmgr_name, qualifier.upper()))
+        count = 0
+        for row in rows:
+            self.add(qmgr_name, qualifier, str(row.get(name_key, "")), row)
+            count += 1
+        return count
+
+    def capture(
+        self, session: MQRESTSession, qualifier: str, *, response_parameters: Sequence[str] | None = None
+    ) -> int:
+        """Run ``DISPLAY <qualifier>(*)`` on *session* and record the result.
+
+        If the ``DISPLAY`` fails, the whole snapshot is discarded before
+        the error is raised, so a failed capture never leaves an
+        uncommitted snapshot behind in the store.
+
+        Args:
+            session: Session of the queue manager to capture.
+            qualifier: MQSC qualifier with a ``display_*`` method
+                listing objects by name, e.g. ``"QUEUE"``.
+            response_parameters: Attributes to capture; ``None`` or
+                empty for all of them.
+
+        Returns:
+            The number of objects recorded.
+
+        """
+        display = getattr(session, f"display_{qualifier.lower()}")
+        try:
+            rows = cast("list[dict[str, object]]", display("*", response_parameters=response_parameters or None))
+        except Exception:
+            self.discard()
+            raise
+        name_key = session.response_key(qualifier, object_name_attribute(qualifier))
+        return self.add_rows(session.qmgr_name, qualifier, rows, name_key=name_key)
+
+    def commit(self) -> SnapshotInfo:
+        """Write buffered objects and make the snapshot visible.
+
+        Returns:
+            The committed snapshot.
+
+        Raises:
+            LookupError: If the snapshot was discarded or deleted
+                before it could be committed. Nothing written to it is
+                kept.
+
+        """
+        self._flush()
+        self._store._complete(self._snapshot_id)  # noqa: SLF001
+        return SnapshotInfo(
+            snapshot_id=self._snapshot_id,
+            taken_at=self._taken_at,
+            label=self._label,
+            object_count=self._count,
+        )
+
+    def discard(self) -> None:
+        """Delete everything written to this snapshot."""
+        self._batch.clear()
+        self._store._discard(self._snapshot_id)  # noqa: SLF001
+
+    def _flush(self) -> None:
+        self._store._write_batch(self._snapshot_id, self._scopes, self._batch)  # noqa: SLF001
+        self._batch = []
+
+
+def _decode(data: bytes) -> dict[str, object]:
+    return cast("dict[str, object]", json.loads(zlib.decompress(data)))
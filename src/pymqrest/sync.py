@@ -3,29 +3,57 @@
 from __future__ import annotations
 
 import enum
+import random
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from .exceptions import MQRESTTimeoutError
+from .ensure import _NO_MATCH_REASON_CODES, _common_prefix, _is_no_match_error
+from .exceptions import MQRESTCommandError, MQRESTError, MQRESTTimeoutError
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+DEFAULT_SYNC_WORKERS = 8
 
 
 @dataclass(frozen=True)
 class SyncConfig:
     """Configuration for synchronous polling operations.
 
+    The defaults poll at a fixed interval, starting one interval after
+    the command. For latency that tracks the real transition time, set
+    *first_poll_immediate* and poll with a short interval that backs
+    off, e.g. ``SyncConfig(poll_interval_seconds=0.1,
+    first_poll_immediate=True, backoff_multiplier=2.0,
+    max_poll_interval_seconds=2.0, jitter=0.1)``. The sleep before a
+    poll never runs past the timeout, so the last poll happens at the
+    deadline.
+
     Attributes:
         timeout_seconds: Maximum wall-clock seconds to wait for the
             object to reach the target state.
-        poll_interval_seconds: Seconds to sleep between status polls.
+        poll_interval_seconds: Seconds to sleep before the first
+            scheduled poll, and between polls when there is no backoff.
+        first_poll_immediate: Poll once straight after the command,
+            before the first interval.
+        backoff_multiplier: Factor applied to the interval after each
+            scheduled poll. ``1.0`` keeps it fixed.
+        max_poll_interval_seconds: Upper bound on the interval as it
+            backs off, or ``None`` for no bound.
+        jitter: Fraction by which each sleep is randomly lengthened or
+            shortened, so many waiters do not poll in lockstep.
 
     """
 
     timeout_seconds: float = 30.0
     poll_interval_seconds: float = 1.0
+    first_poll_immediate: bool = False
+    backoff_multiplier: float = 1.0
+    max_poll_interval_seconds: float | None = None
+    jitter: float = 0.0
 
 
 class SyncOperation(enum.Enum):
@@ -60,6 +88,31 @@ class SyncResult:
     elapsed_seconds: float
 
 
+@dataclass(frozen=True)
+class SyncBatchResult:
+    """Result of a synchronous start or stop of many objects.
+
+    Attributes:
+        results: :class:`SyncResult` of each object that reached the
+            target state, keyed by name. ``polls`` counts the shared
+            status polls issued until the object was resolved.
+        errors: Exception for each object whose command failed or which
+            did not reach the target state in time, keyed by name.
+        skipped: Names left untouched because a rolling restart ran out
+            of availability budget.
+
+    """
+
+    results: dict[str, SyncResult]
+    errors: dict[str, MQRESTError]
+    skipped: tuple[str, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        """Whether every object reached the target state."""
+        return not self.errors and not self.skipped
+
+
 @dataclass(frozen=True)
 class _ObjectTypeConfig:
     """Per-object-type metadata for polling logic."""
@@ -69,6 +122,7 @@ class _ObjectTypeConfig:
     status_qualifier: str
     status_keys: tuple[str, ...]
     empty_means_stopped: bool
+    name_attribute: str
 
 
 _CHANNEL_CONFIG = _ObjectTypeConfig(
@@ -77,6 +131,7 @@ _CHANNEL_CONFIG = _ObjectTypeConfig(
     status_qualifier="CHSTATUS",
     status_keys=("channel_status", "STATUS"),
     empty_means_stopped=True,
+    name_attribute="CHANNEL",
 )
 
 _LISTENER_CONFIG = _ObjectTypeConfig(
@@ -85,6 +140,7 @@ _LISTENER_CONFIG = _ObjectTypeConfig(
     status_qualifier="LSSTATUS",
     status_keys=("status", "STATUS"),
     empty_means_stopped=False,
+    name_attribute="LISTENER",
 )
 
 _SERVICE_CONFIG = _ObjectTypeConfig(
@@ -93,10 +149,14 @@ _SERVICE_CONFIG = _ObjectTypeConfig(
     status_qualifier="SVSTATUS",
     status_keys=("status", "STATUS"),
     empty_means_stopped=False,
+    name_attribute="SERVICE",
 )
 
+_STATUS_ATTRIBUTE = "STATUS"
 _RUNNING_VALUES = frozenset({"RUNNING", "running"})
 _STOPPED_VALUES = frozenset({"STOPPED", "stopped"})
+# The no-match codes plus MQRCCF_CHL_STATUS_NOT_FOUND, for no channel status.
+_NO_STATUS_REASON_CODES = _NO_MATCH_REASON_CODES | {3065}
 
 
 class MQRESTSyncMixin:
@@ -106,6 +166,9 @@ class MQRESTSyncMixin:
     corresponding ``DISPLAY *STATUS`` until the object reaches a
     stable state or the timeout expires.  ``restart_*`` methods
     perform a synchronous stop followed by a synchronous start.
+    The plural ``start_*s_sync`` and ``stop_*s_sync`` methods do the
+    same for many objects at once, sharing one generic status
+    ``DISPLAY`` per poll.
     """
 
     def _mqsc_command(
@@ -120,6 +183,14 @@ class MQRESTSyncMixin:
     ) -> list[dict[str, object]]:
         raise NotImplementedError  # pragma: no cover
 
+    def response_key(self, qualifier: str, attribute: str) -> str:
+        """Return the key under which ``DISPLAY`` results report an MQSC attribute."""
+        raise NotImplementedError  # pragma: no cover
+
+    def display_projection(self, qualifier: str, attributes: Iterable[str]) -> list[str]:
+        """Return the ``DISPLAY`` response parameters needed to compare *attributes*."""
+        raise NotImplementedError  # pragma: no cover
+
     # ------------------------------------------------------------------
     # Channel
     # ------------------------------------------------------------------
@@ -192,6 +263,105 @@ class MQRESTSyncMixin:
         """
         return self._restart(name, _CHANNEL_CONFIG, config)
 
+    def start_channels_sync(
+        self,
+        names: Iterable[str],
+        *,
+        config: SyncConfig | None = None,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+    ) -> SyncBatchResult:
+        """Start many channels and wait until each is running.
+
+        The ``START`` commands run on up to *max_workers* threads; then
+        each poll is one generic ``DISPLAY`` of the status of every
+        channel sharing the names' common prefix, resolving each
+        channel as soon as it is running.
+
+        Args:
+            names: Channel names.
+            config: Optional polling configuration, with the timeout
+                applying to the whole batch.
+            max_workers: Maximum number of ``START`` commands in flight.
+
+        Returns:
+            A :class:`SyncBatchResult` with each channel's result or error.
+
+        Raises:
+            ValueError: If *max_workers* is less than 1 or *config* is
+                invalid.
+
+        """
+        return self._command_and_poll_many(names, _CHANNEL_CONFIG, config, SyncOperation.STARTED, max_workers)
+
+    def stop_channels_sync(
+        self,
+        names: Iterable[str],
+        *,
+        config: SyncConfig | None = None,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+    ) -> SyncBatchResult:
+        """Stop many channels and wait until each is stopped.
+
+        Works like :meth:`start_channels_sync` with ``STOP`` commands.
+
+        Args:
+            names: Channel names.
+            config: Optional polling configuration, with the timeout
+                applying to the whole batch.
+            max_workers: Maximum number of ``STOP`` commands in flight.
+
+        Returns:
+            A :class:`SyncBatchResult` with each channel's result or error.
+
+        Raises:
+            ValueError: If *max_workers* is less than 1 or *config* is
+                invalid.
+
+        """
+        return self._command_and_poll_many(names, _CHANNEL_CONFIG, config, SyncOperation.STOPPED, max_workers)
+
+    def rolling_restart_channels(
+        self,
+        names: str | Iterable[str],
+        *,
+        max_in_flight: int = 1,
+        where: str | None = None,
+        config: SyncConfig | None = None,
+    ) -> SyncBatchResult:
+        """Restart many channels with at most *max_in_flight* down at once.
+
+        Restarts run as a sliding window: whenever a channel is running
+        again, the next one is stopped. All channels in flight share one
+        generic status ``DISPLAY`` per poll. A channel whose restart
+        failed after it was stopped keeps its slot, since it may still
+        be down; once every slot is held that way, the remaining
+        channels are skipped. A failed status poll is recorded as the
+        error of every channel in flight, each of which keeps its slot.
+
+        Args:
+            names: Channel names, or a generic name such as
+                ``"TO.*"`` listing the channels to restart.
+            max_in_flight: Maximum number of channels between ``STOP``
+                and confirmed running.
+            where: Optional ``WHERE`` filter applied when *names* is a
+                generic name.
+            config: Optional polling configuration. Each phase of each
+                restart gets the full timeout.
+
+        Returns:
+            A :class:`SyncBatchResult` with a ``RESTARTED``
+            :class:`SyncResult` per restarted channel, timed from its
+            ``STOP``.
+
+        Raises:
+            MQRESTError: If listing the objects of a generic name fails
+                for any reason other than no matching objects.
+            ValueError: If *max_in_flight* is less than 1 or *config*
+                is invalid.
+
+        """
+        return self._rolling_restart(names, _CHANNEL_CONFIG, config, max_in_flight, where)
+
     # ------------------------------------------------------------------
     # Listener
     # ------------------------------------------------------------------
@@ -264,6 +434,105 @@ class MQRESTSyncMixin:
         """
         return self._restart(name, _LISTENER_CONFIG, config)
 
+    def start_listeners_sync(
+        self,
+        names: Iterable[str],
+        *,
+        config: SyncConfig | None = None,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+    ) -> SyncBatchResult:
+        """Start many listeners and wait until each is running.
+
+        The ``START`` commands run on up to *max_workers* threads; then
+        each poll is one generic ``DISPLAY`` of the status of every
+        listener sharing the names' common prefix, resolving each
+        listener as soon as it is running.
+
+        Args:
+            names: Listener names.
+            config: Optional polling configuration, with the timeout
+                applying to the whole batch.
+            max_workers: Maximum number of ``START`` commands in flight.
+
+        Returns:
+            A :class:`SyncBatchResult` with each listener's result or error.
+
+        Raises:
+            ValueError: If *max_workers* is less than 1 or *config* is
+                invalid.
+
+        """
+        return self._command_and_poll_many(names, _LISTENER_CONFIG, config, SyncOperation.STARTED, max_workers)
+
+    def stop_listeners_sync(
+        self,
+        names: Iterable[str],
+        *,
+        config: SyncConfig | None = None,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+    ) -> SyncBatchResult:
+        """Stop many listeners and wait until each is stopped.
+
+        Works like :meth:`start_listeners_sync` with ``STOP`` commands.
+
+        Args:
+            names: Listener names.
+            config: Optional polling configuration, with the timeout
+                applying to the whole batch.
+            max_workers: Maximum number of ``STOP`` commands in flight.
+
+        Returns:
+            A :class:`SyncBatchResult` with each listener's result or error.
+
+        Raises:
+            ValueError: If *max_workers* is less than 1 or *config* is
+                invalid.
+
+        """
+        return self._command_and_poll_many(names, _LISTENER_CONFIG, config, SyncOperation.STOPPED, max_workers)
+
+    def rolling_restart_listeners(
+        self,
+        names: str | Iterable[str],
+        *,
+        max_in_flight: int = 1,
+        where: str | None = None,
+        config: SyncConfig | None = None,
+    ) -> SyncBatchResult:
+        """Restart many listeners with at most *max_in_flight* down at once.
+
+        Restarts run as a sliding window: whenever a listener is running
+        again, the next one is stopped. All listeners in flight share one
+        generic status ``DISPLAY`` per poll. A listener whose restart
+        failed after it was stopped keeps its slot, since it may still
+        be down; once every slot is held that way, the remaining
+        listeners are skipped. A failed status poll is recorded as the
+        error of every listener in flight, each of which keeps its slot.
+
+        Args:
+            names: Listener names, or a generic name such as
+                ``"APP.*"`` listing the listeners to restart.
+            max_in_flight: Maximum number of listeners between ``STOP``
+                and confirmed running.
+            where: Optional ``WHERE`` filter applied when *names* is a
+                generic name.
+            config: Optional polling configuration. Each phase of each
+                restart gets the full timeout.
+
+        Returns:
+            A :class:`SyncBatchResult` with a ``RESTARTED``
+            :class:`SyncResult` per restarted listener, timed from its
+            ``STOP``.
+
+        Raises:
+            MQRESTError: If listing the objects of a generic name fails
+                for any reason other than no matching objects.
+            ValueError: If *max_in_flight* is less than 1 or *config*
+                is invalid.
+
+        """
+        return self._rolling_restart(names, _LISTENER_CONFIG, config, max_in_flight, where)
+
     # ------------------------------------------------------------------
     # Service
     # ------------------------------------------------------------------
@@ -336,6 +605,105 @@ class MQRESTSyncMixin:
         """
         return self._restart(name, _SERVICE_CONFIG, config)
 
+    def start_services_sync(
+        self,
+        names: Iterable[str],
+        *,
+        config: SyncConfig | None = None,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+    ) -> SyncBatchResult:
+        """Start many services and wait until each is running.
+
+        The ``START`` commands run on up to *max_workers* threads; then
+        each poll is one generic ``DISPLAY`` of the status of every
+        service sharing the names' common prefix, resolving each
+        service as soon as it is running.
+
+        Args:
+            names: Service names.
+            config: Optional polling configuration, with the timeout
+                applying to the whole batch.
+            max_workers: Maximum number of ``START`` commands in flight.
+
+        Returns:
+            A :class:`SyncBatchResult` with each service's result or error.
+
+        Raises:
+            ValueError: If *max_workers* is less than 1 or *config* is
+                invalid.
+
+        """
+        return self._command_and_poll_many(names, _SERVICE_CONFIG, config, SyncOperation.STARTED, max_workers)
+
+    def stop_services_sync(
+        self,
+        names: Iterable[str],
+        *,
+        config: SyncConfig | None = None,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+    ) -> SyncBatchResult:
+        """Stop many services and wait until each is stopped.
+
+        Works like :meth:`start_services_sync` with ``STOP`` commands.
+
+        Args:
+            names: Service names.
+            config: Optional polling configuration, with the timeout
+                applying to the whole batch.
+            max_workers: Maximum number of ``STOP`` commands in flight.
+
+        Returns:
+            A :class:`SyncBatchResult` with each service's result or error.
+
+        Raises:
+            ValueError: If *max_workers* is less than 1 or *config* is
+                invalid.
+
+        """
+        return self._command_and_poll_many(names, _SERVICE_CONFIG, config, SyncOperation.STOPPED, max_workers)
+
+    def rolling_restart_services(
+        self,
+        names: str | Iterable[str],
+        *,
+        max_in_flight: int = 1,
+        where: str | None = None,
+        config: SyncConfig | None = None,
+    ) -> SyncBatchResult:
+        """Restart many services with at most *max_in_flight* down at once.
+
+        Restarts run as a sliding window: whenever a service is running
+        again, the next one is stopped. All services in flight share one
+        generic status ``DISPLAY`` per poll. A service whose restart
+        failed after it was stopped keeps its slot, since it may still
+        be down; once every slot is held that way, the remaining
+        services are skipped. A failed status poll is recorded as the
+        error of every service in flight, each of which keeps its slot.
+
+        Args:
+            names: Service names, or a generic name such as
+                ``"APP.*"`` listing the services to restart.
+            max_in_flight: Maximum number of services between ``STOP``
+                and confirmed running.
+            where: Optional ``WHERE`` filter applied when *names* is a
+                generic name.
+            config: Optional polling configuration. Each phase of each
+                restart gets the full timeout.
+
+        Returns:
+            A :class:`SyncBatchResult` with a ``RESTARTED``
+            :class:`SyncResult` per restarted service, timed from its
+            ``STOP``.
+
+        Raises:
+            MQRESTError: If listing the objects of a generic name fails
+                for any reason other than no matching objects.
+            ValueError: If *max_in_flight* is less than 1 or *config*
+                is invalid.
+
+        """
+        return self._rolling_restart(names, _SERVICE_CONFIG, config, max_in_flight, where)
+
     # ------------------------------------------------------------------
     # Core polling helpers
     # ------------------------------------------------------------------
@@ -348,6 +716,7 @@ class MQRESTSyncMixin:
     ) -> SyncResult:
         """Issue START then poll until the object is RUNNING."""
         sync_config = config or SyncConfig()
+        _validate_sync_config(sync_config)
         self._mqsc_command(
             command="START",
             mqsc_qualifier=object_config.start_qualifier,
@@ -355,30 +724,13 @@ class MQRESTSyncMixin:
             request_parameters=None,
             response_parameters=None,
         )
-        polls = 0
-        start_time = time.monotonic()
-        while True:
-            time.sleep(sync_config.poll_interval_seconds)
-            status_rows = self._mqsc_command(
-                command="DISPLAY",
-                mqsc_qualifier=object_config.status_qualifier,
-                name=name,
-                request_parameters=None,
-                response_parameters=["all"],
-            )
-            polls += 1
-            if _has_status(status_rows, object_config.status_keys, _RUNNING_VALUES):
-                elapsed = time.monotonic() - start_time
-                return SyncResult(SyncOperation.STARTED, polls=polls, elapsed_seconds=elapsed)
-            elapsed = time.monotonic() - start_time
-            if elapsed >= sync_config.timeout_seconds:
-                message = f"{object_config.start_qualifier} '{name}' did not reach RUNNING within {sync_config.timeout_seconds}s"
-                raise MQRESTTimeoutError(
-                    message,
-                    name=name,
-                    operation="start",
-                    elapsed=elapsed,
-                )
+        return self._poll_until(
+            name,
+            object_config,
+            sync_config,
+            SyncOperation.STARTED,
+            _reached_check(object_config, SyncOperation.STARTED),
+        )
 
     def _stop_and_poll(
         self,
@@ -388,6 +740,7 @@ class MQRESTSyncMixin:
     ) -> SyncResult:
         """Issue STOP then poll until the object is STOPPED."""
         sync_config = config or SyncConfig()
+        _validate_sync_config(sync_config)
         self._mqsc_command(
             command="STOP",
             mqsc_qualifier=object_config.stop_qualifier,
@@ -395,33 +748,212 @@ class MQRESTSyncMixin:
             request_parameters=None,
             response_parameters=None,
         )
+        return self._poll_until(
+            name,
+            object_config,
+            sync_config,
+            SyncOperation.STOPPED,
+            _reached_check(object_config, SyncOperation.STOPPED),
+        )
+
+    def _poll_until(
+        self,
+        name: str,
+        object_config: _ObjectTypeConfig,
+        sync_config: SyncConfig,
+        operation: SyncOperation,
+        reached: Callable[[list[dict[str, object]]], bool],
+    ) -> SyncResult:
+        """Poll the object's status until *reached* holds or the timeout expires."""
+        response_parameters = self._status_projection(object_config)
+        delays = _poll_delays(sync_config)
         polls = 0
         start_time = time.monotonic()
         while True:
-            time.sleep(sync_config.poll_interval_seconds)
+            remaining = sync_config.timeout_seconds - (time.monotonic() - start_time)
+            time.sleep(max(min(next(delays), remaining), 0.0))
             status_rows = self._mqsc_command(
                 command="DISPLAY",
                 mqsc_qualifier=object_config.status_qualifier,
                 name=name,
                 request_parameters=None,
-                response_parameters=["all"],
+                response_parameters=response_parameters,
             )
             polls += 1
-            if object_config.empty_means_stopped and not status_rows:
-                elapsed = time.monotonic() - start_time
-                return SyncResult(SyncOperation.STOPPED, polls=polls, elapsed_seconds=elapsed)
-            if _has_status(status_rows, object_config.status_keys, _STOPPED_VALUES):
-                elapsed = time.monotonic() - start_time
-                return SyncResult(SyncOperation.STOPPED, polls=polls, elapsed_seconds=elapsed)
             elapsed = time.monotonic() - start_time
+            if reached(status_rows):
+                return SyncResult(operation, polls=polls, elapsed_seconds=elapsed)
             if elapsed >= sync_config.timeout_seconds:
-                message = f"{object_config.stop_qualifier} '{name}' did not reach STOPPED within {sync_config.timeout_seconds}s"
-                raise MQRESTTimeoutError(
-                    message,
+                raise _timeout_error(name, object_config, sync_config, operation, elapsed)
+
+    def _command_and_poll_many(
+        self,
+        names: Iterable[str],
+        object_config: _ObjectTypeConfig,
+        config: SyncConfig | None,
+        operation: SyncOperation,
+        max_workers: int,
+    ) -> SyncBatchResult:
+        """Issue START or STOP for every name, then poll their status together."""
+        if max_workers < 1:
+            message = "max_workers must be at least 1."
+            raise ValueError(message)
+        sync_config = config or SyncConfig()
+        _validate_sync_config(sync_config)
+        name_list = list(dict.fromkeys(names))
+        errors = self._run_commands(name_list, object_config, operation, max_workers)
+        pending = [name for name in name_list if name not in errors]
+        results = self._poll_many(pending, object_config, sync_config, operation, errors)
+        return SyncBatchResult(results=results, errors=errors)
+
+    def _run_commands(
+        self,
+        names: Sequence[str],
+        object_config: _ObjectTypeConfig,
+        operation: SyncOperation,
+        max_workers: int,
+    ) -> dict[str, MQRESTError]:
+        """Issue START or STOP for each name concurrently, returning the failures."""
+        if not names:
+            return {}
+        started = operation is SyncOperation.STARTED
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names)), thread_name_prefix="pymqrest-sync") as pool:
+            futures = {
+                name: pool.submit(
+                    self._mqsc_command,
+                    command="START" if started else "STOP",
+                    mqsc_qualifier=object_config.start_qualifier if started else object_config.stop_qualifier,
                     name=name,
-                    operation="stop",
-                    elapsed=elapsed,
+                    request_parameters=None,
+                    response_parameters=None,
                 )
+                for name in names
+            }
+        errors: dict[str, MQRESTError] = {}
+        for name, future in futures.items():
+            error = future.exception()
+            if isinstance(error, MQRESTError):
+                errors[name] = error
+            elif error is not None:
+                raise error
+        return errors
+
+    def _poll_many(
+        self,
+        names: Sequence[str],
+        object_config: _ObjectTypeConfig,
+        sync_config: SyncConfig,
+        operation: SyncOperation,
+        errors: dict[str, MQRESTError],
+    ) -> dict[str, SyncResult]:
+        """Poll one generic status ``DISPLAY`` per tick until every name is resolved."""
+        results: dict[str, SyncResult] = {}
+        pending = set(names)
+        if not pending:
+            return results
+        reached = _reached_check(object_config, operation)
+        generic_name = _common_prefix(names) + "*"
+        response_parameters = self._status_projection(object_config)
+        delays = _poll_delays(sync_config)
+        polls = 0
+        start_time = time.monotonic()
+        while pending:
+            remaining = sync_config.timeout_seconds - (time.monotonic() - start_time)
+            time.sleep(max(min(next(delays), remaining), 0.0))
+            rows_by_name = self._status_by_name(object_config, generic_name, response_parameters)
+            polls += 1
+            elapsed = time.monotonic() - start_time
+            for name in [name for name in names if name in pending]:
+                if reached(rows_by_name.get(name, [])):
+                    pending.discard(name)
+                    results[name] = SyncResult(operation, polls=polls, elapsed_seconds=elapsed)
+                elif elapsed >= sync_config.timeout_seconds:
+                    pending.discard(name)
+                    errors[name] = _timeout_error(name, object_config, sync_config, operation, elapsed)
+        return results
+
+    def _status_by_name(
+        self,
+        object_config: _ObjectTypeConfig,
+        generic_name: str,
+        response_parameters: Sequence[str],
+    ) -> dict[str, list[dict[str, object]]]:
+        """Return the status rows of every object matching *generic_name*, grouped by name."""
+        try:
+            status_rows = self._mqsc_command(
+                command="DISPLAY",
+                mqsc_qualifier=object_config.status_qualifier,
+                name=generic_name,
+                request_parameters=None,
+                response_parameters=response_parameters,
+            )
+        except MQRESTCommandError as error:
+            if not _is_no_status_error(error):
+                raise
+            status_rows = []
+        name_key = self.response_key(object_config.status_qualifier, object_config.name_attribute)
+        rows_by_name: dict[str, list[dict[str, object]]] = {}
+        for row in status_rows:
+            rows_by_name.setdefault(str(row.get(name_key)), []).append(row)
+        return rows_by_name
+
+    def _status_projection(self, object_config: _ObjectTypeConfig) -> list[str]:
+        """Return the response parameters requesting only the status attribute.
+
+        mqweb reports the object name alongside it by default.
+        """
+        status_key = self.response_key(object_config.status_qualifier, _STATUS_ATTRIBUTE)
+        return self.display_projection(object_config.status_qualifier, [status_key])
+
+    def _rolling_restart(
+        self,
+        names: str | Iterable[str],
+        object_config: _ObjectTypeConfig,
+        config: SyncConfig | None,
+        max_in_flight: int,
+        where: str | None,
+    ) -> SyncBatchResult:
+        """Restart objects with at most *max_in_flight* between STOP and RUNNING."""
+        if max_in_flight < 1:
+            message = "max_in_flight must be at least 1."
+            raise ValueError(message)
+        sync_config = config or SyncConfig()
+        _validate_sync_config(sync_config)
+        if isinstance(names, str):
+            name_list = self._list_names(object_config, names, where)
+        else:
+            name_list = list(dict.fromkeys(names))
+        if not name_list:
+            return SyncBatchResult(results={}, errors={})
+        generic_name = _common_prefix(name_list) + "*"
+        response_parameters = self._status_projection(object_config)
+        run = _RollingRestart(
+            name_list,
+            object_config,
+            sync_config,
+            max_in_flight,
+            run_commands=lambda batch, operation: self._run_commands(batch, object_config, operation, len(batch)),
+            poll=lambda: self._status_by_name(object_config, generic_name, response_parameters),
+        )
+        return run.execute()
+
+    def _list_names(self, object_config: _ObjectTypeConfig, pattern: str, where: str | None) -> list[str]:
+        """Return the names of the objects matching *pattern* and *where*."""
+        try:
+            rows = self._mqsc_command(
+                command="DISPLAY",
+                mqsc_qualifier=object_config.start_qualifier,
+                name=pattern,
+                request_parameters=None,
+                response_parameters=[],
+                where=where,
+            )
+        except MQRESTCommandError as error:
+            if not _is_no_match_error(error):
+                raise
+            return []
+        name_key = self.response_key(object_config.start_qualifier, object_config.name_attribute)
+        return list(dict.fromkeys(str(row[name_key]) for row in rows if name_key in row))
 
     def _restart(
         self,
@@ -439,6 +971,178 @@ class MQRESTSyncMixin:
         )
 
 
+class _RollingRestart:
+    """Sliding window of restarts sharing one status poll per tick.
+
+    Each object moves from queued to stopping (``STOP`` issued) to
+    starting (``START`` issued) to done. At most *max_in_flight* objects
+    are stopping or starting at once. An object whose restart failed
+    after its ``STOP`` succeeded may still be down, so it keeps its slot
+    for the rest of the run. A failed status poll fails every object in
+    flight, since none of their states can be confirmed.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        object_config: _ObjectTypeConfig,
+        sync_config: SyncConfig,
+        max_in_flight: int,
+        *,
+        run_commands: Callable[[Sequence[str], SyncOperation], dict[str, MQRESTError]],
+        poll: Callable[[], dict[str, list[dict[str, object]]]],
+    ) -> None:
+        self._queue = deque(names)
+        self._object_config = object_config
+        self._sync_config = sync_config
+        self._max_in_flight = max_in_flight
+        self._run_commands = run_commands
+        self._poll = poll
+        self._reached_stopped = _reached_check(object_config, SyncOperation.STOPPED)
+        self._reached_running = _reached_check(object_config, SyncOperation.STARTED)
+        self._phase: dict[str, SyncOperation] = {}
+        self._phase_started: dict[str, float] = {}
+        self._restart_started: dict[str, float] = {}
+        self._polls: dict[str, int] = {}
+        self._held = 0
+        self._results: dict[str, SyncResult] = {}
+        self._errors: dict[str, MQRESTError] = {}
+        self._delays = _poll_delays(sync_config)
+
+    def execute(self) -> SyncBatchResult:
+        while self._queue or self._phase:
+            self._launch()
+            if not self._phase:
+                if self._held >= self._max_in_flight:
+                    break
+                continue
+            now = time.monotonic()
+            remaining = min(
+                started + self._sync_config.timeout_seconds - now for started in self._phase_started.values()
+            )
+            time.sleep(max(min(next(self._delays), remaining), 0.0))
+            try:
+                rows_by_name = self._poll()
+            except MQRESTError as error:
+                for name in list(self._phase):
+                    self._fail(name, error)
+                continue
+            self._advance(rows_by_name)
+        return SyncBatchResult(results=self._results, errors=self._errors, skipped=tuple(self._queue))
+
+    def _launch(self) -> None:
+        batch: list[str] = []
+        while self._queue and len(self._phase) + self._held + len(batch) < self._max_in_flight:
+            batch.append(self._queue.popleft())
+        if not batch:
+            return
+        failed = self._run_commands(batch, SyncOperation.STOPPED)
+        now = time.monotonic()
+        for name in batch:
+            if name in failed:
+                self._errors[name] = failed[name]
+                continue
+            self._enter(name, SyncOperation.STOPPED, now)
+            self._restart_started[name] = now
+            self._polls[name] = 0
+
+    def _advance(self, rows_by_name: dict[str, list[dict[str, object]]]) -> None:
+        now = time.monotonic()
+        stopped: list[str] = []
+        for name, phase in list(self._phase.items()):
+            self._polls[name] += 1
+            rows = rows_by_name.get(name, [])
+            if phase is SyncOperation.STOPPED and self._reached_stopped(rows):
+                stopped.append(name)
+            elif phase is SyncOperation.STARTED and self._reached_running(rows):
+                self._leave(name)
+                self._results[name] = SyncResult(
+                    SyncOperation.RESTARTED,
+                    polls=self._polls[name],
+                    elapsed_seconds=now - self._restart_started[name],
+                )
+            elif now - self._phase_started[name] >= self._sync_config.timeout_seconds:
+                self._fail(
+                    name,
+                    _timeout_error(
+                        name, self._object_config, self._sync_config, phase, now - self._phase_started[name]
+                    ),
+                )
+        if not stopped:
+            return
+        failed = self._run_commands(stopped, SyncOperation.STARTED)
+        now = time.monotonic()
+        for name in stopped:
+            if name in failed:
+                self._fail(name, failed[name])
+            else:
+                self._enter(name, SyncOperation.STARTED, now)
+
+    def _enter(self, name: str, phase: SyncOperation, now: float) -> None:
+        self._phase[name] = phase
+        self._phase_started[name] = now
+        self._delays = _poll_delays(self._sync_config)
+
+    def _leave(self, name: str) -> None:
+        del self._phase[name]
+        del self._phase_started[name]
+
+    def _fail(self, name: str, error: MQRESTError) -> None:
+        self._leave(name)
+        self._errors[name] = error
+        self._held += 1
+
+
+def _reached_check(
+    object_config: _ObjectTypeConfig,
+    operation: SyncOperation,
+) -> Callable[[list[dict[str, object]]], bool]:
+    """Return a check of whether status rows show the operation's target state."""
+    if operation is SyncOperation.STARTED:
+        return lambda rows: _has_status(rows, object_config.status_keys, _RUNNING_VALUES)
+    return lambda rows: (
+        (object_config.empty_means_stopped and not rows)
+        or _has_status(rows, object_config.status_keys, _STOPPED_VALUES)
+    )
+
+
+def _timeout_error(
+    name: str,
+    object_config: _ObjectTypeConfig,
+    sync_config: SyncConfig,
+    operation: SyncOperation,
+    elapsed: float,
+) -> MQRESTTimeoutError:
+    started = operation is SyncOperation.STARTED
+    target = "RUNNING" if started else "STOPPED"
+    message = f"{object_config.start_qualifier} '{name}' did not reach {target} within {sync_config.timeout_seconds}s"
+    return MQRESTTimeoutError(message, name=name, operation="start" if started else "stop", elapsed=elapsed)
+
+
+def _poll_delays(config: SyncConfig) -> Iterator[float]:
+    """Yield the sleep before each status poll, before clamping to the deadline."""
+    if config.first_poll_immediate:
+        yield 0.0
+    interval = config.poll_interval_seconds
+    while True:
+        if config.max_poll_interval_seconds is not None:
+            interval = min(interval, config.max_poll_interval_seconds)
+        yield interval * (1 + random.uniform(-config.jitter, config.jitter))  # noqa: S311
+        interval *= config.backoff_multiplier
+
+
+def _validate_sync_config(config: SyncConfig) -> None:
+    if config.backoff_multiplier < 1:
+        message = "backoff_multiplier must be at least 1."
+        raise ValueError(message)
+    if config.max_poll_interval_seconds is not None and config.max_poll_interval_seconds <= 0:
+        message = "max_poll_interval_seconds must be positive."
+        raise ValueError(message)
+    if not 0 <= config.jitter < 1:
+        message = "jitter must be at least 0 and less than 1."
+        raise ValueError(message)
+
+
 def _has_status(
     rows: list[dict[str, object]],
     status_keys: tuple[str, ...],
@@ -451,3 +1155,8 @@ def _has_status(
             if isinstance(value, str) and value in target_values:
                 return True
     return False
+
+
+def _is_no_status_error(error: MQRESTCommandError) -> bool:
+    """Check whether a failed status ``DISPLAY`` only reports that no status was found."""
+    return _is_no_match_error(error, _NO_STATUS_REASON_CODES)
@@ -0,0 +1,499 @@
+"""Client-side rate limiting and concurrency caps for MQ REST endpoints."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from .exceptions import MQRESTTransportError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .session import MQRESTTransport, TransportResponse
+
+ERROR_THROTTLE_WAIT_EXCEEDED = "Timed out waiting for an MQ REST request slot."
+SERVER_ERROR_STATUS = 500
+_LATENCY_SMOOTHING = 0.2
+_BASELINE_DRIFT = 0.01
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrencyConfig:
+    """Additive-increase/multiplicative-decrease (AIMD) concurrency control.
+
+    The in-flight limit grows by *increase_step* for each full window of
+    healthy requests and is multiplied by *decrease_factor* when a
+    request times out, fails with a 5xx status, or the smoothed latency
+    rises above *latency_tolerance* times the best latency observed.
+    At most one decrease is applied per round-trip time.
+
+    Attributes:
+        initial_limit: Concurrency limit before any feedback.
+        min_limit: Lower bound for the limit.
+        max_limit: Upper bound for the limit.
+        increase_step: Additive increase per window of healthy requests.
+        decrease_factor: Multiplier applied on congestion, between
+            ``0`` and ``1``.
+        latency_tolerance: Ratio of smoothed latency to baseline
+            latency above which the endpoint is considered congested.
+
+    """
+
+    initial_limit: int = 4
+    min_limit: int = 1
+    max_limit: int = 64
+    increase_step: float = 1.0
+    decrease_factor: float = 0.5
+    latency_tolerance: float = 2.0
+
+
+@dataclass(frozen=True)
+class ThrottleConfig:
+    """Limits applied to every request sent to a single mqweb endpoint.
+
+    Attributes:
+        requests_per_second: Sustained request rate allowed by the
+            token bucket, or ``None`` for no rate limit.
+        burst: Token bucket capacity — the number of requests that may
+            be issued back-to-back before the rate limit applies.
+        max_in_flight: Maximum number of concurrent requests, or
+            ``None`` for no concurrency cap.
+        max_wait_seconds: Maximum seconds a request may wait for a
+            slot before :class:`~pymqrest.exceptions.MQRESTTransportError`
+            is raised, or ``None`` to wait indefinitely.
+        adaptive: Optional :class:`AdaptiveConcurrencyConfig`. When set,
+            the in-flight limit adapts to endpoint health, bounded above
+            by *max_in_flight* when that is also set.
+
+    """
+
+    requests_per_second: float | None = None
+    burst: int = 1
+    max_in_flight: int | None = None
+    max_wait_seconds: float | None = None
+    adaptive: AdaptiveConcurrencyConfig | None = None
+
+
+@dataclass(frozen=True)
+class ThrottleStats:
+    """Point-in-time counters for a single endpoint throttle.
+
+    Attributes:
+        endpoint: The endpoint key (``scheme://host:port``).
+        requests: Total requests admitted.
+        delayed_requests: Requests that had to wait for a slot.
+        rejected_requests: Requests that gave up after
+            ``max_wait_seconds``.
+        total_wait_seconds: Cumulative seconds spent queued.
+        max_wait_seconds: Longest single wait in seconds.
+        in_flight: Requests currently in flight.
+        peak_in_flight: Highest concurrent in-flight count observed.
+        concurrency_limit: Current adaptive in-flight limit, or
+            ``None`` when adaptive control is disabled.
+        failed_requests: Requests reported as failed (timeouts,
+            transport errors, or 5xx responses).
+
+    """
+
+    endpoint: str
+    requests: int
+    delayed_requests: int
+    rejected_requests: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    in_flight: int
+    peak_in_flight: int
+    concurrency_limit: int | None = None
+    failed_requests: int = 0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Mean seconds spent queued per admitted request."""
+        if not self.requests:
+            return 0.0
+        return self.total_wait_seconds / self.requests
+
+
+class EndpointThrottle:
+    """Token bucket rate limiter and in-flight cap for one endpoint.
+
+    Instances are thread-safe. Callers block in :meth:`acquire` until
+    both a rate token and an in-flight slot are available, and must
+    call :meth:`release` once the request completes. When adaptive
+    control is configured, the outcome passed to :meth:`release` drives
+    the AIMD in-flight limit.
+    """
+
+    def __init__(self, endpoint: str, config: ThrottleConfig) -> None:
+        """Initialize the throttle.
+
+        Args:
+            endpoint: The endpoint key this throttle guards.
+            config: The limits to enforce.
+
+        Raises:
+            ValueError: If any limit in *config* is not positive.
+
+        """
+        _validate_throttle_config(config)
+        self._endpoint = endpoint
+        self._config = config
+        self._condition = threading.Condition()
+        self._tokens = float(config.burst)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._requests = 0
+        self._delayed_requests = 0
+        self._rejected_requests = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._failed_requests = 0
+        adaptive = config.adaptive
+        self._limit = float(adaptive.initial_limit) if adaptive is not None else 0.0
+        self._baseline_latency: float | None = None
+        self._smoothed_latency: float | None = None
+        self._decrease_hold_until = 0.0
+
+    @property
+    def endpoint(self) -> str:
+        """The endpoint key this throttle guards."""
+        return self._endpoint
+
+    @property
+    def config(self) -> ThrottleConfig:
+        """The limits enforced by this throttle."""
+        return self._config
+
+    def acquire(self) -> float:
+        """Block until a request may be sent to the endpoint.
+
+        Returns:
+            The number of seconds spent waiting.
+
+        Raises:
+            MQRESTTransportError: If no slot became available within
+                ``max_wait_seconds``.
+
+        """
+        with self._condition:
+            start_time = time.monotonic()
+            deadline = None
+            if self._config.max_wait_seconds is not None:
+                deadline = start_time + self._config.max_wait_seconds
+            delayed = False
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                token_wait = self._token_wait_seconds()
+                limit = self._in_flight_limit()
+                has_slot = limit is None or self._in_flight < limit
+                if has_slot and token_wait == 0.0:
+                    break
+                remaining = None if deadline is None else deadline - now
+                if remaining is not None and remaining <= 0:
+                    self._rejected_requests += 1
+                    raise MQRESTTransportError(ERROR_THROTTLE_WAIT_EXCEEDED, url=self._endpoint)
+                delayed = True
+                self._condition.wait(_min_timeout(token_wait if has_slot else None, remaining))
+            if self._config.requests_per_second is not None:
+                self._tokens -= 1.0
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            waited = time.monotonic() - start_time if delayed else 0.0
+            self._requests += 1
+            if delayed:
+                self._delayed_requests += 1
+            self._total_wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+            return waited
+
+    def release(self, *, latency_seconds: float | None = None, failed: bool = False) -> None:
+        """Return an in-flight slot acquired by :meth:`acquire`.
+
+        Args:
+            latency_seconds: Observed request latency, used as a
+                congestion signal by adaptive control.
+            failed: Whether the request timed out, failed at the
+                transport level, or returned a 5xx status.
+
+        """
+        with self._condition:
+            if failed:
+                self._failed_requests += 1
+            if self._config.adaptive is not None:
+                self._adapt_limit(self._config.adaptive, latency_seconds, failed=failed)
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def stats(self) -> ThrottleStats:
+        """Return a snapshot of the throttle counters.
+
+        Returns:
+            A :class:`ThrottleStats` instance.
+
+        """
+        with self._condition:
+            return ThrottleStats(
+                endpoint=self._endpoint,
+                requests=self._requests,
+                delayed_requests=self._delayed_requests,
+                rejected_requests=self._rejected_requests,
+                total_wait_seconds=self._total_wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+                in_flight=self._in_flight,
+                peak_in_flight=self._peak_in_flight,
+                concurrency_limit=self._in_flight_limit() if self._config.adaptive is not None else None,
+                failed_requests=self._failed_requests,
+            )
+
+    def _in_flight_limit(self) -> int | None:
+        if self._config.adaptive is None:
+            return self._config.max_in_flight
+        limit = int(self._limit)
+        if self._config.max_in_flight is not None:
+            limit = min(limit, self._config.max_in_flight)
+        return limit
+
+    def _adapt_limit(
+        self,
+        adaptive: AdaptiveConcurrencyConfig,
+        latency_seconds: float | None,
+        *,
+        failed: bool,
+    ) -> None:
+        if latency_seconds is not None and not failed:
+            self._track_latency(latency_seconds)
+        congested = failed or (
+            self._baseline_latency is not None
+            and self._smoothed_latency is not None
+            and self._smoothed_latency > self._baseline_latency * adaptive.latency_tolerance
+        )
+        if congested:
+            now = time.monotonic()
+            if now >= self._decrease_hold_until:
+                self._limit = max(float(adaptive.min_limit), self._limit * adaptive.decrease_factor)
+                # One decrease per round trip, as in TCP congestion control.
+                self._decrease_hold_until = now + (self._smoothed_latency or 0.0)
+            return
+        # Only grow while at least half of the current limit is in use.
+        if self._in_flight * 2 >= self._limit:
+            self._limit = min(float(adaptive.max_limit), self._limit + adaptive.increase_step / self._limit)
+
+    def _track_latency(self, latency_seconds: float) -> None:
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency_seconds
+        else:
+            self._smoothed_latency += (latency_seconds - self._smoothed_latency) * _LATENCY_SMOOTHING
+        if self._baseline_latency is None or latency_seconds < self._baseline_latency:
+            self._baseline_latency = latency_seconds
+        else:
+            # Let the baseline drift upward so a permanent shift is relearned.
+            self._baseline_latency += (latency_seconds - self._baseline_latency) * _BASELINE_DRIFT
+
+    def _refill(self, now: float) -> None:
+        rate = self._config.requests_per_second
+        if rate is not None:
+            self._tokens = min(float(self._config.burst), self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+
+    def _token_wait_seconds(self) -> float:
+        rate = self._config.requests_per_second
+        if rate is None or self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / rate
+
+
+class ThrottleRegistry:
+    """Per-endpoint throttles shared across transports and sessions.
+
+    A registry lazily creates one :class:`EndpointThrottle` per
+    endpoint (``scheme://host:port``). Pass the same registry to
+    several sessions so that they share one budget per mqweb server.
+    """
+
+    def __init__(
+        self,
+        config: ThrottleConfig | None = None,
+        *,
+        endpoint_configs: Mapping[str, ThrottleConfig] | None = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            config: Default limits for endpoints without an explicit
+                entry in *endpoint_configs*.
+            endpoint_configs: Per-endpoint limit overrides, keyed by
+                any URL on the endpoint (e.g. the REST base URL).
+
+        Raises:
+            ValueError: If any configured limit is not positive.
+
+        """
+        self._default_config = config or ThrottleConfig()
+        _validate_throttle_config(self._default_config)
+        self._endpoint_configs: dict[str, ThrottleConfig] = {}
+        for url, endpoint_config in (endpoint_configs or {}).items():
+            _validate_throttle_config(endpoint_config)
+            self._endpoint_configs[endpoint_key(url)] = endpoint_config
+        self._lock = threading.Lock()
+        self._throttles: dict[str, EndpointThrottle] = {}
+
+    def throttle_for(self, url: str) -> EndpointThrottle:
+        """Return the throttle guarding the endpoint that serves *url*.
+
+        Args:
+            url: Any URL on the endpoint.
+
+        Returns:
+            The shared :class:`EndpointThrottle` for the endpoint.
+
+        """
+        key = endpoint_key(url)
+        with self._lock:
+            throttle = self._throttles.get(key)
+            if throttle is None:
+                throttle = EndpointThrottle(key, self._endpoint_configs.get(key, self._default_config))
+                self._throttles[key] = throttle
+            return throttle
+
+    def stats(self) -> dict[str, ThrottleStats]:
+        """Return a snapshot of every endpoint throttle.
+
+        Returns:
+            A dict mapping endpoint keys to :class:`ThrottleStats`.
+
+        """
+        with self._lock:
+            throttles = list(self._throttles.values())
+        return {throttle.endpoint: throttle.stats() for throttle in throttles}
+
+
+class ThrottledTransport:
+    """:class:`~pymqrest.session.MQRESTTransport` wrapper enforcing endpoint limits.
+
+    Every request, including LTPA login, acquires a slot from the
+    registry's throttle for the target endpoint before being delegated
+    to the wrapped transport.
+    """
+
+    def __init__(self, transport: MQRESTTransport, registry: ThrottleRegistry) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            transport: The transport that performs the HTTP requests.
+            registry: The registry supplying per-endpoint throttles.
+
+        """
+        self._transport = transport
+        self._registry = registry
+
+    @property
+    def registry(self) -> ThrottleRegistry:
+        """The registry supplying per-endpoint throttles."""
+        return self._registry
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        """Wait for an endpoint slot, then delegate to the wrapped transport.
+
+        Args:
+            url: The fully-qualified URL to POST to.
+            payload: The JSON-serialisable request body.
+            headers: HTTP headers to include in the request.
+            timeout_seconds: Request timeout in seconds, or ``None``
+                for no timeout.
+            verify_tls: Whether to verify the server's TLS certificate.
+
+        Returns:
+            The wrapped transport's :class:`~pymqrest.session.TransportResponse`.
+
+        Raises:
+            MQRESTTransportError: If no slot became available within
+                ``max_wait_seconds``, or the wrapped transport fails.
+
+        """
+        throttle = self._registry.throttle_for(url)
+        throttle.acquire()
+        start_time = time.monotonic()
+        try:
+            response = self._transport.post_json(
+                url,
+                payload,
+                headers=headers,
+                timeout_seconds=timeout_seconds,
+                verify_tls=verify_tls,
+            )
+        except MQRESTTransportError:
+            throttle.release(latency_seconds=time.monotonic() - start_time, failed=True)
+            raise
+        except BaseException:
+            throttle.release()
+            raise
+        throttle.release(
+            latency_seconds=time.monotonic() - start_time,
+            failed=response.status_code >= SERVER_ERROR_STATUS,
+        )
+        return response
+
+
+def endpoint_key(url: str) -> str:
+    """Return the ``scheme://host:port`` endpoint key for *url*.
+
+    Args:
+        url: Any absolute URL.
+
+    Returns:
+        The lower-cased scheme and network location of *url*.
+
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def _validate_throttle_config(config: ThrottleConfig) -> None:
+    if config.requests_per_second is not None and config.requests_per_second <= 0:
+        message = "requests_per_second must be positive."
+        raise ValueError(message)
+    if config.burst < 1:
+        message = "burst must be at least 1."
+        raise ValueError(message)
+    if config.max_in_flight is not None and config.max_in_flight < 1:
+        message = "max_in_flight must be at least 1."
+        raise ValueError(message)
+    if config.adaptive is not None:
+        _validate_adaptive_config(config.adaptive)
+
+
+def _validate_adaptive_config(adaptive: AdaptiveConcurrencyConfig) -> None:
+    if not 1 <= adaptive.min_limit <= adaptive.initial_limit <= adaptive.max_limit:
+        message = "Adaptive limits must satisfy 1 <= min_limit <= initial_limit <= max_limit."
+        raise ValueError(message)
+    if adaptive.increase_step <= 0:
+        message = "increase_step must be positive."
+        raise ValueError(message)
+    if not 0 < adaptive.decrease_factor < 1:
+        message = "decrease_factor must be between 0 and 1."
+        raise ValueError(message)
+    if adaptive.latency_tolerance <= 1:
+        message = "latency_tolerance must be greater than 1."
+        raise ValueError(message)
+
+
+def _min_timeout(first: float | None, second: float | None) -> float | None:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return min(first, second)
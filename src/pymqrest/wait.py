@@ -0,0 +1,391 @@
+"""Condition waits on ``DISPLAY`` results, sharing one poll per qualifier."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
+
+from .cache import qualifier_family
+from .ensure import _common_prefix
+from .exceptions import MQRESTCommandError, MQRESTError, MQRESTTimeoutError
+from .sync import SyncConfig, _is_no_status_error, _poll_delays, _validate_sync_config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    Rows = list[dict[str, object]]
+
+_GENERIC_SUFFIX = "*"
+
+
+@dataclass(frozen=True)
+class WaitResult:
+    """Result of a satisfied wait.
+
+    Attributes:
+        rows: The ``DISPLAY`` rows of the waited-on object that
+            satisfied the predicate.
+        polls: Number of polls evaluated for this wait.
+        elapsed_seconds: Seconds from submitting the wait to the poll
+            that satisfied it.
+
+    """
+
+    rows: list[dict[str, object]]
+    polls: int
+    elapsed_seconds: float
+
+
+class PendingWait:
+    """A submitted wait, resolved by polls shared with other waits.
+
+    Returned by :meth:`MQRESTWaitMixin.submit_wait`. Waits are only
+    polled while some thread is blocked in :meth:`result` of a wait in
+    the same poll group, and every wait in the group is evaluated
+    against each poll, so waits submitted together and collected one
+    after another cost one ``DISPLAY`` per tick between them.
+    """
+
+    def __init__(self, group: _PollGroup, waiter: _Waiter) -> None:
+        """Initialize from the wait's poll group and state."""
+        self._group = group
+        self._waiter = waiter
+
+    @property
+    def name(self) -> str:
+        """The object name, or generic name, being waited on."""
+        return self._waiter.name
+
+    @property
+    def done(self) -> bool:
+        """Whether the wait has been satisfied, timed out or failed."""
+        return self._waiter.done
+
+    def result(self) -> WaitResult:
+        """Poll until the predicate holds and return the result.
+
+        Returns:
+            A :class:`WaitResult` with the satisfying rows.
+
+        Raises:
+            MQRESTTimeoutError: If the predicate did not hold within the
+                timeout, counted from submission.
+            MQRESTError: If a poll for the wait failed for any reason
+                other than no matching objects.
+
+        """
+        return self._group.wait(self._waiter)
+
+
+class MQRESTWaitMixin:
+    """Mixin providing condition waits on ``DISPLAY`` results.
+
+    :meth:`wait_for` polls ``DISPLAY <qualifier>`` until a predicate
+    holds for the named object's rows. Waits on the same queue manager,
+    qualifier and parameters form one poll group: each tick issues a
+    single ``DISPLAY`` of the generic name covering every waited-on
+    name, and evaluates every wait in the group against it.
+    """
+
+    _qmgr_name: str
+    _poll_scheduler: _PollScheduler
+
+    def _mqsc_command(
+        self,
+        *,
+        command: str,
+        mqsc_qualifier: str,
+        name: str | None,
+        request_parameters: Mapping[str, object] | None,
+        response_parameters: Sequence[str] | None,
+        where: str | None = None,
+    ) -> list[dict[str, object]]:
+        raise NotImplementedError  # pragma: no cover
+
+    def response_key(self, qualifier: str, attribute: str) -> str:
+        """Return the key under which ``DISPLAY`` results report an MQSC attribute."""
+        raise NotImplementedError  # pragma: no cover
+
+    def wait_for(
+        self,
+        qualifier: str,
+        name: str,
+        predicate: Callable[[list[dict[str, object]]], bool],
+        config: SyncConfig | None = None,
+        *,
+        request_parameters: Mapping[str, object] | None = None,
+        response_parameters: Sequence[str] | None = None,
+    ) -> WaitResult:
+        """Poll ``DISPLAY <qualifier>`` until *predicate* holds for *name*.
+
+        Example::
+
+            session.wait_for(
+                "QUEUE",
+                "APP.IN",
+                lambda rows: int(rows[0]["current_queue_depth"]) < 100,
+                SyncConfig(timeout_seconds=300.0, backoff_multiplier=1.5),
+            )
+
+        Args:
+            qualifier: The ``DISPLAY`` qualifier, e.g. ``"QUEUE"`` or
+                ``"CHSTATUS"``.
+            name: Object name, or a generic name such as ``"APP.*"``.
+            predicate: Called with the rows reported for *name* on each
+                poll (empty when there are none); the wait ends when it
+                returns ``True``.
+            config: Timeout and polling intervals. The timeout is a
+                deadline counted from the call.
+            request_parameters: Optional ``DISPLAY`` request
+                parameters, e.g. ``{"type": "HANDLE"}`` for
+                ``QSTATUS``.
+            response_parameters: Attributes the predicate reads, or
+                ``None`` for all of them. The object name is always
+                reported.
+
+        Returns:
+            A :class:`WaitResult` with the satisfying rows.
+
+        Raises:
+            MQRESTTimeoutError: If the predicate did not hold within the
+                timeout.
+            MQRESTError: If a poll failed for any reason other than no
+                matching objects or status.
+            ValueError: If *config* is invalid.
+
+        """
+        return self.submit_wait(
+            qualifier,
+            name,
+            predicate,
+            config,
+            request_parameters=request_parameters,
+            response_parameters=response_parameters,
+        ).result()
+
+    def submit_wait(
+        self,
+        qualifier: str,
+        name: str,
+        predicate: Callable[[list[dict[str, object]]], bool],
+        config: SyncConfig | None = None,
+        *,
+        request_parameters: Mapping[str, object] | None = None,
+        response_parameters: Sequence[str] | None = None,
+    ) -> PendingWait:
+        """Register a wait without blocking; see :meth:`wait_for`.
+
+        Submit several waits, then call :meth:`PendingWait.result` on
+        each: waits in the same poll group share every ``DISPLAY``.
+
+        Returns:
+            The :class:`PendingWait`.
+
+        Raises:
+            ValueError: If *config* is invalid.
+
+        """
+        sync_config = config or SyncConfig()
+        _validate_sync_config(sync_config)
+        qualifier_upper = qualifier.strip().upper()
+        parameters = dict(request_parameters) if request_parameters is not None else None
+        projection = list(response_parameters) if response_parameters is not None else ["all"]
+        key = (
+            self._qmgr_name,
+            qualifier_upper,
+            tuple(sorted((str(key), str(value)) for key, value in (parameters or {}).items())),
+            tuple(projection),
+        )
+
+        def fetch(generic_name: str) -> Rows:
+            try:
+                return self._mqsc_command(
+                    command="DISPLAY",
+                    mqsc_qualifier=qualifier_upper,
+                    name=generic_name,
+                    request_parameters=parameters,
+                    response_parameters=projection,
+                )
+            except MQRESTCommandError as error:
+                if not _is_no_status_error(error):
+                    raise
+                return []
+
+        name_key = self.response_key(qualifier_upper, qualifier_family(qualifier_upper))
+        return self._poll_scheduler.submit(key, fetch, name_key, _Waiter(name, predicate, sync_config))
+
+
+class _Waiter:
+    """State of one wait within its poll group."""
+
+    def __init__(
+        self,
+        name: str,
+        predicate: Callable[[Rows], bool],
+        config: SyncConfig,
+    ) -> None:
+        self.name = name
+        self.predicate = predicate
+        self.config = config
+        self.started = time.monotonic()
+        self.deadline = self.started + config.timeout_seconds
+        self.delays = _poll_delays(config)
+        self.schedule(self.started)
+        self.polls = 0
+        self.result: WaitResult | None = None
+        self.error: Exception | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None or self.error is not None
+
+    def schedule(self, now: float) -> None:
+        self.next_poll = min(now + next(self.delays), self.deadline)
+
+    def matches(self, row_name: str) -> bool:
+        if self.name.endswith(_GENERIC_SUFFIX):
+            return row_name.startswith(self.name.removesuffix(_GENERIC_SUFFIX))
+        return row_name == self.name
+
+    def evaluate(self, rows: Rows, name_key: str, now: float) -> None:
+        self.polls += 1
+        matched = [row for row in rows if self.matches(str(row.get(name_key)))]
+        try:
+            satisfied = self.predicate(matched)
+        except Exception as error:  # noqa: BLE001
+            self.error = error
+            return
+        elapsed = now - self.started
+        if satisfied:
+            self.result = WaitResult(rows=matched, polls=self.polls, elapsed_seconds=elapsed)
+        elif now >= self.deadline:
+            message = f"'{self.name}' did not satisfy the wait condition within {self.config.timeout_seconds}s"
+            self.error = MQRESTTimeoutError(message, name=self.name, operation="wait", elapsed=elapsed)
+        elif now >= self.next_poll:
+            self.schedule(now)
+
+    def outcome(self) -> WaitResult:
+        if self.error is not None:
+            raise self.error
+        return cast("WaitResult", self.result)
+
+
+class _PollGroup:
+    """Waits sharing one ``DISPLAY`` per tick.
+
+    Whichever thread is blocked on a wait of the group and finds no
+    poll in progress drives the polling: it waits until the earliest
+    wait is due, issues the ``DISPLAY`` and evaluates every wait. A
+    wait submitted meanwhile wakes it, so a wait due sooner is not held
+    back by the interval of another. Other threads block until a poll
+    resolves their wait or the driver's own wait ends and the role
+    passes on.
+    """
+
+    def __init__(
+        self,
+        scheduler: _PollScheduler,
+        key: tuple[object, ...],
+        fetch: Callable[[str], Rows],
+        name_key: str,
+    ) -> None:
+        self._scheduler = scheduler
+        self._key = key
+        self._fetch = fetch
+        self._name_key = name_key
+        self._condition = threading.Condition()
+        self._waiters: list[_Waiter] = []
+        self._polling = False
+
+    @property
+    def idle(self) -> bool:
+        with self._condition:
+            return not self._waiters
+
+    def add(self, waiter: _Waiter) -> None:
+        with self._condition:
+            self._waiters.append(waiter)
+            self._condition.notify_all()
+
+    def wait(self, waiter: _Waiter) -> WaitResult:
+        with self._condition:
+            while not waiter.done:
+                if self._polling:
+                    self._condition.wait()
+                    continue
+                self._polling = True
+                try:
+                    self._tick()
+                finally:
+                    self._polling = False
+                    self._condition.notify_all()
+        self._scheduler.discard(self._key, self)
+        return waiter.outcome()
+
+    def _pause(self, seconds: float) -> None:
+        self._condition.wait(seconds)
+
+    def _tick(self) -> None:
+        """Wait until the earliest wait is due, poll once and evaluate every wait.
+
+        A failed poll fails every wait it was issued for.
+        """
+        while (remaining := min(waiter.next_poll for waiter in self._waiters) - time.monotonic()) > 0:
+            self._pause(remaining)
+        waiters = list(self._waiters)
+        names = list(dict.fromkeys(waiter.name for waiter in waiters))
+        if len(names) == 1 and not names[0].endswith(_GENERIC_SUFFIX):
+            generic_name = names[0]
+        else:
+            generic_name = _common_prefix([name.removesuffix(_GENERIC_SUFFIX) for name in names]) + _GENERIC_SUFFIX
+        self._condition.release()
+        failure: MQRESTError | None = None
+        try:
+            rows = self._fetch(generic_name)
+        except MQRESTError as error:
+            rows, failure = [], error
+        finally:
+            self._condition.acquire()
+        now = time.monotonic()
+        for waiter in waiters:
+            if failure is not None:
+                waiter.error = failure
+            else:
+                waiter.evaluate(rows, self._name_key, now)
+        self._waiters = [waiter for waiter in self._waiters if not waiter.done]
+
+
+class _PollScheduler:
+    """Poll groups of one session, keyed by queue manager, qualifier and parameters.
+
+    A group is dropped once its last wait has been collected.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._groups: dict[tuple[object, ...], _PollGroup] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._groups)
+
+    def submit(
+        self,
+        key: tuple[object, ...],
+        fetch: Callable[[str], Rows],
+        name_key: str,
+        waiter: _Waiter,
+    ) -> PendingWait:
+        with self._lock:
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = _PollGroup(self, key, fetch, name_key)
+            group.add(waiter)
+        return PendingWait(group, waiter)
+
+    def discard(self, key: tuple[object, ...], group: _PollGroup) -> None:
+        with self._lock:
+            if self._groups.get(key) is group and group.idle:
+                del self._groups[key]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+import time
 from os import getenv
 from pathlib import Path
 
@@ -46,3 +47,22 @@ def pytest_collection_modifyitems(
     for test_item in items:
         if test_item.get_closest_marker("integration") is not None:
             test_item.add_marker(skip_marker)
+
+
+class FakeClock:
+    """Clock standing in for :func:`time.monotonic` and :func:`time.time`; set ``now`` to move it."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def read(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Freeze ``time.monotonic`` and ``time.time`` at a settable fake clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake.read)
+    monkeypatch.setattr(time, "time", fake.read)
+    return fake
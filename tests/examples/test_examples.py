@@ -126,6 +126,15 @@ class TestHealthCheck:
         assert len(results) == 1
         assert results[0].passed is True
 
+    def test_main_reports_failed_check(self, mock_session: MagicMock) -> None:
+        mock_session.display_qmgr.return_value = {"queue_manager_name": "QM1"}
+        mock_session.display_qmstatus.side_effect = MQRESTError("fail")
+
+        results = health_check_main([mock_session])
+
+        assert results[0].qmgr_name == "QM1"
+        assert results[0].reachable is False
+
 
 # ---------------------------------------------------------------------------
 # channel_status
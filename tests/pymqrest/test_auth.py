@@ -3,26 +3,41 @@
 from __future__ import annotations
 
 import dataclasses
+import json
+import stat
+import threading
+import time
 from typing import TYPE_CHECKING
 
 import pytest
 
+from pymqrest import auth
 from pymqrest.auth import (
+    ERROR_LTPA_LOGIN_FAILED,
     BasicAuth,
     CertificateAuth,
     LTPAAuth,
-    _extract_ltpa_token,
-    _perform_ltpa_login,
+    LTPAToken,
+    LTPATokenCache,
+    _derive_verifier,
+    _extract_ltpa_morsel,
+    _request_ltpa_token,
 )
 from pymqrest.exceptions import MQRESTAuthError
 from pymqrest.session import TransportResponse
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
+    from pathlib import Path
 
 TEST_PASSWORD = "secret"
 STATUS_OK = 200
 STATUS_UNAUTHORIZED = 401
+BASE_URL = "https://example.invalid/ibmmq/rest/v2"
+MAX_AGE_SECONDS = 600
+CUSTOM_LIFETIME_SECONDS = 60.0
+OWNER_READ_WRITE = 0o600
+WAIT_SECONDS = 5.0
 
 
 class FakeLoginTransport:
@@ -94,10 +109,10 @@ def test_certificate_auth_is_frozen() -> None:
         cred.cert_path = "/other.pem"  # type: ignore[misc]
 
 
-# -- _perform_ltpa_login success --
+# -- _request_ltpa_token success --
 
 
-def test_perform_ltpa_login_success() -> None:
+def test_request_ltpa_token_success() -> None:
     transport = FakeLoginTransport(
         TransportResponse(
             status_code=STATUS_OK,
@@ -106,7 +121,7 @@ def test_perform_ltpa_login_success() -> None:
         ),
     )
 
-    token = _perform_ltpa_login(
+    token = _request_ltpa_token(
         transport,
         "https://example.invalid/ibmmq/rest/v2",
         LTPAAuth("user", TEST_PASSWORD),
@@ -115,14 +130,14 @@ def test_perform_ltpa_login_success() -> None:
         verify_tls=False,
     )
 
-    assert token == "abc123"
+    assert token.value == "abc123"
     assert transport.recorded_url == "https://example.invalid/ibmmq/rest/v2/login"
     assert transport.recorded_payload == {"username": "user", "password": TEST_PASSWORD}
     assert transport.recorded_headers is not None
     assert transport.recorded_headers["ibm-mq-rest-csrf-token"] == "local"
 
 
-def test_perform_ltpa_login_without_csrf_token() -> None:
+def test_request_ltpa_token_without_csrf_token() -> None:
     transport = FakeLoginTransport(
         TransportResponse(
             status_code=STATUS_OK,
@@ -131,7 +146,7 @@ def test_perform_ltpa_login_without_csrf_token() -> None:
         ),
     )
 
-    token = _perform_ltpa_login(
+    token = _request_ltpa_token(
         transport,
         "https://example.invalid/ibmmq/rest/v2",
         LTPAAuth("user", TEST_PASSWORD),
@@ -140,15 +155,15 @@ def test_perform_ltpa_login_without_csrf_token() -> None:
         verify_tls=False,
     )
 
-    assert token == "token_value"
+    assert token.value == "token_value"
     assert transport.recorded_headers is not None
     assert "ibm-mq-rest-csrf-token" not in transport.recorded_headers
 
 
-# -- _perform_ltpa_login failures --
+# -- _request_ltpa_token failures --
 
 
-def test_perform_ltpa_login_http_error_raises() -> None:
+def test_request_ltpa_token_http_error_raises() -> None:
     transport = FakeLoginTransport(
         TransportResponse(
             status_code=STATUS_UNAUTHORIZED,
@@ -158,7 +173,7 @@ def test_perform_ltpa_login_http_error_raises() -> None:
     )
 
     with pytest.raises(MQRESTAuthError) as excinfo:
-        _perform_ltpa_login(
+        _request_ltpa_token(
             transport,
             "https://example.invalid/ibmmq/rest/v2",
             LTPAAuth("user", TEST_PASSWORD),
@@ -171,7 +186,7 @@ def test_perform_ltpa_login_http_error_raises() -> None:
     assert excinfo.value.status_code == STATUS_UNAUTHORIZED
 
 
-def test_perform_ltpa_login_missing_token_raises() -> None:
+def test_request_ltpa_token_missing_token_raises() -> None:
     transport = FakeLoginTransport(
         TransportResponse(
             status_code=STATUS_OK,
@@ -181,7 +196,7 @@ def test_perform_ltpa_login_missing_token_raises() -> None:
     )
 
     with pytest.raises(MQRESTAuthError) as excinfo:
-        _perform_ltpa_login(
+        _request_ltpa_token(
             transport,
             "https://example.invalid/ibmmq/rest/v2",
             LTPAAuth("user", TEST_PASSWORD),
@@ -194,7 +209,7 @@ def test_perform_ltpa_login_missing_token_raises() -> None:
     assert excinfo.value.status_code == STATUS_OK
 
 
-def test_perform_ltpa_login_no_set_cookie_raises() -> None:
+def test_request_ltpa_token_no_set_cookie_raises() -> None:
     transport = FakeLoginTransport(
         TransportResponse(
             status_code=STATUS_OK,
@@ -204,7 +219,7 @@ def test_perform_ltpa_login_no_set_cookie_raises() -> None:
     )
 
     with pytest.raises(MQRESTAuthError):
-        _perform_ltpa_login(
+        _request_ltpa_token(
             transport,
             "https://example.invalid/ibmmq/rest/v2",
             LTPAAuth("user", TEST_PASSWORD),
@@ -214,28 +229,207 @@ def test_perform_ltpa_login_no_set_cookie_raises() -> None:
         )
 
 
-# -- _extract_ltpa_token edge cases --
+# -- _extract_ltpa_morsel edge cases --
 
 
-def test_extract_ltpa_token_with_multiple_cookies() -> None:
+def _morsel_value(headers: Mapping[str, str]) -> str:
+    morsel = _extract_ltpa_morsel(headers)
+    assert morsel is not None
+    return morsel.value
+
+
+def test_extract_ltpa_morsel_with_multiple_cookies() -> None:
     headers = {"Set-Cookie": "Other=x; Path=/, LtpaToken2=multi_tok; Path=/; Secure"}
-    assert _extract_ltpa_token(headers) == "multi_tok"
+    assert _morsel_value(headers) == "multi_tok"
 
 
-def test_extract_ltpa_token_no_match() -> None:
+def test_extract_ltpa_morsel_no_match() -> None:
     headers = {"Set-Cookie": "SessionId=abc; Path=/"}
-    assert _extract_ltpa_token(headers) is None
+    assert _extract_ltpa_morsel(headers) is None
 
 
-def test_extract_ltpa_token_empty_set_cookie() -> None:
+def test_extract_ltpa_morsel_empty_set_cookie() -> None:
     headers = {"Set-Cookie": ""}
-    assert _extract_ltpa_token(headers) is None
+    assert _extract_ltpa_morsel(headers) is None
 
 
-def test_extract_ltpa_token_no_headers() -> None:
-    assert _extract_ltpa_token({}) is None
+def test_extract_ltpa_morsel_no_headers() -> None:
+    assert _extract_ltpa_morsel({}) is None
 
 
-def test_extract_ltpa_token_lowercase_header() -> None:
+def test_extract_ltpa_morsel_lowercase_header() -> None:
     headers = {"set-cookie": "LtpaToken2=lower_tok; Path=/"}
-    assert _extract_ltpa_token(headers) == "lower_tok"
+    assert _morsel_value(headers) == "lower_tok"
+
+
+# -- LTPA token expiry --
+
+
+def _login_token(set_cookie: str, credentials: LTPAAuth | None = None) -> LTPAToken:
+    transport = FakeLoginTransport(
+        TransportResponse(status_code=STATUS_OK, text="", headers={"Set-Cookie": set_cookie})
+    )
+    return _request_ltpa_token(
+        transport,
+        BASE_URL,
+        credentials or LTPAAuth("user", TEST_PASSWORD),
+        csrf_token=None,
+        timeout_seconds=None,
+        verify_tls=True,
+    )
+
+
+def test_token_expiry_from_max_age() -> None:
+    before = time.time()
+    token = _login_token(f"LtpaToken2=tok; Max-Age={MAX_AGE_SECONDS}; Path=/")
+    assert token.value == "tok"
+    assert before + MAX_AGE_SECONDS <= token.expires_at <= time.time() + MAX_AGE_SECONDS
+
+
+def test_token_expiry_from_expires() -> None:
+    token = _login_token("LtpaToken2=tok; Expires=Wed, 21 Oct 2037 07:28:00 GMT; Path=/")
+    assert token.expires_at == pytest.approx(2139722880.0)
+
+
+@pytest.mark.parametrize(
+    "set_cookie",
+    [
+        "LtpaToken2=tok; Path=/",
+        "LtpaToken2=tok; Max-Age=soon; Expires=whenever; Path=/",
+    ],
+)
+def test_token_expiry_defaults_to_configured_lifetime(set_cookie: str) -> None:
+    before = time.time()
+    token = _login_token(set_cookie, LTPAAuth("user", TEST_PASSWORD, token_lifetime_seconds=CUSTOM_LIFETIME_SECONDS))
+    assert before + CUSTOM_LIFETIME_SECONDS <= token.expires_at <= time.time() + CUSTOM_LIFETIME_SECONDS
+
+
+def test_token_needs_refresh_within_margin() -> None:
+    token = LTPAToken("tok", expires_at=1000.0)
+    assert not token.needs_refresh(100.0, now=899.0)
+    assert token.needs_refresh(100.0, now=900.0)
+    assert not LTPAToken("tok", expires_at=time.time() + MAX_AGE_SECONDS).needs_refresh(0.0)
+
+
+# -- LTPATokenCache --
+
+
+def _fresh_token(value: str) -> LTPAToken:
+    return LTPAToken(value, expires_at=time.time() + MAX_AGE_SECONDS)
+
+
+USER = LTPAAuth("user", TEST_PASSWORD)
+
+
+def test_token_cache_get_put_invalidate() -> None:
+    cache = LTPATokenCache()
+    token = _fresh_token("tok")
+    cache.put(BASE_URL, USER, token)
+
+    assert cache.get(BASE_URL, USER) == token
+    assert cache.get(BASE_URL, LTPAAuth("other", TEST_PASSWORD)) is None
+
+    cache.invalidate(BASE_URL, "user")
+    cache.invalidate(BASE_URL, "user")
+    assert cache.get(BASE_URL, USER) is None
+
+
+def test_token_cache_get_ignores_expired_tokens() -> None:
+    cache = LTPATokenCache()
+    cache.put(BASE_URL, USER, LTPAToken("old", expires_at=time.time() - 1))
+    assert cache.get(BASE_URL, USER) is None
+
+
+def test_token_cache_withholds_tokens_from_other_passwords() -> None:
+    cache = LTPATokenCache()
+    token = _fresh_token("tok")
+    cache.put(BASE_URL, USER, token)
+    wrong = LTPAAuth("user", "WRONG")
+    logins: list[str] = []
+
+    def failing_login() -> LTPAToken:
+        logins.append("login")
+        raise MQRESTAuthError(ERROR_LTPA_LOGIN_FAILED, url=BASE_URL, status_code=STATUS_UNAUTHORIZED)
+
+    assert cache.get(BASE_URL, wrong) is None
+    with pytest.raises(MQRESTAuthError):
+        cache.acquire(BASE_URL, wrong, failing_login, margin_seconds=0.0)
+    assert logins == ["login"]
+    assert cache.acquire(BASE_URL, USER, failing_login, margin_seconds=0.0) == token
+
+
+def test_token_cache_acquire_reuses_refreshes_and_skips_stale() -> None:
+    cache = LTPATokenCache()
+    logins: list[str] = []
+
+    def login() -> LTPAToken:
+        logins.append("login")
+        return _fresh_token(f"tok{len(logins)}")
+
+    first = cache.acquire(BASE_URL, USER, login, margin_seconds=0.0)
+    assert cache.acquire(BASE_URL, USER, login, margin_seconds=0.0) == first
+    refreshed = cache.acquire(BASE_URL, USER, login, margin_seconds=MAX_AGE_SECONDS * 2)
+    assert refreshed.value == "tok2"
+    replaced = cache.acquire(BASE_URL, USER, login, margin_seconds=0.0, stale=refreshed)
+    assert replaced.value == "tok3"
+    assert len(logins) == len(("tok1", "tok2", "tok3"))
+
+
+def test_token_cache_persists_to_disk(tmp_path: Path) -> None:
+    path = tmp_path / "tokens.json"
+    cache = LTPATokenCache(path)
+    token = _fresh_token("tok")
+    cache.put(BASE_URL, USER, token)
+
+    assert stat.S_IMODE(path.stat().st_mode) == OWNER_READ_WRITE
+    assert TEST_PASSWORD not in path.read_text(encoding="utf-8")
+    reloaded = LTPATokenCache(path)
+    assert reloaded.get(BASE_URL, LTPAAuth("user", "WRONG")) is None
+    assert reloaded.get(BASE_URL, USER) == token
+    assert reloaded.get(BASE_URL, USER) == token
+
+    cache.clear()
+    assert json.loads(path.read_text(encoding="utf-8")) == {"tokens": []}
+
+
+def test_token_cache_verifies_passwords_outside_the_cache_lock(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "tokens.json"
+    other = LTPAAuth("other", TEST_PASSWORD)
+    writer = LTPATokenCache(path)
+    writer.put(BASE_URL, USER, _fresh_token("tok"))
+    writer.put(BASE_URL, other, _fresh_token("other"))
+    cache = LTPATokenCache(path)
+    entered, release = threading.Event(), threading.Event()
+
+    def slow_derive(password: str, salt: bytes) -> bytes:
+        if not entered.is_set():
+            entered.set()
+            release.wait(WAIT_SECONDS)
+        return _derive_verifier(password, salt)
+
+    monkeypatch.setattr(auth, "_derive_verifier", slow_derive)
+    results: list[LTPAToken | None] = []
+    lookup = threading.Thread(target=lambda: results.append(cache.get(BASE_URL, USER)))
+    lookup.start()
+    entered.wait(WAIT_SECONDS)
+
+    other_token = cache.get(BASE_URL, other)
+    cache.put(BASE_URL, USER, _fresh_token("replaced"))
+    release.set()
+    lookup.join(WAIT_SECONDS)
+
+    assert other_token is not None
+    assert other_token.value == "other"
+    assert [token.value for token in results if token is not None] == ["tok"]
+    assert cache.get(BASE_URL, USER).value == "replaced"  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize("content", ["not json", '{"tokens": [{"url": "x"}]}'])
+def test_token_cache_ignores_unreadable_file(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "tokens.json"
+    path.write_text(content, encoding="utf-8")
+    assert LTPATokenCache(path).get(BASE_URL, USER) is None
+
+
+def test_token_cache_missing_file_starts_empty(tmp_path: Path) -> None:
+    assert LTPATokenCache(tmp_path / "missing.json").get(BASE_URL, USER) is None
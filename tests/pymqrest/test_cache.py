@@ -0,0 +1,236 @@
+"""Tests for the read-through DISPLAY result cache."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.cache import ResultCache, ResultCacheConfig, ResultCacheStats, qualifier_family
+from pymqrest.exceptions import MQRESTCommandError, MQRESTTransportError
+from pymqrest.session import MQRESTSession, TransportResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from tests.conftest import FakeClock
+
+TEST_PASSWORD = "pass"
+QUEUE_TTL_SECONDS = 5.0
+EXPECT_TWO = 2
+FAILURE_MESSAGE = "connection reset"
+
+
+class CountingTransport:
+    """Transport answering every command with one object, counting requests."""
+
+    def __init__(self) -> None:
+        self.payloads: list[dict[str, object]] = []
+        self.completion_code = 0
+        self.fail = False
+        self.on_post: Callable[[], None] | None = None
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (headers, timeout_seconds, verify_tls)
+        self.payloads.append(dict(payload))
+        if self.on_post is not None:
+            self.on_post()
+        if self.fail:
+            raise MQRESTTransportError(FAILURE_MESSAGE, url=url)
+        body = {
+            "commandResponse": [
+                {"completionCode": self.completion_code, "reasonCode": 0, "parameters": {"QUEUE": "APP.IN"}}
+            ],
+            "overallCompletionCode": self.completion_code,
+            "overallReasonCode": 0,
+        }
+        return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _session(transport: CountingTransport, cache: ResultCache, qmgr_name: str = "QM1") -> MQRESTSession:
+    return MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        qmgr_name,
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+        map_attributes=False,
+        result_cache=cache,
+    )
+
+
+def test_repeated_display_is_served_from_cache() -> None:
+    transport = CountingTransport()
+    cache = ResultCache()
+    session = _session(transport, cache)
+
+    first = session.display_queue("APP.IN")
+    session.last_response_text = None
+    second = session.display_queue("APP.IN")
+
+    assert first == second == [{"QUEUE": "APP.IN"}]
+    assert len(transport.payloads) == 1
+    assert session.last_response_text is not None
+    assert cache.stats() == ResultCacheStats(size=1, hits=1, misses=1, evictions=0, invalidations=0)
+
+
+def test_different_payloads_are_cached_separately() -> None:
+    transport = CountingTransport()
+    session = _session(transport, ResultCache())
+
+    session.display_queue("APP.IN")
+    session.display_queue("APP.IN", response_parameters=["CURDEPTH"])
+
+    assert len(transport.payloads) == EXPECT_TWO
+
+
+def test_entries_expire_after_qualifier_ttl(clock: FakeClock) -> None:
+    transport = CountingTransport()
+    config = ResultCacheConfig(qualifier_ttl_seconds={"QUEUE": QUEUE_TTL_SECONDS})
+    session = _session(transport, ResultCache(config))
+
+    session.display_queue("APP.IN")
+    clock.now += QUEUE_TTL_SECONDS - 1
+    session.display_queue("APP.IN")
+    clock.now += 1
+    session.display_queue("APP.IN")
+
+    assert len(transport.payloads) == EXPECT_TWO
+
+
+def test_status_qualifiers_are_not_cached_by_default() -> None:
+    transport = CountingTransport()
+    cache = ResultCache()
+    session = _session(transport, cache)
+
+    session.display_qstatus("APP.IN")
+    session.display_qstatus("APP.IN")
+
+    assert len(transport.payloads) == EXPECT_TWO
+    assert cache.stats().misses == 0
+    assert cache.config.ttl_for("chstatus") == 0
+    response = TransportResponse(status_code=200, text="{}", headers={})
+    cache.store("key", response, qmgr_name="QM1", qualifier="QSTATUS", generation=0)
+    assert len(cache) == 0
+
+
+def test_writes_invalidate_the_same_qualifier_family() -> None:
+    transport = CountingTransport()
+    cache = ResultCache()
+    session = _session(transport, cache)
+    session.display_queue("APP.IN")
+    session.display_channel("TO.QM2")
+
+    session.define_qlocal("APP.NEW")
+    session.display_channel("TO.QM2")
+    session.display_queue("APP.IN")
+
+    assert [payload["command"] for payload in transport.payloads] == ["DISPLAY", "DISPLAY", "DEFINE", "DISPLAY"]
+    assert transport.payloads[-1]["qualifier"] == "QUEUE"
+    assert cache.stats().invalidations == 1
+
+
+def test_failed_write_still_invalidates() -> None:
+    transport = CountingTransport()
+    cache = ResultCache()
+    session = _session(transport, cache)
+    session.display_queue("APP.IN")
+
+    transport.fail = True
+    with pytest.raises(MQRESTTransportError):
+        session.clear_qlocal("APP.IN")
+
+    assert len(cache) == 0
+
+
+def test_invalidation_is_scoped_to_the_queue_manager() -> None:
+    transport = CountingTransport()
+    cache = ResultCache()
+    qm1 = _session(transport, cache)
+    qm2 = qm1.for_qmgr("QM2")
+
+    qm1.display_queue("APP.IN")
+    qm2.display_queue("APP.IN")
+    qm2.define_qlocal("APP.NEW")
+    qm1.display_queue("APP.IN")
+
+    assert len(transport.payloads) == len(("QM1 read", "QM2 read", "QM2 define"))
+    assert len(cache) == 1
+
+
+def test_error_responses_are_not_cached() -> None:
+    transport = CountingTransport()
+    transport.completion_code = 2
+    cache = ResultCache()
+    session = _session(transport, cache)
+
+    for _ in range(EXPECT_TWO):
+        with pytest.raises(MQRESTCommandError):
+            session.display_queue("MISSING")
+
+    assert len(transport.payloads) == EXPECT_TWO
+    assert len(cache) == 0
+
+
+def test_response_racing_a_write_is_not_cached() -> None:
+    transport = CountingTransport()
+    cache = ResultCache()
+    session = _session(transport, cache)
+    transport.on_post = lambda: cache.invalidate("QM1", "QLOCAL")
+
+    session.display_queue("APP.IN")
+    transport.on_post = None
+    session.display_queue("APP.IN")
+
+    assert len(transport.payloads) == EXPECT_TWO
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    transport = CountingTransport()
+    cache = ResultCache(ResultCacheConfig(max_entries=2))
+    session = _session(transport, cache)
+
+    session.display_queue("A")
+    session.display_queue("B")
+    session.display_queue("A")
+    session.display_queue("C")
+    session.display_queue("A")
+    session.display_queue("B")
+
+    assert len(transport.payloads) == len(("A", "B", "C", "B again"))
+    assert cache.stats().evictions == EXPECT_TWO
+
+
+def test_invalidate_whole_queue_manager_and_clear() -> None:
+    transport = CountingTransport()
+    cache = ResultCache()
+    session = _session(transport, cache)
+    session.display_queue("APP.IN")
+    session.display_channel("TO.QM2")
+    generation = cache.generation("QM1", "LISTENER")
+
+    assert cache.invalidate("QM1") == EXPECT_TWO
+    assert cache.generation("QM1", "LISTENER") != generation
+    session.display_queue("APP.IN")
+    cache.clear()
+    assert cache.stats() == ResultCacheStats(size=0, hits=0, misses=3, evictions=0, invalidations=3)
+
+
+def test_qualifier_families() -> None:
+    assert qualifier_family("qlocal") == qualifier_family("QSTATUS") == "QUEUE"
+    assert qualifier_family("CHSTATUS") == "CHANNEL"
+    assert qualifier_family("NAMELIST") == "NAMELIST"
+
+
+def test_invalid_cache_configuration_raises() -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        ResultCache(ResultCacheConfig(max_entries=0))
@@ -3,19 +3,22 @@
 from __future__ import annotations
 
 import json
+import threading
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import pytest
 
 from pymqrest.auth import BasicAuth
-from pymqrest.ensure import EnsureAction, EnsureResult, _values_match
+from pymqrest.ensure import EnsureAction, EnsureResult, EnsureSpec, _values_match
+from pymqrest.exceptions import MQRESTCommandError, MQRESTEnsureError, MQRESTTransportError
 from pymqrest.session import MQRESTSession, TransportResponse
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
 
 TEST_PASSWORD = "pass"
+FAILURE_MESSAGE = "connection refused"
 EXPECT_ONE_REQUEST = 1
 EXPECT_TWO_REQUESTS = 2
 
@@ -268,6 +271,18 @@ class TestEnsureCreated:
         define_payload = transport.recorded_requests[1].payload
         assert define_payload["command"] == "DEFINE"
 
+    def test_other_display_errors_are_raised(self) -> None:
+        display_error_response: dict[str, object] = {
+            "commandResponse": [{"completionCode": 2, "reasonCode": 2035}],
+            "overallCompletionCode": 2,
+            "overallReasonCode": 3008,
+        }
+        session, transport = _build_session([display_error_response])
+
+        with pytest.raises(MQRESTCommandError, match="2035"):
+            session.ensure_qlocal("TEST.Q", request_parameters={"description": "test"})
+        assert len(transport.recorded_requests) == 1
+
     def test_object_not_found_creates(self) -> None:
         display_response = _success_payload()  # empty commandResponse
         define_response = _success_payload()
@@ -417,18 +432,37 @@ class TestDisplayCommand:
         display_payload = transport.recorded_requests[0].payload
         assert display_payload["command"] == "DISPLAY"
         assert display_payload["qualifier"] == "QUEUE"
-        assert display_payload["responseParameters"] == ["all"]
+        assert "responseParameters" not in display_payload
+
+    def test_display_requests_only_compared_attributes(self) -> None:
+        display_response = _success_payload([{"CHANNEL": "TEST.CHL", "DESCR": "chl"}])
+        session, transport = _build_session([display_response])
 
-    def test_display_requests_all_attributes(self) -> None:
+        result = session.ensure_channel("TEST.CHL", request_parameters={"description": "chl"})
+
+        assert result.action is EnsureAction.UNCHANGED
+        display_payload = transport.recorded_requests[0].payload
+        assert display_payload["responseParameters"] == ["DESCR"]
+
+    def test_display_requests_all_attributes_for_define_only_keywords(self) -> None:
         display_response = _success_payload()
         define_response = _success_payload()
         session, transport = _build_session([display_response, define_response])
 
-        session.ensure_channel("TEST.CHL")
+        session.ensure_qlocal("TEST.Q", request_parameters={"replace": "yes", "description": "q"})
 
         display_payload = transport.recorded_requests[0].payload
         assert display_payload["responseParameters"] == ["all"]
 
+    def test_qmgr_display_requests_only_compared_attributes(self) -> None:
+        display_response = _success_payload([{"STATQ": "ON", "STATCHL": "ON"}])
+        session, transport = _build_session([display_response])
+
+        result = session.ensure_qmgr(request_parameters={"queue_statistics": "on", "channel_statistics": "on"})
+
+        assert result.action is EnsureAction.UNCHANGED
+        assert transport.recorded_requests[0].payload["responseParameters"] == ["STATQ", "STATCHL"]
+
 
 # ---------------------------------------------------------------------------
 # Each ensure method uses correct qualifier triple
@@ -509,3 +543,259 @@ class TestQualifierTriples:
         assert display_payload["qualifier"] == display_q
         alter_payload = transport.recorded_requests[1].payload
         assert alter_payload["qualifier"] == alter_q
+
+
+# ---------------------------------------------------------------------------
+# ensure_many (one DISPLAY per qualifier, concurrent DEFINE/ALTER)
+# ---------------------------------------------------------------------------
+
+
+class ObjectStoreTransport:
+    """Transport answering generic DISPLAYs from a store and accepting changes."""
+
+    def __init__(
+        self,
+        objects: dict[str, dict[str, dict[str, object]]],
+        *,
+        failing: str | None = None,
+        denied: str | None = None,
+    ) -> None:
+        self.objects = objects
+        self.failing = failing
+        self.denied = denied
+        self.payloads: list[dict[str, object]] = []
+        self._lock = threading.Lock()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, headers, timeout_seconds, verify_tls)
+        with self._lock:
+            self.payloads.append(dict(payload))
+        qualifier = str(payload["qualifier"])
+        name = str(payload["name"])
+        if payload["command"] == "DISPLAY" and qualifier == self.denied:
+            return _make_response({"overallCompletionCode": 2, "overallReasonCode": 2035})
+        if payload["command"] == "DISPLAY":
+            prefix = name.removesuffix("*")
+            rows = [
+                {qualifier: object_name, **attributes}
+                for object_name, attributes in sorted(self.objects.get(qualifier, {}).items())
+                if object_name.startswith(prefix)
+            ]
+            if not rows:
+                return _make_response(
+                    {
+                        "commandResponse": [{"completionCode": 2, "reasonCode": 2085}],
+                        "overallCompletionCode": 2,
+                        "overallReasonCode": 3008,
+                    }
+                )
+            return _make_response(_success_payload(rows))
+        if name == self.failing:
+            return _make_response({"commandResponse": [], "overallCompletionCode": 2, "overallReasonCode": 3008})
+        return _make_response(_success_payload())
+
+
+def _store_session(transport: ObjectStoreTransport) -> MQRESTSession:
+    return MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        "QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+    )
+
+
+class TestEnsureMany:
+    def test_one_display_per_qualifier_and_local_diffs(self) -> None:
+        transport = ObjectStoreTransport(
+            {
+                "QUEUE": {
+                    "APP.IN": {"DESCR": "inbound", "MAXDEPTH": "5000"},
+                    "APP.OUT": {"DESCR": "old"},
+                    "OTHER.Q": {"DESCR": "not displayed"},
+                },
+            },
+        )
+        session = _store_session(transport)
+
+        results = session.ensure_many(
+            [
+                EnsureSpec("qlocal", "APP.IN", {"description": "INBOUND", "max_queue_depth": 5000}),
+                EnsureSpec("qlocal", "APP.OUT", {"description": "outbound"}),
+                EnsureSpec("qalias", "APP.ALIAS", {"target_queue_name": "APP.IN"}),
+                EnsureSpec("qlocal", "APP.BARE"),
+                EnsureSpec("CHANNEL", "TO.HUB", {"channel_type": "SDR", "connection_name": "hub(1414)"}),
+            ],
+            max_workers=4,
+        )
+
+        assert results == [
+            EnsureResult(EnsureAction.UNCHANGED),
+            EnsureResult(EnsureAction.UPDATED, changed=("description",)),
+            EnsureResult(EnsureAction.CREATED),
+            EnsureResult(EnsureAction.CREATED),
+            EnsureResult(EnsureAction.CREATED),
+        ]
+        displays = [(p["qualifier"], p["name"]) for p in transport.payloads if p["command"] == "DISPLAY"]
+        assert displays == [("QUEUE", "APP.*"), ("CHANNEL", "TO.HUB*")]
+        changes = {(p["command"], p["qualifier"], p["name"]) for p in transport.payloads if p["command"] != "DISPLAY"}
+        assert changes == {
+            ("ALTER", "QLOCAL", "APP.OUT"),
+            ("DEFINE", "QALIAS", "APP.ALIAS"),
+            ("DEFINE", "QLOCAL", "APP.BARE"),
+            ("DEFINE", "CHANNEL", "TO.HUB"),
+        }
+        bare_define = next(p for p in transport.payloads if p["name"] == "APP.BARE")
+        assert "parameters" not in bare_define
+
+    def test_specs_compare_desired_attributes(self) -> None:
+        assert EnsureSpec("qlocal", "APP.IN", {"max_depth": 5}) == EnsureSpec("qlocal", "APP.IN", {"max_depth": 5})
+        assert EnsureSpec("qlocal", "APP.IN", {"max_depth": 5}) != EnsureSpec("qlocal", "APP.IN", {"max_depth": 9})
+
+    def test_no_specs_sends_nothing(self) -> None:
+        transport = ObjectStoreTransport({})
+
+        assert _store_session(transport).ensure_many([]) == []
+        assert transport.payloads == []
+
+    def test_unchanged_objects_send_only_display(self) -> None:
+        transport = ObjectStoreTransport({"QUEUE": {"APP.IN": {"DESCR": "inbound"}}})
+
+        results = _store_session(transport).ensure_many([EnsureSpec("qlocal", "APP.IN")])
+
+        assert results == [EnsureResult(EnsureAction.UNCHANGED)]
+        assert len(transport.payloads) == EXPECT_ONE_REQUEST
+
+    def test_failure_is_raised_after_all_commands_complete(self) -> None:
+        transport = ObjectStoreTransport({"QUEUE": {"APP.D": {"DESCR": "old"}}}, failing="APP.BAD")
+        session = _store_session(transport)
+        specs = [EnsureSpec("qlocal", name) for name in ["APP.A", "APP.BAD", "APP.C"]]
+        specs.append(EnsureSpec("qlocal", "APP.D", {"description": "new"}))
+
+        with pytest.raises(MQRESTEnsureError, match="1 of 4 ensure specs failed") as excinfo:
+            session.ensure_many(specs)
+
+        assert isinstance(excinfo.value, MQRESTCommandError)
+        assert excinfo.value.results == [
+            EnsureResult(EnsureAction.CREATED),
+            None,
+            EnsureResult(EnsureAction.CREATED),
+            EnsureResult(EnsureAction.UPDATED, changed=("description",)),
+        ]
+        assert list(excinfo.value.errors) == [1]
+        assert excinfo.value.payload == excinfo.value.errors[1].payload  # type: ignore[attr-defined]
+        defines = {p["name"] for p in transport.payloads if p["command"] == "DEFINE"}
+        assert defines == {"APP.A", "APP.BAD", "APP.C"}
+
+    def test_failed_display_fails_its_specs_without_defining_them(self) -> None:
+        transport = ObjectStoreTransport({}, denied="QUEUE")
+        specs = [EnsureSpec("qlocal", "APP.A"), EnsureSpec("channel", "TO.A"), EnsureSpec("qlocal", "APP.B")]
+
+        with pytest.raises(MQRESTEnsureError, match="2 of 3 ensure specs failed") as excinfo:
+            _store_session(transport).ensure_many(specs)
+
+        assert excinfo.value.results == [None, EnsureResult(EnsureAction.CREATED), None]
+        assert list(excinfo.value.errors) == [0, 2]
+        assert "2035" in str(excinfo.value.errors[0])
+        assert [(p["command"], p["name"]) for p in transport.payloads if p["command"] != "DISPLAY"] == [
+            ("DEFINE", "TO.A")
+        ]
+
+    def test_transport_failures_are_reported_per_spec(self) -> None:
+        transport = ObjectStoreTransport({})
+        post_json = transport.post_json
+
+        def refuse_bad(url: str, payload: Mapping[str, object], **kwargs: object) -> TransportResponse:
+            if payload["command"] == "DEFINE" and payload["name"] == "APP.BAD":
+                raise MQRESTTransportError(FAILURE_MESSAGE, url=url)
+            return post_json(url, payload, **kwargs)  # type: ignore[arg-type]
+
+        transport.post_json = refuse_bad  # type: ignore[method-assign]
+
+        with pytest.raises(MQRESTEnsureError) as excinfo:
+            _store_session(transport).ensure_many([EnsureSpec("qlocal", "APP.BAD"), EnsureSpec("qlocal", "APP.OK")])
+
+        assert excinfo.value.results == [None, EnsureResult(EnsureAction.CREATED)]
+        assert isinstance(excinfo.value.errors[0], MQRESTTransportError)
+        assert excinfo.value.payload == {}
+
+    def test_unexpected_errors_propagate(self) -> None:
+        transport = ObjectStoreTransport({})
+        post_json = transport.post_json
+
+        def explode(url: str, payload: Mapping[str, object], **kwargs: object) -> TransportResponse:
+            if payload["command"] == "DEFINE":
+                raise RuntimeError(FAILURE_MESSAGE)
+            return post_json(url, payload, **kwargs)  # type: ignore[arg-type]
+
+        transport.post_json = explode  # type: ignore[method-assign]
+
+        with pytest.raises(RuntimeError, match=FAILURE_MESSAGE):
+            _store_session(transport).ensure_many([EnsureSpec("qlocal", "APP.NEW")])
+
+    @pytest.mark.parametrize(
+        ("specs", "max_workers", "message"),
+        [
+            ([EnsureSpec("qmgr", "QM1")], 1, "qmgr"),
+            ([EnsureSpec("qlocal", "APP.IN"), EnsureSpec("qremote", "APP.IN")], 1, "Duplicate"),
+            ([], 0, "max_workers"),
+        ],
+    )
+    def test_invalid_arguments_raise(self, specs: list[EnsureSpec], max_workers: int, message: str) -> None:
+        transport = ObjectStoreTransport({})
+
+        with pytest.raises(ValueError, match=message):
+            _store_session(transport).ensure_many(specs, max_workers=max_workers)
+        assert transport.payloads == []
+
+    def test_generic_display_requests_union_of_attributes(self) -> None:
+        transport = ObjectStoreTransport({"QUEUE": {"APP.IN": {"DESCR": "in", "MAXDEPTH": "10"}}})
+
+        _store_session(transport).ensure_many(
+            [
+                EnsureSpec("qlocal", "APP.IN", {"description": "in"}),
+                EnsureSpec("qlocal", "APP.OUT", {"max_queue_depth": 10, "description": "out"}),
+            ],
+        )
+
+        assert transport.payloads[0]["responseParameters"] == ["DESCR", "MAXDEPTH"]
+
+    @pytest.mark.parametrize(
+        ("method_name", "display_q", "define_q", "alter_q"),
+        _QUALIFIER_TRIPLES,
+        ids=[triple[0] for triple in _QUALIFIER_TRIPLES],
+    )
+    def test_object_types_match_ensure_methods(
+        self,
+        method_name: str,
+        display_q: str,
+        define_q: str,
+        alter_q: str,
+    ) -> None:
+        transport = ObjectStoreTransport({display_q: {"TEST.OLD": {"DESCR": "old"}}})
+        session = MQRESTSession(
+            "https://example.invalid/ibmmq/rest/v2",
+            "QM1",
+            credentials=BasicAuth("user", TEST_PASSWORD),
+            transport=transport,
+            map_attributes=False,
+        )
+        object_type = method_name.removeprefix("ensure_")
+
+        session.ensure_many(
+            [EnsureSpec(object_type, "TEST.NEW"), EnsureSpec(object_type, "TEST.OLD", {"DESCR": "new"})],
+            max_workers=1,
+        )
+
+        assert [(p["command"], p["qualifier"]) for p in transport.payloads] == [
+            ("DISPLAY", display_q),
+            ("DEFINE", define_q),
+            ("ALTER", alter_q),
+        ]
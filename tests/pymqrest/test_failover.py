@@ -0,0 +1,306 @@
+"""Tests for multi-endpoint routing and failover."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth, LTPAAuth
+from pymqrest.exceptions import MQRESTAuthError, MQRESTResponseError, MQRESTTransportError
+from pymqrest.failover import (
+    EndpointSelection,
+    EndpointSet,
+    FailoverConfig,
+    RESTEndpoint,
+)
+from pymqrest.session import MQRESTSession, TransportResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+TEST_PASSWORD = "pass"
+FAILURE_MESSAGE = "connection refused"
+PRIMARY = "https://mq1.example.invalid/ibmmq/rest/v2"
+SECONDARY = "https://mq2.example.invalid/ibmmq/rest/v2"
+STATUS_UNAVAILABLE = 503
+EXPECT_TWO = 2
+
+
+def _success() -> TransportResponse:
+    body = {
+        "commandResponse": [{"completionCode": 0, "reasonCode": 0, "parameters": {"QMNAME": "QM1"}}],
+        "overallCompletionCode": 0,
+        "overallReasonCode": 0,
+    }
+    return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+class RoutedTransport:
+    """Transport whose behaviour is configured per base URL."""
+
+    def __init__(self, behaviour: dict[str, str]) -> None:
+        self.behaviour = behaviour
+        self.urls: list[str] = []
+        self.cookies: list[str | None] = []
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (payload, timeout_seconds, verify_tls)
+        self.urls.append(url)
+        self.cookies.append(headers.get("Cookie"))
+        base_url = PRIMARY if url.startswith(PRIMARY) else SECONDARY
+        action = self.behaviour.get(base_url, "ok")
+        if action == "down":
+            raise MQRESTTransportError(FAILURE_MESSAGE, url=url)
+        if action == "unavailable" or (action == "login-unavailable" and url.endswith("/login")):
+            return TransportResponse(status_code=STATUS_UNAVAILABLE, text="", headers={})
+        if url.endswith("/login"):
+            if action == "deny":
+                return TransportResponse(status_code=401, text="", headers={})
+            token = "tok1" if base_url == PRIMARY else "tok2"
+            return TransportResponse(status_code=200, text="", headers={"Set-Cookie": f"LtpaToken2={token}; Path=/"})
+        if action == "deny":
+            return TransportResponse(status_code=401, text="", headers={})
+        return _success()
+
+
+def _build_session(
+    transport: RoutedTransport,
+    endpoints: Sequence[str | RESTEndpoint] = (PRIMARY, SECONDARY),
+    *,
+    ltpa: bool = False,
+    config: FailoverConfig | None = None,
+) -> MQRESTSession:
+    credentials = LTPAAuth("user", TEST_PASSWORD) if ltpa else BasicAuth("user", TEST_PASSWORD)
+    return MQRESTSession(
+        rest_base_url=endpoints,
+        qmgr_name="QM1",
+        credentials=credentials,
+        transport=transport,
+        failover=config,
+    )
+
+
+# -- EndpointSet --
+
+
+def test_endpoint_set_requires_endpoints() -> None:
+    with pytest.raises(ValueError, match="At least one"):
+        EndpointSet([], FailoverConfig())
+
+
+def test_endpoint_set_rejects_non_positive_weight() -> None:
+    with pytest.raises(ValueError, match="weights must be positive"):
+        EndpointSet([RESTEndpoint(PRIMARY, weight=0.0)], FailoverConfig())
+
+
+def test_weighted_selection_prefers_low_latency_per_weight() -> None:
+    endpoints = EndpointSet(
+        [RESTEndpoint(PRIMARY), RESTEndpoint(SECONDARY + "/", weight=4.0)],
+        FailoverConfig(selection=EndpointSelection.WEIGHTED),
+    )
+    primary, secondary = endpoints.states
+    endpoints.record_success(primary, 0.1)
+    endpoints.record_success(secondary, 0.2)
+
+    assert endpoints.candidates() == [secondary, primary]
+    assert secondary.url == SECONDARY
+
+
+def test_latency_is_smoothed() -> None:
+    endpoints = EndpointSet([PRIMARY], FailoverConfig())
+    state = endpoints.states[0]
+    endpoints.record_success(state, 1.0)
+    endpoints.record_success(state, 2.0)
+
+    assert endpoints.health()[0].latency_seconds == pytest.approx(1.2)
+
+
+def test_failed_endpoint_is_tried_last_until_cooldown_expires() -> None:
+    endpoints = EndpointSet([PRIMARY, SECONDARY], FailoverConfig(cooldown_seconds=60.0))
+    primary, secondary = endpoints.states
+    endpoints.record_failure(primary)
+
+    assert endpoints.candidates() == [secondary, primary]
+    health = endpoints.health()
+    assert not health[0].healthy
+    assert health[0].consecutive_failures == 1
+    assert health[1].healthy
+
+
+# -- Session routing --
+
+
+def test_single_url_keeps_existing_behaviour() -> None:
+    transport = RoutedTransport({})
+    session = _build_session(transport, PRIMARY)
+
+    session.display_qmgr()
+
+    assert transport.urls == [f"{PRIMARY}/admin/action/qmgr/QM1/mqsc"]
+    assert session.rest_base_url == PRIMARY
+
+
+def test_transport_error_fails_over_to_next_endpoint() -> None:
+    transport = RoutedTransport({PRIMARY: "down"})
+    session = _build_session(transport)
+
+    assert session.display_qmgr() == {"queue_manager_name": "QM1"}
+    assert session.rest_base_url == SECONDARY
+
+    session.display_qmgr()
+    assert transport.urls[-1].startswith(SECONDARY)
+    health = session.endpoint_health()
+    assert [entry.failures for entry in health] == [1, 0]
+    assert health[1].requests == EXPECT_TWO
+
+
+def test_failover_status_code_fails_over_to_next_endpoint() -> None:
+    transport = RoutedTransport({PRIMARY: "unavailable"})
+    session = _build_session(transport)
+
+    session.display_qmgr()
+
+    assert len(transport.urls) == EXPECT_TWO
+    assert not session.endpoint_health()[0].healthy
+
+
+def test_failover_status_from_last_endpoint_is_returned() -> None:
+    transport = RoutedTransport({PRIMARY: "unavailable", SECONDARY: "unavailable"})
+    session = _build_session(transport)
+
+    with pytest.raises(MQRESTResponseError):
+        session.display_qmgr()
+    assert session.last_http_status == STATUS_UNAVAILABLE
+
+
+def test_all_endpoints_down_raises_last_error() -> None:
+    transport = RoutedTransport({PRIMARY: "down", SECONDARY: "down"})
+    session = _build_session(transport)
+
+    with pytest.raises(MQRESTTransportError, match=FAILURE_MESSAGE) as excinfo:
+        session.display_qmgr()
+    assert excinfo.value.url.startswith(SECONDARY)
+
+
+def test_recovered_endpoint_is_preferred_again() -> None:
+    transport = RoutedTransport({PRIMARY: "down"})
+    session = _build_session(transport, config=FailoverConfig(cooldown_seconds=0.0))
+    session.display_qmgr()
+
+    transport.behaviour = {}
+    session.display_qmgr()
+
+    assert transport.urls[-1].startswith(PRIMARY)
+
+
+# -- LTPA --
+
+
+def test_ltpa_login_fails_over_at_construction() -> None:
+    transport = RoutedTransport({PRIMARY: "down"})
+    session = _build_session(transport, ltpa=True)
+
+    session.display_qmgr()
+
+    assert transport.urls[1] == f"{SECONDARY}/login"
+    assert transport.cookies[-1] == "LtpaToken2=tok2"
+
+
+def test_ltpa_login_on_every_endpoint_down_raises() -> None:
+    transport = RoutedTransport({PRIMARY: "down", SECONDARY: "down"})
+    with pytest.raises(MQRESTTransportError):
+        _build_session(transport, ltpa=True)
+
+
+def test_ltpa_login_unavailable_fails_over_at_construction() -> None:
+    transport = RoutedTransport({PRIMARY: "login-unavailable"})
+    session = _build_session(transport, ltpa=True)
+
+    session.display_qmgr()
+
+    assert transport.urls[:2] == [f"{PRIMARY}/login", f"{SECONDARY}/login"]
+    assert transport.cookies[-1] == "LtpaToken2=tok2"
+    assert not session.endpoint_health()[0].healthy
+
+
+def test_ltpa_login_unavailable_fails_over_during_a_command() -> None:
+    transport = RoutedTransport({})
+    session = _build_session(transport, ltpa=True, config=FailoverConfig(cooldown_seconds=0.0))
+    session.display_qmgr()
+    session._token_cache.clear()  # noqa: SLF001
+    transport.behaviour = {PRIMARY: "login-unavailable"}
+
+    assert session.display_qmgr() == {"queue_manager_name": "QM1"}
+    assert transport.cookies[-1] == "LtpaToken2=tok2"
+
+    transport.behaviour = {PRIMARY: "login-unavailable", SECONDARY: "login-unavailable"}
+    session._token_cache.clear()  # noqa: SLF001
+    with pytest.raises(MQRESTAuthError) as excinfo:
+        session.display_qmgr()
+    assert excinfo.value.status_code == STATUS_UNAVAILABLE
+
+
+def test_ltpa_auth_error_is_not_failed_over() -> None:
+    transport = RoutedTransport({PRIMARY: "deny"})
+    with pytest.raises(MQRESTAuthError):
+        _build_session(transport, ltpa=True)
+    assert transport.urls == [f"{PRIMARY}/login"]
+
+
+def test_ltpa_auth_error_during_a_command_is_not_failed_over() -> None:
+    transport = RoutedTransport({})
+    session = _build_session(transport, ltpa=True)
+    session._token_cache.clear()  # noqa: SLF001
+    transport.behaviour = {PRIMARY: "deny"}
+
+    with pytest.raises(MQRESTAuthError):
+        session.display_qmgr()
+    assert transport.urls[-1] == f"{PRIMARY}/login"
+
+
+def test_ltpa_logs_in_to_failover_endpoint_transparently() -> None:
+    transport = RoutedTransport({})
+    session = _build_session(transport, ltpa=True)
+    session.display_qmgr()
+    assert transport.cookies[-1] == "LtpaToken2=tok1"
+
+    transport.behaviour = {PRIMARY: "down"}
+    session.display_qmgr()
+    session.display_qmgr()
+
+    logins = [url for url in transport.urls if url.endswith("/login")]
+    assert logins == [f"{PRIMARY}/login", f"{SECONDARY}/login"]
+    assert transport.cookies[-1] == "LtpaToken2=tok2"
+
+
+# -- Health checks --
+
+
+def test_check_endpoints_probes_every_endpoint() -> None:
+    transport = RoutedTransport({SECONDARY: "unavailable"})
+    session = _build_session(transport, (PRIMARY, SECONDARY, "https://mq3.example.invalid/ibmmq/rest/v2"))
+
+    health = session.check_endpoints()
+
+    assert [entry.healthy for entry in health] == [True, False, False]
+    assert health[0].latency_seconds is not None
+
+
+def test_check_endpoints_records_transport_and_auth_errors() -> None:
+    transport = RoutedTransport({})
+    session = _build_session(transport, ltpa=True)
+    transport.behaviour = {PRIMARY: "down", SECONDARY: "deny"}
+
+    health = session.check_endpoints()
+
+    assert [entry.healthy for entry in health] == [False, False]
@@ -0,0 +1,277 @@
+"""Tests for the desired-state fingerprint store."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.ensure import EnsureAction, EnsureResult, EnsureSpec
+from pymqrest.exceptions import MQRESTCommandError
+from pymqrest.fingerprint import FingerprintEntry, FingerprintStore, desired_fingerprint
+from pymqrest.session import MQRESTSession, TransportResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from tests.conftest import FakeClock
+
+TEST_PASSWORD = "pass"
+EXPECT_THREE = 3
+
+
+class QueueManagerTransport:
+    """Transport holding MQSC objects that DISPLAY, DEFINE, ALTER and DELETE act on."""
+
+    def __init__(self, objects: dict[str, dict[str, dict[str, object]]], *, failing: str | None = None) -> None:
+        self.objects = objects
+        self.failing = failing
+        self.payloads: list[dict[str, object]] = []
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, headers, timeout_seconds, verify_tls)
+        self.payloads.append(dict(payload))
+        command = payload["command"]
+        qualifier = str(payload["qualifier"])
+        qualifier = "QUEUE" if qualifier in {"QLOCAL", "QALIAS", "QREMOTE", "QMODEL"} else qualifier
+        name = str(payload.get("name", "QM1"))
+        objects = self.objects.setdefault(qualifier, {})
+        if command == "DISPLAY":
+            rows = [
+                {"QMNAME" if qualifier == "QMGR" else qualifier: object_name, **attributes}
+                for object_name, attributes in sorted(objects.items())
+                if object_name == name or (name.endswith("*") and object_name.startswith(name[:-1]))
+            ]
+            return _response(rows) if rows else _failure()
+        if name == self.failing:
+            return _failure()
+        parameters = dict(payload.get("parameters", {}))  # type: ignore[call-overload]
+        if command == "DELETE":
+            objects.pop(name, None)
+        else:
+            objects.setdefault(name, {}).update(parameters)
+        return _response([])
+
+
+def _response(rows: list[dict[str, object]]) -> TransportResponse:
+    items = [{"completionCode": 0, "reasonCode": 0, "parameters": row} for row in rows]
+    body = {"commandResponse": items, "overallCompletionCode": 0, "overallReasonCode": 0}
+    return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _failure() -> TransportResponse:
+    body = {
+        "commandResponse": [{"completionCode": 2, "reasonCode": 2085}],
+        "overallCompletionCode": 2,
+        "overallReasonCode": 3008,
+    }
+    return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _session(transport: QueueManagerTransport, store: FingerprintStore) -> MQRESTSession:
+    return MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        "QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+        fingerprint_store=store,
+    )
+
+
+def test_fingerprint_normalizes_values_and_order() -> None:
+    fingerprint = desired_fingerprint("qlocal", {"max_queue_depth": 5000, "description": " App "})
+
+    assert fingerprint == desired_fingerprint("QLOCAL", {"description": "APP", "max_queue_depth": "5000"})
+    assert fingerprint != desired_fingerprint("QALIAS", {"description": "APP", "max_queue_depth": "5000"})
+    assert fingerprint != desired_fingerprint("QLOCAL", {"description": "APP"})
+    assert desired_fingerprint("QLOCAL", None) == desired_fingerprint("QLOCAL", {})
+
+
+def test_record_match_and_verification_interval(clock: FakeClock) -> None:
+    store = FingerprintStore(verify_interval_seconds=60.0)
+    store.record("QM1", "queue", "APP.IN", "abc")
+
+    assert store.verify_interval_seconds == 60.0  # noqa: PLR2004
+    assert store.get("QM1", "QUEUE", "APP.IN") == FingerprintEntry("abc", 1000.0)
+    assert store.matches("QM1", "QUEUE", "APP.IN", "abc")
+    assert not store.matches("QM1", "QUEUE", "APP.IN", "other")
+    assert not store.matches("QM2", "QUEUE", "APP.IN", "abc")
+
+    clock.now = 1060.0
+    assert not store.matches("QM1", "QUEUE", "APP.IN", "abc")
+
+    store.record("QM1", "QUEUE", "APP.IN", "abc")
+    assert store.get("QM1", "QUEUE", "APP.IN") == FingerprintEntry("abc", 1060.0)
+
+
+def test_invalidate_matches_given_fields() -> None:
+    store = FingerprintStore()
+    for qmgr_name, qualifier, name in [
+        ("QM1", "QUEUE", "APP.IN"),
+        ("QM1", "QUEUE", "APP.OUT"),
+        ("QM1", "CHANNEL", "TO.HUB"),
+        ("QM2", "QUEUE", "APP.IN"),
+    ]:
+        store.record(qmgr_name, qualifier, name, "abc")
+
+    assert store.invalidate("QM1", "queue", "APP.IN") == 1
+    assert store.invalidate("QM1", "QUEUE") == 1
+    assert store.invalidate(name="TO.HUB") == 1
+    assert store.invalidate() == 1
+    assert store.get("QM2", "QUEUE", "APP.IN") is None
+
+
+def test_store_opens_databases_with_alteration_stamp_columns(tmp_path: Path) -> None:
+    path = tmp_path / "fingerprints.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE fingerprints (qmgr_name TEXT NOT NULL, qualifier TEXT NOT NULL, name TEXT NOT NULL, "
+            "fingerprint TEXT NOT NULL, alteration_date TEXT, alteration_time TEXT, verified_at REAL NOT NULL, "
+            "PRIMARY KEY (qmgr_name, qualifier, name)) WITHOUT ROWID"
+        )
+    connection.close()
+
+    with FingerprintStore(path) as store:
+        store.record("QM1", "QUEUE", "APP.IN", "abc")
+        assert store.matches("QM1", "QUEUE", "APP.IN", "abc")
+
+
+def test_store_persists_on_disk(tmp_path: Path) -> None:
+    path = tmp_path / "fingerprints.db"
+    with FingerprintStore(path) as store:
+        store.record("QM1", "QUEUE", "APP.IN", "abc")
+
+    with FingerprintStore(path) as reopened:
+        assert reopened.matches("QM1", "QUEUE", "APP.IN", "abc")
+
+
+def test_invalid_interval_raises() -> None:
+    with pytest.raises(ValueError, match="verify_interval_seconds"):
+        FingerprintStore(verify_interval_seconds=0.0)
+
+
+def test_repeat_ensure_skips_display_until_verification_is_due(clock: FakeClock) -> None:
+    transport = QueueManagerTransport({"QUEUE": {"APP.IN": {"DESCR": "inbound"}}})
+    store = FingerprintStore(verify_interval_seconds=300.0)
+    session = _session(transport, store)
+
+    assert session.ensure_qlocal("APP.IN", {"description": "inbound"}).action is EnsureAction.UNCHANGED
+    assert transport.payloads[0]["responseParameters"] == ["DESCR"]
+    assert store.get("QM1", "QUEUE", "APP.IN") == FingerprintEntry(
+        desired_fingerprint("QLOCAL", {"description": "inbound"}), clock.now
+    )
+
+    assert session.ensure_qlocal("APP.IN", {"description": "INBOUND"}).action is EnsureAction.UNCHANGED
+    assert len(transport.payloads) == 1
+
+    clock.now += 300.0
+    transport.objects["QUEUE"]["APP.IN"]["DESCR"] = "changed elsewhere"
+    result = session.ensure_qlocal("APP.IN", {"description": "inbound"})
+
+    assert result == EnsureResult(EnsureAction.UPDATED, changed=("description",))
+    assert [payload["command"] for payload in transport.payloads[1:]] == ["DISPLAY", "ALTER"]
+    assert store.get("QM1", "QUEUE", "APP.IN") == FingerprintEntry(
+        desired_fingerprint("QLOCAL", {"description": "inbound"}), clock.now
+    )
+
+
+def test_changed_desired_state_and_state_changing_commands_force_display() -> None:
+    transport = QueueManagerTransport({})
+    store = FingerprintStore()
+    session = _session(transport, store)
+
+    assert session.ensure_qlocal("APP.IN").action is EnsureAction.CREATED
+    assert session.ensure_qlocal("APP.IN").action is EnsureAction.UNCHANGED
+    assert [payload["command"] for payload in transport.payloads] == ["DISPLAY", "DEFINE"]
+
+    assert session.ensure_qlocal("APP.IN", {"description": "new"}).action is EnsureAction.UPDATED
+    session.delete_qlocal("APP.IN")
+    assert store.get("QM1", "QUEUE", "APP.IN") is None
+
+    assert session.ensure_qlocal("APP.IN", {"description": "new"}).action is EnsureAction.CREATED
+
+
+def test_failed_change_records_nothing() -> None:
+    transport = QueueManagerTransport({}, failing="APP.BAD")
+    store = FingerprintStore()
+
+    with pytest.raises(MQRESTCommandError):
+        _session(transport, store).ensure_qlocal("APP.BAD")
+
+    assert store.get("QM1", "QUEUE", "APP.BAD") is None
+
+
+def test_ensure_qmgr_uses_queue_manager_name() -> None:
+    transport = QueueManagerTransport({"QMGR": {"QM1": {"DESCR": "old"}}})
+    store = FingerprintStore()
+    session = _session(transport, store)
+
+    assert session.ensure_qmgr({"description": "old"}).action is EnsureAction.UNCHANGED
+    assert session.ensure_qmgr({"description": "old"}).action is EnsureAction.UNCHANGED
+    assert len(transport.payloads) == 1
+
+    assert session.ensure_qmgr({"description": "new"}).action is EnsureAction.UPDATED
+    assert session.ensure_qmgr({"description": "new"}).action is EnsureAction.UNCHANGED
+    assert [payload["command"] for payload in transport.payloads] == ["DISPLAY", "DISPLAY", "ALTER"]
+    assert store.get("QM1", "QMGR", "QM1") is not None
+
+
+def test_ensure_many_displays_only_objects_without_fresh_fingerprints() -> None:
+    transport = QueueManagerTransport(
+        {"QUEUE": {"APP.IN": {"DESCR": "in"}, "APP.OUT": {"DESCR": "old"}}},
+    )
+    store = FingerprintStore()
+    session = _session(transport, store)
+    specs = [
+        EnsureSpec("qlocal", "APP.IN", {"description": "in"}),
+        EnsureSpec("qlocal", "APP.OUT", {"description": "out"}),
+        EnsureSpec("qlocal", "APP.NEW"),
+    ]
+
+    session.ensure_many(specs)
+    assert transport.payloads[0]["responseParameters"] == ["DESCR"]
+    transport.payloads.clear()
+
+    specs.append(EnsureSpec("channel", "TO.HUB", {"channel_type": "SDR"}))
+    results = session.ensure_many(specs)
+
+    assert results == [
+        EnsureResult(EnsureAction.UNCHANGED),
+        EnsureResult(EnsureAction.UNCHANGED),
+        EnsureResult(EnsureAction.UNCHANGED),
+        EnsureResult(EnsureAction.CREATED),
+    ]
+    assert [(payload["command"], payload["name"]) for payload in transport.payloads] == [
+        ("DISPLAY", "TO.HUB*"),
+        ("DEFINE", "TO.HUB"),
+    ]
+    assert store.invalidate("QM1", "QUEUE") == EXPECT_THREE
+    assert store.invalidate("QM1") == 1
+
+
+def test_ensure_many_failure_records_every_object_but_the_failed_one() -> None:
+    transport = QueueManagerTransport({"QUEUE": {"APP.OK": {}}}, failing="APP.BAD")
+    store = FingerprintStore()
+    session = _session(transport, store)
+
+    with pytest.raises(MQRESTCommandError):
+        session.ensure_many(
+            [EnsureSpec("qlocal", "APP.OK"), EnsureSpec("qlocal", "APP.BAD"), EnsureSpec("qlocal", "APP.NEW")]
+        )
+
+    assert store.get("QM1", "QUEUE", "APP.OK") is not None
+    assert store.get("QM1", "QUEUE", "APP.NEW") is not None
+    assert store.get("QM1", "QUEUE", "APP.BAD") is None
+    assert len(transport.payloads) == EXPECT_THREE
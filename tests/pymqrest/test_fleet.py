@@ -0,0 +1,356 @@
+"""Tests for concurrent fleet execution."""
+
+from __future__ import annotations
+
+import functools
+import json
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.ensure import EnsureAction, EnsureResult, EnsureSpec
+from pymqrest.exceptions import (
+    MQRESTAuthError,
+    MQRESTEnsureError,
+    MQRESTError,
+    MQRESTTimeoutError,
+    MQRESTTransportError,
+)
+from pymqrest.fleet import FLEET_QMGR_KEY, Fleet, RolloutConfig
+from pymqrest.session import MQRESTSession, TransportResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+TEST_PASSWORD = "pass"
+FAILURE_MESSAGE = "command server not available"
+WAIT_SECONDS = 5.0
+SHORT_DEADLINE = 0.05
+FLEET_SIZE = 3
+LOGIN_INTERVAL = 0.5
+
+
+class UnusedTransport:
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        raise AssertionError((url, payload, headers, timeout_seconds, verify_tls))
+
+
+def _sessions(*names: str) -> list[MQRESTSession]:
+    return [
+        MQRESTSession(
+            "https://example.invalid/ibmmq/rest/v2",
+            name,
+            credentials=BasicAuth("user", TEST_PASSWORD),
+            transport=UnusedTransport(),
+        )
+        for name in names
+    ]
+
+
+def _single_session(name: str) -> MQRESTSession:
+    return _sessions(name)[0]
+
+
+def test_run_returns_results_in_session_order() -> None:
+    fleet = Fleet(_sessions("QM1", "QM2", "QM3"))
+
+    run = fleet.run(lambda session: session.qmgr_name.lower())
+
+    assert [result.value for result in run.results] == ["qm1", "qm2", "qm3"]
+    assert [result.qmgr_name for result in run.results] == ["QM1", "QM2", "QM3"]
+    assert all(result.ok for result in run.results)
+    assert run.errors == {}
+    assert len(fleet.sessions) == FLEET_SIZE
+
+
+def test_runs_concurrently() -> None:
+    barrier = threading.Barrier(FLEET_SIZE, timeout=WAIT_SECONDS)
+    fleet = Fleet(_sessions("QM1", "QM2", "QM3"), max_workers=FLEET_SIZE)
+
+    run = fleet.run(lambda _session: barrier.wait())
+
+    assert len(run.succeeded) == FLEET_SIZE
+
+
+def test_errors_are_reported_per_target() -> None:
+    def operation(session: MQRESTSession) -> list[dict[str, object]]:
+        if session.qmgr_name == "QM2":
+            raise MQRESTError(FAILURE_MESSAGE)
+        return [{"queue_name": "APP.IN"}, {"queue_name": "APP.OUT"}]
+
+    run = Fleet(_sessions("QM1", "QM2")).run(operation)
+
+    assert [result.qmgr_name for result in run.failed] == ["QM2"]
+    assert str(run.errors["QM2"]) == FAILURE_MESSAGE
+    assert run.failed[0].value is None
+    assert run.rows() == [
+        {"queue_name": "APP.IN", FLEET_QMGR_KEY: "QM1"},
+        {"queue_name": "APP.OUT", FLEET_QMGR_KEY: "QM1"},
+    ]
+
+
+def test_rows_accept_single_dicts_and_skip_other_values() -> None:
+    values: dict[str, object] = {"QM1": {"status": "RUNNING"}, "QM2": None, "QM3": ["text"]}
+
+    run = Fleet(_sessions("QM1", "QM2", "QM3")).run(lambda session: values[session.qmgr_name])
+
+    assert run.rows() == [{"status": "RUNNING", FLEET_QMGR_KEY: "QM1"}]
+
+
+def test_slow_target_times_out_without_failing_the_run() -> None:
+    release = threading.Event()
+
+    def operation(session: MQRESTSession) -> str:
+        if session.qmgr_name == "QM2":
+            release.wait(WAIT_SECONDS)
+        return session.qmgr_name
+
+    fleet = Fleet(_sessions("QM1", "QM2", "QM3"), max_workers=2, timeout_seconds=WAIT_SECONDS)
+    run = fleet.run(operation, timeout_seconds=SHORT_DEADLINE)
+    release.set()
+
+    assert [result.value for result in run.succeeded] == ["QM1", "QM3"]
+    error = run.errors["QM2"]
+    assert isinstance(error, MQRESTTimeoutError)
+    assert error.name == "QM2"
+    assert run.failed[0].elapsed_seconds >= SHORT_DEADLINE
+
+
+def test_empty_fleet() -> None:
+    assert Fleet([]).run(lambda session: session.qmgr_name).results == ()
+
+
+def test_invalid_max_workers_raises() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        Fleet([], max_workers=0)
+
+
+def test_queued_target_is_not_timed_out_before_it_starts() -> None:
+    release = threading.Event()
+
+    def operation(session: MQRESTSession) -> str:
+        if session.qmgr_name == "QM1":
+            release.wait(WAIT_SECONDS)
+        return session.qmgr_name
+
+    threading.Timer(SHORT_DEADLINE * 3, release.set).start()
+    run = Fleet(_sessions("QM1", "QM2"), max_workers=1, timeout_seconds=SHORT_DEADLINE).run(operation)
+
+    assert isinstance(run.errors["QM1"], MQRESTTimeoutError)
+    assert run.results[1].value == "QM2"
+
+
+def test_timed_out_target_frees_its_worker_slot() -> None:
+    release = threading.Event()
+
+    def operation(session: MQRESTSession) -> str:
+        if session.qmgr_name == "QM1":
+            release.wait(WAIT_SECONDS)
+        return session.qmgr_name
+
+    started = time.monotonic()
+    run = Fleet(_sessions("QM1", "QM2", "QM3"), max_workers=1, timeout_seconds=SHORT_DEADLINE).run(operation)
+    elapsed = time.monotonic() - started
+    release.set()
+
+    assert isinstance(run.errors["QM1"], MQRESTTimeoutError)
+    assert [result.value for result in run.succeeded] == ["QM2", "QM3"]
+    assert elapsed < WAIT_SECONDS
+
+
+# -- Bootstrap --
+
+
+def test_bootstrap_builds_sessions_concurrently_and_reports_failures() -> None:
+    barrier = threading.Barrier(2, timeout=WAIT_SECONDS)
+
+    def build(name: str) -> MQRESTSession:
+        barrier.wait()
+        return _sessions(name)[0]
+
+    def reject() -> MQRESTSession:
+        raise MQRESTAuthError(FAILURE_MESSAGE, url="https://example.invalid/login", status_code=401)
+
+    def unreachable() -> MQRESTSession:
+        raise MQRESTTransportError(FAILURE_MESSAGE, url="https://example.invalid/login")
+
+    bootstrap = Fleet.bootstrap(
+        {
+            "QM1": lambda: build("QM1"),
+            "QM2": reject,
+            "QM3": lambda: build("QM3"),
+            "QM4": unreachable,
+        },
+        max_workers=FLEET_SIZE,
+        timeout_seconds=SHORT_DEADLINE,
+    )
+
+    assert [session.qmgr_name for session in bootstrap.fleet.sessions] == ["QM1", "QM3"]
+    assert set(bootstrap.failures) == {"QM2", "QM4"}
+    assert list(bootstrap.auth_failures) == ["QM2"]
+
+
+def test_bootstrap_spreads_session_starts(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    bootstrap = Fleet.bootstrap(
+        {name: functools.partial(_single_session, name) for name in ("QM1", "QM2", "QM3")},
+        max_workers=1,
+        login_interval_seconds=LOGIN_INTERVAL,
+    )
+
+    assert len(bootstrap.fleet.sessions) == FLEET_SIZE
+    assert sleeps == [LOGIN_INTERVAL, LOGIN_INTERVAL * 2]
+
+
+def test_bootstrap_rejects_invalid_max_workers() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        Fleet.bootstrap({}, max_workers=0)
+
+
+# -- Rollout --
+
+
+class EnsureTransport:
+    """Transport where APP.IN exists with an old description, or every command fails."""
+
+    def __init__(self, *, failing: bool) -> None:
+        self.failing = failing
+        self.commands: list[str] = []
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, headers, timeout_seconds, verify_tls)
+        self.commands.append(str(payload["command"]))
+        if self.failing:
+            body: dict[str, object] = {"commandResponse": [], "overallCompletionCode": 2, "overallReasonCode": 2035}
+        else:
+            rows = [{"QUEUE": "APP.IN", "DESCR": "old"}] if payload["command"] == "DISPLAY" else []
+            items = [{"completionCode": 0, "reasonCode": 0, "parameters": row} for row in rows]
+            body = {"commandResponse": items, "overallCompletionCode": 0, "overallReasonCode": 0}
+        return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _rollout_fleet(count: int, failing: set[str] | None = None) -> tuple[Fleet, dict[str, EnsureTransport]]:
+    transports = {f"QM{index}": EnsureTransport(failing=f"QM{index}" in (failing or set())) for index in range(count)}
+    sessions = [
+        MQRESTSession(
+            "https://example.invalid/ibmmq/rest/v2",
+            name,
+            credentials=BasicAuth("user", TEST_PASSWORD),
+            transport=transport,
+        )
+        for name, transport in transports.items()
+    ]
+    return Fleet(sessions, max_workers=4), transports
+
+
+ROLLOUT_SPECS = [EnsureSpec("qlocal", "APP.IN", {"description": "new"})]
+
+
+def test_rollout_applies_specs_in_growing_waves() -> None:
+    fleet, transports = _rollout_fleet(10)
+
+    rollout = fleet.rollout(ROLLOUT_SPECS)
+
+    assert [len(wave.results) for wave in rollout.waves] == [1, 2, 4, 3]
+    assert not rollout.halted
+    assert rollout.error_rate == 0.0
+    assert [result.qmgr_name for result in rollout.results] == list(transports)
+    assert all(
+        result.value == [EnsureResult(EnsureAction.UPDATED, changed=("description",))] for result in rollout.results
+    )
+    assert all(transport.commands == ["DISPLAY", "ALTER"] for transport in transports.values())
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [
+        (RolloutConfig(canary_count=0), [1, 2, 4, 3]),
+        (RolloutConfig(canary_count=2, growth_factor=1.5), [2, 3, 5]),
+        (RolloutConfig(canary_count=1, max_wave_size=3), [1, 2, 3, 3, 1]),
+        (RolloutConfig(canary_count=20), [10]),
+    ],
+)
+def test_rollout_wave_sizes(config: RolloutConfig, expected: list[int]) -> None:
+    fleet, _ = _rollout_fleet(10)
+
+    assert [len(wave.results) for wave in fleet.rollout(ROLLOUT_SPECS, config=config).waves] == expected
+
+
+def test_canary_failure_stops_rollout() -> None:
+    fleet, transports = _rollout_fleet(5, failing={"QM0"})
+
+    rollout = fleet.rollout(ROLLOUT_SPECS, config=RolloutConfig(max_error_rate=0.5))
+
+    assert rollout.halted
+    assert len(rollout.waves) == 1
+    error = rollout.waves[0].errors["QM0"]
+    assert isinstance(error, MQRESTEnsureError)
+    assert error.results == [None]
+    assert rollout.skipped == ("QM1", "QM2", "QM3", "QM4")
+    assert all(transport.commands == [] for name, transport in transports.items() if name != "QM0")
+
+
+def test_rollout_stops_when_error_rate_exceeds_threshold() -> None:
+    fleet, _ = _rollout_fleet(10, failing={"QM3", "QM4", "QM5"})
+
+    tolerant = fleet.rollout(ROLLOUT_SPECS, config=RolloutConfig(max_error_rate=0.5))
+    strict = fleet.rollout(ROLLOUT_SPECS, config=RolloutConfig(max_error_rate=0.3))
+
+    assert [len(wave.results) for wave in tolerant.waves] == [1, 2, 4, 3]
+    assert tolerant.error_rate == pytest.approx(0.3)
+    assert [len(wave.results) for wave in strict.waves] == [1, 2, 4]
+    assert strict.skipped == ("QM7", "QM8", "QM9")
+
+
+def test_rollout_pauses_between_waves(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    fleet, _ = _rollout_fleet(3)
+
+    fleet.rollout(ROLLOUT_SPECS, config=RolloutConfig(pause_seconds=LOGIN_INTERVAL))
+
+    assert sleeps == [LOGIN_INTERVAL]
+
+
+def test_rollout_of_empty_fleet() -> None:
+    rollout = Fleet([]).rollout(ROLLOUT_SPECS)
+
+    assert rollout.waves == ()
+    assert rollout.error_rate == 0.0
+
+
+@pytest.mark.parametrize(
+    ("config", "message"),
+    [
+        (RolloutConfig(canary_count=-1), "canary_count"),
+        (RolloutConfig(growth_factor=0.5), "growth_factor"),
+        (RolloutConfig(max_wave_size=0), "max_wave_size"),
+        (RolloutConfig(max_error_rate=1.5), "max_error_rate"),
+        (RolloutConfig(pause_seconds=-1.0), "pause_seconds"),
+    ],
+)
+def test_rollout_rejects_invalid_config(config: RolloutConfig, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        Fleet([]).rollout(ROLLOUT_SPECS, config=config)
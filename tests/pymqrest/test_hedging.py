@@ -0,0 +1,276 @@
+"""Tests for latency tracking and hedged read-only requests."""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.exceptions import MQRESTTransportError
+from pymqrest.hedging import (
+    READ_ONLY_COMMANDS,
+    HedgeConfig,
+    LatencyTracker,
+    hedge_delay_seconds,
+)
+from pymqrest.session import MQRESTSession, TransportResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+TEST_PASSWORD = "pass"
+FAILURE_MESSAGE = "boom"
+FAST_HEDGE = HedgeConfig(initial_delay_seconds=0.01, min_delay_seconds=0.0)
+EXPECT_TWO_REQUESTS = 2
+SAMPLE_COUNT = 100
+WAIT_SECONDS = 5.0
+
+
+def _response(name: str) -> TransportResponse:
+    body = {
+        "commandResponse": [{"completionCode": 0, "reasonCode": 0, "parameters": {"QMNAME": name}}],
+        "overallCompletionCode": 0,
+        "overallReasonCode": 0,
+    }
+    return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+class ScriptedTransport:
+    """Transport whose N-th call blocks, fails, or answers as scripted."""
+
+    def __init__(self, script: list[str]) -> None:
+        self.script = script
+        self.calls: list[dict[str, object]] = []
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (headers, timeout_seconds, verify_tls)
+        with self._lock:
+            index = len(self.calls)
+            self.calls.append(dict(payload))
+        action = self.script[index]
+        if action == "block":
+            self.release.wait(WAIT_SECONDS)
+            return _response("SLOW")
+        if action == "fail":
+            raise MQRESTTransportError(FAILURE_MESSAGE, url=url)
+        if action == "ok":
+            return TransportResponse(status_code=200, text=json.dumps({"overallCompletionCode": 0}), headers={})
+        if action == "slow-fail":
+            self.release.wait(WAIT_SECONDS)
+            raise MQRESTTransportError(FAILURE_MESSAGE, url=url)
+        return _response(action)
+
+
+def _build_session(
+    transport: ScriptedTransport,
+    hedging: HedgeConfig | None = FAST_HEDGE,
+) -> MQRESTSession:
+    return MQRESTSession(
+        rest_base_url="https://example.invalid/ibmmq/rest/v2",
+        qmgr_name="QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+        hedging=hedging,
+    )
+
+
+# -- LatencyTracker --
+
+
+def test_tracker_percentiles_use_nearest_rank() -> None:
+    tracker = LatencyTracker()
+    for index in range(1, SAMPLE_COUNT + 1):
+        tracker.record("DISPLAY QUEUE", index / 1000)
+    tracker.record_hedge("DISPLAY QUEUE")
+
+    stats = tracker.stats()["DISPLAY QUEUE"]
+
+    assert stats.command == "DISPLAY QUEUE"
+    assert stats.count == SAMPLE_COUNT
+    assert stats.hedged == 1
+    assert stats.p50_seconds == pytest.approx(0.050)
+    assert stats.p95_seconds == pytest.approx(0.095)
+    assert stats.p99_seconds == pytest.approx(0.099)
+    assert stats.max_seconds == pytest.approx(0.100)
+    assert tracker.percentile("DISPLAY QUEUE", 0.01) == pytest.approx(0.001)
+
+
+def test_tracker_keeps_only_recent_window() -> None:
+    tracker = LatencyTracker(window=2)
+    for seconds in (1.0, 2.0, 3.0):
+        tracker.record("DISPLAY QMGR", seconds)
+
+    assert tracker.sample_count("DISPLAY QMGR") == EXPECT_TWO_REQUESTS
+    assert tracker.stats()["DISPLAY QMGR"].count == len((1.0, 2.0, 3.0))
+    assert tracker.percentile("DISPLAY QMGR", 0.5) == pytest.approx(2.0)
+
+
+def test_tracker_without_samples() -> None:
+    tracker = LatencyTracker()
+    assert tracker.percentile("DISPLAY QMGR", 0.5) is None
+    assert tracker.sample_count("DISPLAY QMGR") == 0
+    assert tracker.stats() == {}
+
+
+# -- hedge_delay_seconds --
+
+
+def test_hedge_delay_uses_initial_delay_until_enough_samples() -> None:
+    tracker = LatencyTracker()
+    tracker.record("DISPLAY QMGR", 0.2)
+    config = HedgeConfig(initial_delay_seconds=0.5, min_samples=2)
+
+    assert hedge_delay_seconds(config, tracker, "DISPLAY QMGR") == pytest.approx(0.5)
+
+    tracker.record("DISPLAY QMGR", 0.3)
+    assert hedge_delay_seconds(config, tracker, "DISPLAY QMGR") == pytest.approx(0.3)
+
+
+def test_hedge_delay_is_clamped() -> None:
+    tracker = LatencyTracker()
+    tracker.record("DISPLAY QMGR", 10.0)
+    config = HedgeConfig(min_samples=1, min_delay_seconds=0.1, max_delay_seconds=2.0)
+    assert hedge_delay_seconds(config, tracker, "DISPLAY QMGR") == pytest.approx(2.0)
+
+    tracker = LatencyTracker()
+    tracker.record("DISPLAY QMGR", 0.001)
+    assert hedge_delay_seconds(config, tracker, "DISPLAY QMGR") == pytest.approx(0.1)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        HedgeConfig(percentile=1.0),
+        HedgeConfig(min_samples=0),
+        HedgeConfig(max_workers=0),
+    ],
+)
+def test_invalid_hedge_config_raises(config: HedgeConfig) -> None:
+    with pytest.raises(ValueError, match="must be"):
+        _build_session(ScriptedTransport([]), hedging=config)
+
+
+def test_only_display_is_read_only() -> None:
+    assert frozenset({"DISPLAY"}) == READ_ONLY_COMMANDS
+
+
+# -- Session latency tracking --
+
+
+def test_session_records_latency_per_command() -> None:
+    transport = ScriptedTransport(["QM1", "QM1"])
+    session = _build_session(transport, hedging=None)
+
+    session.display_qmgr()
+    session.alter_qmgr(request_parameters={"description": "x"})
+
+    stats = session.latency_stats()
+    assert set(stats) == {"DISPLAY QMGR", "ALTER QMGR"}
+    assert stats["DISPLAY QMGR"].hedged == 0
+
+
+# -- Hedged requests --
+
+
+def test_fast_primary_sends_no_hedge() -> None:
+    transport = ScriptedTransport(["QM1", "QM2"])
+    session = _build_session(transport, hedging=HedgeConfig(initial_delay_seconds=WAIT_SECONDS))
+
+    assert session.display_qmgr() == {"queue_manager_name": "QM1"}
+    assert session.display_qmgr() == {"queue_manager_name": "QM2"}
+    assert len(transport.calls) == EXPECT_TWO_REQUESTS
+    assert session.latency_stats()["DISPLAY QMGR"].hedged == 0
+
+
+def test_slow_primary_is_hedged_and_hedge_wins() -> None:
+    transport = ScriptedTransport(["block", "FAST"])
+    session = _build_session(transport)
+
+    result = session.display_qmgr()
+    transport.release.set()
+
+    assert result == {"queue_manager_name": "FAST"}
+    assert len(transport.calls) == EXPECT_TWO_REQUESTS
+    assert transport.calls[0] == transport.calls[1]
+    assert session.latency_stats()["DISPLAY QMGR"].hedged == 1
+
+
+def test_failed_hedge_falls_back_to_primary() -> None:
+    transport = ScriptedTransport(["block", "fail"])
+    session = _build_session(transport)
+    threading.Timer(0.05, transport.release.set).start()
+
+    result = session.display_qmgr()
+
+    assert result == {"queue_manager_name": "SLOW"}
+
+
+def test_both_attempts_failing_raises_first_error() -> None:
+    transport = ScriptedTransport(["slow-fail", "fail"])
+    session = _build_session(transport)
+    threading.Timer(0.05, transport.release.set).start()
+
+    with pytest.raises(MQRESTTransportError, match=FAILURE_MESSAGE):
+        session.display_qmgr()
+
+
+def test_concurrent_primaries_are_not_limited_by_hedge_workers() -> None:
+    callers = 4
+    barrier = threading.Barrier(callers, timeout=WAIT_SECONDS)
+    transport = ScriptedTransport(["QM1"] * callers)
+    post_json = transport.post_json
+
+    def post_together(url: str, payload: Mapping[str, object], **kwargs: object) -> TransportResponse:
+        barrier.wait()
+        return post_json(url, payload, **kwargs)  # type: ignore[arg-type]
+
+    transport.post_json = post_together  # type: ignore[method-assign]
+    session = _build_session(transport, hedging=HedgeConfig(initial_delay_seconds=WAIT_SECONDS, max_workers=1))
+    threads = [threading.Thread(target=session.display_qmgr) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(WAIT_SECONDS)
+
+    assert len(transport.calls) == callers
+    assert session.latency_stats()["DISPLAY QMGR"].hedged == 0
+
+
+def test_close_releases_hedge_threads_and_session_stays_usable() -> None:
+    transport = ScriptedTransport(["block", "FAST", "block", "QM2", "block", "AGAIN"])
+    session = _build_session(transport)
+    derived = session.for_qmgr("QM2")
+    assert session.display_qmgr() == {"queue_manager_name": "FAST"}
+    assert derived.display_qmgr() == {"queue_manager_name": "QM2"}
+
+    derived.close()
+    derived.close()
+    assert session._hedge_executor._pool is None  # type: ignore[union-attr]  # noqa: SLF001
+    assert session.display_qmgr() == {"queue_manager_name": "AGAIN"}
+    transport.release.set()
+    session.close()
+    _build_session(transport, hedging=None).close()
+
+
+@pytest.mark.parametrize("command", ["define_qlocal", "alter_qlocal", "delete_queue", "start_channel", "stop_channel"])
+def test_state_changing_commands_are_never_hedged(command: str) -> None:
+    transport = ScriptedTransport(["ok"])
+    session = _build_session(transport, hedging=HedgeConfig(initial_delay_seconds=0.0, min_delay_seconds=0.0))
+
+    getattr(session, command)(name="OBJ")
+
+    assert len(transport.calls) == 1
+    assert "DISPLAY QMGR" not in session.latency_stats()
@@ -0,0 +1,162 @@
+"""Tests for the local name index."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.index import NameIndex
+from pymqrest.session import MQRESTSession, TransportResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from tests.conftest import FakeClock
+
+TEST_PASSWORD = "pass"
+QUEUE_NAMES = ["APP.IN", "APP.OUT", "APP2.IN", "SYSTEM.DEFAULT.LOCAL.QUEUE"]
+CHANNEL_NAMES = ["TO.HUB"]
+
+
+class NameListTransport:
+    """Transport listing fixed queue and channel names."""
+
+    def __init__(self) -> None:
+        self.payloads: list[Mapping[str, object]] = []
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, headers, timeout_seconds, verify_tls)
+        self.payloads.append(payload)
+        qualifier = str(payload["qualifier"])
+        names, extra = (
+            (CHANNEL_NAMES, {"CHLTYPE": "SDR"}) if qualifier == "CHANNEL" else (QUEUE_NAMES, {"TYPE": "QLOCAL"})
+        )
+        items = [
+            {"completionCode": 0, "reasonCode": 0, "parameters": {qualifier: name, **extra}} for name in reversed(names)
+        ]
+        items.append({"completionCode": 0, "reasonCode": 0, "parameters": {}})
+        body = {"commandResponse": items, "overallCompletionCode": 0, "overallReasonCode": 0}
+        return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _index(
+    transport: NameListTransport,
+    qualifiers: tuple[str, ...] = ("QUEUE", "CHANNEL"),
+    *,
+    map_attributes: bool = True,
+    ttl_seconds: float | None = None,
+) -> NameIndex:
+    session = MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        "QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+        map_attributes=map_attributes,
+    )
+    return NameIndex(session, qualifiers, ttl_seconds=ttl_seconds)
+
+
+def test_loads_each_qualifier_once_with_minimal_projection() -> None:
+    transport = NameListTransport()
+    index = _index(transport)
+
+    assert index.qualifiers == ("QUEUE", "CHANNEL")
+    assert index.exists("queue", "APP.IN")
+    assert not index.exists("QUEUE", "APP.MISSING")
+    assert index.missing("QUEUE", ["APP.X", "APP.OUT", "APP.A"]) == ["APP.X", "APP.A"]
+    assert index.exists("CHANNEL", "TO.HUB")
+
+    assert [payload["qualifier"] for payload in transport.payloads] == ["QUEUE", "CHANNEL"]
+    assert all("responseParameters" not in payload for payload in transport.payloads)
+    assert all(payload["name"] == "*" for payload in transport.payloads)
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        (None, sorted(QUEUE_NAMES)),
+        ("APP.*", ["APP.IN", "APP.OUT"]),
+        ("APP*", ["APP.IN", "APP.OUT", "APP2.IN"]),
+        ("*", sorted(QUEUE_NAMES)),
+        ("NONE.*", []),
+        ("APP.IN", ["APP.IN"]),
+        ("APP.NONE", []),
+        ("ZZZ", []),
+        ("*.IN", ["APP.IN", "APP2.IN"]),
+        ("APP?.IN", ["APP2.IN"]),
+    ],
+)
+def test_names_matches_patterns(pattern: str | None, expected: list[str]) -> None:
+    index = _index(NameListTransport(), map_attributes=False)
+
+    assert index.names("QUEUE", pattern) == expected
+
+
+def test_add_and_discard_update_loaded_qualifiers_only() -> None:
+    transport = NameListTransport()
+    index = _index(transport)
+
+    index.add("QUEUE", "APP.NEW")
+    index.discard("QUEUE", "APP.IN")
+    assert transport.payloads == []
+
+    index.refresh("QUEUE")
+    index.add("QUEUE", "APP.NEW")
+    index.add("QUEUE", "APP.NEW")
+    index.discard("QUEUE", "APP.IN")
+    index.discard("QUEUE", "APP.IN")
+
+    assert index.names("QUEUE", "APP.*") == ["APP.NEW", "APP.OUT"]
+    assert not index.exists("QUEUE", "APP.IN")
+    assert len(transport.payloads) == 1
+
+
+def test_refresh_invalidate_and_ttl_reload_names(clock: FakeClock) -> None:
+    transport = NameListTransport()
+    index = _index(transport, ttl_seconds=10.0)
+
+    index.refresh()
+    assert len(transport.payloads) == len(index.qualifiers)
+
+    clock.now += 5.0
+    assert index.exists("QUEUE", "APP.IN")
+    assert len(transport.payloads) == len(index.qualifiers)
+
+    clock.now += 6.0
+    assert index.exists("QUEUE", "APP.IN")
+    assert len(transport.payloads) == len(index.qualifiers) + 1
+
+    index.invalidate()
+    index.invalidate("CHANNEL")
+    assert index.exists("CHANNEL", "TO.HUB")
+    assert [payload["qualifier"] for payload in transport.payloads][-1] == "CHANNEL"
+
+
+def test_unindexed_qualifier_raises_key_error() -> None:
+    index = _index(NameListTransport(), ("QUEUE",))
+
+    with pytest.raises(KeyError, match="CHANNEL"):
+        index.exists("CHANNEL", "TO.HUB")
+
+
+@pytest.mark.parametrize(
+    ("qualifiers", "ttl_seconds", "message"),
+    [
+        (("QMGR",), None, "QMGR"),
+        (("QUEUE",), 0.0, "ttl_seconds"),
+    ],
+)
+def test_invalid_arguments_raise(qualifiers: tuple[str, ...], ttl_seconds: float | None, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        _index(NameListTransport(), qualifiers, ttl_seconds=ttl_seconds)
@@ -0,0 +1,325 @@
+"""Tests for the background refresh-ahead inventory."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.exceptions import MQRESTTransportError
+from pymqrest.inventory import Inventory, InventoryConfig, object_name_attribute
+from pymqrest.session import MQRESTSession, TransportResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from tests.conftest import FakeClock
+
+TEST_PASSWORD = "pass"
+FAILURE_MESSAGE = "connection refused"
+TTL_SECONDS = 100.0
+RETRY_SECONDS = 5.0
+WAIT_SECONDS = 5.0
+EXPECT_TWO = 2
+
+
+class InventoryTransport:
+    """Transport listing one queue and one channel per queue manager."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str]] = []
+        self.failing: set[str] = set()
+        self.description = "first"
+        self.requested = threading.Event()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (headers, timeout_seconds, verify_tls)
+        qmgr_name = url.split("/qmgr/")[1].split("/", maxsplit=1)[0]
+        qualifier = str(payload["qualifier"])
+        self.requests.append((qmgr_name, qualifier))
+        self.requested.set()
+        if qmgr_name in self.failing:
+            raise MQRESTTransportError(FAILURE_MESSAGE, url=url)
+        name = "APP.IN" if qualifier == "QUEUE" else f"{qmgr_name}.TO.HUB"
+        parameters = {qualifier: name, "DESCR": self.description}
+        body = {
+            "commandResponse": [{"completionCode": 0, "reasonCode": 0, "parameters": parameters}],
+            "overallCompletionCode": 0,
+            "overallReasonCode": 0,
+        }
+        return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+class QueueStoreTransport:
+    """Transport serving DISPLAY QUEUE from a mutable store of queues."""
+
+    def __init__(self, queues: dict[str, tuple[str, str]]) -> None:
+        self.queues = queues
+        self.requests: list[tuple[str, list[str]]] = []
+        self.stamps = True
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, headers, timeout_seconds, verify_tls)
+        name = str(payload["name"])
+        response_parameters = list(payload.get("responseParameters", []))  # type: ignore[call-overload]
+        self.requests.append((name, response_parameters))
+        names = sorted(self.queues) if name == "*" else [name]
+        items = []
+        for queue_name in names:
+            if queue_name not in self.queues:
+                items.append({"completionCode": 2, "reasonCode": 2085, "parameters": {}})
+                continue
+            description, alteration_time = self.queues[queue_name]
+            parameters: dict[str, object] = {"QUEUE": queue_name}
+            if self.stamps:
+                parameters |= {"ALTDATE": "2026-01-01", "ALTTIME": alteration_time}
+            if response_parameters != ["ALTDATE", "ALTTIME"]:
+                parameters["DESCR"] = description
+            items.append({"completionCode": 0, "reasonCode": 0, "parameters": parameters})
+        failed = any(item["completionCode"] for item in items)
+        body = {"commandResponse": items, "overallCompletionCode": 2 if failed else 0, "overallReasonCode": 0}
+        return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _sessions(transport: InventoryTransport, *names: str) -> list[MQRESTSession]:
+    return [
+        MQRESTSession(
+            "https://example.invalid/ibmmq/rest/v2",
+            name,
+            credentials=BasicAuth("user", TEST_PASSWORD),
+            transport=transport,
+        )
+        for name in names
+    ]
+
+
+def _config(**overrides: float) -> InventoryConfig:
+    return InventoryConfig(ttl_seconds=TTL_SECONDS, retry_seconds=RETRY_SECONDS, **overrides)  # type: ignore[arg-type]
+
+
+def test_refresh_loads_every_entry_and_serves_reads(clock: FakeClock) -> None:
+    transport = InventoryTransport()
+    inventory = Inventory(_sessions(transport, "QM1", "QM2"), _config())
+
+    assert inventory.entry("QM1", "queue").age_seconds is None
+    assert len(inventory.refresh()) == len(("QM1", "QM2")) * EXPECT_TWO
+    clock.now += 3.0
+    requests = len(transport.requests)
+
+    assert inventory.get("QM1", "QUEUE", "APP.IN") == {"queue_name": "APP.IN", "description": "first"}
+    assert inventory.get("QM2", "CHANNEL", "QM2.TO.HUB") is not None
+    assert inventory.get("QM1", "QUEUE", "MISSING") is None
+    assert [row["channel_name"] for row in inventory.objects("QM1", "CHANNEL")] == ["QM1.TO.HUB"]
+    assert inventory.entry("QM2", "QUEUE").age_seconds == pytest.approx(3.0)
+    assert [(entry.qmgr_name, entry.qualifier) for entry in inventory.entries()] == [
+        ("QM1", "CHANNEL"),
+        ("QM1", "QUEUE"),
+        ("QM2", "CHANNEL"),
+        ("QM2", "QUEUE"),
+    ]
+    assert len(transport.requests) == requests
+    with pytest.raises(KeyError):
+        inventory.get("QM3", "QUEUE", "APP.IN")
+
+
+def test_refresh_can_target_one_queue_manager_or_qualifier() -> None:
+    transport = InventoryTransport()
+    inventory = Inventory(_sessions(transport, "QM1", "QM2"), _config())
+
+    inventory.refresh("QM2")
+    inventory.refresh(qualifier="channel")
+
+    assert transport.requests == [("QM2", "QUEUE"), ("QM2", "CHANNEL"), ("QM1", "CHANNEL"), ("QM2", "CHANNEL")]
+
+
+def test_entries_are_refreshed_ahead_of_ttl(clock: FakeClock) -> None:
+    transport = InventoryTransport()
+    inventory = Inventory(_sessions(transport, "QM1"), _config(refresh_ahead=0.5))
+    inventory.refresh()
+
+    clock.now += TTL_SECONDS * 0.5 - 1
+    assert inventory.refresh_due() == []
+    transport.description = "second"
+    clock.now += 1
+    refreshed = inventory.refresh_due()
+
+    assert len(refreshed) == EXPECT_TWO
+    assert inventory.get("QM1", "QUEUE", "APP.IN") == {"queue_name": "APP.IN", "description": "second"}
+    assert inventory.entry("QM1", "QUEUE").age_seconds == 0
+
+
+def test_failed_refresh_keeps_previous_objects_and_retries(clock: FakeClock) -> None:
+    transport = InventoryTransport()
+    inventory = Inventory(_sessions(transport, "QM1"), _config(refresh_ahead=1.0))
+    inventory.refresh()
+    transport.failing.add("QM1")
+    clock.now += TTL_SECONDS
+
+    inventory.refresh_due()
+    entry = inventory.entry("QM1", "QUEUE")
+
+    assert isinstance(entry.error, MQRESTTransportError)
+    assert entry.age_seconds == TTL_SECONDS
+    assert inventory.get("QM1", "QUEUE", "APP.IN") is not None
+    clock.now += RETRY_SECONDS - 1
+    assert inventory.refresh_due() == []
+    transport.failing.clear()
+    clock.now += 1
+    inventory.refresh_due()
+    assert inventory.entry("QM1", "QUEUE").error is None
+
+
+def test_background_thread_refreshes_until_stopped() -> None:
+    transport = InventoryTransport()
+    inventory = Inventory(_sessions(transport, "QM1"), InventoryConfig(qualifiers=["QUEUE"], ttl_seconds=0.01))
+
+    with inventory:
+        transport.requested.clear()
+        assert transport.requested.wait(WAIT_SECONDS)
+        inventory.start(load=False)
+
+    requests = len(transport.requests)
+    assert requests >= EXPECT_TWO
+    time.sleep(0.05)
+    assert len(transport.requests) == requests
+
+
+def test_background_thread_without_sessions_waits_for_retry_interval() -> None:
+    inventory = Inventory([], _config())
+    assert inventory.config.retry_seconds == RETRY_SECONDS
+    assert inventory.refresh_due() == []
+    assert inventory._seconds_until_due() == RETRY_SECONDS  # noqa: SLF001
+    inventory.stop()
+
+
+def _incremental(transport: QueueStoreTransport, **overrides: object) -> Inventory:
+    session = MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        "QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+        map_attributes=False,
+    )
+    config = InventoryConfig(qualifiers=["QUEUE"], incremental=True, **overrides)  # type: ignore[arg-type]
+    return Inventory([session], config)
+
+
+def test_incremental_refresh_fetches_only_changed_objects() -> None:
+    transport = QueueStoreTransport({"A": ("a", "10.00.00"), "B": ("b", "10.00.00"), "C": ("c", "10.00.00")})
+    inventory = _incremental(transport)
+    inventory.refresh()
+    transport.queues["B"] = ("b2", "11.00.00")
+    transport.queues["D"] = ("d", "11.00.00")
+    del transport.queues["C"]
+    transport.requests.clear()
+
+    inventory.refresh()
+
+    assert transport.requests == [("*", ["ALTDATE", "ALTTIME"]), ("B", ["all"]), ("D", ["all"])]
+    assert sorted(row["QUEUE"] for row in inventory.objects("QM1", "QUEUE")) == ["A", "B", "D"]
+    assert inventory.get("QM1", "QUEUE", "B") == {
+        "QUEUE": "B",
+        "ALTDATE": "2026-01-01",
+        "ALTTIME": "11.00.00",
+        "DESCR": "b2",
+    }
+    transport.requests.clear()
+    inventory.refresh()
+    assert transport.requests == [("*", ["ALTDATE", "ALTTIME"])]
+
+
+def test_incremental_refresh_drops_objects_deleted_while_fetching() -> None:
+    transport = QueueStoreTransport({"A": ("a", "10.00.00")})
+    inventory = _incremental(transport)
+    inventory.refresh()
+    transport.queues["A"] = ("a2", "11.00.00")
+    original = transport.post_json
+
+    def delete_after_listing(url: str, payload: Mapping[str, object], **kwargs: object) -> TransportResponse:
+        response = original(url, payload, **kwargs)  # type: ignore[arg-type]
+        transport.queues.pop("A", None)
+        return response
+
+    transport.post_json = delete_after_listing  # type: ignore[method-assign]
+    inventory.refresh()
+
+    assert inventory.objects("QM1", "QUEUE") == []
+
+
+def test_incremental_refresh_reloads_in_full_when_many_changed() -> None:
+    transport = QueueStoreTransport({"A": ("a", "10.00.00"), "B": ("b", "10.00.00")})
+    inventory = _incremental(transport, max_incremental_fetches=1, response_parameters=["DESCR"])
+    inventory.refresh()
+    assert transport.requests == [("*", ["DESCR", "ALTDATE", "ALTTIME"])]
+    transport.queues = dict.fromkeys(transport.queues, ("new", "12.00.00"))
+    transport.requests.clear()
+
+    inventory.refresh()
+
+    assert transport.requests == [("*", ["ALTDATE", "ALTTIME"]), ("*", ["DESCR", "ALTDATE", "ALTTIME"])]
+    assert inventory.get("QM1", "QUEUE", "A") == {
+        "QUEUE": "A",
+        "ALTDATE": "2026-01-01",
+        "ALTTIME": "12.00.00",
+        "DESCR": "new",
+    }
+
+
+def test_incremental_refresh_refetches_objects_without_alteration_stamps() -> None:
+    transport = QueueStoreTransport({"A": ("a", "10.00.00")})
+    transport.stamps = False
+    inventory = _incremental(transport, response_parameters=["all"])
+    inventory.refresh()
+    transport.requests.clear()
+
+    inventory.refresh()
+
+    assert transport.requests == [("*", ["ALTDATE", "ALTTIME"]), ("A", ["all"])]
+
+
+def test_object_name_attribute() -> None:
+    assert object_name_attribute("QLOCAL") == "QUEUE"
+    assert object_name_attribute("CHSTATUS") == "CHANNEL"
+    assert object_name_attribute("NAMELIST") == "NAMELIST"
+
+
+@pytest.mark.parametrize("qualifier", ["QMGR", "NOSUCH"])
+def test_qualifiers_without_list_display_are_rejected(qualifier: str) -> None:
+    with pytest.raises(ValueError, match="No DISPLAY method"):
+        Inventory([], InventoryConfig(qualifiers=[qualifier]))
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"ttl_seconds": 0.0}, "ttl_seconds"),
+        ({"refresh_ahead": 0.0}, "refresh_ahead"),
+        ({"refresh_ahead": 1.5}, "refresh_ahead"),
+        ({"retry_seconds": 0.0}, "retry_seconds"),
+        ({"max_workers": 0}, "max_workers"),
+        ({"max_incremental_fetches": -1}, "max_incremental_fetches"),
+    ],
+)
+def test_invalid_inventory_configuration_raises(overrides: dict[str, float], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        Inventory([], InventoryConfig(**overrides))  # type: ignore[arg-type]
@@ -0,0 +1,350 @@
+"""Tests for desired-state planning and dependency-ordered apply."""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.exceptions import MQRESTCommandError
+from pymqrest.plan import ApplyResult, ChangeAction, DesiredObject, PlannedChange, Planner
+from pymqrest.session import MQRESTSession, TransportResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+TEST_PASSWORD = "pass"
+WAIT_SECONDS = 5.0
+EXPECT_TWO = 2
+
+_FAMILIES = {"QLOCAL": "QUEUE", "QREMOTE": "QUEUE", "CHANNEL": "CHANNEL", "PROCESS": "PROCESS"}
+_REFERENCES = {"XMITQ": "QUEUE", "INITQ": "QUEUE", "PROCESS": "PROCESS"}
+
+
+class QueueManagerTransport:
+    """Transport simulating one queue manager that enforces object references."""
+
+    def __init__(self, objects: dict[str, dict[str, dict[str, object]]] | None = None) -> None:
+        self.objects: dict[str, dict[str, dict[str, object]]] = objects or {}
+        self.commands: list[tuple[str, str, str]] = []
+        self.failing: set[str] = set()
+        self.denied: set[str] = set()
+        self.barrier: threading.Barrier | None = None
+        self._lock = threading.Lock()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, headers, timeout_seconds, verify_tls)
+        command, qualifier, name = str(payload["command"]), str(payload["qualifier"]), str(payload["name"])
+        if command != "DISPLAY" and self.barrier is not None:
+            self.barrier.wait()
+        with self._lock:
+            self.commands.append((command, qualifier, name))
+            parameters = payload.get("parameters", {})
+            assert isinstance(parameters, dict)
+            return self._respond(command, qualifier, name, parameters)
+
+    def _respond(self, command: str, qualifier: str, name: str, parameters: dict[str, object]) -> TransportResponse:
+        if command == "DISPLAY":
+            return self._display(qualifier, name)
+        family = self.objects.setdefault(_FAMILIES[qualifier], {})
+        if name in self.failing:
+            return _failure()
+        if command == "DELETE":
+            if self._referenced(_FAMILIES[qualifier], name):
+                return _failure()
+            del family[name]
+            return _response([])
+        for attribute, target in _REFERENCES.items():
+            if attribute in parameters and str(parameters[attribute]) not in self.objects.get(target, {}):
+                return _failure()
+        family.setdefault(name, {}).update(parameters)
+        return _response([])
+
+    def _display(self, qualifier: str, name: str) -> TransportResponse:
+        if qualifier in self.denied:
+            return _failure(2035)
+        prefix = name.removesuffix("*")
+        rows = [
+            {qualifier: object_name, **attributes}
+            for object_name, attributes in sorted(self.objects.get(qualifier, {}).items())
+            if object_name.startswith(prefix)
+        ]
+        return _response(rows) if rows else _failure()
+
+    def _referenced(self, family: str, name: str) -> bool:
+        return any(
+            str(attributes.get(attribute)) == name
+            for objects in self.objects.values()
+            for attributes in objects.values()
+            for attribute, target in _REFERENCES.items()
+            if target == family
+        )
+
+
+def _response(rows: list[dict[str, object]]) -> TransportResponse:
+    body = {
+        "commandResponse": [{"completionCode": 0, "reasonCode": 0, "parameters": row} for row in rows],
+        "overallCompletionCode": 0,
+        "overallReasonCode": 0,
+    }
+    return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _failure(reason_code: int = 2085) -> TransportResponse:
+    body = {
+        "commandResponse": [{"completionCode": 2, "reasonCode": reason_code}],
+        "overallCompletionCode": 2,
+        "overallReasonCode": 3008,
+    }
+    return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _session(qmgr_name: str, transport: QueueManagerTransport) -> MQRESTSession:
+    return MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        qmgr_name,
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+    )
+
+
+def _environment() -> list[DesiredObject]:
+    return [
+        DesiredObject(
+            "QM1",
+            "channel",
+            "QM1.TO.QM2",
+            {"channel_type": "SDR", "connection_name": "qm2(1414)", "transmission_queue_name": "QM2.XMITQ"},
+        ),
+        DesiredObject("QM1", "qlocal", "APP.TRIGGERED", {"process_name": "APP.PROCESS", "description": "triggered"}),
+        DesiredObject("QM1", "process", "APP.PROCESS", {"application_id": "/bin/app"}),
+        DesiredObject("QM1", "qlocal", "QM2.XMITQ", {"usage": "XMITQ"}),
+        DesiredObject("QM2", "channel", "QM1.TO.QM2", {"channel_type": "RCVR"}),
+    ]
+
+
+def test_plan_orders_creates_after_referenced_objects() -> None:
+    qm1, qm2 = QueueManagerTransport(), QueueManagerTransport()
+    planner = Planner([_session("QM1", qm1), _session("QM2", qm2)])
+
+    plan = planner.plan(_environment())
+
+    assert plan.diff().splitlines() == [
+        "+ QM1 PROCESS(APP.PROCESS)",
+        "+ QM1 QLOCAL(APP.TRIGGERED)",
+        "+ QM1 QLOCAL(QM2.XMITQ)",
+        "+ QM1 CHANNEL(QM1.TO.QM2)",
+        "+ QM2 CHANNEL(QM1.TO.QM2)",
+    ]
+    assert [change.depends_on for change in plan.changes] == [(), (0,), (), (2,), ()]
+    assert sorted(qm1.commands) == [
+        ("DISPLAY", "CHANNEL", "QM1.TO.QM2*"),
+        ("DISPLAY", "PROCESS", "APP.PROCESS*"),
+        ("DISPLAY", "QUEUE", "*"),
+    ]
+    assert qm2.commands == [("DISPLAY", "CHANNEL", "QM1.TO.QM2*")]
+
+
+def test_apply_builds_environment_and_replan_is_empty() -> None:
+    qm1, qm2 = QueueManagerTransport(), QueueManagerTransport()
+    planner = Planner([_session("QM1", qm1), _session("QM2", qm2)], max_workers=4)
+
+    result = planner.apply(planner.plan(_environment()))
+
+    assert result.succeeded
+    assert result.failures == []
+    assert qm1.objects["CHANNEL"]["QM1.TO.QM2"]["XMITQ"] == "QM2.XMITQ"
+    replan = planner.plan(_environment())
+    assert replan.changes == ()
+    assert len(replan.unchanged) == len(_environment())
+
+
+def test_plan_alters_only_differing_attributes() -> None:
+    qm1 = QueueManagerTransport({"QUEUE": {"APP.IN": {"DESCR": "old", "MAXDEPTH": "5000"}}})
+    planner = Planner([_session("QM1", qm1)])
+
+    plan = planner.plan([DesiredObject("QM1", "qlocal", "APP.IN", {"description": "new", "max_queue_depth": 5000})])
+
+    assert plan.changes == (
+        PlannedChange(
+            ChangeAction.ALTER,
+            "QM1",
+            "qlocal",
+            "APP.IN",
+            {"description": "new"},
+            changed=("description",),
+        ),
+    )
+    assert plan.diff() == "~ QM1 QLOCAL(APP.IN) [description]"
+    assert planner.apply(plan).succeeded
+    assert qm1.objects["QUEUE"]["APP.IN"]["DESCR"] == "new"
+
+
+def test_teardown_deletes_referencing_objects_first() -> None:
+    qm1, qm2 = QueueManagerTransport(), QueueManagerTransport()
+    planner = Planner([_session("QM1", qm1), _session("QM2", qm2)])
+    assert planner.apply(planner.plan(_environment())).succeeded
+
+    absent = [
+        DesiredObject(item.qmgr_name, item.object_type, item.name, present=False)
+        for item in [*_environment(), DesiredObject("QM1", "qlocal", "NEVER.DEFINED")]
+    ]
+    plan = planner.plan(absent)
+
+    assert plan.diff().splitlines() == [
+        "- QM1 CHANNEL(QM1.TO.QM2)",
+        "- QM1 QLOCAL(APP.TRIGGERED)",
+        "- QM1 PROCESS(APP.PROCESS)",
+        "- QM1 QLOCAL(QM2.XMITQ)",
+        "- QM2 CHANNEL(QM1.TO.QM2)",
+    ]
+    assert [item.name for item in plan.unchanged] == ["NEVER.DEFINED"]
+    assert planner.apply(plan).succeeded
+    assert all(not objects for objects in qm1.objects.values())
+
+
+def test_plan_displays_only_compared_attributes_unless_deleting() -> None:
+    qm1 = QueueManagerTransport()
+    displays: list[object] = []
+    original = qm1.post_json
+
+    def record(url: str, payload: Mapping[str, object], **kwargs: object) -> TransportResponse:
+        displays.append(payload.get("responseParameters"))
+        return original(url, payload, **kwargs)  # type: ignore[arg-type]
+
+    qm1.post_json = record  # type: ignore[method-assign]
+    planner = Planner([_session("QM1", qm1)])
+
+    planner.plan(
+        [DesiredObject("QM1", "qlocal", "APP.IN", {"description": "in"}), DesiredObject("QM1", "qlocal", "APP.X")]
+    )
+    planner.plan(
+        [
+            DesiredObject("QM1", "qlocal", "APP.OLD", present=False),
+            DesiredObject("QM1", "qlocal", "APP.IN", {"description": "in"}),
+        ]
+    )
+
+    assert displays == [["DESCR"], ["all"]]
+
+
+def test_failed_change_skips_dependents_only() -> None:
+    qm1 = QueueManagerTransport()
+    qm1.failing.add("QM2.XMITQ")
+    planner = Planner([_session("QM1", qm1), _session("QM2", QueueManagerTransport())])
+
+    result = planner.apply(planner.plan(_environment()))
+
+    assert not result.succeeded
+    failed = {outcome.change.name: outcome for outcome in result.failures}
+    assert set(failed) == {"QM2.XMITQ", "QM1.TO.QM2"}
+    assert isinstance(failed["QM2.XMITQ"].error, MQRESTCommandError)
+    assert failed["QM1.TO.QM2"].skipped
+    assert failed["QM1.TO.QM2"].change.qmgr_name == "QM1"
+    assert "APP.TRIGGERED" in qm1.objects["QUEUE"]
+
+
+@pytest.mark.parametrize(
+    ("failing", "failed_names"),
+    [
+        ({"APP.PROCESS"}, {"APP.PROCESS", "APP.TRIGGERED"}),
+        ({"APP.PROCESS", "APP.INITQ"}, {"APP.PROCESS", "APP.INITQ", "APP.TRIGGERED"}),
+    ],
+)
+def test_change_with_several_dependencies_is_skipped_once(failing: set[str], failed_names: set[str]) -> None:
+    qm1 = QueueManagerTransport()
+    qm1.failing.update(failing)
+    planner = Planner([_session("QM1", qm1)], max_workers=1)
+    plan = planner.plan(
+        [
+            DesiredObject(
+                "QM1",
+                "qlocal",
+                "APP.TRIGGERED",
+                {"process_name": "APP.PROCESS", "initiation_queue_name": "APP.INITQ"},
+            ),
+            DesiredObject("QM1", "process", "APP.PROCESS"),
+            DesiredObject("QM1", "process", "APP.PROCESS2"),
+            DesiredObject("QM1", "qlocal", "APP.INITQ", {"process_name": "APP.PROCESS2"}),
+        ],
+    )
+
+    result = planner.apply(plan)
+
+    assert {outcome.change.name for outcome in result.failures} == failed_names
+    assert [outcome.skipped for outcome in result.outcomes if outcome.change.name == "APP.TRIGGERED"] == [True]
+
+
+def test_independent_changes_run_in_parallel() -> None:
+    qm1, qm2 = QueueManagerTransport(), QueueManagerTransport()
+    barrier = threading.Barrier(EXPECT_TWO, timeout=WAIT_SECONDS)
+    qm1.barrier = qm2.barrier = barrier
+    planner = Planner([_session("QM1", qm1), _session("QM2", qm2)], max_workers=EXPECT_TWO)
+    plan = planner.plan([DesiredObject("QM1", "qlocal", "APP.IN"), DesiredObject("QM2", "qlocal", "APP.IN")])
+
+    assert planner.apply(plan).succeeded
+
+
+def test_empty_plan_applies_nothing() -> None:
+    transport = QueueManagerTransport()
+    planner = Planner([_session("QM1", transport)])
+
+    plan = planner.plan([])
+
+    assert plan.diff() == ""
+    assert planner.apply(plan) == ApplyResult(outcomes=())
+    assert transport.commands == []
+
+
+@pytest.mark.parametrize(
+    ("desired", "message"),
+    [
+        ([DesiredObject("QM9", "qlocal", "APP.IN")], "QM9"),
+        ([DesiredObject("QM1", "qmgr", "QM1")], "qmgr"),
+        ([DesiredObject("QM1", "qlocal", "APP.IN"), DesiredObject("QM1", "qalias", "APP.IN")], "Duplicate"),
+        (
+            [
+                DesiredObject("QM1", "qalias", "A", {"target_queue_name": "B"}),
+                DesiredObject("QM1", "qalias", "B", {"TARGET": "A"}),
+            ],
+            "cycle",
+        ),
+    ],
+)
+def test_invalid_plans_raise(desired: list[DesiredObject], message: str) -> None:
+    planner = Planner([_session("QM1", QueueManagerTransport())])
+
+    with pytest.raises(ValueError, match=message):
+        planner.plan(desired)
+
+
+def test_desired_objects_compare_desired_attributes() -> None:
+    assert DesiredObject("QM1", "qlocal", "APP.IN", {"max_depth": 5}) != DesiredObject(
+        "QM1", "qlocal", "APP.IN", {"max_depth": 9}
+    )
+
+
+def test_failed_display_is_raised_instead_of_planning_creates() -> None:
+    transport = QueueManagerTransport({"QUEUE": {"APP.IN": {}}})
+    transport.denied.add("QUEUE")
+    planner = Planner([_session("QM1", transport)])
+
+    with pytest.raises(MQRESTCommandError, match="2035"):
+        planner.plan([DesiredObject("QM1", "qlocal", "APP.IN")])
+    assert [command for command, _, _ in transport.commands] == ["DISPLAY"]
+
+
+def test_max_workers_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        Planner([], max_workers=0)
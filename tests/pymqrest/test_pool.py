@@ -0,0 +1,238 @@
+"""Tests for the session pool."""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth, CertificateAuth, LTPAAuth, LTPAToken, LTPATokenCache
+from pymqrest.exceptions import MQRESTAuthError
+from pymqrest.pool import MQRESTSessionPool, SessionPoolStats, _freeze
+from pymqrest.session import MQRESTSession, TransportResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from tests.conftest import FakeClock
+
+BASE_URL = "https://example.invalid/ibmmq/rest/v2"
+TEST_PASSWORD = "pass"
+IDLE_TTL_SECONDS = 60.0
+EXPECT_TWO = 2
+WAIT_SECONDS = 5.0
+
+
+class LoginCountingTransport:
+    """Transport answering LTPA logins and MQSC commands, counting logins.
+
+    Logins with any password but ``TEST_PASSWORD`` are rejected.
+    """
+
+    def __init__(self) -> None:
+        self.logins = 0
+        self.login_started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (headers, timeout_seconds, verify_tls)
+        if url.endswith("/login"):
+            if payload["password"] != TEST_PASSWORD:
+                return TransportResponse(status_code=401, text="", headers={})
+            self.logins += 1
+            self.login_started.set()
+            self.release.wait(WAIT_SECONDS)
+            return TransportResponse(status_code=200, text="", headers={"Set-Cookie": "LtpaToken2=tok; Path=/"})
+        body = {"commandResponse": [], "overallCompletionCode": 0, "overallReasonCode": 0}
+        return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _ltpa() -> LTPAAuth:
+    return LTPAAuth("user", TEST_PASSWORD)
+
+
+def test_same_key_returns_same_session() -> None:
+    transport = LoginCountingTransport()
+    pool = MQRESTSessionPool(transport=transport)
+
+    first = pool.get(BASE_URL, "QM1", credentials=_ltpa(), mapping_overrides={"qualifiers": {}})
+    second = pool.get(BASE_URL, "QM1", credentials=_ltpa(), mapping_overrides={"qualifiers": {}})
+
+    assert first is second
+    assert pool.stats().hits == 1
+    assert pool.stats().misses == 1
+
+
+def test_different_keys_share_ltpa_token() -> None:
+    transport = LoginCountingTransport()
+    pool = MQRESTSessionPool(transport=transport)
+
+    qm1 = pool.get([BASE_URL], "QM1", credentials=_ltpa())
+    qm2 = pool.get([BASE_URL], "QM2", credentials=_ltpa())
+    gateway = pool.get([BASE_URL], "QM2", credentials=_ltpa(), gateway_qmgr="QM1")
+
+    assert len({id(qm1), id(qm2), id(gateway)}) == len(pool)
+    assert transport.logins == 1
+    qm2.display_qmgr()
+    assert transport.logins == 1
+
+
+def test_wrong_password_fails_on_a_warm_pool() -> None:
+    transport = LoginCountingTransport()
+    pool = MQRESTSessionPool(transport=transport)
+    pool.get(BASE_URL, "QM1", credentials=_ltpa()).display_qmgr()
+
+    with pytest.raises(MQRESTAuthError):
+        pool.get(BASE_URL, "QM1", credentials=LTPAAuth("user", "guess"))
+
+    assert transport.logins == 1
+    assert pool.stats().size == 1
+
+
+def test_least_recently_used_session_is_evicted() -> None:
+    pool = MQRESTSessionPool(max_sessions=2, transport=LoginCountingTransport())
+    credentials = BasicAuth("user", TEST_PASSWORD)
+    qm1 = pool.get(BASE_URL, "QM1", credentials=credentials)
+    pool.get(BASE_URL, "QM2", credentials=credentials)
+    pool.get(BASE_URL, "QM1", credentials=credentials)
+
+    pool.get(BASE_URL, "QM3", credentials=credentials)
+
+    assert len(pool) == EXPECT_TWO
+    assert pool.get(BASE_URL, "QM1", credentials=credentials) is qm1
+    assert pool.stats().evictions == 1
+    assert pool.get(BASE_URL, "QM2", credentials=credentials) is not None
+    assert pool.stats().misses == len(("QM1", "QM2", "QM3", "QM2 again"))
+
+
+def test_idle_sessions_expire(clock: FakeClock) -> None:
+    pool = MQRESTSessionPool(idle_ttl_seconds=IDLE_TTL_SECONDS, transport=LoginCountingTransport())
+    credentials = BasicAuth("user", TEST_PASSWORD)
+    qm1 = pool.get(BASE_URL, "QM1", credentials=credentials)
+    pool.get(BASE_URL, "QM2", credentials=credentials)
+
+    clock.now += IDLE_TTL_SECONDS / 2
+    pool.get(BASE_URL, "QM1", credentials=credentials)
+    clock.now += IDLE_TTL_SECONDS
+    assert pool.evict_idle() == 1
+    assert pool.get(BASE_URL, "QM1", credentials=credentials) is qm1
+
+    clock.now += IDLE_TTL_SECONDS * 2
+    assert pool.get(BASE_URL, "QM1", credentials=credentials) is not qm1
+
+
+def test_idle_ttl_none_keeps_sessions(clock: FakeClock) -> None:
+    pool = MQRESTSessionPool(idle_ttl_seconds=None, transport=LoginCountingTransport())
+    pool.get(BASE_URL, "QM1", credentials=BasicAuth("user", TEST_PASSWORD))
+    clock.now += 1e9
+    assert pool.evict_idle() == 0
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_dropped_sessions_are_closed(clock: FakeClock, monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[str] = []
+    monkeypatch.setattr(MQRESTSession, "close", lambda session: closed.append(session.qmgr_name))
+    pool = MQRESTSessionPool(max_sessions=2, idle_ttl_seconds=IDLE_TTL_SECONDS, transport=LoginCountingTransport())
+    credentials = BasicAuth("user", TEST_PASSWORD)
+    for qmgr_name in ("QM1", "QM2", "QM3"):
+        pool.get(BASE_URL, qmgr_name, credentials=credentials)
+    assert closed == ["QM1"]
+
+    clock.now += IDLE_TTL_SECONDS * 2
+    pool.get(BASE_URL, "QM4", credentials=credentials)
+    assert closed == ["QM1", "QM2", "QM3"]
+
+    pool.clear()
+    assert closed == ["QM1", "QM2", "QM3", "QM4"]
+
+
+class ObservedTokenCache(LTPATokenCache):
+    """Token cache signalling each caller that reaches it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.callers = threading.Semaphore(0)
+
+    def acquire(
+        self,
+        rest_base_url: str,
+        credentials: LTPAAuth,
+        login: Callable[[], LTPAToken],
+        *,
+        margin_seconds: float,
+        stale: LTPAToken | None = None,
+    ) -> LTPAToken:
+        self.callers.release()
+        return super().acquire(rest_base_url, credentials, login, margin_seconds=margin_seconds, stale=stale)
+
+
+def test_concurrent_build_keeps_first_session() -> None:
+    transport = LoginCountingTransport()
+    cache = ObservedTokenCache()
+    pool = MQRESTSessionPool(transport=transport, token_cache=cache)
+    sessions: list[object] = []
+
+    def build() -> None:
+        sessions.append(pool.get(BASE_URL, "QM1", credentials=_ltpa()))
+
+    first = threading.Thread(target=build)
+    second = threading.Thread(target=build)
+    transport.release.clear()
+    first.start()
+    assert transport.login_started.wait(WAIT_SECONDS)
+    second.start()
+    assert cache.callers.acquire(timeout=WAIT_SECONDS)
+    assert cache.callers.acquire(timeout=WAIT_SECONDS)
+    transport.release.set()
+    first.join(WAIT_SECONDS)
+    second.join(WAIT_SECONDS)
+
+    assert len(sessions) == EXPECT_TWO
+    assert sessions[0] is sessions[1]
+    assert transport.logins == 1
+    assert pool.stats() == SessionPoolStats(size=1, hits=1, misses=1, evictions=0)
+
+
+def test_default_transports_are_shared_per_client_certificate() -> None:
+    pool = MQRESTSessionPool()
+    basic = BasicAuth("user", TEST_PASSWORD)
+    cert = CertificateAuth("/cert.pem", "/key.pem")
+    combined = CertificateAuth("/combined.pem")
+
+    qm1 = pool.get(BASE_URL, "QM1", credentials=basic)
+    qm2 = pool.get(BASE_URL, "QM2", credentials=basic)
+    cert_qm1 = pool.get(BASE_URL, "QM1", credentials=cert)
+    cert_qm2 = pool.get(BASE_URL, "QM2", credentials=cert)
+    combined_qm1 = pool.get(BASE_URL, "QM1", credentials=combined)
+
+    assert qm1._transport is qm2._transport  # noqa: SLF001
+    assert cert_qm1._transport is cert_qm2._transport  # noqa: SLF001
+    assert cert_qm1._transport is not qm1._transport  # noqa: SLF001
+    assert combined_qm1._transport is not cert_qm1._transport  # noqa: SLF001
+
+
+def test_pool_key_freezes_nested_options() -> None:
+    frozen = _freeze({"b": [1, {"c": {2}}], "a": (3,)})
+    assert frozen == (("a", (3,)), ("b", (1, (("c", frozenset({2})),))))
+    assert hash(frozen) == hash(_freeze({"a": [3], "b": ({"c": {2}}, 1)[::-1]}))
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [({"max_sessions": 0}, "max_sessions"), ({"idle_ttl_seconds": 0.0}, "idle_ttl_seconds")],
+)
+def test_invalid_pool_configuration_raises(kwargs: dict[str, float], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        MQRESTSessionPool(**kwargs)  # type: ignore[arg-type]
@@ -11,13 +11,14 @@ from requests import RequestException
 
 from pymqrest import session as session_module
 from pymqrest._mapping_merge import MappingOverrideMode
-from pymqrest.auth import BasicAuth, CertificateAuth, LTPAAuth
+from pymqrest.auth import BasicAuth, CertificateAuth, LTPAAuth, LTPATokenCache
 from pymqrest.exceptions import (
     MQRESTAuthError,
     MQRESTCommandError,
     MQRESTResponseError,
     MQRESTTransportError,
 )
+from pymqrest.hedging import HedgeConfig
 from pymqrest.mapping import MappingError
 from pymqrest.mapping_data import MAPPING_DATA
 from pymqrest.session import GATEWAY_HEADER, MQRESTSession, RequestsTransport, TransportResponse
@@ -30,6 +31,8 @@ STATUS_INTERNAL_SERVER_ERROR = 500
 STATUS_CREATED = 201
 TEST_PASSWORD = "pass"
 TEST_DEPTH = 5
+STATUS_OK = 200
+EXPECT_TWO_SAMPLES = 2
 
 
 @dataclass(frozen=True)
@@ -102,6 +105,41 @@ def test_qmgr_name_property_returns_configured_name() -> None:
     assert session.qmgr_name == "QM1"
 
 
+def test_response_key_follows_attribute_mapping() -> None:
+    session, _ = _build_session({"overallCompletionCode": 0, "overallReasonCode": 0})
+    raw = MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        "QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        map_attributes=False,
+    )
+
+    assert session.response_key("qlocal", "QUEUE") == "queue_name"
+    assert session.response_key("CHANNEL", "altdate") == "alteration_date"
+    assert session.response_key("QUEUE", "NOSUCH") == "NOSUCH"
+    assert raw.response_key("QUEUE", "altdate") == "ALTDATE"
+
+
+def test_display_projection_requests_only_display_attributes() -> None:
+    session, _ = _build_session({"overallCompletionCode": 0, "overallReasonCode": 0})
+    raw = MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        "QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        map_attributes=False,
+    )
+
+    assert session.display_projection("QUEUE", ["description", "max_queue_depth", "description"]) == [
+        "description",
+        "max_queue_depth",
+    ]
+    assert session.display_projection("QUEUE", []) == []
+    assert session.display_projection("QUEUE", ["description", "replace"]) == ["all"]
+    assert session.display_projection("NOSUCH", ["description"]) == ["all"]
+    assert raw.display_projection("QUEUE", ["DESCR"]) == ["DESCR"]
+    assert raw.display_projection("QUEUE", ["description"]) == ["all"]
+
+
 def test_display_qmgr_returns_first_object() -> None:
     response_payload = {
         "commandResponse": [
@@ -1252,6 +1290,70 @@ def test_gateway_session_url_uses_target_qmgr() -> None:
     assert recorded.headers[GATEWAY_HEADER] == "GWQM"
 
 
+# -- Derived sessions --
+
+
+QMGR_RESPONSE_PAYLOAD = {
+    "commandResponse": [{"completionCode": 0, "reasonCode": 0, "parameters": {"QMNAME": "QM42"}}],
+    "overallCompletionCode": 0,
+    "overallReasonCode": 0,
+}
+
+
+def test_for_qmgr_routes_through_session_qmgr_as_gateway() -> None:
+    session, transport = _build_session(QMGR_RESPONSE_PAYLOAD)
+    session.display_qmgr()
+
+    derived = session.for_qmgr("QM42")
+    derived.display_qmgr()
+
+    recorded = transport.recorded_requests[-1]
+    assert "/qmgr/QM42/mqsc" in recorded.url
+    assert recorded.headers[GATEWAY_HEADER] == "QM1"
+    assert derived.qmgr_name == "QM42"
+    assert derived.last_http_status == STATUS_OK
+    assert session.qmgr_name == "QM1"
+    assert session.gateway_qmgr is None
+    assert derived._transport is session._transport  # noqa: SLF001
+    assert derived._mapping_data is session._mapping_data  # noqa: SLF001
+    assert session.latency_stats()["DISPLAY QMGR"].count == EXPECT_TWO_SAMPLES
+
+
+def test_for_qmgr_keeps_existing_gateway() -> None:
+    session, _ = _build_session(QMGR_RESPONSE_PAYLOAD, gateway_qmgr="GWQM")
+    session.display_qmgr()
+
+    derived = session.for_qmgr("QM42")
+
+    assert derived.gateway_qmgr == "GWQM"
+    assert derived.last_command_payload is None
+    assert session.for_qmgr("GWQM").gateway_qmgr is None
+
+
+def test_for_qmgr_without_gateway() -> None:
+    session, transport = _build_session(QMGR_RESPONSE_PAYLOAD)
+
+    session.for_qmgr("QM2", via_gateway=False).display_qmgr()
+
+    assert GATEWAY_HEADER not in transport.recorded_requests[0].headers
+
+
+def test_for_qmgr_shares_hedge_executor() -> None:
+    transport = FakeTransport(TransportResponse(status_code=200, text=json.dumps(QMGR_RESPONSE_PAYLOAD), headers={}))
+    session = MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        "QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+        hedging=HedgeConfig(),
+    )
+
+    derived = session.for_qmgr("QM42")
+
+    assert derived.display_qmgr() == {"queue_manager_name": "QM42"}
+    assert derived._hedge_executor is session._hedge_executor  # noqa: SLF001
+
+
 # -- Mapping overrides tests --
 
 
@@ -1560,6 +1662,85 @@ def test_credentials_ltpa_auth_sends_cookie_header() -> None:
     assert command_request.headers["Cookie"] == "LtpaToken2=ltpa_test_token"
 
 
+def _login_response(token: str, max_age: int | None = None) -> TransportResponse:
+    cookie = f"LtpaToken2={token}; Path=/"
+    if max_age is not None:
+        cookie += f"; Max-Age={max_age}"
+    return TransportResponse(status_code=200, text="", headers={"Set-Cookie": cookie})
+
+
+def _qmgr_response() -> TransportResponse:
+    body = {
+        "commandResponse": [{"completionCode": 0, "reasonCode": 0, "parameters": {"QMNAME": "QM1"}}],
+        "overallCompletionCode": 0,
+        "overallReasonCode": 0,
+    }
+    return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _ltpa_session(
+    transport: MultiResponseTransport,
+    token_cache: LTPATokenCache | None = None,
+    password: str = TEST_PASSWORD,
+) -> MQRESTSession:
+    return MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        "QM1",
+        credentials=LTPAAuth("user", password),
+        transport=transport,
+        token_cache=token_cache,
+    )
+
+
+def test_ltpa_relogs_in_once_on_unauthorized_and_retries() -> None:
+    unauthorized = TransportResponse(status_code=401, text="", headers={})
+    transport = MultiResponseTransport(
+        [_login_response("expired"), unauthorized, _login_response("renewed"), _qmgr_response()],
+    )
+    session = _ltpa_session(transport)
+
+    assert session.display_qmgr() == {"queue_manager_name": "QM1"}
+
+    urls = [request.url.rsplit("/", 1)[-1] for request in transport.recorded_requests]
+    assert urls == ["login", "mqsc", "login", "mqsc"]
+    assert transport.recorded_requests[-1].headers["Cookie"] == "LtpaToken2=renewed"
+
+
+def test_ltpa_token_is_refreshed_before_expiry() -> None:
+    transport = MultiResponseTransport(
+        [_login_response("short", max_age=60), _login_response("fresh"), _qmgr_response()],
+    )
+    session = _ltpa_session(transport)
+
+    session.display_qmgr()
+
+    assert transport.recorded_requests[1].url.endswith("/login")
+    assert transport.recorded_requests[-1].headers["Cookie"] == "LtpaToken2=fresh"
+
+
+def test_shared_token_cache_logs_in_once_per_endpoint() -> None:
+    cache = LTPATokenCache()
+    first_transport = MultiResponseTransport([_login_response("shared"), _qmgr_response()])
+    second_transport = MultiResponseTransport([_qmgr_response()])
+    _ltpa_session(first_transport, cache).display_qmgr()
+
+    _ltpa_session(second_transport, cache).display_qmgr()
+
+    assert len(second_transport.recorded_requests) == 1
+    assert second_transport.recorded_requests[0].headers["Cookie"] == "LtpaToken2=shared"
+
+
+def test_shared_token_cache_rejects_wrong_password() -> None:
+    cache = LTPATokenCache()
+    _ltpa_session(MultiResponseTransport([_login_response("shared")]), cache)
+    rejected = MultiResponseTransport([TransportResponse(status_code=401, text="", headers={})])
+
+    with pytest.raises(MQRESTAuthError, match="LTPA login failed"):
+        _ltpa_session(rejected, cache, password="WRONG")
+
+    assert [request.url.rsplit("/", 1)[-1] for request in rejected.recorded_requests] == ["login"]
+
+
 def test_credentials_certificate_auth_no_auth_header() -> None:
     response_payload = {
         "commandResponse": [
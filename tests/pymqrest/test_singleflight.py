@@ -0,0 +1,164 @@
+"""Tests for single-flight coalescing of read-only commands."""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.exceptions import MQRESTTransportError
+from pymqrest.session import MQRESTSession, TransportResponse
+from pymqrest.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+TEST_PASSWORD = "pass"
+FAILURE_MESSAGE = "boom"
+WAIT_SECONDS = 5.0
+CALLERS = 4
+
+
+class GatedTransport:
+    """Transport that holds every request until released."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.requests: list[dict[str, object]] = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (headers, timeout_seconds, verify_tls)
+        with self._lock:
+            self.requests.append(dict(payload))
+        self.entered.set()
+        self.release.wait(WAIT_SECONDS)
+        if self.fail:
+            raise MQRESTTransportError(FAILURE_MESSAGE, url=url)
+        body = {
+            "commandResponse": [{"completionCode": 0, "reasonCode": 0, "parameters": {"QMNAME": "QM1"}}],
+            "overallCompletionCode": 0,
+            "overallReasonCode": 0,
+        }
+        return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _session(transport: GatedTransport, group: SingleFlight | None) -> MQRESTSession:
+    return MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        "QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+        single_flight=group,
+    )
+
+
+def test_concurrent_identical_displays_share_one_request() -> None:
+    transport = GatedTransport()
+    group = SingleFlight()
+    session = _session(transport, group)
+    results: list[object] = []
+    threads = [threading.Thread(target=lambda: results.append(session.display_qmgr())) for _ in range(CALLERS)]
+
+    threads[0].start()
+    assert transport.entered.wait(WAIT_SECONDS)
+    for thread in threads[1:]:
+        thread.start()
+    _wait_for(lambda: group.calls_coalesced == CALLERS - 1)
+    transport.release.set()
+    for thread in threads:
+        thread.join(WAIT_SECONDS)
+
+    assert len(transport.requests) == 1
+    assert results == [{"queue_manager_name": "QM1"}] * CALLERS
+    assert group.calls_started == 1
+
+
+def test_errors_are_shared_with_waiting_callers() -> None:
+    transport = GatedTransport(fail=True)
+    group = SingleFlight()
+    session = _session(transport, group)
+    errors: list[BaseException] = []
+
+    def call() -> None:
+        try:
+            session.display_qmgr()
+        except MQRESTTransportError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    threads[0].start()
+    assert transport.entered.wait(WAIT_SECONDS)
+    threads[1].start()
+    _wait_for(lambda: group.calls_coalesced == 1)
+    transport.release.set()
+    for thread in threads:
+        thread.join(WAIT_SECONDS)
+
+    assert len(errors) == len(threads)
+    assert errors[0] is errors[1]
+    assert len(transport.requests) == 1
+
+
+def test_sequential_calls_are_not_cached() -> None:
+    transport = GatedTransport()
+    transport.release.set()
+    group = SingleFlight()
+    session = _session(transport, group)
+
+    session.display_qmgr()
+    session.display_qmgr()
+
+    assert len(transport.requests) == len(("first", "second"))
+    assert group.calls_coalesced == 0
+
+
+def test_different_targets_are_not_coalesced() -> None:
+    transport = GatedTransport()
+    transport.release.set()
+    group = SingleFlight()
+    session = _session(transport, group)
+
+    assert session._request_key({"type": "runCommandJSON"}) != session.for_qmgr("QM2")._request_key(  # noqa: SLF001
+        {"type": "runCommandJSON"},
+    )
+
+
+def test_state_changing_commands_bypass_single_flight() -> None:
+    transport = GatedTransport()
+    transport.release.set()
+    group = SingleFlight()
+
+    _session(transport, group).alter_qmgr(request_parameters={"description": "x"})
+
+    assert group.calls_started == 0
+
+
+def test_single_flight_propagates_leader_error() -> None:
+    group = SingleFlight()
+
+    def fail() -> None:
+        raise MQRESTTransportError(FAILURE_MESSAGE, url="x")
+
+    with pytest.raises(MQRESTTransportError):
+        group.do("key", fail)
+    assert group.do("key", lambda: 1) == 1
+
+
+def _wait_for(condition: Callable[[], bool]) -> None:
+    waiter = threading.Event()
+    while not condition() and not waiter.wait(0.001):
+        pass
@@ -0,0 +1,219 @@
+"""Tests for the SQLite snapshot store."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.exceptions import MQRESTCommandError
+from pymqrest.session import MQRESTSession, TransportResponse
+from pymqrest.snapshot import SnapshotInfo, SnapshotStore
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+TEST_PASSWORD = "pass"
+EXPECT_TWO = 2
+FAILURE_MESSAGE = "capture failed"
+
+
+class QueueListTransport:
+    """Transport listing a fixed set of queues."""
+
+    def __init__(self, queues: dict[str, str], *, fail: bool = False) -> None:
+        self.queues = queues
+        self.fail = fail
+        self.payloads: list[dict[str, object]] = []
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, headers, timeout_seconds, verify_tls)
+        self.payloads.append(dict(payload))
+        if self.fail:
+            body: dict[str, object] = {"overallCompletionCode": 2, "overallReasonCode": 2035}
+            return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+        items = [
+            {"completionCode": 0, "reasonCode": 0, "parameters": {"QUEUE": name, "DESCR": description}}
+            for name, description in sorted(self.queues.items())
+        ]
+        body = {"commandResponse": items, "overallCompletionCode": 0, "overallReasonCode": 0}
+        return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _session(transport: QueueListTransport, qmgr_name: str = "QM1") -> MQRESTSession:
+    return MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        qmgr_name,
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+    )
+
+
+def test_capture_stores_mapped_display_results(tmp_path: Path) -> None:
+    transport = QueueListTransport({"APP.IN": "inbound", "APP.OUT": "outbound"})
+    path = tmp_path / "snapshots.db"
+
+    with SnapshotStore(path, batch_size=1) as store, store.begin(label="nightly", taken_at=100.0) as writer:
+        assert writer.capture(_session(transport), "queue") == EXPECT_TWO
+
+    with SnapshotStore(path) as reopened:
+        assert reopened.get("QM1", "QUEUE", "APP.IN") == {"queue_name": "APP.IN", "description": "inbound"}
+        assert [row["queue_name"] for row in reopened.objects("QM1", "queue")] == ["APP.IN", "APP.OUT"]
+        assert reopened.snapshots() == [SnapshotInfo(snapshot_id=1, taken_at=100.0, label="nightly", object_count=2)]
+        assert reopened.get("QM1", "QUEUE", "MISSING") is None
+        assert reopened.get("QM2", "QUEUE", "APP.IN") is None
+        assert reopened.objects("QM2", "QUEUE") == []
+
+
+def test_lookups_use_latest_snapshot_of_each_scope() -> None:
+    store = SnapshotStore()
+    with store.begin(taken_at=100.0) as writer:
+        writer.add("QM1", "QUEUE", "APP.IN", {"description": "v1"})
+        writer.add("QM2", "QUEUE", "APP.IN", {"description": "qm2"})
+    with store.begin(taken_at=200.0) as writer:
+        writer.add_rows("QM1", "QUEUE", [{"queue_name": "APP.IN", "description": "v2"}], name_key="queue_name")
+
+    assert store.get("QM1", "QUEUE", "APP.IN") == {"queue_name": "APP.IN", "description": "v2"}
+    assert store.get("QM1", "QUEUE", "APP.IN", at=150.0) == {"description": "v1"}
+    assert store.get("QM1", "QUEUE", "APP.IN", at=50.0) is None
+    assert store.get("QM2", "QUEUE", "APP.IN") == {"description": "qm2"}
+
+
+def test_empty_capture_records_that_no_objects_existed() -> None:
+    store = SnapshotStore()
+    with store.begin(taken_at=100.0) as writer:
+        writer.add("QM1", "QUEUE", "APP.IN", {"description": "v1"})
+    with store.begin(taken_at=200.0) as writer:
+        assert writer.add_rows("QM1", "QUEUE", [], name_key="queue_name") == 0
+
+    assert store.objects("QM1", "QUEUE") == []
+    assert store.objects("QM1", "QUEUE", at=100.0) == [{"description": "v1"}]
+
+
+def test_uncommitted_and_failed_snapshots_are_invisible() -> None:
+    store = SnapshotStore()
+    writer = store.begin()
+    writer.add("QM1", "QUEUE", "APP.IN", {"description": "pending"})
+    assert writer.snapshot_id == 1
+    assert store.get("QM1", "QUEUE", "APP.IN") is None
+
+    def capture_then_fail() -> None:
+        with store.begin() as failed:
+            failed.add("QM1", "QUEUE", "APP.IN", {"description": "failed"})
+            raise RuntimeError(FAILURE_MESSAGE)
+
+    with pytest.raises(RuntimeError, match=FAILURE_MESSAGE):
+        capture_then_fail()
+
+    info = writer.commit()
+    assert info.object_count == 1
+    assert [snapshot.snapshot_id for snapshot in store.snapshots()] == [1]
+    assert store.get("QM1", "QUEUE", "APP.IN") == {"description": "pending"}
+
+
+def test_failed_capture_discards_its_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "snapshots.db"
+    store = SnapshotStore(path)
+    writer = store.begin()
+    writer.capture(_session(QueueListTransport({"APP.IN": "inbound"})), "QUEUE")
+
+    with pytest.raises(MQRESTCommandError, match="2035"):
+        writer.capture(_session(QueueListTransport({}, fail=True)), "CHANNEL")
+
+    with pytest.raises(LookupError):
+        writer.commit()
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM snapshots").fetchone() == (0,)
+        assert connection.execute("SELECT COUNT(*) FROM objects").fetchone() == (0,)
+    store.close()
+
+
+def test_empty_response_parameters_capture_all_attributes() -> None:
+    transport = QueueListTransport({"APP.IN": "inbound"})
+    with SnapshotStore() as store, store.begin() as writer:
+        writer.capture(_session(transport), "QUEUE", response_parameters=[])
+
+    assert transport.payloads[0]["responseParameters"] == ["all"]
+
+
+def test_history_collapses_unchanged_versions_and_shares_blobs(tmp_path: Path) -> None:
+    path = tmp_path / "snapshots.db"
+    store = SnapshotStore(path)
+    for taken_at, description in [(100.0, "v1"), (200.0, "v1"), (300.0, "v2"), (400.0, "v2")]:
+        with store.begin(taken_at=taken_at) as writer:
+            writer.add("QM1", "QUEUE", "APP.IN", {"description": description})
+    with store.begin(taken_at=500.0) as writer:
+        writer.add("QM1", "QUEUE", "OTHER", {"description": "v1"})
+
+    history = store.history("QM1", "queue", "APP.IN")
+
+    assert [(version.taken_at, version.attributes) for version in history] == [
+        (100.0, {"description": "v1"}),
+        (300.0, {"description": "v2"}),
+    ]
+    store.close()
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM blobs").fetchone()[0] == EXPECT_TWO
+
+
+def test_prune_keeps_newest_snapshots_and_referenced_blobs() -> None:
+    store = SnapshotStore()
+    for taken_at, description in [(100.0, "v1"), (200.0, "v2"), (300.0, "v3")]:
+        with store.begin(taken_at=taken_at) as writer:
+            writer.add("QM1", "QUEUE", "APP.IN", {"description": description})
+
+    assert store.prune(keep=2) == 1
+    assert [snapshot.taken_at for snapshot in store.snapshots()] == [200.0, 300.0]
+    assert [version.attributes for version in store.history("QM1", "QUEUE", "APP.IN")] == [
+        {"description": "v2"},
+        {"description": "v3"},
+    ]
+    assert store.prune(keep=0) == EXPECT_TWO
+    assert store.snapshots() == []
+
+
+def test_prune_skips_snapshots_still_being_written(tmp_path: Path) -> None:
+    path = tmp_path / "snapshots.db"
+    store = SnapshotStore(path, batch_size=1)
+    with store.begin(taken_at=100.0) as writer:
+        writer.add("QM1", "QUEUE", "APP.IN", {"description": "v1"})
+    pending = store.begin(taken_at=200.0)
+    pending.add("QM1", "QUEUE", "APP.IN", {"description": "v2"})
+
+    assert store.prune(keep=0) == 1
+    assert pending.commit().object_count == 1
+    assert store.get("QM1", "QUEUE", "APP.IN") == {"description": "v2"}
+
+    abandoned = store.begin(taken_at=300.0)
+    abandoned.add("QM1", "QUEUE", "APP.OUT", {"description": "lost"})
+    abandoned.discard()
+    abandoned.add("QM1", "QUEUE", "APP.OUT", {"description": "orphan"})
+    with pytest.raises(LookupError, match="no longer exists"):
+        abandoned.commit()
+    store.close()
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM objects WHERE snapshot_id = 3").fetchone()[0] == 0
+
+
+@pytest.mark.parametrize(
+    ("call", "message"),
+    [
+        (lambda: SnapshotStore(batch_size=0), "batch_size"),
+        (lambda: SnapshotStore().prune(keep=-1), "keep"),
+    ],
+)
+def test_invalid_arguments_raise(call: object, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        call()  # type: ignore[operator]
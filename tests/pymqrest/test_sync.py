@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import random
+import threading
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -10,9 +12,9 @@ from typing import TYPE_CHECKING
 import pytest
 
 from pymqrest.auth import BasicAuth
-from pymqrest.exceptions import MQRESTError, MQRESTTimeoutError
+from pymqrest.exceptions import MQRESTCommandError, MQRESTError, MQRESTTimeoutError
 from pymqrest.session import MQRESTSession, TransportResponse
-from pymqrest.sync import SyncConfig, SyncOperation, SyncResult
+from pymqrest.sync import SyncBatchResult, SyncConfig, SyncOperation, SyncResult
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
@@ -242,6 +244,7 @@ class TestStartChannelSync:
         assert transport.recorded_requests[0].payload["name"] == "MY.CHL"
         assert transport.recorded_requests[1].payload["command"] == "DISPLAY"
         assert transport.recorded_requests[1].payload["qualifier"] == "CHSTATUS"
+        assert transport.recorded_requests[1].payload["responseParameters"] == ["STATUS"]
 
     def test_running_after_multiple_polls(self) -> None:
         start_response = _success_payload()
@@ -282,7 +285,7 @@ class TestStartChannelSync:
         """Polling works when mapping is off (raw MQSC STATUS key)."""
         start_response = _success_payload()
         status_response = _success_payload([{"STATUS": "RUNNING"}])
-        session, _transport = _build_session(
+        session, transport = _build_session(
             [start_response, status_response],
             map_attributes=False,
         )
@@ -290,6 +293,7 @@ class TestStartChannelSync:
         result = session.start_channel_sync("MY.CHL")
 
         assert result.operation is SyncOperation.STARTED
+        assert transport.recorded_requests[1].payload["responseParameters"] == ["STATUS"]
 
 
 @pytest.mark.usefixtures("_fake_clock")
@@ -497,6 +501,462 @@ class TestRestartService:
         assert len(transport.recorded_requests) == EXPECT_FOUR_REQUESTS
 
 
+# ---------------------------------------------------------------------------
+# Polling strategy: immediate first poll, backoff, jitter, deadline
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.usefixtures("_fake_clock")
+class TestPollingStrategy:
+    def test_immediate_first_poll(self) -> None:
+        running = _success_payload([{"STATUS": "RUNNING"}])
+        session, _transport = _build_session([_success_payload(), running])
+
+        result = session.start_channel_sync("MY.CHL", config=SyncConfig(first_poll_immediate=True))
+
+        assert result.polls == EXPECT_ONE_POLL
+        assert result.elapsed_seconds == 0.0
+
+    def test_backoff_is_capped(self) -> None:
+        initializing = _success_payload([{"STATUS": "INITIALIZING"}])
+        running = _success_payload([{"STATUS": "RUNNING"}])
+        session, _transport = _build_session([_success_payload(), *[initializing] * 5, running])
+        sync_config = SyncConfig(
+            poll_interval_seconds=0.1,
+            first_poll_immediate=True,
+            backoff_multiplier=2.0,
+            max_poll_interval_seconds=0.5,
+        )
+
+        result = session.start_channel_sync("MY.CHL", config=sync_config)
+
+        # Sleeps: 0, 0.1, 0.2, 0.4, 0.5, 0.5
+        assert result.polls == 6  # noqa: PLR2004
+        assert result.elapsed_seconds == pytest.approx(1.7)
+
+    def test_last_sleep_stops_at_deadline(self) -> None:
+        initializing = _success_payload([{"STATUS": "INITIALIZING"}])
+        session, _transport = _build_session([_success_payload(), *[initializing] * 3])
+
+        with pytest.raises(MQRESTTimeoutError) as exc_info:
+            session.stop_listener_sync("MY.LIS", config=SyncConfig(timeout_seconds=2.5))
+
+        assert exc_info.value.elapsed == EXPECT_ELAPSED_2_5
+        assert exc_info.value.operation == "stop"
+
+    def test_jitter_scales_each_sleep(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        bounds: list[tuple[float, float]] = []
+
+        def fake_uniform(low: float, high: float) -> float:
+            bounds.append((low, high))
+            return high
+
+        monkeypatch.setattr(random, "uniform", fake_uniform)
+        running = _success_payload([{"STATUS": "RUNNING"}])
+        session, _transport = _build_session([_success_payload(), running])
+
+        result = session.start_service_sync("MY.SVC", config=SyncConfig(jitter=0.5))
+
+        assert bounds == [(-0.5, 0.5)]
+        assert result.elapsed_seconds == pytest.approx(1.5)
+
+    @pytest.mark.parametrize(
+        ("sync_config", "message"),
+        [
+            (SyncConfig(backoff_multiplier=0.5), "backoff_multiplier"),
+            (SyncConfig(max_poll_interval_seconds=0.0), "max_poll_interval_seconds"),
+            (SyncConfig(jitter=1.0), "jitter"),
+        ],
+    )
+    def test_invalid_config_raises_before_command(self, sync_config: SyncConfig, message: str) -> None:
+        session, transport = _build_session([])
+
+        with pytest.raises(ValueError, match=message):
+            session.start_channel_sync("MY.CHL", config=sync_config)
+        assert transport.recorded_requests == []
+
+
+# ---------------------------------------------------------------------------
+# Batched start/stop with shared status polling
+# ---------------------------------------------------------------------------
+
+_NAME_ATTRIBUTES = {"CHSTATUS": "CHANNEL", "LSSTATUS": "LISTENER", "SVSTATUS": "SERVICE"}
+
+
+class StatusTransport:
+    """Transport whose generic status DISPLAYs step through per-object status sequences.
+
+    ``None`` in a sequence means the object has no status row. The last
+    status of a sequence repeats once it is reached.
+    """
+
+    def __init__(
+        self,
+        statuses: dict[str, list[str | None]],
+        *,
+        failing: str | None = None,
+        broken: str | None = None,
+        no_status: dict[str, object] | None = None,
+    ) -> None:
+        self.statuses = statuses
+        self.no_status = no_status or {"overallCompletionCode": 2, "overallReasonCode": 2085}
+        self.failing = failing
+        self.broken = broken
+        self.payloads: list[dict[str, object]] = []
+        self._displays = 0
+        self._lock = threading.Lock()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, headers, timeout_seconds, verify_tls)
+        with self._lock:
+            self.payloads.append(dict(payload))
+        name = str(payload["name"])
+        if payload["command"] != "DISPLAY":
+            if name == self.broken:
+                raise RuntimeError(name)
+            if name == self.failing:
+                return _make_response({"overallCompletionCode": 2, "overallReasonCode": 2085})
+            return _make_response(_success_payload())
+        qualifier = str(payload["qualifier"])
+        tick = self._displays
+        self._displays += 1
+        rows: list[dict[str, object]] = []
+        for object_name, sequence in self.statuses.items():
+            status = sequence[min(tick, len(sequence) - 1)]
+            if object_name.startswith(name.removesuffix("*")) and status is not None:
+                rows.append({_NAME_ATTRIBUTES[qualifier]: object_name, "STATUS": status})
+        if not rows:
+            return _make_response(self.no_status)
+        return _make_response(_success_payload(rows))
+
+
+def _status_session(transport: StatusTransport, *, map_attributes: bool = True) -> MQRESTSession:
+    return MQRESTSession(
+        rest_base_url="https://example.invalid/ibmmq/rest/v2",
+        qmgr_name="QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+        map_attributes=map_attributes,
+        mapping_strict=False,
+    )
+
+
+@pytest.mark.usefixtures("_fake_clock")
+class TestBatchSync:
+    def test_start_channels_resolves_each_as_it_runs(self) -> None:
+        transport = StatusTransport(
+            {
+                "APP.A": ["RUNNING"],
+                "APP.B": ["BINDING", "BINDING", "RUNNING"],
+                "APP.C": [None, "RUNNING"],
+                "OTHER": ["RUNNING"],
+            },
+        )
+
+        batch = _status_session(transport).start_channels_sync(["APP.A", "APP.B", "APP.C", "APP.A"])
+
+        assert batch.ok
+        assert batch.results == {
+            "APP.A": SyncResult(SyncOperation.STARTED, polls=1, elapsed_seconds=1.0),
+            "APP.C": SyncResult(SyncOperation.STARTED, polls=2, elapsed_seconds=2.0),
+            "APP.B": SyncResult(SyncOperation.STARTED, polls=3, elapsed_seconds=3.0),
+        }
+        commands = [(p["command"], p["name"]) for p in transport.payloads if p["command"] == "START"]
+        assert sorted(commands) == [("START", "APP.A"), ("START", "APP.B"), ("START", "APP.C")]
+        displays = [
+            (p["qualifier"], p["name"], p["responseParameters"])
+            for p in transport.payloads
+            if p["command"] == "DISPLAY"
+        ]
+        assert displays == [("CHSTATUS", "APP.*", ["STATUS"])] * EXPECT_THREE_POLLS
+
+    def test_stop_channels_treats_missing_status_as_stopped(self) -> None:
+        transport = StatusTransport({"TO.A": ["STOPPING", None], "TO.B": [None]})
+
+        batch = _status_session(transport).stop_channels_sync(["TO.A", "TO.B"], max_workers=1)
+
+        assert batch.results["TO.B"].polls == EXPECT_ONE_POLL
+        assert batch.results["TO.A"].polls == EXPECT_TWO_POLLS
+
+    def test_channel_status_not_found_means_stopped(self) -> None:
+        no_status: dict[str, object] = {
+            "commandResponse": [{"completionCode": 2, "reasonCode": 3065}],
+            "overallCompletionCode": 2,
+            "overallReasonCode": 3008,
+        }
+        transport = StatusTransport({"TO.A": [None]}, no_status=no_status)
+
+        batch = _status_session(transport).stop_channels_sync(["TO.A"])
+
+        assert batch.results["TO.A"].polls == EXPECT_ONE_POLL
+
+    @pytest.mark.parametrize(
+        "no_status",
+        [
+            {"overallCompletionCode": 2, "overallReasonCode": 2035},
+            {
+                "commandResponse": [{"completionCode": 2, "reasonCode": 2035}],
+                "overallCompletionCode": 2,
+                "overallReasonCode": 3008,
+            },
+        ],
+    )
+    def test_other_status_errors_propagate(self, no_status: dict[str, object]) -> None:
+        transport = StatusTransport({"TO.A": [None]}, no_status=no_status)
+
+        with pytest.raises(MQRESTCommandError, match="2035"):
+            _status_session(transport).stop_channels_sync(["TO.A"])
+
+    def test_failed_commands_and_timeouts_are_reported_per_name(self) -> None:
+        transport = StatusTransport(
+            {"LIS.OK": ["RUNNING"], "LIS.BAD": ["STOPPED"], "LIS.STUCK": ["STARTING"]},
+            failing="LIS.BAD",
+        )
+
+        batch = _status_session(transport, map_attributes=False).start_listeners_sync(
+            ["LIS.OK", "LIS.BAD", "LIS.STUCK"],
+            config=SyncConfig(timeout_seconds=2.5),
+        )
+
+        assert not batch.ok
+        assert list(batch.results) == ["LIS.OK"]
+        assert isinstance(batch.errors["LIS.BAD"], MQRESTCommandError)
+        timeout = batch.errors["LIS.STUCK"]
+        assert isinstance(timeout, MQRESTTimeoutError)
+        assert timeout.operation == "start"
+        assert timeout.elapsed == EXPECT_ELAPSED_2_5
+
+    @pytest.mark.parametrize(
+        ("method_name", "status"),
+        [("start_services_sync", "RUNNING"), ("stop_services_sync", "STOPPED"), ("stop_listeners_sync", "STOPPED")],
+    )
+    def test_listener_and_service_batches(self, method_name: str, status: str) -> None:
+        transport = StatusTransport({"OBJ.A": [status], "OBJ.B": [status]})
+
+        batch: SyncBatchResult = getattr(_status_session(transport), method_name)(["OBJ.A", "OBJ.B"])
+
+        assert sorted(batch.results) == ["OBJ.A", "OBJ.B"]
+        assert {tuple(p["responseParameters"]) for p in transport.payloads if p["command"] == "DISPLAY"} == {  # type: ignore[arg-type]
+            ("STATUS",),
+        }
+
+    def test_empty_batch_sends_nothing(self) -> None:
+        transport = StatusTransport({})
+
+        batch = _status_session(transport).start_channels_sync([])
+
+        assert batch == SyncBatchResult(results={}, errors={})
+        assert transport.payloads == []
+
+    def test_unexpected_command_errors_propagate(self) -> None:
+        transport = StatusTransport({"APP.A": ["RUNNING"]}, broken="APP.A")
+
+        with pytest.raises(RuntimeError, match=r"APP\.A"):
+            _status_session(transport).start_channels_sync(["APP.A"])
+
+    def test_invalid_max_workers_raises(self) -> None:
+        transport = StatusTransport({})
+
+        with pytest.raises(ValueError, match="max_workers"):
+            _status_session(transport).stop_channels_sync(["APP.A"], max_workers=0)
+        assert transport.payloads == []
+
+
+# ---------------------------------------------------------------------------
+# Rolling restart
+# ---------------------------------------------------------------------------
+
+MAX_IN_FLIGHT = 2
+_STATUS_QUALIFIERS = {"CHSTATUS": "CHANNEL", "LSSTATUS": "LISTENER", "SVSTATUS": "SERVICE"}
+
+
+class RestartTransport:
+    """Transport simulating objects that stop and start one status poll after the command."""
+
+    def __init__(
+        self,
+        names: list[str],
+        *,
+        stuck: str | None = None,
+        failing_start: str | None = None,
+        failing_stop: str | None = None,
+        hide_stopped: bool = True,
+        denied_polls: int = 0,
+        denied_list: bool = False,
+    ) -> None:
+        self.status: dict[str, str] = dict.fromkeys(names, "RUNNING")
+        self.denied_polls = denied_polls
+        self.denied_list = denied_list
+        self.stuck = stuck
+        self.failing_start = failing_start
+        self.failing_stop = failing_stop
+        self.hide_stopped = hide_stopped
+        self.payloads: list[dict[str, object]] = []
+        self.max_down = 0
+        self._lock = threading.Lock()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, headers, timeout_seconds, verify_tls)
+        with self._lock:
+            self.payloads.append(dict(payload))
+            return self._handle(payload)
+
+    def _handle(self, payload: Mapping[str, object]) -> TransportResponse:
+        command, qualifier, name = payload["command"], str(payload["qualifier"]), str(payload["name"])
+        failure = _make_response({"overallCompletionCode": 2, "overallReasonCode": 2085})
+        if command == "DISPLAY" and qualifier in _STATUS_QUALIFIERS:
+            if self.denied_polls:
+                self.denied_polls -= 1
+                return _make_response({"overallCompletionCode": 2, "overallReasonCode": 2035})
+            for object_name, status in self.status.items():
+                if status == "STOPPING" and object_name != self.stuck:
+                    self.status[object_name] = "STOPPED"
+                elif status == "STARTING":
+                    self.status[object_name] = "RUNNING"
+            rows: list[dict[str, object]] = [
+                {_STATUS_QUALIFIERS[qualifier]: object_name, "STATUS": status}
+                for object_name, status in self.status.items()
+                if not (self.hide_stopped and status == "STOPPED")
+            ]
+            return _make_response(_success_payload(rows)) if rows else failure
+        if command == "DISPLAY" and self.denied_list:
+            return _make_response({"overallCompletionCode": 2, "overallReasonCode": 2035})
+        if command == "DISPLAY":
+            prefix = name.removesuffix("*")
+            rows = [{qualifier: object_name} for object_name in self.status if object_name.startswith(prefix)]
+            return _make_response(_success_payload(rows)) if rows else failure
+        failing = self.failing_start if command == "START" else self.failing_stop
+        if name == failing:
+            return failure
+        self.status[name] = "STARTING" if command == "START" else "STOPPING"
+        self.max_down = max(self.max_down, sum(status != "RUNNING" for status in self.status.values()))
+        return _make_response(_success_payload())
+
+
+def _restart_session(transport: RestartTransport) -> MQRESTSession:
+    return MQRESTSession(
+        rest_base_url="https://example.invalid/ibmmq/rest/v2",
+        qmgr_name="QM1",
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+        map_attributes=False,
+    )
+
+
+@pytest.mark.usefixtures("_fake_clock")
+class TestRollingRestart:
+    def test_sliding_window_honours_limit(self) -> None:
+        names = ["TO.A", "TO.B", "TO.C", "TO.D", "TO.E"]
+        transport = RestartTransport(names)
+
+        batch = _restart_session(transport).rolling_restart_channels(names, max_in_flight=MAX_IN_FLIGHT)
+
+        assert batch.ok
+        assert list(batch.results) == names
+        assert all(result == SyncResult(SyncOperation.RESTARTED, 2, 2.0) for result in batch.results.values())
+        assert transport.max_down == MAX_IN_FLIGHT
+        assert all(status == "RUNNING" for status in transport.status.values())
+        displays = {(p["qualifier"], p["name"]) for p in transport.payloads if p["command"] == "DISPLAY"}
+        assert displays == {("CHSTATUS", "TO.*")}
+
+    def test_generic_name_lists_objects_with_where_filter(self) -> None:
+        transport = RestartTransport(["TO.A", "TO.B"])
+
+        batch = _restart_session(transport).rolling_restart_channels("TO.*", where="CHLTYPE EQ SDR")
+
+        assert list(batch.results) == ["TO.A", "TO.B"]
+        assert transport.payloads[0]["qualifier"] == "CHANNEL"
+        assert transport.payloads[0]["parameters"] == {"WHERE": "CHLTYPE EQ SDR"}
+        assert transport.max_down == 1
+
+    def test_failed_listing_is_raised(self) -> None:
+        transport = RestartTransport(["TO.A", "TO.B"], denied_list=True)
+
+        with pytest.raises(MQRESTCommandError, match="2035"):
+            _restart_session(transport).rolling_restart_channels("TO.*")
+        assert [p["command"] for p in transport.payloads] == ["DISPLAY"]
+
+    def test_failed_start_holds_slot_and_skips_the_rest(self) -> None:
+        transport = RestartTransport(["LIS.A", "LIS.B", "LIS.C"], failing_start="LIS.A", hide_stopped=False)
+
+        batch = _restart_session(transport).rolling_restart_listeners(["LIS.A", "LIS.B", "LIS.C"])
+
+        assert not batch.ok
+        assert isinstance(batch.errors["LIS.A"], MQRESTCommandError)
+        assert batch.skipped == ("LIS.B", "LIS.C")
+        assert transport.status["LIS.B"] == "RUNNING"
+
+    def test_failed_poll_is_reported_for_objects_in_flight(self) -> None:
+        names = ["TO.A", "TO.B", "TO.C"]
+        transport = RestartTransport(names, denied_polls=1)
+
+        batch = _restart_session(transport).rolling_restart_channels(names, max_in_flight=MAX_IN_FLIGHT)
+
+        assert list(batch.errors) == ["TO.A", "TO.B"]
+        assert all(isinstance(error, MQRESTCommandError) for error in batch.errors.values())
+        assert batch.skipped == ("TO.C",)
+        assert transport.status["TO.C"] == "RUNNING"
+
+    def test_stuck_stop_times_out_while_others_continue(self) -> None:
+        transport = RestartTransport(["SVC.A", "SVC.B", "SVC.C"], stuck="SVC.A", hide_stopped=False)
+
+        batch = _restart_session(transport).rolling_restart_services(
+            ["SVC.A", "SVC.B", "SVC.C"],
+            max_in_flight=MAX_IN_FLIGHT,
+            config=SyncConfig(timeout_seconds=5.0),
+        )
+
+        timeout = batch.errors["SVC.A"]
+        assert isinstance(timeout, MQRESTTimeoutError)
+        assert timeout.operation == "stop"
+        assert list(batch.results) == ["SVC.B", "SVC.C"]
+        assert batch.skipped == ()
+
+    def test_failed_stop_does_not_hold_slot(self) -> None:
+        transport = RestartTransport(["TO.A", "TO.B"], failing_stop="TO.A")
+
+        batch = _restart_session(transport).rolling_restart_channels(["TO.A", "TO.B"])
+
+        assert list(batch.errors) == ["TO.A"]
+        assert list(batch.results) == ["TO.B"]
+
+    def test_all_stops_failing_ends_run(self) -> None:
+        transport = RestartTransport(["TO.A"], failing_stop="TO.A")
+
+        batch = _restart_session(transport).rolling_restart_channels(["TO.A"])
+
+        assert list(batch.errors) == ["TO.A"]
+        assert [p["command"] for p in transport.payloads] == ["STOP"]
+
+    def test_no_matching_objects(self) -> None:
+        transport = RestartTransport([])
+
+        assert _restart_session(transport).rolling_restart_channels("NONE.*") == SyncBatchResult(results={}, errors={})
+
+    def test_invalid_max_in_flight_raises(self) -> None:
+        transport = RestartTransport(["TO.A"])
+
+        with pytest.raises(ValueError, match="max_in_flight"):
+            _restart_session(transport).rolling_restart_channels(["TO.A"], max_in_flight=0)
+        assert transport.payloads == []
+
+
 # ---------------------------------------------------------------------------
 # Parametrized: correct qualifiers for all object types
 # ---------------------------------------------------------------------------
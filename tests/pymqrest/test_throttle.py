@@ -0,0 +1,476 @@
+"""Tests for client-side endpoint throttling."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.exceptions import MQRESTTransportError
+from pymqrest.session import MQRESTSession, TransportResponse
+from pymqrest.throttle import (
+    AdaptiveConcurrencyConfig,
+    EndpointThrottle,
+    ThrottleConfig,
+    ThrottledTransport,
+    ThrottleRegistry,
+    ThrottleStats,
+    endpoint_key,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+TEST_PASSWORD = "pass"
+FAILURE_MESSAGE = "boom"
+BASE_URL = "https://example.invalid:9443/ibmmq/rest/v2"
+OTHER_BASE_URL = "https://other.invalid:9443/ibmmq/rest/v2"
+FAST_RATE = 200.0
+EXPECT_TWO_REQUESTS = 2
+EXPECT_THREE_REQUESTS = 3
+WORKER_COUNT = 6
+MAX_IN_FLIGHT = 2
+DEFAULT_MAX_IN_FLIGHT = 4
+UNLIMITED_REQUESTS = 5
+ADAPTIVE_INITIAL_LIMIT = 4
+ADAPTIVE_MIN_LIMIT = 2
+HEALTHY_LATENCY = 0.01
+
+
+class CountingTransport:
+    """Transport that records concurrency and returns an empty success."""
+
+    def __init__(self, delay_seconds: float = 0.0) -> None:
+        self.delay_seconds = delay_seconds
+        self.calls = 0
+        self.active = 0
+        self.peak_active = 0
+        self._lock = threading.Lock()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, payload, headers, timeout_seconds, verify_tls)
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        time.sleep(self.delay_seconds)
+        with self._lock:
+            self.active -= 1
+        body = json.dumps({"overallCompletionCode": 0, "overallReasonCode": 0})
+        return TransportResponse(status_code=200, text=body, headers={})
+
+
+class FailingTransport:
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (payload, headers, timeout_seconds, verify_tls)
+        raise MQRESTTransportError(FAILURE_MESSAGE, url=url)
+
+
+def _post(transport: ThrottledTransport, url: str = BASE_URL) -> TransportResponse:
+    return transport.post_json(url, {}, headers={}, timeout_seconds=None, verify_tls=True)
+
+
+# -- endpoint_key --
+
+
+def test_endpoint_key_strips_path_and_lowercases() -> None:
+    assert endpoint_key("HTTPS://Host.Example:9443/ibmmq/rest/v2/login") == "https://host.example:9443"
+
+
+# -- ThrottleConfig validation --
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        ThrottleConfig(requests_per_second=0.0),
+        ThrottleConfig(burst=0),
+        ThrottleConfig(max_in_flight=0),
+    ],
+)
+def test_invalid_config_raises(config: ThrottleConfig) -> None:
+    with pytest.raises(ValueError, match="must be"):
+        ThrottleRegistry(config)
+
+
+def test_invalid_endpoint_config_raises() -> None:
+    with pytest.raises(ValueError, match="burst"):
+        ThrottleRegistry(endpoint_configs={BASE_URL: ThrottleConfig(burst=0)})
+
+
+def test_config_defaults_disable_all_limits() -> None:
+    config = ThrottleConfig()
+    assert config.requests_per_second is None
+    assert config.burst == 1
+    assert config.max_in_flight is None
+    assert config.max_wait_seconds is None
+
+
+# -- EndpointThrottle --
+
+
+def test_unlimited_throttle_never_waits() -> None:
+    throttle = EndpointThrottle("https://h:1", ThrottleConfig())
+    assert throttle.stats().mean_wait_seconds == 0.0
+    for _ in range(UNLIMITED_REQUESTS):
+        assert throttle.acquire() == 0.0
+        throttle.release()
+    stats = throttle.stats()
+    assert stats.requests == UNLIMITED_REQUESTS
+    assert stats.delayed_requests == 0
+    assert stats.mean_wait_seconds == 0.0
+    assert throttle.endpoint == "https://h:1"
+    assert throttle.config == ThrottleConfig()
+
+
+def test_rate_limit_delays_requests_beyond_burst() -> None:
+    throttle = EndpointThrottle("https://h:1", ThrottleConfig(requests_per_second=FAST_RATE, burst=1))
+
+    waits = []
+    for _ in range(EXPECT_THREE_REQUESTS):
+        waits.append(throttle.acquire())
+        throttle.release()
+
+    assert waits[0] == 0.0
+    assert all(wait > 0 for wait in waits[1:])
+    stats = throttle.stats()
+    assert stats.requests == EXPECT_THREE_REQUESTS
+    assert stats.delayed_requests == EXPECT_TWO_REQUESTS
+    assert stats.total_wait_seconds > 0
+    assert stats.max_wait_seconds <= stats.total_wait_seconds
+    assert stats.mean_wait_seconds > 0
+
+
+def test_burst_allows_back_to_back_requests() -> None:
+    throttle = EndpointThrottle("https://h:1", ThrottleConfig(requests_per_second=1.0, burst=3))
+    for _ in range(EXPECT_THREE_REQUESTS):
+        assert throttle.acquire() == 0.0
+        throttle.release()
+
+
+def test_max_wait_rejects_when_no_slot() -> None:
+    throttle = EndpointThrottle("https://h:1", ThrottleConfig(max_in_flight=1, max_wait_seconds=0.01))
+    throttle.acquire()
+
+    with pytest.raises(MQRESTTransportError) as excinfo:
+        throttle.acquire()
+
+    assert excinfo.value.url == "https://h:1"
+    assert throttle.stats().rejected_requests == 1
+    throttle.release()
+    assert throttle.acquire() == 0.0
+
+
+def test_max_wait_rejects_when_rate_exhausted() -> None:
+    throttle = EndpointThrottle(
+        "https://h:1",
+        ThrottleConfig(requests_per_second=0.01, burst=1, max_wait_seconds=0.01),
+    )
+    throttle.acquire()
+    throttle.release()
+
+    with pytest.raises(MQRESTTransportError):
+        throttle.acquire()
+
+
+def test_in_flight_cap_is_enforced_across_threads() -> None:
+    registry = ThrottleRegistry(ThrottleConfig(max_in_flight=MAX_IN_FLIGHT))
+    inner = CountingTransport(delay_seconds=0.02)
+    transport = ThrottledTransport(inner, registry)
+
+    threads = [threading.Thread(target=_post, args=(transport,)) for _ in range(WORKER_COUNT)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert inner.calls == WORKER_COUNT
+    assert inner.peak_active <= MAX_IN_FLIGHT
+    stats = registry.stats()[endpoint_key(BASE_URL)]
+    assert stats.peak_in_flight == MAX_IN_FLIGHT
+    assert stats.in_flight == 0
+    assert stats.delayed_requests > 0
+
+
+# -- ThrottleRegistry --
+
+
+def test_registry_creates_one_throttle_per_endpoint() -> None:
+    registry = ThrottleRegistry()
+
+    first = registry.throttle_for(f"{BASE_URL}/login")
+    second = registry.throttle_for(f"{BASE_URL}/admin/action/qmgr/QM1/mqsc")
+    other = registry.throttle_for(OTHER_BASE_URL)
+
+    assert first is second
+    assert first is not other
+    assert set(registry.stats()) == {endpoint_key(BASE_URL), endpoint_key(OTHER_BASE_URL)}
+
+
+def test_registry_applies_endpoint_overrides() -> None:
+    override = ThrottleConfig(max_in_flight=1)
+    registry = ThrottleRegistry(
+        ThrottleConfig(max_in_flight=DEFAULT_MAX_IN_FLIGHT), endpoint_configs={BASE_URL: override}
+    )
+
+    assert registry.throttle_for(BASE_URL).config == override
+    assert registry.throttle_for(OTHER_BASE_URL).config.max_in_flight == DEFAULT_MAX_IN_FLIGHT
+
+
+# -- ThrottledTransport --
+
+
+def test_throttled_transport_releases_slot_on_error() -> None:
+    registry = ThrottleRegistry(ThrottleConfig(max_in_flight=1, max_wait_seconds=0.01))
+    transport = ThrottledTransport(FailingTransport(), registry)
+
+    with pytest.raises(MQRESTTransportError, match="boom"):
+        _post(transport)
+    with pytest.raises(MQRESTTransportError, match="boom"):
+        _post(transport)
+
+    assert registry.throttle_for(BASE_URL).stats().in_flight == 0
+    assert transport.registry is registry
+
+
+def test_session_wraps_transport_and_shares_registry() -> None:
+    registry = ThrottleRegistry(ThrottleConfig(max_in_flight=1))
+    inner = CountingTransport()
+    sessions = [
+        MQRESTSession(
+            rest_base_url=BASE_URL,
+            qmgr_name=qmgr_name,
+            credentials=BasicAuth("user", TEST_PASSWORD),
+            transport=inner,
+            throttle=registry,
+        )
+        for qmgr_name in ("QM1", "QM2")
+    ]
+
+    for session in sessions:
+        session.alter_qmgr(request_parameters={"description": "x"})
+
+    stats = registry.stats()
+    assert list(stats) == [endpoint_key(BASE_URL)]
+    assert isinstance(stats[endpoint_key(BASE_URL)], ThrottleStats)
+    assert stats[endpoint_key(BASE_URL)].requests == EXPECT_TWO_REQUESTS
+    assert inner.calls == EXPECT_TWO_REQUESTS
+
+
+# -- Adaptive concurrency (AIMD) --
+
+
+class StatusTransport:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, payload, headers, timeout_seconds, verify_tls)
+        return TransportResponse(status_code=self.status_code, text="{}", headers={})
+
+
+class InterruptingTransport:
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, payload, headers, timeout_seconds, verify_tls)
+        raise KeyboardInterrupt
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    clock = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def _adaptive_throttle(**overrides: object) -> EndpointThrottle:
+    adaptive = AdaptiveConcurrencyConfig(**overrides)  # type: ignore[arg-type]
+    return EndpointThrottle("https://h:1", ThrottleConfig(adaptive=adaptive))
+
+
+def _fill(throttle: EndpointThrottle) -> int:
+    limit = throttle.stats().concurrency_limit
+    assert limit is not None
+    for _ in range(limit):
+        throttle.acquire()
+    return limit
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"min_limit": 0},
+        {"initial_limit": 100, "max_limit": 10},
+        {"increase_step": 0.0},
+        {"decrease_factor": 1.0},
+        {"latency_tolerance": 1.0},
+    ],
+)
+def test_invalid_adaptive_config_raises(overrides: dict[str, object]) -> None:
+    with pytest.raises(ValueError, match="must"):
+        _adaptive_throttle(**overrides)
+
+
+def test_adaptive_limit_starts_at_initial_limit() -> None:
+    throttle = _adaptive_throttle(initial_limit=ADAPTIVE_INITIAL_LIMIT)
+    assert throttle.stats().concurrency_limit == ADAPTIVE_INITIAL_LIMIT
+    assert EndpointThrottle("https://h:1", ThrottleConfig()).stats().concurrency_limit is None
+
+
+def test_adaptive_limit_grows_while_saturated_and_healthy(fake_clock: list[float]) -> None:
+    _ = fake_clock
+    throttle = _adaptive_throttle(initial_limit=ADAPTIVE_INITIAL_LIMIT)
+
+    for _ in range(ADAPTIVE_INITIAL_LIMIT):
+        count = _fill(throttle)
+        for _ in range(count):
+            throttle.release(latency_seconds=HEALTHY_LATENCY)
+
+    limit = throttle.stats().concurrency_limit
+    assert limit is not None
+    assert limit > ADAPTIVE_INITIAL_LIMIT
+
+
+def test_adaptive_limit_does_not_grow_when_underused() -> None:
+    throttle = _adaptive_throttle(initial_limit=ADAPTIVE_INITIAL_LIMIT)
+
+    for _ in range(UNLIMITED_REQUESTS * ADAPTIVE_INITIAL_LIMIT):
+        throttle.acquire()
+        throttle.release(latency_seconds=HEALTHY_LATENCY)
+
+    assert throttle.stats().concurrency_limit == ADAPTIVE_INITIAL_LIMIT
+
+
+def test_adaptive_limit_respects_max_limit(fake_clock: list[float]) -> None:
+    _ = fake_clock
+    throttle = _adaptive_throttle(initial_limit=1, max_limit=ADAPTIVE_INITIAL_LIMIT, increase_step=10.0)
+
+    for _ in range(UNLIMITED_REQUESTS):
+        count = _fill(throttle)
+        for _ in range(count):
+            throttle.release(latency_seconds=HEALTHY_LATENCY)
+
+    assert throttle.stats().concurrency_limit == ADAPTIVE_INITIAL_LIMIT
+
+
+def test_adaptive_limit_is_capped_by_max_in_flight() -> None:
+    adaptive = AdaptiveConcurrencyConfig(initial_limit=ADAPTIVE_INITIAL_LIMIT)
+    throttle = EndpointThrottle("https://h:1", ThrottleConfig(max_in_flight=1, adaptive=adaptive))
+    assert throttle.stats().concurrency_limit == 1
+
+
+def test_failure_halves_limit_once_per_round_trip(fake_clock: list[float]) -> None:
+    throttle = _adaptive_throttle(initial_limit=ADAPTIVE_INITIAL_LIMIT, min_limit=1)
+    throttle.acquire()
+    throttle.release(latency_seconds=HEALTHY_LATENCY)
+
+    for _ in range(EXPECT_THREE_REQUESTS):
+        throttle.acquire()
+        throttle.release(latency_seconds=HEALTHY_LATENCY, failed=True)
+
+    assert throttle.stats().concurrency_limit == ADAPTIVE_INITIAL_LIMIT // 2
+    assert throttle.stats().failed_requests == EXPECT_THREE_REQUESTS
+
+    fake_clock[0] += 1.0
+    throttle.acquire()
+    throttle.release(failed=True)
+
+    assert throttle.stats().concurrency_limit == ADAPTIVE_INITIAL_LIMIT // 4
+
+
+def test_limit_never_drops_below_min_limit(fake_clock: list[float]) -> None:
+    throttle = _adaptive_throttle(initial_limit=ADAPTIVE_INITIAL_LIMIT, min_limit=ADAPTIVE_MIN_LIMIT)
+
+    for _ in range(UNLIMITED_REQUESTS):
+        fake_clock[0] += 1.0
+        throttle.acquire()
+        throttle.release(failed=True)
+
+    assert throttle.stats().concurrency_limit == ADAPTIVE_MIN_LIMIT
+
+
+def test_rising_latency_reduces_limit(fake_clock: list[float]) -> None:
+    _ = fake_clock
+    throttle = _adaptive_throttle(initial_limit=ADAPTIVE_INITIAL_LIMIT)
+    throttle.acquire()
+    throttle.release(latency_seconds=HEALTHY_LATENCY)
+
+    for _ in range(UNLIMITED_REQUESTS * 2):
+        throttle.acquire()
+        throttle.release(latency_seconds=HEALTHY_LATENCY * 20)
+
+    limit = throttle.stats().concurrency_limit
+    assert limit is not None
+    assert limit < ADAPTIVE_INITIAL_LIMIT
+
+
+def test_throttled_transport_reports_server_errors_as_failures() -> None:
+    registry = ThrottleRegistry(ThrottleConfig(adaptive=AdaptiveConcurrencyConfig()))
+
+    ThrottledTransport(StatusTransport(503), registry).post_json(
+        BASE_URL,
+        {},
+        headers={},
+        timeout_seconds=None,
+        verify_tls=True,
+    )
+    _post(ThrottledTransport(StatusTransport(200), registry))
+
+    stats = registry.throttle_for(BASE_URL).stats()
+    assert stats.failed_requests == 1
+    assert stats.requests == EXPECT_TWO_REQUESTS
+
+
+def test_throttled_transport_reports_transport_errors_as_failures() -> None:
+    registry = ThrottleRegistry(ThrottleConfig(adaptive=AdaptiveConcurrencyConfig()))
+
+    with pytest.raises(MQRESTTransportError):
+        _post(ThrottledTransport(FailingTransport(), registry))
+
+    assert registry.throttle_for(BASE_URL).stats().failed_requests == 1
+
+
+def test_throttled_transport_releases_on_unexpected_exception() -> None:
+    registry = ThrottleRegistry(ThrottleConfig(max_in_flight=1))
+
+    with pytest.raises(KeyboardInterrupt):
+        _post(ThrottledTransport(InterruptingTransport(), registry))
+
+    stats = registry.throttle_for(BASE_URL).stats()
+    assert stats.in_flight == 0
+    assert stats.failed_requests == 0
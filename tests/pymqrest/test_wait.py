@@ -0,0 +1,269 @@
+"""Tests for condition waits on a shared poll scheduler."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymqrest.auth import BasicAuth
+from pymqrest.exceptions import MQRESTCommandError, MQRESTTimeoutError
+from pymqrest.session import MQRESTSession, TransportResponse
+from pymqrest.sync import SyncConfig
+from pymqrest.wait import PendingWait, WaitResult, _PollGroup
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+TEST_PASSWORD = "pass"
+EXPECT_TWO_POLLS = 2
+EXPECT_THREE_POLLS = 3
+DRAINED_DEPTH = 10
+THREAD_JOIN_SECONDS = 5.0
+
+
+class DepthTransport:
+    """Transport whose queue DISPLAYs step through per-queue depth sequences.
+
+    The last depth of a sequence repeats once it is reached; queues
+    without a sequence are not reported.
+    """
+
+    def __init__(
+        self,
+        depths: dict[str, list[int]],
+        *,
+        gate: threading.Event | None = None,
+        denied: bool = False,
+    ) -> None:
+        self.depths = depths
+        self.gate = gate
+        self.denied = denied
+        self.entered = threading.Event()
+        self.payloads: list[dict[str, object]] = []
+        self._displays = 0
+
+    def post_json(
+        self,
+        url: str,
+        payload: Mapping[str, object],
+        *,
+        headers: Mapping[str, str],
+        timeout_seconds: float | None,
+        verify_tls: bool,
+    ) -> TransportResponse:
+        _ = (url, headers, timeout_seconds, verify_tls)
+        self.payloads.append(dict(payload))
+        self.entered.set()
+        if self.gate is not None:
+            self.gate.wait(THREAD_JOIN_SECONDS)
+        name = str(payload["name"])
+        tick = self._displays
+        self._displays += 1
+        rows = [
+            {"QUEUE": queue, "CURDEPTH": sequence[min(tick, len(sequence) - 1)]}
+            for queue, sequence in self.depths.items()
+            if queue == name or (name.endswith("*") and queue.startswith(name[:-1]))
+        ]
+        if self.denied:
+            body: dict[str, object] = {"overallCompletionCode": 2, "overallReasonCode": 2035}
+        elif not rows:
+            body = {"overallCompletionCode": 2, "overallReasonCode": 2085}
+        else:
+            items = [{"completionCode": 0, "reasonCode": 0, "parameters": row} for row in rows]
+            body = {"commandResponse": items, "overallCompletionCode": 0, "overallReasonCode": 0}
+        return TransportResponse(status_code=200, text=json.dumps(body), headers={})
+
+
+def _session(transport: DepthTransport, qmgr_name: str = "QM1") -> MQRESTSession:
+    return MQRESTSession(
+        "https://example.invalid/ibmmq/rest/v2",
+        qmgr_name,
+        credentials=BasicAuth("user", TEST_PASSWORD),
+        transport=transport,
+    )
+
+
+def _drained(rows: list[dict[str, object]]) -> bool:
+    return bool(rows) and all(int(str(row["current_queue_depth"])) < DRAINED_DEPTH for row in rows)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Patch time.monotonic and the poll driver's pause so each pause advances a fake clock."""
+    clock = [0.0]
+    recorded: list[float] = []
+
+    def fake_pause(group: _PollGroup, seconds: float) -> None:
+        _ = group
+        recorded.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(_PollGroup, "_pause", fake_pause)
+    return recorded
+
+
+@pytest.mark.usefixtures("sleeps")
+def test_wait_for_polls_until_predicate_holds() -> None:
+    transport = DepthTransport({"APP.IN": [500, 50, 5]})
+
+    result = _session(transport).wait_for(
+        "queue",
+        "APP.IN",
+        _drained,
+        SyncConfig(poll_interval_seconds=2.0),
+        response_parameters=["current_queue_depth"],
+    )
+
+    assert result == WaitResult(rows=[{"queue_name": "APP.IN", "current_queue_depth": 5}], polls=3, elapsed_seconds=6.0)
+    assert {(payload["name"], tuple(payload["responseParameters"])) for payload in transport.payloads} == {  # type: ignore[arg-type]
+        ("APP.IN", ("CURDEPTH",)),
+    }
+
+
+def test_waits_on_the_same_qualifier_share_each_display(sleeps: list[float]) -> None:
+    transport = DepthTransport({"APP.IN": [500, 5], "APP.OUT": [500, 500, 5], "OTHER": [0]})
+    session = _session(transport)
+    config = SyncConfig(poll_interval_seconds=1.0)
+
+    first = session.submit_wait("QUEUE", "APP.IN", _drained, config)
+    second = session.submit_wait("QUEUE", "APP.OUT", _drained, config)
+
+    assert first.name == "APP.IN"
+    assert not second.done
+    assert first.result().polls == EXPECT_TWO_POLLS
+    assert not second.done
+    assert second.result().polls == EXPECT_THREE_POLLS
+    assert [payload["name"] for payload in transport.payloads] == ["APP.*", "APP.*", "APP.OUT"]
+    assert sleeps == [1.0, 1.0, 1.0]
+    assert len(session._poll_scheduler) == 0  # noqa: SLF001
+    assert first.result().polls == EXPECT_TWO_POLLS
+
+
+def test_waits_keep_their_own_schedules_within_a_group(sleeps: list[float]) -> None:
+    transport = DepthTransport({"APP.IN": [500, 5], "APP.OUT": [500, 500, 5]})
+    session = _session(transport)
+
+    fast = session.submit_wait("QUEUE", "APP.IN", _drained, SyncConfig(poll_interval_seconds=1.0))
+    slow = session.submit_wait("QUEUE", "APP.OUT", _drained, SyncConfig(poll_interval_seconds=10.0))
+
+    assert fast.result().elapsed_seconds == EXPECT_TWO_POLLS
+    assert slow.result() == WaitResult(
+        rows=[{"queue_name": "APP.OUT", "current_queue_depth": 5}], polls=3, elapsed_seconds=10.0
+    )
+    assert sleeps == [1.0, 1.0, 8.0]
+
+
+@pytest.mark.usefixtures("sleeps")
+def test_generic_names_and_separate_groups() -> None:
+    transport = DepthTransport({"APP.IN": [5], "APP.OUT": [500, 5]})
+    session = _session(transport)
+    other_qmgr = session.for_qmgr("QM2")
+
+    pending = [
+        session.submit_wait("QUEUE", "APP.*", _drained),
+        session.submit_wait("QUEUE", "APP.IN", _drained, response_parameters=["current_queue_depth"]),
+        other_qmgr.submit_wait("QUEUE", "APP.IN", _drained),
+    ]
+    results = [wait.result() for wait in pending]
+
+    assert [len(result.rows) for result in results] == [2, 1, 1]
+    assert [payload["name"] for payload in transport.payloads] == ["APP.*", "APP.*", "APP.IN", "APP.IN"]
+
+
+def test_adaptive_intervals_end_at_the_deadline(sleeps: list[float]) -> None:
+    transport = DepthTransport({"APP.IN": [500]})
+    config = SyncConfig(
+        timeout_seconds=5.0,
+        poll_interval_seconds=1.0,
+        first_poll_immediate=True,
+        backoff_multiplier=2.0,
+    )
+
+    with pytest.raises(MQRESTTimeoutError) as excinfo:
+        _session(transport).wait_for("QUEUE", "APP.IN", _drained, config)
+
+    assert excinfo.value.operation == "wait"
+    assert excinfo.value.elapsed == config.timeout_seconds
+    assert sleeps == [1.0, 2.0, 2.0]
+
+
+@pytest.mark.usefixtures("sleeps")
+def test_missing_objects_give_no_rows_and_predicate_errors_propagate() -> None:
+    transport = DepthTransport({})
+    session = _session(transport)
+
+    assert session.wait_for("QUEUE", "GONE", lambda rows: not rows).rows == []
+    with pytest.raises(IndexError):
+        session.wait_for("QUEUE", "GONE", lambda rows: bool(rows[0]))
+
+
+@pytest.mark.usefixtures("sleeps")
+def test_failed_poll_fails_every_wait_in_the_group() -> None:
+    transport = DepthTransport({"APP.IN": [5]}, denied=True)
+    session = _session(transport)
+    first = session.submit_wait("QUEUE", "APP.IN", lambda rows: not rows)
+    second = session.submit_wait("QUEUE", "APP.OUT", lambda rows: not rows)
+
+    with pytest.raises(MQRESTCommandError, match="2035"):
+        first.result()
+    assert second.done
+    with pytest.raises(MQRESTCommandError, match="2035"):
+        second.result()
+    assert len(transport.payloads) == 1
+    assert len(session._poll_scheduler) == 0  # noqa: SLF001
+
+
+def test_invalid_config_raises() -> None:
+    session = _session(DepthTransport({}))
+
+    with pytest.raises(ValueError, match="backoff_multiplier"):
+        session.submit_wait("QUEUE", "APP.IN", _drained, SyncConfig(backoff_multiplier=0.5))
+
+
+@pytest.mark.usefixtures("sleeps")
+def test_concurrent_waiters_block_while_another_thread_polls() -> None:
+    gate = threading.Event()
+    transport = DepthTransport({"APP.IN": [500, 5], "APP.OUT": [5]}, gate=gate)
+    session = _session(transport)
+    first = session.submit_wait("QUEUE", "APP.IN", _drained)
+    second = session.submit_wait("QUEUE", "APP.OUT", _drained)
+    results: dict[str, WaitResult] = {}
+
+    def collect(name: str, wait: PendingWait) -> None:
+        results[name] = wait.result()
+
+    driver = threading.Thread(target=collect, args=("APP.IN", first))
+    driver.start()
+    transport.entered.wait(THREAD_JOIN_SECONDS)
+    follower = threading.Thread(target=collect, args=("APP.OUT", second))
+    follower.start()
+    threading.Event().wait(0.1)
+    gate.set()
+    driver.join(THREAD_JOIN_SECONDS)
+    follower.join(THREAD_JOIN_SECONDS)
+
+    assert results["APP.OUT"].polls == 1
+    assert results["APP.IN"].polls == EXPECT_TWO_POLLS
+
+
+def test_immediate_wait_wakes_a_driver_waiting_for_a_longer_interval() -> None:
+    transport = DepthTransport({"APP.IN": [5], "APP.OUT": [5]})
+    session = _session(transport)
+    slow = session.submit_wait("QUEUE", "APP.IN", _drained, SyncConfig(poll_interval_seconds=60.0))
+    results: dict[str, WaitResult] = {}
+    driver = threading.Thread(target=lambda: results.setdefault("APP.IN", slow.result()))
+    driver.start()
+    threading.Event().wait(0.1)
+
+    immediate = session.wait_for("QUEUE", "APP.OUT", _drained, SyncConfig(first_poll_immediate=True))
+    driver.join(THREAD_JOIN_SECONDS)
+
+    assert not driver.is_alive()
+    assert immediate.polls == 1
+    assert results["APP.IN"].polls == 1
+    assert len(transport.payloads) == 1